@@ -154,12 +154,12 @@ class CreateAgentStepEvent(BaseEvent):
 
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
-		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/png;base64,{browser_state_summary.screenshot}'
+		if screenshot := browser_state_summary.screenshot_data:
+			screenshot_url = f'data:{screenshot.media_type};base64,{screenshot.b64}'
 			import logging
 
 			logger = logging.getLogger(__name__)
-			logger.debug(f'📸 Including screenshot in CreateAgentStepEvent, length: {len(browser_state_summary.screenshot)}')
+			logger.debug(f'📸 Including screenshot in CreateAgentStepEvent: {screenshot!r}')
 		else:
 			import logging
 
@@ -1,21 +1,65 @@
 from __future__ import annotations
 
+import ast
 import base64
-import io
+import functools
+import itertools
 import logging
+import multiprocessing
+import multiprocessing.context
 import os
 import platform
-from typing import TYPE_CHECKING
-
-from browser_use.agent.views import AgentHistoryList
-from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT
+import subprocess
+import sys
+import threading
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT, Screenshot
 from browser_use.config import CONFIG
 
 if TYPE_CHECKING:
 	from PIL import Image, ImageFont
 
+	from browser_use.agent.views import AgentHistoryList
+
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_4PX_BYTES = base64.b64decode(PLACEHOLDER_4PX_SCREENSHOT)
+
+# Try different font options in order of preference
+# ArialUni is a font that comes with Office and can render most non-alphabet characters
+_FONT_OPTIONS = [
+	'PingFang',
+	'STHeiti Medium',
+	'Microsoft YaHei',  # 微软雅黑
+	'SimHei',  # 黑体
+	'SimSun',  # 宋体
+	'Noto Sans CJK SC',  # 思源黑体
+	'WenQuanYi Micro Hei',  # 文泉驿微米黑
+	'Helvetica',
+	'Arial',
+	'DejaVuSans',
+	'Verdana',
+]
+
+# Encoder arguments per video container, frames stay on screen for seconds so x264 is tuned for still images
+_VIDEO_CODEC_ARGS: dict[str, list[str]] = {
+	'.mp4': ['-c:v', 'libx264', '-preset', 'veryfast', '-tune', 'stillimage', '-crf', '23', '-movflags', '+faststart'],
+	'.webm': ['-c:v', 'libvpx-vp9', '-deadline', 'good', '-cpu-used', '4', '-crf', '32', '-b:v', '0'],
+}
+
+# Below this many frames starting worker processes costs more than it saves
+_MIN_FRAMES_FOR_WORKERS = 16
+
+
+def _is_placeholder(screenshot: Screenshot) -> bool:
+	# compare the size first, slicing a memory-mapped screenshot copies it
+	return len(screenshot) == len(_PLACEHOLDER_4PX_BYTES) and screenshot.data[:] == _PLACEHOLDER_4PX_BYTES
+
 
 def decode_unicode_escapes_to_utf8(text: str) -> str:
 	"""Handle decoding any unicode escape sequences embedded in a string (needed to render non-ASCII languages like chinese or arabic in the GIF overlay text)"""
@@ -32,6 +76,256 @@ def decode_unicode_escapes_to_utf8(text: str) -> str:
 		return text
 
 
+class _FrameStyle(NamedTuple):
+	"""Rendering settings shared by all frames, sent to the worker processes with every job"""
+
+	size: tuple[int, int]  # of the first real screenshot, the task frame and video frames use it
+	output: Literal['gif', 'video']
+	font_size: int
+	title_font_size: int
+	goal_font_size: int
+	margin: int
+	line_spacing: float
+	show_logo: bool
+
+
+class _FrameJob(NamedTuple):
+	screenshot_path: str | None  # None for the task frame
+	step_number: int
+	text: str | None  # the task for the task frame, the goal to overlay otherwise
+
+
+@functools.cache
+def _load_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
+	from PIL import ImageFont
+
+	return ImageFont.truetype(font_name, size)
+
+
+@functools.cache
+def _load_fonts(font_size: int, title_font_size: int, goal_font_size: int) -> tuple[ImageFont.FreeTypeFont, ...]:
+	"""Regular, title and goal font of the first preferred font that is installed, loaded once per process"""
+	from PIL import ImageFont
+
+	for font_name in _FONT_OPTIONS:
+		try:
+			if platform.system() == 'Windows':
+				# Need to specify the abs font path on Windows
+				font_name = os.path.join(CONFIG.WIN_FONT_DIR, font_name + '.ttf')
+			return (
+				_load_font(font_name, font_size),
+				_load_font(font_name, title_font_size),
+				_load_font(font_name, goal_font_size),
+			)
+		except OSError:
+			continue
+
+	regular_font = ImageFont.load_default()
+	return regular_font, ImageFont.load_default(), regular_font  # type: ignore
+
+
+@functools.cache
+def _load_logo() -> Image.Image | None:
+	"""The logo resized for the overlay, loaded once per process"""
+	from PIL import Image
+
+	try:
+		logo = Image.open('./static/browser-use.png')
+		# Resize logo to be small (e.g., 40px height)
+		logo_height = 150
+		aspect_ratio = logo.width / logo.height
+		logo_width = int(logo_height * aspect_ratio)
+		return logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+	except Exception as e:
+		logger.warning(f'Could not load logo: {e}')
+		return None
+
+
+def _render_frame(job: _FrameJob, style: _FrameStyle) -> Image.Image | bytes:
+	"""Draw one frame, runs in the worker processes.
+
+	Returns a palette image for the GIF encoder, or raw RGB pixels of `style.size` for the video encoder.
+	"""
+	from PIL import Image, ImageOps
+
+	regular_font, title_font, _ = _load_fonts(style.font_size, style.title_font_size, style.goal_font_size)
+	logo = _load_logo() if style.show_logo else None
+
+	if job.screenshot_path is None:
+		image = _create_task_frame(job.text or '', style.size, title_font, regular_font, logo, style.line_spacing)
+	else:
+		with Image.open(job.screenshot_path) as screenshot:
+			image = screenshot.convert('RGB')
+		if job.text is not None:
+			image = _add_overlay_to_image(
+				image=image,
+				step_number=job.step_number,
+				goal_text=job.text,
+				regular_font=regular_font,
+				title_font=title_font,
+				margin=style.margin,
+				logo=logo,
+			)
+
+	if style.output == 'gif':
+		# the quantization the GIF encoder would do anyway, done here so it runs in parallel
+		return image.convert('P', palette=Image.Palette.ADAPTIVE)
+
+	if image.size != style.size:
+		image = ImageOps.pad(image, style.size, color=(0, 0, 0))
+	return image.tobytes()
+
+
+def _can_fork() -> bool:
+	"""Forking is only safe while no other thread (like the agent's event loop) can hold a lock the child inherits"""
+	return sys.platform == 'linux' and threading.active_count() == 1
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+	if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare) or len(node.test.comparators) != 1:
+		return False
+	operands = {ast.unparse(node.test.left), ast.unparse(node.test.comparators[0])}
+	return isinstance(node.test.ops[0], ast.Eq) and operands in ({'__name__', "'__main__'"}, {'__name__', '"__main__"'})
+
+
+def _main_module_is_importable() -> bool:
+	"""Whether `forkserver` / `spawn` workers can import the caller's `__main__` module without re-running its script"""
+	main_module = sys.modules['__main__']
+	main_path = getattr(main_module, '__file__', None)
+	spec_name = getattr(getattr(main_module, '__spec__', None), 'name', None)
+	# interactive sessions and `python -m package` are not re-imported by multiprocessing
+	if main_path is None or (spec_name is not None and spec_name.endswith('.__main__')):
+		return True
+	try:
+		tree = ast.parse(Path(main_path).read_text(encoding='utf-8'))
+	except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+		return False
+	return any(_is_main_guard(node) for node in tree.body)
+
+
+def _get_mp_context() -> multiprocessing.context.BaseContext | None:
+	"""The context to start render workers with, None if frames have to be rendered in the calling process"""
+	if _can_fork():
+		return multiprocessing.get_context('fork')
+	# without the `if __name__ == '__main__':` guard the workers would run the caller's script (and its agent) again
+	if not _main_module_is_importable():
+		return None
+	return multiprocessing.get_context('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+
+def _render_frames(jobs: list[_FrameJob], style: _FrameStyle, workers: int) -> Generator[Image.Image | bytes, None, None]:
+	"""Render frames in order, in up to `workers` processes with at most two frames per worker in flight"""
+	context = _get_mp_context() if workers > 1 and len(jobs) >= _MIN_FRAMES_FOR_WORKERS else None
+	if context is None:
+		for job in jobs:
+			yield _render_frame(job, style)
+		return
+
+	if context.get_start_method() == 'fork':
+		# load fonts and logo before forking, the workers inherit them
+		_load_fonts(style.font_size, style.title_font_size, style.goal_font_size)
+		if style.show_logo:
+			_load_logo()
+
+	executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+	try:
+		remaining = iter(jobs)
+		pending: deque[Future[Image.Image | bytes]] = deque(
+			executor.submit(_render_frame, job, style) for job in itertools.islice(remaining, workers * 2)
+		)
+		while pending:
+			frame = pending.popleft().result()
+			for job in itertools.islice(remaining, 1):
+				pending.append(executor.submit(_render_frame, job, style))
+			yield frame
+	finally:
+		executor.shutdown(cancel_futures=True)
+
+
+def _write_gif(frames: Iterator[Image.Image], output_path: str, duration: int) -> int:
+	first_frame = next(frames, None)
+	if first_frame is None:
+		return 0
+
+	frame_count = 1
+
+	def counted() -> Iterator[Image.Image]:
+		nonlocal frame_count
+		for frame in frames:
+			frame_count += 1
+			yield frame
+
+	# the GIF encoder pulls frames one by one, it still keeps the (palette, cropped to changes) frames until it's done
+	first_frame.save(
+		output_path,
+		format='GIF',
+		save_all=True,
+		append_images=counted(),
+		duration=duration,
+		loop=0,
+		optimize=False,
+	)
+	return frame_count
+
+
+def _write_video(frames: Iterator[bytes], output_path: str, size: tuple[int, int], duration: int) -> int:
+	try:
+		import imageio_ffmpeg
+	except ImportError:
+		logger.error('Video output requires ffmpeg, install it with: pip install "browser-use[video]"')
+		return 0
+
+	width, height = size
+	extension = Path(output_path).suffix.lower()
+	command = [
+		imageio_ffmpeg.get_ffmpeg_exe(),
+		'-y',
+		'-loglevel',
+		'error',
+		'-f',
+		'rawvideo',
+		'-pix_fmt',
+		'rgb24',
+		'-s',
+		f'{width}x{height}',
+		'-framerate',
+		f'1000/{duration}',
+		'-i',
+		'-',
+		# yuv420p needs even dimensions
+		'-vf',
+		'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+		*_VIDEO_CODEC_ARGS[extension],
+		'-pix_fmt',
+		'yuv420p',
+		output_path,
+	]
+
+	frame_count = 0
+	process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+	assert process.stdin is not None and process.stderr is not None
+	try:
+		for frame in frames:
+			process.stdin.write(frame)
+			frame_count += 1
+	except BrokenPipeError:
+		pass  # ffmpeg exited, its error is reported below
+	finally:
+		try:
+			process.stdin.close()
+		except BrokenPipeError:
+			pass
+		# ffmpeg only logs errors, too little to fill the pipe while frames are written
+		stderr = process.stderr.read()
+		process.wait()
+
+	if process.returncode != 0:
+		logger.error(f'ffmpeg failed to encode {output_path}: {stderr.decode(errors="replace").strip()}')
+		Path(output_path).unlink(missing_ok=True)
+		return 0
+	return frame_count
+
+
 def create_history_gif(
 	task: str,
 	history: AgentHistoryList,
@@ -46,183 +340,113 @@ def create_history_gif(
 	goal_font_size: int = 44,
 	margin: int = 40,
 	line_spacing: float = 1.5,
+	workers: int | None = None,
 ) -> None:
-	"""Create a GIF from the agent's history with overlaid task and goal text."""
-	if not history.history:
-		logger.warning('No history to create GIF from')
-		return
-
-	from PIL import Image, ImageFont
+	"""Create a GIF from the agent's history with overlaid task and goal text.
 
-	images = []
+	Frames are rendered from the stored screenshots in worker processes and streamed to the encoder in order.
+	An `output_path` ending in `.mp4` or `.webm` produces a video instead, a fraction of the GIF's size and encoding
+	time (needs ffmpeg from `imageio[ffmpeg]`).
 
-	# if history is empty, we can't create a gif
+	`workers` defaults to up to 4 processes when they can be forked, on Linux from a single-threaded caller. When
+	`workers` is passed from a multi-threaded caller like the agent, they are started with `forkserver` (or `spawn`)
+	instead, which imports the calling script in the workers. A script without an `if __name__ == '__main__':` guard
+	would run again there, so its frames are rendered in the calling process.
+	"""
 	if not history.history:
 		logger.warning('No history to create GIF from')
 		return
 
-	# Get all screenshots from history (including None placeholders)
-	screenshots = history.screenshots(return_none_if_not_screenshot=True)
+	from PIL import Image
 
-	if not screenshots:
+	# Screenshots are memory-mapped from the screenshot store one at a time, not loaded all at once
+	if not any(history.screenshot_paths(return_none_if_not_screenshot=False)):
 		logger.warning('No screenshots found in history')
 		return
 
-	# Find the first non-placeholder screenshot
+	from browser_use.utils import is_new_tab_page
+
+	# Frames to render, skipping placeholders and new tab pages
 	# A screenshot is considered a placeholder if:
 	# 1. It's the exact 4px placeholder for about:blank pages, OR
 	# 2. It comes from a new tab page (chrome://newtab/, about:blank, etc.)
-	first_real_screenshot = None
-	for screenshot in screenshots:
-		if screenshot and screenshot != PLACEHOLDER_4PX_SCREENSHOT:
-			first_real_screenshot = screenshot
-			break
-
-	if not first_real_screenshot:
-		logger.warning('No valid screenshots found (all are placeholders or from new tab pages)')
-		return
-
-	# Try to load nicer fonts
-	try:
-		# Try different font options in order of preference
-		# ArialUni is a font that comes with Office and can render most non-alphabet characters
-		font_options = [
-			'PingFang',
-			'STHeiti Medium',
-			'Microsoft YaHei',  # 微软雅黑
-			'SimHei',  # 黑体
-			'SimSun',  # 宋体
-			'Noto Sans CJK SC',  # 思源黑体
-			'WenQuanYi Micro Hei',  # 文泉驿微米黑
-			'Helvetica',
-			'Arial',
-			'DejaVuSans',
-			'Verdana',
-		]
-		font_loaded = False
-
-		for font_name in font_options:
-			try:
-				if platform.system() == 'Windows':
-					# Need to specify the abs font path on Windows
-					font_name = os.path.join(CONFIG.WIN_FONT_DIR, font_name + '.ttf')
-				regular_font = ImageFont.truetype(font_name, font_size)
-				title_font = ImageFont.truetype(font_name, title_font_size)
-				goal_font = ImageFont.truetype(font_name, goal_font_size)
-				font_loaded = True
-				break
-			except OSError:
-				continue
-
-		if not font_loaded:
-			raise OSError('No preferred fonts found')
-
-	except OSError:
-		regular_font = ImageFont.load_default()
-		title_font = ImageFont.load_default()
-
-		goal_font = regular_font
-
-	# Load logo if requested
-	logo = None
-	if show_logo:
-		try:
-			logo = Image.open('./static/browser-use.png')
-			# Resize logo to be small (e.g., 40px height)
-			logo_height = 150
-			aspect_ratio = logo.width / logo.height
-			logo_width = int(logo_height * aspect_ratio)
-			logo = logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-		except Exception as e:
-			logger.warning(f'Could not load logo: {e}')
-
-	# Create task frame if requested
-	if show_task and task:
-		# Find the first non-placeholder screenshot for the task frame
-		first_real_screenshot = None
-		for item in history.history:
-			screenshot_b64 = item.state.get_screenshot()
-			if screenshot_b64 and screenshot_b64 != PLACEHOLDER_4PX_SCREENSHOT:
-				first_real_screenshot = screenshot_b64
-				break
-
-		if first_real_screenshot:
-			task_frame = _create_task_frame(
-				task,
-				first_real_screenshot,
-				title_font,  # type: ignore
-				regular_font,  # type: ignore
-				logo,
-				line_spacing,
-			)
-			images.append(task_frame)
-		else:
-			logger.warning('No real screenshots found for task frame, skipping task frame')
-
-	# Process each history item with its corresponding screenshot
-	for i, (item, screenshot) in enumerate(zip(history.history, screenshots), 1):
-		if not screenshot:
+	jobs: list[_FrameJob] = []
+	first_screenshot_path = None
+	for i, item in enumerate(history.history, 1):
+		screenshot = item.state.load_screenshot()
+		if not screenshot or not item.state.screenshot_path:
 			continue
+		with screenshot:
+			is_placeholder = _is_placeholder(screenshot)
 
 		# Skip placeholder screenshots from about:blank pages
 		# These are 4x4 white PNGs encoded as a specific base64 string
-		if screenshot == PLACEHOLDER_4PX_SCREENSHOT:
+		if is_placeholder:
 			logger.debug(f'Skipping placeholder screenshot from about:blank page at step {i}')
 			continue
 
 		# Skip screenshots from new tab pages
-		from browser_use.utils import is_new_tab_page
-
 		if is_new_tab_page(item.state.url):
 			logger.debug(f'Skipping screenshot from new tab page ({item.state.url}) at step {i}')
 			continue
 
-		# Convert base64 screenshot to PIL Image
-		img_data = base64.b64decode(screenshot)
-		image = Image.open(io.BytesIO(img_data))
+		goal_text = item.model_output.current_state.next_goal if show_goals and item.model_output else None
+		jobs.append(_FrameJob(item.state.screenshot_path, i, goal_text))
+		first_screenshot_path = first_screenshot_path or item.state.screenshot_path
 
-		if show_goals and item.model_output:
-			image = _add_overlay_to_image(
-				image=image,
-				step_number=i,
-				goal_text=item.model_output.current_state.next_goal,
-				regular_font=regular_font,  # type: ignore
-				title_font=title_font,  # type: ignore
-				margin=margin,
-				logo=logo,
-			)
+	if not first_screenshot_path:
+		logger.warning('No valid screenshots found (all are placeholders or from new tab pages)')
+		return
 
-		images.append(image)
-
-	if images:
-		# Save the GIF
-		images[0].save(
-			output_path,
-			save_all=True,
-			append_images=images[1:],
-			duration=duration,
-			loop=0,
-			optimize=False,
-		)
-		logger.info(f'Created GIF at {output_path}')
+	# Only the header is read here, the pixels are decoded by the workers
+	with Image.open(first_screenshot_path) as first_screenshot:
+		size = first_screenshot.size
+
+	# Create task frame if requested
+	if show_task and task:
+		jobs.insert(0, _FrameJob(None, 0, task))
+
+	extension = Path(output_path).suffix.lower()
+	style = _FrameStyle(
+		size=size,
+		output='video' if extension in _VIDEO_CODEC_ARGS else 'gif',
+		font_size=font_size,
+		title_font_size=title_font_size,
+		goal_font_size=goal_font_size,
+		margin=margin,
+		line_spacing=line_spacing,
+		show_logo=show_logo,
+	)
+	if workers is None:
+		workers = min(4, os.cpu_count() or 1) if _can_fork() else 1
+
+	frames = _render_frames(jobs, style, workers)
+	try:
+		if style.output == 'video':
+			frame_count = _write_video(frames, output_path, size, duration)  # type: ignore[arg-type]
+		else:
+			frame_count = _write_gif(frames, output_path, duration)  # type: ignore[arg-type]
+	finally:
+		frames.close()
+
+	if frame_count:
+		logger.info(f'Created {"video" if style.output == "video" else "GIF"} with {frame_count} frames at {output_path}')
 	else:
 		logger.warning('No images found in history to create GIF')
 
 
 def _create_task_frame(
 	task: str,
-	first_screenshot: str,
+	size: tuple[int, int],
 	title_font: ImageFont.FreeTypeFont,
 	regular_font: ImageFont.FreeTypeFont,
 	logo: Image.Image | None = None,
 	line_spacing: float = 1.5,
 ) -> Image.Image:
 	"""Create initial frame showing the task."""
-	from PIL import Image, ImageDraw, ImageFont
+	from PIL import Image, ImageDraw
 
-	img_data = base64.b64decode(first_screenshot)
-	template = Image.open(io.BytesIO(img_data))
-	image = Image.new('RGB', template.size, (0, 0, 0))
+	image = Image.new('RGB', size, (0, 0, 0))
 	draw = ImageDraw.Draw(image)
 
 	# Calculate vertical center of image
@@ -249,7 +473,7 @@ def _create_task_frame(
 
 	# Try to create a larger font, but fall back to regular font if it fails
 	try:
-		larger_font = ImageFont.truetype(regular_font.path, font_size)  # type: ignore
+		larger_font = _load_font(regular_font.path, font_size)  # type: ignore
 	except (OSError, AttributeError):
 		# Fall back to regular font if .path is not available or font loading fails
 		larger_font = regular_font
@@ -14,6 +14,7 @@ from browser_use.agent.views import (
 	MessageManagerState,
 )
 from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import DOMSerializationPriority
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.messages import (
 	BaseMessage,
@@ -95,6 +96,7 @@ def _log_format_message_line(message: BaseMessage, content: str, is_last_message
 
 class MessageManager:
 	vision_detail_level: Literal['auto', 'low', 'high']
+	dom_serialization_priority: DOMSerializationPriority
 
 	def __init__(
 		self,
@@ -110,6 +112,7 @@ class MessageManager:
 		include_tool_call_examples: bool = False,
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
+		dom_serialization_priority: DOMSerializationPriority = 'document',
 	):
 		self.task = task
 		self.state = state
@@ -122,6 +125,7 @@ class MessageManager:
 		self.include_tool_call_examples = include_tool_call_examples
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images
+		self.dom_serialization_priority = dom_serialization_priority
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
 
@@ -129,38 +133,62 @@ class MessageManager:
 		self.include_attributes = include_attributes or []
 		self.sensitive_data = sensitive_data
 		self.last_input_messages = []
+		self._rendered_history_items: list[tuple[HistoryItem, str]] = []
 		# Only initialize messages if state is empty
 		if len(self.state.history.get_messages()) == 0:
 			self._set_message_with_type(self.system_prompt, 'system')
 
-	@property
-	def agent_history_description(self) -> str:
-		"""Build agent history description from list of items, respecting max_history_items limit"""
-		if self.max_history_items is None:
-			# Include all items
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+	def _get_history_blocks(self) -> list[str]:
+		"""Get the rendered history items, respecting max_history_items limit
 
-		total_items = len(self.state.agent_history_items)
+		History items are only ever appended, so each item is rendered once and the blocks of previous steps stay
+		identical, which keeps the prompt prefix stable for provider prompt caching.
+		"""
+		items = self.state.agent_history_items
+		rendered = self._rendered_history_items
+		if len(rendered) > len(items) or (rendered and items[len(rendered) - 1] is not rendered[-1][0]):
+			# the history items were replaced, render them again
+			rendered.clear()
+		rendered.extend((item, item.to_string()) for item in items[len(rendered) :])
 
-		# If we have fewer items than the limit, just return all items
-		if total_items <= self.max_history_items:
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+		if self.max_history_items is None or len(rendered) <= self.max_history_items:
+			# Include all items
+			return [text for _, text in rendered]
 
 		# We have more items than the limit, so we need to omit some
-		omitted_count = total_items - self.max_history_items
+		omitted_count = len(rendered) - self.max_history_items
 
 		# Show first item + omitted message + most recent (max_history_items - 1) items
 		# The omitted message doesn't count against the limit, only real history items do
 		recent_items_count = self.max_history_items - 1  # -1 for first item
 
-		items_to_include = [
-			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
+		return [
+			rendered[0][1],  # Keep first item (initialization)
 			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
+			*(text for _, text in rendered[-recent_items_count:]),
 		]
-		# Add most recent items
-		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
 
-		return '\n'.join(items_to_include)
+	@property
+	def agent_history_description(self) -> str:
+		"""Build agent history description from list of items, respecting max_history_items limit"""
+		return '\n'.join(self._get_history_blocks())
+
+	def _create_history_parts(self) -> list[ContentPartTextParam]:
+		"""Create the agent history content parts, one part per history item
+
+		The cache breakpoint goes after the last history item, so the next step (which only appends items) reads the
+		whole prefix up to that point from the cache.
+		"""
+		blocks = self._get_history_blocks()
+		if not blocks:
+			return [ContentPartTextParam(text='<agent_history>\n</agent_history>\n\n')]
+
+		parts = [
+			ContentPartTextParam(text=('<agent_history>\n' if i == 0 else '\n') + block, cache=i == len(blocks) - 1)
+			for i, block in enumerate(blocks)
+		]
+		parts.append(ContentPartTextParam(text='\n</agent_history>\n\n'))
+		return parts
 
 	def add_new_task(self, new_task: str) -> None:
 		new_task = '<follow_up_user_request> ' + new_task.strip() + ' </follow_up_user_request>'
@@ -276,7 +304,7 @@ class MessageManager:
 		sensitive_data=None,
 		available_file_paths: list[str] | None = None,  # Always pass current available_file_paths
 	) -> None:
-		"""Create single state message with all content"""
+		"""Create the state message for this step, led by the agent history"""
 
 		# Clear contextual messages from previous steps to prevent accumulation
 		self.state.history.context_messages.clear()
@@ -291,17 +319,15 @@ class MessageManager:
 			self.sensitive_data = effective_sensitive_data
 			self.sensitive_data_description = self._get_sensitive_data_description(browser_state_summary.url)
 
-		# Use only the current screenshot
+		# Use only the current screenshot, base64 is only built when it is sent to the LLM
 		screenshots = []
-		if browser_state_summary.screenshot:
-			screenshots.append(browser_state_summary.screenshot)
+		if use_vision and browser_state_summary.screenshot_data:
+			screenshots.append(browser_state_summary.screenshot_data.b64)
 
-		# Create single state message with all content
 		assert browser_state_summary
 		state_message = AgentMessagePrompt(
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
-			agent_history_description=self.agent_history_description,
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -313,9 +339,16 @@ class MessageManager:
 			vision_detail_level=self.vision_detail_level,
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
+			dom_serialization_priority=self.dom_serialization_priority,
 		).get_user_message(use_vision)
 
-		# Set the state message with caching enabled
+		# The history only grows between steps, so it leads the state message and everything that changes every step
+		# comes after it. Keeping both in one user message avoids consecutive user turns, which some providers reject.
+		state_content = state_message.content
+		if isinstance(state_content, str):
+			state_content = [ContentPartTextParam(text=state_content)]
+		state_message.content = [*self._create_history_parts(), *state_content]
+
 		self._set_message_with_type(state_message, 'state')
 
 	def _log_history_lines(self) -> str:
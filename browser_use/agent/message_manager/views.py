@@ -74,7 +74,11 @@ class MessageHistory(BaseModel):
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	def get_messages(self) -> list[BaseMessage]:
-		"""Get all messages in the correct order: system -> state -> contextual"""
+		"""Get all messages in the correct order: system -> state -> contextual
+
+		The state message starts with the agent history, so the prompt prefix stays the same between steps and can be
+		served from the provider's prompt cache.
+		"""
 		messages = []
 		if self.system_message:
 			messages.append(self.system_message)
@@ -4,11 +4,12 @@ from typing import TYPE_CHECKING, Literal, Optional
 
 from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
 from browser_use.observability import observe_debug
-from browser_use.utils import is_new_tab_page
+from browser_use.utils import get_image_media_type, is_new_tab_page
 
 if TYPE_CHECKING:
 	from browser_use.agent.views import AgentStepInfo
 	from browser_use.browser.views import BrowserStateSummary
+	from browser_use.dom.views import DOMSerializationPriority
 	from browser_use.filesystem.file_system import FileSystem
 
 
@@ -88,6 +89,7 @@ class AgentMessagePrompt:
 		step_info: Optional['AgentStepInfo'] = None,
 		page_filtered_actions: str | None = None,
 		max_clickable_elements_length: int = 40000,
+		dom_serialization_priority: 'DOMSerializationPriority' = 'document',
 		sensitive_data: str | None = None,
 		available_file_paths: list[str] | None = None,
 		screenshots: list[str] | None = None,
@@ -104,6 +106,7 @@ class AgentMessagePrompt:
 		self.step_info = step_info
 		self.page_filtered_actions: str | None = page_filtered_actions
 		self.max_clickable_elements_length: int = max_clickable_elements_length
+		self.dom_serialization_priority: 'DOMSerializationPriority' = dom_serialization_priority
 		self.sensitive_data: str | None = sensitive_data
 		self.available_file_paths: list[str] | None = available_file_paths
 		self.screenshots = screenshots or []
@@ -114,13 +117,12 @@ class AgentMessagePrompt:
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='_get_browser_state_description')
 	def _get_browser_state_description(self) -> str:
-		elements_text = self.browser_state.dom_state.llm_representation(include_attributes=self.include_attributes)
-
-		if len(elements_text) > self.max_clickable_elements_length:
-			elements_text = elements_text[: self.max_clickable_elements_length]
-			truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)'
-		else:
-			truncated_text = ''
+		elements_text, truncated = self.browser_state.dom_state.llm_representation_with_budget(
+			self.max_clickable_elements_length,
+			include_attributes=self.include_attributes,
+			priority=self.dom_serialization_priority,
+		)
+		truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)' if truncated else ''
 
 		has_content_above = (self.browser_state.pixels_above or 0) > 0
 		has_content_below = (self.browser_state.pixels_below or 0) > 0
@@ -237,7 +239,11 @@ Available tabs:
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
 	def get_user_message(self, use_vision: bool = True) -> UserMessage:
-		"""Get complete state as a single cached message"""
+		"""Get the complete state as a single message
+
+		The agent history is only included when it was passed in, the MessageManager puts it in front of this message's
+		content as separate parts so it can be cached between steps.
+		"""
 		# Don't pass screenshot to model if page is a new tab page, step is 0, and there's only one tab
 		if (
 			is_new_tab_page(self.browser_state.url)
@@ -248,11 +254,9 @@ Available tabs:
 			use_vision = False
 
 		# Build complete state description
-		state_description = (
-			'<agent_history>\n'
-			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
-			+ '\n</agent_history>\n\n'
-		)
+		state_description = ''
+		if self.agent_history_description is not None:
+			state_description += '<agent_history>\n' + self.agent_history_description.strip('\n') + '\n</agent_history>\n\n'
 		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
 		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
 		# Only add read_state if it has content
@@ -284,16 +288,17 @@ Available tabs:
 				content_parts.append(ContentPartTextParam(text=label))
 
 				# Add the screenshot
+				media_type = get_image_media_type(screenshot)
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{screenshot}',
-							media_type='image/png',
+							url=f'data:{media_type};base64,{screenshot}',
+							media_type=media_type,
 							detail=self.vision_detail_level,
 						),
 					)
 				)
 
-			return UserMessage(content=content_parts, cache=True)
+			return UserMessage(content=content_parts)
 
-		return UserMessage(content=state_description, cache=True)
+		return UserMessage(content=state_description)
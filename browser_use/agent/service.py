@@ -3,13 +3,14 @@ import gc
 import inspect
 import json
 import logging
+import os
 import re
 import tempfile
 import time
 from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Generic, Literal, TypeVar
+from typing import Any, Generic, Literal, TypeVar, get_args
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
@@ -23,8 +24,10 @@ from browser_use.agent.cloud_events import (
 )
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
 from browser_use.llm.openai.chat import ChatOpenAI
+from browser_use.llm.streaming import JSONArrayStreamParser
 from browser_use.tokens.service import TokenCost
 
 load_dotenv()
@@ -57,7 +60,7 @@ from browser_use.agent.views import (
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
-from browser_use.dom.views import DOMInteractedElement
+from browser_use.dom.views import DOMInteractedElement, DOMSerializationPriority, EnhancedDOMTreeNode
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
 from browser_use.sync import CloudSync
@@ -122,6 +125,9 @@ Context = TypeVar('Context')
 
 AgentHookFunc = Callable[['Agent'], Awaitable[None]]
 
+# How many likely action targets get their node handles resolved while the LLM is thinking (pipeline_steps)
+PREFETCH_NODE_HANDLES = 10
+
 
 class Agent(Generic[Context, AgentStructuredOutput]):
 	@time_execution_sync('--init')
@@ -161,9 +167,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		generate_gif: bool | str = False,
 		available_file_paths: list[str] | None = None,
 		include_attributes: list[str] | None = None,
+		dom_serialization_priority: DOMSerializationPriority = 'document',
 		max_actions_per_step: int = 10,
 		use_thinking: bool = True,
 		flash_mode: bool = False,
+		stream_actions: bool = False,
+		pipeline_steps: bool = False,
 		max_history_items: int | None = None,
 		page_extraction_llm: BaseChatModel | None = None,
 		injected_agent_state: AgentState | None = None,
@@ -257,9 +266,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			extend_system_message=extend_system_message,
 			generate_gif=generate_gif,
 			include_attributes=include_attributes,
+			dom_serialization_priority=dom_serialization_priority,
 			max_actions_per_step=max_actions_per_step,
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
+			stream_actions=stream_actions,
+			pipeline_steps=pipeline_steps,
 			max_history_items=max_history_items,
 			page_extraction_llm=page_extraction_llm,
 			calculate_cost=calculate_cost,
@@ -292,6 +304,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._set_screenshot_service()
 
 		# Action setup
+		self._agent_output_models: dict[type[ActionModel], type[AgentOutput]] = {}
 		self._setup_action_models()
 		self._set_browser_use_version_and_source(source)
 
@@ -354,6 +367,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_tool_call_examples=self.settings.include_tool_call_examples,
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
+			dom_serialization_priority=self.settings.dom_serialization_priority,
 		)
 
 		if self.sensitive_data:
@@ -440,6 +454,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._external_pause_event = asyncio.Event()
 		self._external_pause_event.set()
 
+		# Whether this agent keeps the shared LLM HTTP clients open, until close()
+		self._retains_http_clients = False
+
+		# First action of the step, started while the model output was still streaming (stream_actions)
+		self._first_action_task: asyncio.Task[ActionResult] | None = None
+
+		# Work done ahead of time when pipelining steps: the next browser state, built while the previous step is
+		# finalized, and the node handles of likely action targets, resolved while the LLM is thinking
+		self._state_prefetch: asyncio.Task[BrowserStateSummary] | None = None
+		self._node_handle_prefetch: asyncio.Task[int] | None = None
+
 	@property
 	def logger(self) -> logging.Logger:
 		"""Get instance-specific logger with task ID in the name"""
@@ -580,21 +605,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initially only include actions with no filters
 		self.ActionModel = self.tools.registry.create_action_model()
 		# Create output model with the dynamic actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_model(self.ActionModel)
 
 		# used to force the done action when max_steps is reached
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'])
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_model(self.DoneActionModel)
+
+	def _get_agent_output_model(self, action_model: type[ActionModel]) -> type[AgentOutput]:
+		"""Output model for the given action model, created once per action model so its JSON schema stays cached"""
+		output_model = self._agent_output_models.get(action_model)
+		if output_model is None:
+			if self.settings.flash_mode:
+				output_model = AgentOutput.type_with_custom_actions_flash_mode(action_model)
+			elif self.settings.use_thinking:
+				output_model = AgentOutput.type_with_custom_actions(action_model)
+			else:
+				output_model = AgentOutput.type_with_custom_actions_no_thinking(action_model)
+			self._agent_output_models[action_model] = output_model
+		return output_model
 
 	def add_new_task(self, new_task: str) -> None:
 		"""Add a new task to the agent, keeping the same task_id as tasks are continuous"""
@@ -644,11 +672,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Phase 3: Post-processing
 			await self._post_process()
 
+			# Build the next browser state while this step is finalized
+			if self.settings.pipeline_steps and self._has_next_step(step_info):
+				self._start_state_prefetch()
+
 		except Exception as e:
 			# Handle ALL exceptions in one place
 			await self._handle_step_error(e)
 
 		finally:
+			# a first action that was started while streaming but never reached multi_act (the step failed before)
+			await self._finish_first_action()
+			await self._stop_node_handle_prefetch()
+			if self.browser_session:
+				# free the element handles the actions of this step resolved
+				await self.browser_session.release_node_handles()
 			await self._finalize(browser_state_summary)
 
 	async def _prepare_context(self, step_info: AgentStepInfo | None = None) -> BrowserStateSummary:
@@ -658,15 +696,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 
 		self.logger.debug(f'🌐 Step {self.state.n_steps}: Getting browser state...')
-		# Always take screenshots for all steps
-		self.logger.debug('📸 Requesting browser state with include_screenshot=True')
-		browser_state_summary = await self.browser_session.get_browser_state_summary(
-			cache_clickable_elements_hashes=True,
-			include_screenshot=True,  # always capture even if use_vision=False so that cloud sync is useful (it's fast now anyway)
-			include_recent_events=self.include_recent_events,
-		)
-		if browser_state_summary.screenshot:
-			self.logger.debug(f'📸 Got browser state WITH screenshot, length: {len(browser_state_summary.screenshot)}')
+		browser_state_summary = await self._take_state_prefetch()
+		if browser_state_summary is not None:
+			self.logger.debug('📸 Using browser state prefetched at the end of the previous step')
+		else:
+			# Always take screenshots for all steps
+			self.logger.debug('📸 Requesting browser state with include_screenshot=True')
+			browser_state_summary = await self._request_browser_state()
+		if browser_state_summary.screenshot_data:
+			self.logger.debug(f'📸 Got browser state WITH screenshot: {browser_state_summary.screenshot_data!r}')
 		else:
 			self.logger.debug('📸 Got browser state WITHOUT screenshot')
 
@@ -700,6 +738,68 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		await self._force_done_after_failure()
 		return browser_state_summary
 
+	async def _request_browser_state(self) -> BrowserStateSummary:
+		"""Get the browser state for the next LLM call"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		return await self.browser_session.get_browser_state_summary(
+			cache_clickable_elements_hashes=True,
+			include_screenshot=True,  # always capture even if use_vision=False so that cloud sync is useful (it's fast now anyway)
+			include_recent_events=self.include_recent_events,
+		)
+
+	def _has_next_step(self, step_info: AgentStepInfo | None) -> bool:
+		"""Whether another step will follow this one, as far as the step itself can tell"""
+		if step_info and step_info.is_last_step():
+			return False
+		return not (self.state.last_result and self.state.last_result[-1].is_done)
+
+	def _start_state_prefetch(self) -> None:
+		"""Start building the browser state of the next step, while history, telemetry and events of this one are handled"""
+		self._state_prefetch = asyncio.create_task(self._request_browser_state())
+
+	async def _take_state_prefetch(self) -> BrowserStateSummary | None:
+		"""The prefetched browser state, or None if there is none or it failed"""
+		task, self._state_prefetch = self._state_prefetch, None
+		if task is None:
+			return None
+		try:
+			return await task
+		except Exception as e:
+			self.logger.debug(f'Prefetching the browser state failed, requesting it again: {type(e).__name__}: {e}')
+			return None
+
+	async def _discard_state_prefetch(self) -> None:
+		"""Drop the prefetched browser state, when the page may have changed since (hooks, pause, close)"""
+		task, self._state_prefetch = self._state_prefetch, None
+		if task is not None:
+			# let the request finish, the browser handles the state requests one after another anyway
+			await asyncio.gather(task, return_exceptions=True)
+
+	def _likely_action_targets(self, browser_state_summary: BrowserStateSummary) -> list[EnhancedDOMTreeNode]:
+		"""The interactive elements the next actions most likely use: the ones in the viewport, in page order"""
+		selector_map = browser_state_summary.dom_state.selector_map
+		nodes = [selector_map[index] for index in sorted(selector_map)]
+		page_info = browser_state_summary.page_info
+		if page_info:
+			top, bottom = page_info.scroll_y, page_info.scroll_y + page_info.viewport_height
+			in_viewport = [
+				node
+				for node in nodes
+				if node.absolute_position
+				and node.absolute_position.y < bottom
+				and node.absolute_position.y + node.absolute_position.height > top
+			]
+			nodes = in_viewport or nodes
+		return nodes[:PREFETCH_NODE_HANDLES]
+
+	async def _stop_node_handle_prefetch(self) -> None:
+		"""Stop resolving node handles ahead of time, once the actions ran they are of no use anymore"""
+		task, self._node_handle_prefetch = self._node_handle_prefetch, None
+		if task is not None and not task.done():
+			task.cancel()
+		if task is not None:
+			await asyncio.gather(task, return_exceptions=True)
+
 	@observe_debug(ignore_input=True, name='get_next_action')
 	async def _get_next_action(self, browser_state_summary: BrowserStateSummary) -> None:
 		"""Execute LLM interaction with retry logic and handle callbacks"""
@@ -708,6 +808,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
 
+		# Warm up the CDP session and resolve the likely action targets while the LLM is thinking
+		if self.settings.pipeline_steps and self.browser_session:
+			self._node_handle_prefetch = asyncio.create_task(
+				self.browser_session.prefetch_node_handles(self._likely_action_targets(browser_state_summary))
+			)
+
 		try:
 			model_output = await asyncio.wait_for(
 				self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
@@ -742,7 +848,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			raise ValueError('No model output to execute actions from')
 
 		self.logger.debug(f'⚡ Step {self.state.n_steps}: Executing {len(self.state.last_model_output.action)} actions...')
-		result = await self.multi_act(self.state.last_model_output.action)
+		first_action, self._first_action_task = self._first_action_task, None
+		result = await self.multi_act(self.state.last_model_output.action, first_action=first_action)
 		self.logger.debug(f'✅ Step {self.state.n_steps}: Actions completed')
 
 		self.state.last_result = result
@@ -957,11 +1064,13 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Store screenshot and get path
 		screenshot_path = None
-		if browser_state_summary.screenshot:
+		if browser_state_summary.screenshot_data:
 			self.logger.debug(
-				f'📸 Storing screenshot for step {self.state.n_steps}, screenshot length: {len(browser_state_summary.screenshot)}'
+				f'📸 Storing screenshot for step {self.state.n_steps}, screenshot: {browser_state_summary.screenshot_data!r}'
+			)
+			screenshot_path = await self.screenshot_service.store_screenshot(
+				browser_state_summary.screenshot_data, self.state.n_steps
 			)
-			screenshot_path = await self.screenshot_service.store_screenshot(browser_state_summary.screenshot, self.state.n_steps)
 			self.logger.debug(f'📸 Screenshot stored at: {screenshot_path}')
 		else:
 			self.logger.debug(f'📸 No screenshot in browser_state_summary for step {self.state.n_steps}')
@@ -1152,8 +1261,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		urls_replaced = self._process_messsages_and_replace_long_urls_shorter_ones(input_messages)
 
 		try:
-			response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
-			parsed = response.completion
+			if self.settings.stream_actions:
+				parsed = await self._stream_model_output(input_messages, urls_replaced)
+			else:
+				response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
+				parsed = response.completion
 
 			# Replace any shortened URLs in the LLM response back to original URLs
 			if urls_replaced:
@@ -1172,6 +1284,58 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Just re-raise - Pydantic's validation errors are already descriptive
 			raise
 
+	async def _stream_model_output(self, input_messages: list[BaseMessage], urls_replaced: dict[str, str]) -> AgentOutput:
+		"""Stream the model output, starting its first action as soon as that has been generated"""
+		output_model = self.AgentOutput
+		action_model = get_args(output_model.model_fields['action'].annotation)[0]
+		parser = JSONArrayStreamParser('action')
+		# the step callback sees the complete output before any of its actions run, it may reject them
+		first_action_seen = self.register_new_step_callback is not None
+
+		async for chunk in self.llm.astream(input_messages, output_format=output_model):
+			for element in parser.feed(chunk.completion):
+				if first_action_seen:
+					continue
+				first_action_seen = True
+				self._first_action_task = self._start_first_action(element, action_model, urls_replaced)
+
+		# if the output is invalid, step() still records the result of the first action that already ran
+		return output_model.model_validate_json(parser.text)
+
+	def _start_first_action(
+		self, element: str, action_model: type[ActionModel], urls_replaced: dict[str, str]
+	) -> asyncio.Task[ActionResult] | None:
+		"""Start executing the first action of a streamed model output, if it is a valid action"""
+		try:
+			action = action_model.model_validate_json(element)
+		except ValidationError:
+			# the complete output will fail validation as well, and is retried as usual
+			return None
+
+		if action.model_dump(exclude_unset=True) == {}:
+			return None
+
+		if urls_replaced:
+			self._recursive_process_all_strings_inside_pydantic_model(action, urls_replaced)
+
+		self.logger.debug(f'⚡ Step {self.state.n_steps}: Starting first action while the model output is still streaming')
+		return asyncio.create_task(self._execute_action(action, 0, None))
+
+	async def _finish_first_action(self) -> None:
+		"""Wait for a first action that was started while streaming but whose step failed, it can not be undone
+
+		Its result goes in front of the step's error, so the history and the next prompt show what the action did.
+		"""
+		task, self._first_action_task = self._first_action_task, None
+		if task is None:
+			return
+		try:
+			result = await task
+		except Exception as e:
+			result = ActionResult(error=AgentError.format_error(e))
+		self.logger.warning('⚠️ The first action was executed, but the rest of the step failed')
+		self.state.last_result = [result, *(self.state.last_result or [])]
+
 	def _log_agent_run(self) -> None:
 		"""Log the agent run"""
 		# Blue color for task
@@ -1405,6 +1569,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		try:
 			self._log_agent_run()
 
+			if not self._retains_http_clients:
+				http_clients.retain()
+				self._retains_http_clients = True
+
 			self.logger.debug(
 				f'🔧 Agent setup: Agent Session ID {self.session_id[-4:]}, Task ID {self.task_id[-4:]}, Browser Session ID {self.browser_session.id[-4:] if self.browser_session else "None"} {"(connecting via CDP)" if (self.browser_session and self.browser_session.cdp_url) else "(launching local browser)"}'
 			)
@@ -1458,6 +1626,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					self.logger.debug(f'⏸️ Step {step}: Agent paused, waiting to resume...')
 					await self._external_pause_event.wait()
 					signal_handler.reset()
+					# the page may have been changed by hand while paused
+					await self._discard_state_prefetch()
 
 				# Check if we should stop due to too many failures, if final_response_after_failure is True, we try one last time
 				if (self.state.consecutive_failures) >= self.settings.max_failures + int(
@@ -1475,6 +1645,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				if on_step_start is not None:
 					await on_step_start(self)
+					# the hook may have changed the page
+					await self._discard_state_prefetch()
 
 				self.logger.debug(f'🚶 Starting step {step + 1}/{max_steps}...')
 				step_info = AgentStepInfo(step_number=step, max_steps=max_steps)
@@ -1494,6 +1666,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				if on_step_end is not None:
 					await on_step_end(self)
+					# the hook may have changed the page
+					await self._discard_state_prefetch()
 
 				if self.history.is_done():
 					self.logger.debug(f'🎯 Task completed after {step + 1} steps!')
@@ -1583,7 +1757,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				# Lazy import gif module to avoid heavy startup cost
 				from browser_use.agent.gif import create_history_gif
 
-				create_history_gif(task=self.task, history=self.history, output_path=output_path)
+				# rendering and encoding take a while on long runs, keep the event loop responsive meanwhile
+				# render workers are only started by default where they can be forked, not from the agent's threads
+				await asyncio.to_thread(
+					create_history_gif,
+					task=self.task,
+					history=self.history,
+					output_path=output_path,
+					workers=min(4, os.cpu_count() or 1),
+				)
 
 				# Only emit output file event if GIF was actually created
 				if Path(output_path).exists():
@@ -1613,10 +1795,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self,
 		actions: list[ActionModel],
 		check_for_new_elements: bool = True,
+		first_action: asyncio.Task[ActionResult] | None = None,
 	) -> list[ActionResult]:
-		"""Execute multiple actions"""
+		"""Execute multiple actions, `first_action` is the already started execution of the first one (stream_actions)"""
 		results: list[ActionResult] = []
-		time_elapsed = 0
 		total_actions = len(actions)
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
@@ -1701,58 +1883,68 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					)
 					break
 
-			# wait between actions (only after first action)
+			# wait between actions (only after first action), until the previous one's requests settled
 			if i > 0:
-				await asyncio.sleep(self.browser_profile.wait_between_actions)
+				await self.browser_session.wait_for_network_idle(timeout=self.browser_profile.wait_between_actions)
 
-			red = '\033[91m'
-			green = '\033[92m'
-			cyan = '\033[96m'
-			blue = '\033[34m'
-			reset = '\033[0m'
+			if i == 0 and first_action is not None:
+				result = await first_action
+			else:
+				result = await self._execute_action(action, i, total_actions)
+			results.append(result)
 
-			try:
-				await self._raise_if_stopped_or_paused()
-				# Get action name from the action model
-				action_data = action.model_dump(exclude_unset=True)
-				action_name = next(iter(action_data.keys())) if action_data else 'unknown'
-				action_params = getattr(action, action_name, '') or str(action.model_dump(mode='json'))[:140].replace(
-					'"', ''
-				).replace('{', '').replace('}', '').replace("'", '').strip().strip(',')
-				# Ensure action_params is always a string before checking length
-				action_params = str(action_params)
-				action_params = f'{action_params[:122]}...' if len(action_params) > 128 else action_params
-				time_start = time.time()
-				self.logger.info(f'  🦾 {blue}[ACTION {i + 1}/{total_actions}]{reset} {action_params}')
-
-				result = await self.tools.act(
-					action=action,
-					browser_session=self.browser_session,
-					file_system=self.file_system,
-					page_extraction_llm=self.settings.page_extraction_llm,
-					sensitive_data=self.sensitive_data,
-					available_file_paths=self.available_file_paths,
-				)
+			if results[-1].is_done or results[-1].error or i == total_actions - 1:
+				break
 
-				time_end = time.time()
-				time_elapsed = time_end - time_start
-				results.append(result)
+		return results
 
-				self.logger.debug(
-					f'☑️ Executed action {i + 1}/{total_actions}: {green}{action_params}{reset} in {time_elapsed:.2f}s'
-				)
+	async def _execute_action(self, action: ActionModel, index: int, total_actions: int | None) -> ActionResult:
+		"""Execute a single action of the model output"""
+		red = '\033[91m'
+		green = '\033[92m'
+		blue = '\033[34m'
+		reset = '\033[0m'
 
-				if results[-1].is_done or results[-1].error or i == total_actions - 1:
-					break
+		# the total is not known yet for an action started while the model output is still streaming
+		position = f'{index + 1}/{total_actions}' if total_actions is not None else f'{index + 1}'
+		time_elapsed = 0
+		action_params = ''
 
-			except Exception as e:
-				# Handle any exceptions during action execution
-				self.logger.error(
-					f'❌ Executing action {i + 1} failed in {time_elapsed:.2f}s {red}({action_params}) -> {type(e).__name__}: {e}{reset}'
-				)
-				raise e
+		try:
+			await self._raise_if_stopped_or_paused()
+			# Get action name from the action model
+			action_data = action.model_dump(exclude_unset=True)
+			action_name = next(iter(action_data.keys())) if action_data else 'unknown'
+			action_params = getattr(action, action_name, '') or str(action.model_dump(mode='json'))[:140].replace(
+				'"', ''
+			).replace('{', '').replace('}', '').replace("'", '').strip().strip(',')
+			# Ensure action_params is always a string before checking length
+			action_params = str(action_params)
+			action_params = f'{action_params[:122]}...' if len(action_params) > 128 else action_params
+			time_start = time.time()
+			self.logger.info(f'  🦾 {blue}[ACTION {position}]{reset} {action_params}')
+
+			result = await self.tools.act(
+				action=action,
+				browser_session=self.browser_session,
+				file_system=self.file_system,
+				page_extraction_llm=self.settings.page_extraction_llm,
+				sensitive_data=self.sensitive_data,
+				available_file_paths=self.available_file_paths,
+			)
 
-		return results
+			time_end = time.time()
+			time_elapsed = time_end - time_start
+
+			self.logger.debug(f'☑️ Executed action {position}: {green}{action_params}{reset} in {time_elapsed:.2f}s')
+			return result
+
+		except Exception as e:
+			# Handle any exceptions during action execution
+			self.logger.error(
+				f'❌ Executing action {index + 1} failed in {time_elapsed:.2f}s {red}({action_params}) -> {type(e).__name__}: {e}{reset}'
+			)
+			raise e
 
 	async def log_completion(self) -> None:
 		"""Log the completion of the task"""
@@ -1976,6 +2168,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def close(self):
 		"""Close all resources"""
 		try:
+			# A browser state prefetched for a step that never came
+			await self._discard_state_prefetch()
+
 			# Only close browser if keep_alive is False (or not set)
 			if self.browser_session is not None:
 				if not self.browser_session.browser_profile.keep_alive:
@@ -1983,6 +2178,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					# stops the EventBus with clear=True, and recreates a fresh EventBus
 					await self.browser_session.kill()
 
+			# Close the shared LLM connection pools once the last agent of this event loop is done
+			if self._retains_http_clients:
+				self._retains_http_clients = False
+				await http_clients.release()
+
 			# Force garbage collection
 			gc.collect()
 
@@ -2008,24 +2208,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	async def _update_action_models_for_page(self, page_url: str) -> None:
 		"""Update action models with page-specific actions"""
-		# Create new action model with current page's filtered actions
+		# Create new action model with current page's filtered actions, the registry reuses the model if they didn't change
 		self.ActionModel = self.tools.registry.create_action_model(page_url=page_url)
 		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_model(self.ActionModel)
 
 		# Update done action model too
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_model(self.DoneActionModel)
 
 	def get_trace_object(self) -> dict[str, Any]:
 		"""Get the trace and trace_details objects for the agent"""
@@ -13,7 +13,7 @@ from uuid_extensions import uuid7str
 
 from browser_use.agent.message_manager.views import MessageManagerState
 from browser_use.browser.views import BrowserStateHistory
-from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES, DOMInteractedElement, DOMSelectorMap
+from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES, DOMInteractedElement, DOMSelectorMap, DOMSerializationPriority
 
 # from browser_use.dom.history_tree_processor.service import (
 # 	DOMElementNode,
@@ -39,9 +39,12 @@ class AgentSettings(BaseModel):
 	override_system_message: str | None = None
 	extend_system_message: str | None = None
 	include_attributes: list[str] | None = DEFAULT_INCLUDE_ATTRIBUTES
+	dom_serialization_priority: DOMSerializationPriority = 'document'  # Which elements to keep when the page text is truncated
 	max_actions_per_step: int = 4
 	use_thinking: bool = True
 	flash_mode: bool = False  # If enabled, disables evaluation_previous_goal and next_goal, and sets use_thinking = False
+	stream_actions: bool = False  # If enabled, stream the LLM output and start the first action as soon as it is complete
+	pipeline_steps: bool = False  # If enabled, prefetch the next browser state and likely action targets ahead of time
 	max_history_items: int | None = None
 
 	page_extraction_llm: BaseChatModel | None = None
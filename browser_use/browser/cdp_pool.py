@@ -0,0 +1,144 @@
+"""Connection pool that multiplexes flattened CDP target sessions over a bounded number of WebSockets."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from cdp_use import CDPClient
+
+logger = logging.getLogger(__name__)
+
+
+class PooledCDPClient(CDPClient):
+	"""CDPClient shared by several target sessions, with a limit on concurrently in-flight requests."""
+
+	def __init__(self, url: str, max_in_flight: int, additional_headers: dict[str, str] | None = None):
+		super().__init__(url, additional_headers=additional_headers)
+		self.max_in_flight = max_in_flight
+		self.session_ids: set[str] = set()
+		self.pending_sessions = 0
+		self.in_flight = 0
+		self._in_flight_slots = asyncio.Semaphore(max_in_flight)
+
+	@property
+	def load(self) -> int:
+		return len(self.session_ids) + self.pending_sessions
+
+	@property
+	def is_alive(self) -> bool:
+		return self.ws is not None and self._message_handler_task is not None and not self._message_handler_task.done()
+
+	async def send_raw(self, method: str, params: Any | None = None, session_id: str | None = None) -> dict[str, Any]:
+		# CDP event handlers run inside the message loop, if one of them sends a command while all slots are taken
+		# waiting for it to dispatch their responses we'd deadlock, so those requests skip the limit
+		if self._in_flight_slots.locked() and asyncio.current_task() is self._message_handler_task:
+			return await super().send_raw(method, params, session_id)
+
+		async with self._in_flight_slots:
+			self.in_flight += 1
+			try:
+				return await super().send_raw(method, params, session_id)
+			finally:
+				self.in_flight -= 1
+
+
+class CDPConnectionPool:
+	"""
+	Hands out shared CDP clients for target sessions.
+
+	A new WebSocket is only opened while there are fewer than `max_sockets` and every open one already carries
+	a session, otherwise the least loaded socket is reused. Sessions are attached with `flatten=True`, so any
+	number of them can share one connection.
+	"""
+
+	def __init__(
+		self,
+		cdp_url: str,
+		max_sockets: int,
+		max_in_flight_per_socket: int = 64,
+		headers: dict[str, str] | None = None,
+	):
+		assert max_sockets >= 1, 'max_sockets must be at least 1'
+		self.cdp_url = cdp_url
+		self.max_sockets = max_sockets
+		self.max_in_flight_per_socket = max_in_flight_per_socket
+		self.headers = headers
+		self.clients: list[PooledCDPClient] = []
+		self.sockets_opened_total = 0
+		self._lock = asyncio.Lock()
+
+	async def acquire(self) -> PooledCDPClient:
+		"""Reserve a client for a new session, must be followed by `register_session` or `cancel`."""
+		async with self._lock:
+			self.clients = [client for client in self.clients if client.is_alive]
+
+			if len(self.clients) < self.max_sockets and all(client.load for client in self.clients):
+				client = PooledCDPClient(self.cdp_url, self.max_in_flight_per_socket, additional_headers=self.headers)
+				await client.start()
+				self.clients.append(client)
+				self.sockets_opened_total += 1
+				logger.debug(f'🔌 Opened pooled CDP WebSocket {len(self.clients)}/{self.max_sockets}')
+			else:
+				client = min(self.clients, key=lambda client: (client.load, client.in_flight))
+
+			client.pending_sessions += 1
+			return client
+
+	@staticmethod
+	def register_session(client: PooledCDPClient, session_id: str) -> None:
+		client.pending_sessions -= 1
+		client.session_ids.add(session_id)
+
+	@staticmethod
+	def cancel(client: PooledCDPClient) -> None:
+		client.pending_sessions -= 1
+
+	async def release_session(self, client: PooledCDPClient, session_id: str) -> None:
+		"""Detach a session from its target, the shared socket stays open for other sessions."""
+		client.session_ids.discard(session_id)
+		if not client.is_alive:
+			return
+		try:
+			await client.send.Target.detachFromTarget(params={'sessionId': session_id})
+		except Exception:
+			pass  # target is already gone
+
+	@property
+	def session_count(self) -> int:
+		return sum(len(client.session_ids) for client in self.clients)
+
+	@property
+	def in_flight(self) -> int:
+		return sum(client.in_flight for client in self.clients)
+
+	async def close(self) -> None:
+		clients, self.clients = self.clients, []
+		for client in clients:
+			try:
+				await client.stop()
+			except Exception:
+				pass  # Ignore errors during cleanup
+
+
+class CDPAttachMetrics:
+	"""Keeps track of how long attaching CDP sessions to targets takes."""
+
+	__slots__ = ('count', 'total_seconds', 'max_seconds', 'last_seconds')
+
+	def __init__(self):
+		self.count = 0
+		self.total_seconds = 0.0
+		self.max_seconds = 0.0
+		self.last_seconds = 0.0
+
+	def record(self, started_at: float) -> None:
+		elapsed = time.perf_counter() - started_at
+		self.count += 1
+		self.total_seconds += elapsed
+		self.max_seconds = max(self.max_seconds, elapsed)
+		self.last_seconds = elapsed
+
+	@property
+	def average_seconds(self) -> float:
+		return self.total_seconds / self.count if self.count else 0.0
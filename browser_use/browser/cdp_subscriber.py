@@ -0,0 +1,30 @@
+"""Base class of the session caches that are kept current from CDP events."""
+
+import weakref
+from abc import ABC, abstractmethod
+
+from cdp_use import CDPClient
+
+
+class CDPEventSubscriber(ABC):
+	"""
+	Installs its CDP event handlers once per client. cdp_use keeps a single handler per event and client, so
+	registering twice would only replace the handler, and a pooled client is shared by the sessions of many targets.
+	"""
+
+	def __init__(self):
+		self._clients: weakref.WeakSet[CDPClient] = weakref.WeakSet()
+
+	def register(self, cdp_client: CDPClient) -> None:
+		"""Install the handlers on `cdp_client`, a no-op for clients that already have them."""
+		if cdp_client in self._clients:
+			return
+		self._register_handlers(cdp_client)
+		self._clients.add(cdp_client)
+
+	@abstractmethod
+	def _register_handlers(self, cdp_client: CDPClient) -> None: ...
+
+	def _forget_clients(self) -> None:
+		"""Install the handlers again on the next `register()`, for clients kept across a `clear()`."""
+		self._clients = weakref.WeakSet()
@@ -0,0 +1,99 @@
+"""Watches a directory for files being written to it, using inotify on Linux."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import functools
+import os
+import struct
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+# from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+# struct inotify_event: wd, mask, cookie, len, followed by len bytes of nul-padded file name
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+@functools.cache
+def _load_libc() -> ctypes.CDLL | None:
+	if sys.platform != 'linux':
+		return None
+	try:
+		libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+	except OSError:
+		return None
+	return libc if hasattr(libc, 'inotify_init1') else None
+
+
+class DirectoryWatcher:
+	"""Calls `on_file(path)` for every file in `directory` that is closed after writing or moved into it.
+
+	Browsers write downloads to a temporary name and rename them when done, so both cover a finished download.
+	Runs on the event loop via `add_reader()`, without a thread. Only available on Linux, see `is_supported()`.
+	"""
+
+	def __init__(self, directory: str | Path, on_file: Callable[[Path], None]):
+		self.directory = Path(directory)
+		self.on_file = on_file
+		self._fd: int | None = None
+		self._loop: asyncio.AbstractEventLoop | None = None
+
+	@staticmethod
+	def is_supported() -> bool:
+		return _load_libc() is not None
+
+	@property
+	def is_running(self) -> bool:
+		return self._fd is not None
+
+	def start(self) -> None:
+		libc = _load_libc()
+		if libc is None:
+			raise OSError('inotify is not available on this platform')
+		if self._fd is not None:
+			return
+
+		fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if fd < 0:
+			errno = ctypes.get_errno()
+			raise OSError(errno, os.strerror(errno))
+		if libc.inotify_add_watch(fd, os.fsencode(self.directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+			errno = ctypes.get_errno()
+			os.close(fd)
+			raise OSError(errno, os.strerror(errno), str(self.directory))
+
+		self._loop = asyncio.get_running_loop()
+		self._loop.add_reader(fd, self._read_events)
+		self._fd = fd
+
+	def stop(self) -> None:
+		if self._fd is None:
+			return
+		if self._loop is not None and not self._loop.is_closed():
+			self._loop.remove_reader(self._fd)
+		os.close(self._fd)
+		self._fd = None
+		self._loop = None
+
+	def _read_events(self) -> None:
+		if self._fd is None:
+			return
+		try:
+			data = os.read(self._fd, 64 * 1024)
+		except BlockingIOError:
+			return
+
+		offset = 0
+		while offset + _EVENT_HEADER.size <= len(data):
+			_, _, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+			offset += _EVENT_HEADER.size
+			name = data[offset : offset + name_length].rstrip(b'\0')
+			offset += name_length
+			if name:
+				self.on_file(self.directory / os.fsdecode(name))
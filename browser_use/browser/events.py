@@ -175,10 +175,11 @@ class CloseTabEvent(BaseEvent[None]):
 
 
 class ScreenshotEvent(BaseEvent[str]):
-	"""Request to take a screenshot."""
+	"""Request to take a base64 screenshot, format, quality and size follow the BrowserProfile screenshot settings."""
 
 	full_page: bool = False
-	clip: dict[str, float] | None = None  # {x, y, width, height}
+	# {x, y, width, height} in CSS pixels of the viewport, overrides BrowserProfile.screenshot_clip
+	clip: dict[str, float] | None = None
 
 	event_timeout: float | None = _get_timeout('TIMEOUT_ScreenshotEvent', 8.0)  # seconds
 
@@ -530,6 +531,17 @@ class FileDownloadedEvent(BaseEvent):
 	event_timeout: float | None = _get_timeout('TIMEOUT_FileDownloadedEvent', 30.0)  # seconds
 
 
+class FileDownloadProgressEvent(BaseEvent):
+	"""A chunk of a file download has been written to disk."""
+
+	url: str
+	path: str
+	received_bytes: int
+	total_bytes: int | None = None  # None if the size is not known upfront
+
+	event_timeout: float | None = _get_timeout('TIMEOUT_FileDownloadProgressEvent', 5.0)  # seconds
+
+
 class AboutBlankDVDScreensaverShownEvent(BaseEvent):
 	"""AboutBlankWatchdog has shown DVD screensaver animation on an about:blank tab."""
 
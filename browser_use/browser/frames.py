@@ -0,0 +1,110 @@
+"""Cached frame hierarchy of all browser targets, kept current from CDP frame and target lifecycle events."""
+
+from typing import Any
+
+from cdp_use import CDPClient
+
+from browser_use.browser.cdp_subscriber import CDPEventSubscriber
+
+FrameHierarchy = tuple[dict[str, dict], dict[str, str]]
+"""(frame_id -> frame info, target_id -> session_id), as returned by `BrowserSession.get_all_frames()`."""
+
+
+class FrameRegistry(CDPEventSubscriber):
+	"""
+	Holds the last frame hierarchy built by `BrowserSession.get_all_frames()` until the frames of a target change.
+
+	Child frame navigations and detaches are applied to the cached hierarchy in place. Anything that needs data
+	only a full walk provides (new frames and their owner nodes, process swaps, top-level navigations, targets
+	attaching or detaching) drops the cache, and the next lookup rebuilds it. A rebuild that raced with such an
+	event is not stored.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._hierarchy: FrameHierarchy | None = None
+		self._focus_target_id: str | None = None
+		self._generation = 0
+
+	# --- setup -------------------------------------------------------------
+
+	def _register_handlers(self, cdp_client: CDPClient) -> None:
+		"""
+		Patch or drop the hierarchy on frame attach / detach / navigation and on targets attaching or detaching.
+
+		Code that installs its own Target.attachedToTarget handler afterwards has to forward to `on_attached_to_target()`.
+		"""
+		cdp_client.register.Page.frameAttached(self.on_frame_attached)  # type: ignore[arg-type]
+		cdp_client.register.Page.frameDetached(self.on_frame_detached)  # type: ignore[arg-type]
+		cdp_client.register.Page.frameNavigated(self.on_frame_navigated)  # type: ignore[arg-type]
+		cdp_client.register.Target.attachedToTarget(self.on_attached_to_target)  # type: ignore[arg-type]
+		cdp_client.register.Target.detachedFromTarget(self.on_detached_from_target)  # type: ignore[arg-type]
+
+	# --- cache -------------------------------------------------------------
+
+	@property
+	def generation(self) -> int:
+		"""Bumped on every invalidation, compare before and after a rebuild to detect races."""
+		return self._generation
+
+	def get(self, focus_target_id: str | None = None) -> FrameHierarchy | None:
+		"""The cached hierarchy, None if it has to be rebuilt (or was built while another target was focused)."""
+		if self._hierarchy is None or focus_target_id != self._focus_target_id:
+			return None
+		return self._hierarchy
+
+	def store(self, hierarchy: FrameHierarchy, generation: int, focus_target_id: str | None = None) -> None:
+		"""Cache a freshly built hierarchy, unless the frames changed since the build started at `generation`."""
+		if generation != self._generation:
+			return
+		self._hierarchy = hierarchy
+		self._focus_target_id = focus_target_id
+
+	def invalidate(self) -> None:
+		self._hierarchy = None
+		self._generation += 1
+
+	def clear(self) -> None:
+		self.invalidate()
+		self._forget_clients()
+
+	# --- CDP event handlers --------------------------------------------------
+
+	def on_frame_attached(self, event: Any, session_id: str | None = None) -> None:
+		# new frames need their owner node and cross-origin info, which only a full walk collects
+		self.invalidate()
+
+	def on_frame_detached(self, event: Any, session_id: str | None = None) -> None:
+		if self._hierarchy is None or event.get('reason') == 'swap':
+			# nothing to patch while a rebuild is in flight, or the frame moved to another process (= became an
+			# out-of-process iframe with its own target)
+			self.invalidate()
+			return
+
+		all_frames, _ = self._hierarchy
+		frame_info = all_frames.get(event['frameId'])
+		if frame_info is None:
+			return
+		parent_info = all_frames.get(frame_info.get('parentFrameId') or '')
+		if parent_info is not None and event['frameId'] in parent_info.get('childFrameIds', []):
+			parent_info['childFrameIds'].remove(event['frameId'])
+		stack = [event['frameId']]
+		while stack:
+			removed = all_frames.pop(stack.pop(), None)
+			if removed is not None:
+				stack.extend(removed.get('childFrameIds', []))
+
+	def on_frame_navigated(self, event: Any, session_id: str | None = None) -> None:
+		frame = event['frame']
+		frame_info = self._hierarchy[0].get(frame['id']) if self._hierarchy is not None else None
+		if frame_info is None or not frame.get('parentId'):
+			# top-level navigations replace the whole frame tree of a target and can change whether it is a valid target
+			self.invalidate()
+			return
+		frame_info.update(frame)
+
+	def on_attached_to_target(self, event: Any, session_id: str | None = None) -> None:
+		self.invalidate()
+
+	def on_detached_from_target(self, event: Any, session_id: str | None = None) -> None:
+		self.invalidate()
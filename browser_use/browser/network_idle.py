@@ -0,0 +1,196 @@
+"""Event-driven network idle detection, built on CDP Network.* request events and Page.lifecycleEvent."""
+
+import asyncio
+import time
+from typing import Any
+
+from cdp_use import CDPClient
+
+from browser_use.browser.cdp_subscriber import CDPEventSubscriber
+
+DEFAULT_QUIET_PERIOD = 0.1
+"""Seconds without network activity after which a page counts as idle."""
+
+LONG_RUNNING_REQUEST_SECONDS = 10.0
+"""Requests still pending after this long are treated as long-poll / streaming connections and no longer block idle."""
+
+IGNORED_RESOURCE_TYPES = frozenset({'WebSocket', 'EventSource', 'Ping', 'CSPViolationReport', 'Media'})
+"""Resource types that are long-lived or fire-and-forget, a page never waits on them to render."""
+
+IGNORED_URL_PATTERNS = (
+	# analytics / tracking / monitoring beacons
+	'google-analytics.com',
+	'googletagmanager.com',
+	'doubleclick.net',
+	'googlesyndication.com',
+	'connect.facebook.net',
+	'facebook.com/tr',
+	'hotjar.com',
+	'segment.io',
+	'segment.com/v1',
+	'mixpanel.com',
+	'amplitude.com',
+	'clarity.ms',
+	'fullstory.com',
+	'sentry.io',
+	'nr-data.net',
+	'datadoghq',
+	'bat.bing.com',
+	'analytics.tiktok.com',
+	'/collect?',
+	# long-poll / push transports
+	'longpoll',
+	'long-poll',
+	'/socket.io/',
+	'/sockjs/',
+	'/signalr/',
+	'/comet',
+)
+
+IGNORED_URL_SCHEMES = ('data:', 'blob:', 'chrome-extension:')
+
+BUSY_LIFECYCLE_EVENTS = frozenset({'init'})
+IDLE_LIFECYCLE_EVENTS = frozenset({'DOMContentLoaded', 'load', 'networkAlmostIdle', 'networkIdle'})
+
+
+def is_ignored_request(url: str, resource_type: str | None = None) -> bool:
+	"""Whether a request should not keep the page from counting as idle."""
+	if resource_type in IGNORED_RESOURCE_TYPES:
+		return True
+	if url.startswith(IGNORED_URL_SCHEMES):
+		return True
+	url = url.lower()
+	return any(pattern in url for pattern in IGNORED_URL_PATTERNS)
+
+
+class NetworkIdleTracker(CDPEventSubscriber):
+	"""
+	Keeps track of in-flight requests per CDP session so callers can wait for a page to go quiet.
+
+	Sessions are opted in with `track()` (after `Network.enable` + `Page.setLifecycleEventsEnabled`), events of
+	other sessions on the same client are ignored. A session is busy while its main frame is between the `init`
+	and `DOMContentLoaded` lifecycle events or while any non-ignored request is pending.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._target_ids: dict[str, str] = {}  # session_id -> target_id (= main frame id)
+		self._requests: dict[str, dict[str, float]] = {}  # session_id -> {request_id: started_at}
+		self._loading: set[str] = set()
+		self._last_activity: dict[str, float] = {}
+		self._activity = asyncio.Event()
+
+	# --- setup -------------------------------------------------------------
+
+	def _register_handlers(self, cdp_client: CDPClient) -> None:
+		"""Follow requests starting and finishing, and the main frame's lifecycle events, of the tracked sessions."""
+		cdp_client.register.Network.requestWillBeSent(self.on_request_will_be_sent)  # type: ignore[arg-type]
+		cdp_client.register.Network.loadingFinished(self.on_loading_finished)  # type: ignore[arg-type]
+		cdp_client.register.Network.loadingFailed(self.on_loading_failed)  # type: ignore[arg-type]
+		cdp_client.register.Page.lifecycleEvent(self.on_lifecycle_event)  # type: ignore[arg-type]
+
+	def track(self, session_id: str, target_id: str) -> None:
+		self._target_ids[session_id] = target_id
+		self._requests.setdefault(session_id, {})
+
+	def forget_target(self, target_id: str) -> None:
+		for session_id in [sid for sid, tid in self._target_ids.items() if tid == target_id]:
+			del self._target_ids[session_id]
+			self._requests.pop(session_id, None)
+			self._loading.discard(session_id)
+			self._last_activity.pop(session_id, None)
+
+	def is_tracking(self, session_id: str) -> bool:
+		return session_id in self._target_ids
+
+	# --- CDP event handlers --------------------------------------------------
+
+	def _touch(self, session_id: str) -> None:
+		self._last_activity[session_id] = time.monotonic()
+		activity, self._activity = self._activity, asyncio.Event()
+		activity.set()
+
+	def on_request_will_be_sent(self, event: Any, session_id: str | None = None) -> None:
+		if session_id not in self._target_ids:
+			return
+		requests = self._requests[session_id]
+		if is_ignored_request(event['request']['url'], event.get('type')):
+			# a redirect can turn a tracked request into an ignored one
+			if requests.pop(event['requestId'], None) is not None:
+				self._touch(session_id)
+			return
+		requests[event['requestId']] = time.monotonic()
+		self._touch(session_id)
+
+	def on_loading_finished(self, event: Any, session_id: str | None = None) -> None:
+		if session_id in self._target_ids and self._requests[session_id].pop(event['requestId'], None) is not None:
+			self._touch(session_id)
+
+	on_loading_failed = on_loading_finished
+
+	def on_lifecycle_event(self, event: Any, session_id: str | None = None) -> None:
+		if session_id not in self._target_ids or event['frameId'] != self._target_ids[session_id]:
+			return
+		name = event['name']
+		if name in BUSY_LIFECYCLE_EVENTS:
+			self._loading.add(session_id)
+		elif name in IDLE_LIFECYCLE_EVENTS:
+			self._loading.discard(session_id)
+			if name == 'networkIdle':
+				# chrome saw no requests for 500ms, anything we still hold lost its finished event
+				self._requests[session_id].clear()
+		else:
+			return
+		self._touch(session_id)
+
+	# --- queries -------------------------------------------------------------
+
+	def pending_requests(self, session_id: str, now: float | None = None) -> int:
+		"""Number of in-flight requests that keep the session busy."""
+		now = time.monotonic() if now is None else now
+		requests = self._requests.get(session_id, {})
+		return sum(1 for started_at in requests.values() if now - started_at < LONG_RUNNING_REQUEST_SECONDS)
+
+	def is_busy(self, session_id: str, now: float | None = None) -> bool:
+		return session_id in self._loading or self.pending_requests(session_id, now) > 0
+
+	async def wait_for_idle(self, session_id: str, timeout: float, quiet_period: float = DEFAULT_QUIET_PERIOD) -> bool:
+		"""
+		Wait until the session had no network activity for `quiet_period` seconds, at most `timeout` seconds.
+
+		The quiet period is counted from the later of the last activity and the start of the wait, which gives
+		requests kicked off by a just-dispatched action a moment to show up. Returns False if the timeout was hit.
+		"""
+		started_at = time.monotonic()
+		deadline = started_at + timeout
+
+		while True:
+			now = time.monotonic()
+			if self.is_busy(session_id, now):
+				# woken up by the next event, or when the oldest pending request turns into a long-running one
+				expiries = (
+					started + LONG_RUNNING_REQUEST_SECONDS - now for started in self._requests.get(session_id, {}).values()
+				)
+				wake_in = min((expiry for expiry in expiries if expiry > 0), default=deadline - now)
+			else:
+				quiet_for = now - max(self._last_activity.get(session_id, 0.0), started_at)
+				if quiet_for >= quiet_period:
+					return True
+				wake_in = quiet_period - quiet_for
+
+			remaining = deadline - now
+			if remaining <= 0:
+				return False
+
+			activity = self._activity
+			try:
+				await asyncio.wait_for(activity.wait(), timeout=max(0.0, min(wake_in, remaining)))
+			except TimeoutError:
+				pass
+
+	def clear(self) -> None:
+		self._target_ids.clear()
+		self._requests.clear()
+		self._loading.clear()
+		self._last_activity.clear()
+		self._forget_clients()
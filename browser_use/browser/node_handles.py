@@ -0,0 +1,88 @@
+"""RemoteObject handles of DOM nodes, resolved once per agent step and shared by the action handlers."""
+
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from cdp_use import CDPClient
+
+from browser_use.browser.cdp_subscriber import CDPEventSubscriber
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+logger = logging.getLogger(__name__)
+
+NODE_HANDLE_OBJECT_GROUP = 'browser_use_node_handles'
+"""Object group of all node handles, freed in bulk with Runtime.releaseObjectGroup."""
+
+
+class NodeHandle(NamedTuple):
+	"""A DOM node resolved to a RemoteObject, with the CDP session the object id is valid in."""
+
+	cdp_session: 'CDPSession'
+	object_id: str
+
+
+class NodeHandleCache(CDPEventSubscriber):
+	"""
+	Node handles keyed by (target_id, backend_node_id), so resolving an element for an action (session lookup plus
+	DOM.resolveNode) happens once per step instead of once per handler.
+
+	`invalidate()` drops the handles when the DOM tree is rebuilt, and the handles of a session are dropped as soon
+	as one of its execution contexts goes away (navigation, reload), since their object ids die with it. Dropped
+	handles stay alive in the browser until `release()` frees the whole object group of every session that got one,
+	at the end of the step.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._handles: dict[tuple[str, int], NodeHandle] = {}
+		self._unreleased_sessions: dict[str, 'CDPSession'] = {}
+
+	# --- setup -------------------------------------------------------------
+
+	def _register_handlers(self, cdp_client: CDPClient) -> None:
+		"""Drop a session's handles when one of its execution contexts is destroyed or all of them are cleared."""
+		cdp_client.register.Runtime.executionContextDestroyed(self.on_execution_context_gone)  # type: ignore[arg-type]
+		cdp_client.register.Runtime.executionContextsCleared(self.on_execution_context_gone)  # type: ignore[arg-type]
+
+	# --- cache -------------------------------------------------------------
+
+	def __len__(self) -> int:
+		return len(self._handles)
+
+	def get(self, target_id: str, backend_node_id: int) -> NodeHandle | None:
+		return self._handles.get((target_id, backend_node_id))
+
+	def store(self, target_id: str, backend_node_id: int, handle: NodeHandle) -> None:
+		self._handles[(target_id, backend_node_id)] = handle
+		self._unreleased_sessions[handle.cdp_session.session_id] = handle.cdp_session
+
+	def invalidate(self) -> None:
+		self._handles.clear()
+
+	def clear(self) -> None:
+		self.invalidate()
+		self._unreleased_sessions.clear()
+		self._forget_clients()
+
+	async def release(self) -> None:
+		"""Drop all handles and free them in the browser, one Runtime.releaseObjectGroup per session."""
+		self.invalidate()
+		sessions, self._unreleased_sessions = list(self._unreleased_sessions.values()), {}
+		for cdp_session in sessions:
+			try:
+				await cdp_session.cdp_client.send.Runtime.releaseObjectGroup(
+					params={'objectGroup': NODE_HANDLE_OBJECT_GROUP}, session_id=cdp_session.session_id
+				)
+			except Exception as e:
+				# the target is gone, and its objects with it
+				logger.debug(f'Failed to release node handles of session {cdp_session.session_id}: {type(e).__name__}: {e}')
+
+	# --- CDP event handlers --------------------------------------------------
+
+	def on_execution_context_gone(self, event: Any, session_id: str | None = None) -> None:
+		if not self._handles:
+			return
+		for key in [key for key, handle in self._handles.items() if handle.cdp_session.session_id == session_id]:
+			del self._handles[key]
@@ -186,6 +186,18 @@ class ViewportSize(BaseModel):
 		setattr(self, key, value)
 
 
+class ScreenshotClip(BaseModel):
+	"""Region of the viewport in CSS pixels, relative to its top left corner."""
+
+	x: float = Field(ge=0)
+	y: float = Field(ge=0)
+	width: float = Field(gt=0)
+	height: float = Field(gt=0)
+
+	def __getitem__(self, key: str) -> float:
+		return dict(self)[key]
+
+
 @cache
 def get_display_size() -> ViewportSize | None:
 	# macOS
@@ -285,6 +297,8 @@ BROWSERUSE_DEFAULT_CHANNEL = BrowserChannel.CHROMIUM
 UrlStr = Annotated[str, AfterValidator(validate_url)]
 NonNegativeFloat = Annotated[float, AfterValidator(lambda x: validate_float_range(x, 0, float('inf')))]
 CliArgStr = Annotated[str, AfterValidator(validate_cli_arg)]
+ScreenshotFormat = Literal['png', 'jpeg', 'webp']
+TypingStrategy = Literal['auto', 'insert_text', 'set_value', 'pipelined_keys', 'keystrokes']
 
 
 # ===== Base Models =====
@@ -590,6 +604,31 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True,
 		description='Enable cross-origin iframe support (OOPIF/Out-of-Process iframes). When False, only same-origin frames are processed to avoid complexity and hanging.',
 	)
+	max_iframes: int = Field(
+		default=3,
+		ge=1,
+		description='Maximum number of iframe documents processed per page, and of cross-origin iframes fetched per page.',
+	)
+	max_iframe_depth: int = Field(default=1, ge=0, description='How many levels of nested cross-origin iframes to follow.')
+	max_concurrent_iframe_fetches: int = Field(
+		default=3, ge=1, description='Maximum number of cross-origin iframe DOM trees fetched at the same time.'
+	)
+	iframe_fetch_timeout: float = Field(
+		default=5.0,
+		gt=0,
+		description='Time budget in seconds for fetching the cross-origin iframes of a page. Iframes that are not done by then are left out of the DOM tree.',
+	)
+
+	# --- CDP connection ---
+
+	cdp_pool_max_sockets: int | None = Field(
+		default=None,
+		ge=1,
+		description='Multiplex the CDP sessions of new targets (tabs, iframes) over at most this many shared WebSocket connections. None opens a dedicated connection per target.',
+	)
+	cdp_pool_max_in_flight: int = Field(
+		default=64, ge=1, description='Maximum number of concurrent CDP requests per pooled WebSocket connection.'
+	)
 
 	# --- Page load/wait timings ---
 
@@ -598,16 +637,58 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 
 	wait_between_actions: float = Field(default=0.5, description='Time to wait between actions.')
 
+	network_idle_detection: bool = Field(
+		default=True,
+		description='Track in-flight requests over CDP and stop waiting as soon as the page is quiet. The wait times above become upper bounds instead of fixed sleeps.',
+	)
+
+	# --- Typing ---
+
+	typing_strategy: TypingStrategy = Field(
+		default='auto',
+		description='How text is typed into elements: insert_text (one Input.insertText call), set_value (set the value and fire input/change events), pipelined_keys (key events sent without waiting for each reply), keystrokes (key events one at a time, like a human) or auto (picked from the element type).',
+	)
+	typing_strategy_overrides: dict[str, TypingStrategy] = Field(
+		default_factory=dict,
+		description='Typing strategy per domain pattern, e.g. {"*.example.com": "keystrokes"} for sites that only react to real key presses. Patterns are matched like allowed_domains.',
+	)
+
 	# --- UI/viewport/DOM ---
 
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
 	filter_highlight_ids: bool = Field(
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
+	screenshot_format: ScreenshotFormat = Field(
+		default='png',
+		description='Image format screenshots are captured and highlighted in. jpeg and webp are lossy but several times smaller than png.',
+	)
+	screenshot_quality: int = Field(default=80, ge=1, le=100, description='Quality of jpeg and webp screenshots (1-100).')
+	screenshot_max_dimension: int | None = Field(
+		default=None,
+		ge=16,
+		description='Downscale screenshots in the browser so their longest side is at most this many pixels (device pixels included).',
+	)
+	screenshot_clip: ScreenshotClip | None = Field(
+		default=None, description='Only capture this region of the viewport (CSS pixels) instead of the whole viewport.'
+	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	incremental_dom_updates: bool = Field(
+		default=False,
+		description='Keep the DOM tree between steps and patch it from CDP DOM mutation events instead of rebuilding it from scratch. Experimental.',
+	)
 
 	# --- Downloads ---
 	auto_download_pdfs: bool = Field(default=True, description='Automatically download PDFs when navigating to PDF viewer pages.')
+	max_concurrent_downloads: int = Field(
+		default=4,
+		ge=1,
+		description='Downloads fetched by the session itself (e.g. PDF auto-downloads) that may run at the same time, others wait in a queue.',
+	)
+	watch_downloads_dir: bool = Field(
+		default=False,
+		description='Also detect finished downloads from file system events on the downloads directory (inotify, Linux only), for browsers that do not report completed downloads over CDP.',
+	)
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
 
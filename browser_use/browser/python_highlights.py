@@ -5,13 +5,17 @@ to draw bounding boxes around interactive elements directly on screenshots.
 """
 
 import asyncio
-import base64
 import io
 import logging
+import mmap
 import os
+from functools import lru_cache
+from typing import NamedTuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from browser_use.browser.profile import ScreenshotFormat
+from browser_use.browser.views import Screenshot
 from browser_use.dom.views import DOMSelectorMap
 from browser_use.observability import observe_debug
 from browser_use.utils import time_execution_async
@@ -105,7 +109,36 @@ def should_show_index_overlay(element_index: int | None) -> bool:
 	return element_index is not None
 
 
+# Dashed border pattern: 4px dash (5px incl. both ends, like PIL lines), 8px gap, 2px wide
+_DASH_LENGTH = 4
+_DASH_GAP = 8
+_DASH_WIDTH = 2
+
+
+@lru_cache(maxsize=512)
+def _dashed_line_mask(length: int, horizontal: bool) -> Image.Image:
+	"""Mask for a dashed line of `length` pixels, pasted in one go instead of drawing every dash separately."""
+	period = _DASH_LENGTH + _DASH_GAP
+	row = bytes(255 if i % period <= _DASH_LENGTH else 0 for i in range(length))
+	if horizontal:
+		return Image.frombytes('L', (length, _DASH_WIDTH), row * _DASH_WIDTH)
+	return Image.frombytes('L', (_DASH_WIDTH, length), bytes(value for value in row for _ in range(_DASH_WIDTH)))
+
+
+def draw_dashed_rectangle(image: Image.Image, bbox: tuple[int, int, int, int], color: str) -> None:
+	"""Draw a dashed rectangle outline, each edge is a single masked paste."""
+	x1, y1, x2, y2 = bbox
+	width, height = x2 - x1 + 1, y2 - y1 + 1
+	horizontal = _dashed_line_mask(width, True)
+	vertical = _dashed_line_mask(height, False)
+	image.paste(color, (x1, y1, x1 + width, y1 + _DASH_WIDTH), horizontal)  # Top
+	image.paste(color, (x1, y2, x1 + width, y2 + _DASH_WIDTH), horizontal)  # Bottom
+	image.paste(color, (x1, y1, x1 + _DASH_WIDTH, y1 + height), vertical)  # Left
+	image.paste(color, (x2, y1, x2 + _DASH_WIDTH, y1 + height), vertical)  # Right
+
+
 def draw_enhanced_bounding_box_with_text(
+	image: Image.Image,
 	draw,  # ImageDraw.Draw - avoiding type annotation due to PIL typing issues
 	bbox: tuple[int, int, int, int],
 	color: str,
@@ -118,31 +151,7 @@ def draw_enhanced_bounding_box_with_text(
 	"""Draw an enhanced bounding box with much bigger index containers and dashed borders."""
 	x1, y1, x2, y2 = bbox
 
-	# Draw dashed bounding box with pattern: 1 line, 2 spaces, 1 line, 2 spaces...
-	dash_length = 4
-	gap_length = 8
-	line_width = 2
-
-	# Helper function to draw dashed line
-	def draw_dashed_line(start_x, start_y, end_x, end_y):
-		if start_x == end_x:  # Vertical line
-			y = start_y
-			while y < end_y:
-				dash_end = min(y + dash_length, end_y)
-				draw.line([(start_x, y), (start_x, dash_end)], fill=color, width=line_width)
-				y += dash_length + gap_length
-		else:  # Horizontal line
-			x = start_x
-			while x < end_x:
-				dash_end = min(x + dash_length, end_x)
-				draw.line([(x, start_y), (dash_end, start_y)], fill=color, width=line_width)
-				x += dash_length + gap_length
-
-	# Draw dashed rectangle
-	draw_dashed_line(x1, y1, x2, y1)  # Top
-	draw_dashed_line(x2, y1, x2, y2)  # Right
-	draw_dashed_line(x2, y2, x1, y2)  # Bottom
-	draw_dashed_line(x1, y2, x1, y1)  # Left
+	draw_dashed_rectangle(image, bbox, color)
 
 	# Draw much bigger index overlay if we have index text
 	if text:
@@ -337,134 +346,180 @@ def draw_bounding_box_with_text(
 			logger.debug(f'Failed to draw text overlay: {e}')
 
 
-def process_element_highlight(
-	element_id: int,
-	element,
-	draw,
+class ElementHighlight(NamedTuple):
+	"""What to draw for one element: its box in device pixels (not clipped to the screenshot yet), color and label."""
+
+	element_id: int
+	bbox: tuple[int, int, int, int]
+	color: str
+	tag_name: str
+	index_text: str | None
+
+
+def collect_element_highlights(
+	selector_map: DOMSelectorMap,
 	device_pixel_ratio: float,
-	font,
 	filter_highlight_ids: bool,
-	image_size: tuple[int, int],
-) -> None:
-	"""Process a single element for highlighting."""
-	try:
-		# Use absolute_position coordinates directly
-		if not element.absolute_position:
-			return
-
-		bounds = element.absolute_position
-
-		# Scale coordinates from CSS pixels to device pixels for screenshot
-		# The screenshot is captured at device pixel resolution, but coordinates are in CSS pixels
-		x1 = int(bounds.x * device_pixel_ratio)
-		y1 = int(bounds.y * device_pixel_ratio)
-		x2 = int((bounds.x + bounds.width) * device_pixel_ratio)
-		y2 = int((bounds.y + bounds.height) * device_pixel_ratio)
-
-		# Ensure coordinates are within image bounds
-		img_width, img_height = image_size
-		x1 = max(0, min(x1, img_width))
-		y1 = max(0, min(y1, img_height))
-		x2 = max(x1, min(x2, img_width))
-		y2 = max(y1, min(y2, img_height))
-
-		# Skip if bounding box is too small or invalid
-		if x2 - x1 < 2 or y2 - y1 < 2:
-			return
-
-		# Get element color based on type
-		tag_name = element.tag_name if hasattr(element, 'tag_name') else 'div'
-		element_type = None
-		if hasattr(element, 'attributes') and element.attributes:
-			element_type = element.attributes.get('type')
-
-		color = get_element_color(tag_name, element_type)
-
-		# Get element index for overlay and apply filtering
-		element_index = getattr(element, 'element_index', None)
-		index_text = None
-
-		if element_index is not None:
-			if filter_highlight_ids:
-				# Use the meaningful text that matches what the LLM sees
-				meaningful_text = element.get_meaningful_text_for_llm()
-				# Show ID only if meaningful text is less than 5 characters
-				if len(meaningful_text) < 3:
+	origin: tuple[float, float] = (0.0, 0.0),
+) -> list[ElementHighlight]:
+	"""Turn the selector map into plain highlight boxes, so rendering doesn't need the DOM nodes.
+
+	`origin` is the viewport position (CSS pixels) of the screenshot's top left corner, `device_pixel_ratio`
+	the screenshot pixels per CSS pixel.
+	"""
+	origin_x, origin_y = origin
+	highlights: list[ElementHighlight] = []
+	for element_id, element in selector_map.items():
+		try:
+			# Use absolute_position coordinates directly
+			if not element.absolute_position:
+				continue
+
+			bounds = element.absolute_position
+
+			# Scale coordinates from CSS pixels to device pixels for screenshot
+			# The screenshot is captured at device pixel resolution, but coordinates are in CSS pixels
+			x1 = int((bounds.x - origin_x) * device_pixel_ratio)
+			y1 = int((bounds.y - origin_y) * device_pixel_ratio)
+			x2 = int((bounds.x - origin_x + bounds.width) * device_pixel_ratio)
+			y2 = int((bounds.y - origin_y + bounds.height) * device_pixel_ratio)
+
+			# Get element color based on type
+			tag_name = element.tag_name if hasattr(element, 'tag_name') else 'div'
+			element_type = None
+			if hasattr(element, 'attributes') and element.attributes:
+				element_type = element.attributes.get('type')
+
+			color = get_element_color(tag_name, element_type)
+
+			# Get element index for overlay and apply filtering
+			element_index = getattr(element, 'element_index', None)
+			index_text = None
+
+			if element_index is not None:
+				if filter_highlight_ids:
+					# Use the meaningful text that matches what the LLM sees
+					meaningful_text = element.get_meaningful_text_for_llm()
+					# Show ID only if meaningful text is less than 5 characters
+					if len(meaningful_text) < 3:
+						index_text = str(element_index)
+				else:
+					# Always show ID when filter is disabled
 					index_text = str(element_index)
-			else:
-				# Always show ID when filter is disabled
-				index_text = str(element_index)
 
-		# Draw enhanced bounding box with bigger index
-		draw_enhanced_bounding_box_with_text(
-			draw, (x1, y1, x2, y2), color, index_text, font, tag_name, image_size, device_pixel_ratio
-		)
+			highlights.append(ElementHighlight(element_id, (x1, y1, x2, y2), color, tag_name, index_text))
 
-	except Exception as e:
-		logger.debug(f'Failed to draw highlight for element {element_id}: {e}')
+		except Exception as e:
+			logger.debug(f'Failed to collect highlight for element {element_id}: {e}')
+	return highlights
+
+
+def encode_screenshot(image: Image.Image, image_format: ScreenshotFormat = 'png', quality: int = 80) -> bytes:
+	"""Encode an image as PNG (lossless) or JPEG / WebP at the given quality."""
+	output_buffer = io.BytesIO()
+	try:
+		if image_format == 'png':
+			image.save(output_buffer, format='PNG')
+		elif image_format == 'jpeg':
+			image.convert('RGB').save(output_buffer, format='JPEG', quality=quality)
+		else:
+			image.save(output_buffer, format='WEBP', quality=quality)
+		return output_buffer.getvalue()
+	finally:
+		output_buffer.close()
+
+
+def render_highlighted_screenshot(
+	screenshot_data: bytes | mmap.mmap,
+	highlights: list[ElementHighlight],
+	image_format: ScreenshotFormat = 'png',
+	quality: int = 80,
+) -> bytes:
+	"""Draw the highlight boxes onto the screenshot and re-encode it (CPU bound, meant to run off the event loop)."""
+	with Image.open(io.BytesIO(screenshot_data)) as decoded:
+		image = decoded.convert('RGB')
+	try:
+		# Create drawing context
+		draw = ImageDraw.Draw(image)
+
+		# Load font using shared function with caching
+		font = get_cross_platform_font(12)
+		# If no system fonts found, font remains None and will use default font
+
+		img_width, img_height = image.size
+		for highlight in highlights:
+			try:
+				# Ensure coordinates are within image bounds
+				x1, y1, x2, y2 = highlight.bbox
+				x1 = max(0, min(x1, img_width))
+				y1 = max(0, min(y1, img_height))
+				x2 = max(x1, min(x2, img_width))
+				y2 = max(y1, min(y2, img_height))
+
+				# Skip if bounding box is too small or invalid
+				if x2 - x1 < 2 or y2 - y1 < 2:
+					continue
+
+				# Draw enhanced bounding box with bigger index
+				draw_enhanced_bounding_box_with_text(
+					image, draw, (x1, y1, x2, y2), highlight.color, highlight.index_text, font, highlight.tag_name, image.size
+				)
+			except Exception as e:
+				logger.debug(f'Failed to draw highlight for element {highlight.element_id}: {e}')
+
+		return encode_screenshot(image, image_format, quality)
+	finally:
+		# Explicit cleanup to prevent memory leaks
+		image.close()
 
 
 @observe_debug(ignore_input=True, ignore_output=True, name='create_highlighted_screenshot')
 @time_execution_async('create_highlighted_screenshot')
 async def create_highlighted_screenshot(
-	screenshot_b64: str,
+	screenshot: Screenshot,
 	selector_map: DOMSelectorMap,
 	device_pixel_ratio: float = 1.0,
 	viewport_offset_x: int = 0,
 	viewport_offset_y: int = 0,
 	filter_highlight_ids: bool = True,
-) -> str:
+	image_format: ScreenshotFormat = 'png',
+	quality: int = 80,
+) -> Screenshot:
 	"""Create a highlighted screenshot with bounding boxes around interactive elements.
 
+	Decoding, drawing and re-encoding run in a worker thread (PIL releases the GIL for most of it), so CDP events
+	keep being handled while a large screenshot is processed.
+
 	Args:
-	    screenshot_b64: Base64 encoded screenshot
+	    screenshot: Captured screenshot, if it only covers a clip of the viewport the boxes are mapped onto that clip
 	    selector_map: Map of interactive elements with their positions
-	    device_pixel_ratio: Device pixel ratio for scaling coordinates
+	    device_pixel_ratio: Device pixel ratio for scaling coordinates (ignored for clipped screenshots)
 	    viewport_offset_x: X offset for viewport positioning
 	    viewport_offset_y: Y offset for viewport positioning
+	    image_format: Format of the returned image, png (lossless), jpeg or webp
+	    quality: Quality for jpeg and webp (1-100)
 
 	Returns:
-	    Base64 encoded highlighted screenshot
+	    Highlighted screenshot
 	"""
 	try:
-		# Decode screenshot
-		screenshot_data = base64.b64decode(screenshot_b64)
-		image = Image.open(io.BytesIO(screenshot_data)).convert('RGBA')
-
-		# Create drawing context
-		draw = ImageDraw.Draw(image)
-
-		# Load font using shared function with caching
-		font = get_cross_platform_font(12)
-		# If no system fonts found, font remains None and will use default font
-
-		# Process elements sequentially to avoid ImageDraw thread safety issues
-		# PIL ImageDraw is not thread-safe, so we process elements one by one
-		for element_id, element in selector_map.items():
-			process_element_highlight(element_id, element, draw, device_pixel_ratio, font, filter_highlight_ids, image.size)
-
-		# Convert back to base64
-		output_buffer = io.BytesIO()
-		try:
-			image.save(output_buffer, format='PNG')
-			output_buffer.seek(0)
-			highlighted_b64 = base64.b64encode(output_buffer.getvalue()).decode('utf-8')
-
-			logger.debug(f'Successfully created highlighted screenshot with {len(selector_map)} elements')
-			return highlighted_b64
-		finally:
-			# Explicit cleanup to prevent memory leaks
-			output_buffer.close()
-			if 'image' in locals():
-				image.close()
+		origin = (0.0, 0.0)
+		if screenshot.clip:
+			# clipped / downscaled in the browser: the image width tells how many pixels a CSS pixel became
+			with Image.open(io.BytesIO(screenshot.data)) as image:
+				device_pixel_ratio = image.width / screenshot.clip.width
+			origin = (screenshot.clip.x, screenshot.clip.y)
+		highlights = collect_element_highlights(selector_map, device_pixel_ratio, filter_highlight_ids, origin)
+		highlighted_data = await asyncio.to_thread(
+			render_highlighted_screenshot, screenshot.data, highlights, image_format, quality
+		)
+		logger.debug(f'Successfully created highlighted screenshot with {len(selector_map)} elements')
+		return Screenshot(highlighted_data, clip=screenshot.clip)
 
 	except Exception as e:
 		logger.error(f'Failed to create highlighted screenshot: {e}')
-		# Clean up on error as well
-		if 'image' in locals():
-			image.close()
 		# Return original screenshot on error
-		return screenshot_b64
+		return screenshot
 
 
 async def get_viewport_info_from_cdp(cdp_session) -> tuple[float, int, int]:
@@ -500,25 +555,33 @@ async def get_viewport_info_from_cdp(cdp_session) -> tuple[float, int, int]:
 
 @time_execution_async('create_highlighted_screenshot_async')
 async def create_highlighted_screenshot_async(
-	screenshot_b64: str, selector_map: DOMSelectorMap, cdp_session=None, filter_highlight_ids: bool = True
-) -> str:
+	screenshot: Screenshot,
+	selector_map: DOMSelectorMap,
+	cdp_session=None,
+	filter_highlight_ids: bool = True,
+	image_format: ScreenshotFormat = 'png',
+	quality: int = 80,
+) -> Screenshot:
 	"""Async wrapper for creating highlighted screenshots.
 
 	Args:
-	    screenshot_b64: Base64 encoded screenshot
+	    screenshot: Captured screenshot
 	    selector_map: Map of interactive elements
 	    cdp_session: CDP session for getting viewport info
 	    filter_highlight_ids: Whether to filter element IDs based on meaningful text
+	    image_format: Format of the returned image, png (lossless), jpeg or webp
+	    quality: Quality for jpeg and webp (1-100)
 
 	Returns:
-	    Base64 encoded highlighted screenshot
+	    Highlighted screenshot
 	"""
 	# Get viewport information if CDP session is available
 	device_pixel_ratio = 1.0
 	viewport_offset_x = 0
 	viewport_offset_y = 0
 
-	if cdp_session:
+	# clipped screenshots carry their own geometry
+	if cdp_session and not screenshot.clip:
 		try:
 			device_pixel_ratio, viewport_offset_x, viewport_offset_y = await get_viewport_info_from_cdp(cdp_session)
 		except Exception as e:
@@ -526,7 +589,14 @@ async def create_highlighted_screenshot_async(
 
 	# Create highlighted screenshot with async processing
 	final_screenshot = await create_highlighted_screenshot(
-		screenshot_b64, selector_map, device_pixel_ratio, viewport_offset_x, viewport_offset_y, filter_highlight_ids
+		screenshot,
+		selector_map,
+		device_pixel_ratio,
+		viewport_offset_x,
+		viewport_offset_y,
+		filter_highlight_ids,
+		image_format,
+		quality,
 	)
 
 	filename = os.getenv('BROWSER_USE_SCREENSHOT_FILE')
@@ -535,7 +605,7 @@ async def create_highlighted_screenshot_async(
 		def _write_screenshot():
 			try:
 				with open(filename, 'wb') as f:
-					f.write(base64.b64decode(final_screenshot))
+					f.write(final_screenshot.data)
 				logger.debug('Saved screenshot to ' + str(filename))
 			except Exception as e:
 				logger.warning(f'Failed to save screenshot to {filename}: {e}')
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal, Self, cast
@@ -17,6 +18,7 @@ from uuid_extensions import uuid7str
 
 # CDP logging is now handled by setup_logging() in logging_config.py
 # It automatically sets CDP logs to the same level as browser_use logs
+from browser_use.browser.cdp_pool import CDPAttachMetrics, CDPConnectionPool, PooledCDPClient
 from browser_use.browser.events import (
 	AgentFocusChangedEvent,
 	BrowserConnectedEvent,
@@ -36,11 +38,15 @@ from browser_use.browser.events import (
 	TabClosedEvent,
 	TabCreatedEvent,
 )
-from browser_use.browser.profile import BrowserProfile, ProxySettings
-from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.browser.frames import FrameRegistry
+from browser_use.browser.network_idle import DEFAULT_QUIET_PERIOD, NetworkIdleTracker
+from browser_use.browser.node_handles import NODE_HANDLE_OBJECT_GROUP, NodeHandle, NodeHandleCache
+from browser_use.browser.profile import BrowserProfile, ProxySettings, ScreenshotClip, ScreenshotFormat, TypingStrategy
+from browser_use.browser.targets import TargetTable
+from browser_use.browser.views import BrowserStateSummary, CDPConnectionStats, DownloadStats, TabInfo, VideoRecordingStats
 from browser_use.dom.views import EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
-from browser_use.utils import _log_pretty_url, is_new_tab_page
+from browser_use.utils import is_new_tab_page
 
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
@@ -66,6 +72,8 @@ class CDPSession(BaseModel):
 
 	# Track if this session owns its CDP client (for cleanup)
 	owns_cdp_client: bool = False
+	# Set if the CDP client is a shared socket from the connection pool
+	connection_pool: CDPConnectionPool | None = None
 
 	@classmethod
 	async def for_target(
@@ -75,6 +83,7 @@ class CDPSession(BaseModel):
 		new_socket: bool = False,
 		cdp_url: str | None = None,
 		domains: list[str] | None = None,
+		connection_pool: CDPConnectionPool | None = None,
 	):
 		"""Create a CDP session for a target.
 
@@ -84,8 +93,29 @@ class CDPSession(BaseModel):
 			new_socket: If True, create a dedicated WebSocket connection for this target
 			cdp_url: CDP URL (required if new_socket is True)
 			domains: List of CDP domains to enable. If None, enables default domains.
+			connection_pool: If set (and new_socket is True), attach over a shared socket from this pool instead
 		"""
-		if new_socket:
+		if new_socket and connection_pool is not None:
+			pooled_client = await connection_pool.acquire()
+			cdp_session = cls(
+				cdp_client=pooled_client,
+				target_id=target_id,
+				session_id='connecting',
+				owns_cdp_client=False,
+				connection_pool=connection_pool,
+			)
+			try:
+				await cdp_session.attach(domains=domains)
+			except BaseException:
+				if cdp_session.session_id == 'connecting':
+					connection_pool.cancel(pooled_client)
+				else:
+					connection_pool.register_session(pooled_client, cdp_session.session_id)
+					await connection_pool.release_session(pooled_client, cdp_session.session_id)
+				raise
+			connection_pool.register_session(pooled_client, cdp_session.session_id)
+			return cdp_session
+		elif new_socket:
 			if not cdp_url:
 				raise ValueError('cdp_url required when new_socket=True')
 			# Create a new CDP client with its own WebSocket connection
@@ -163,7 +193,10 @@ class CDPSession(BaseModel):
 
 	async def disconnect(self) -> None:
 		"""Disconnect and cleanup if this session owns its CDP client."""
-		if self.owns_cdp_client and self.cdp_client:
+		if self.connection_pool is not None and isinstance(self.cdp_client, PooledCDPClient):
+			# shared socket, only detach this session
+			await self.connection_pool.release_session(self.cdp_client, self.session_id)
+		elif self.owns_cdp_client and self.cdp_client:
 			try:
 				await self.cdp_client.stop()
 			except Exception:
@@ -262,14 +295,31 @@ class BrowserSession(BaseModel):
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
+		network_idle_detection: bool | None = None,
+		typing_strategy: TypingStrategy | None = None,
+		typing_strategy_overrides: dict[str, TypingStrategy] | None = None,
 		filter_highlight_ids: bool | None = None,
 		auto_download_pdfs: bool | None = None,
+		max_concurrent_downloads: int | None = None,
+		watch_downloads_dir: bool | None = None,
 		profile_directory: str | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		# DOM extraction layer configuration
 		cross_origin_iframes: bool | None = None,
+		max_iframes: int | None = None,
+		max_iframe_depth: int | None = None,
+		max_concurrent_iframe_fetches: int | None = None,
+		iframe_fetch_timeout: float | None = None,
 		highlight_elements: bool | None = None,
+		screenshot_format: ScreenshotFormat | None = None,
+		screenshot_quality: int | None = None,
+		screenshot_max_dimension: int | None = None,
+		screenshot_clip: ScreenshotClip | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom_updates: bool | None = None,
+		# CDP connection configuration
+		cdp_pool_max_sockets: int | None = None,
+		cdp_pool_max_in_flight: int | None = None,
 	):
 		# Following the same pattern as AgentSettings in service.py
 		# Only pass non-None values to avoid validation errors
@@ -324,6 +374,13 @@ class BrowserSession(BaseModel):
 	# Mutable private state shared between watchdogs
 	_cdp_client_root: CDPClient | None = PrivateAttr(default=None)
 	_cdp_session_pool: dict[str, CDPSession] = PrivateAttr(default_factory=dict)
+	_cdp_connection_pool: CDPConnectionPool | None = PrivateAttr(default=None)
+	_cdp_attach_metrics: CDPAttachMetrics = PrivateAttr(default_factory=CDPAttachMetrics)
+	_cdp_dedicated_sockets_opened: int = PrivateAttr(default=0)
+	_network_idle_tracker: NetworkIdleTracker = PrivateAttr(default_factory=NetworkIdleTracker)
+	_frame_registry: FrameRegistry = PrivateAttr(default_factory=FrameRegistry)
+	_target_table: TargetTable = PrivateAttr(default_factory=TargetTable)
+	_node_handles: NodeHandleCache = PrivateAttr(default_factory=NodeHandleCache)
 	_cached_browser_state_summary: Any = PrivateAttr(default=None)
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
@@ -386,6 +443,15 @@ class BrowserSession(BaseModel):
 			if hasattr(session, 'disconnect'):
 				await session.disconnect()
 		self._cdp_session_pool.clear()
+		if self._cdp_connection_pool:
+			await self._cdp_connection_pool.close()
+			self._cdp_connection_pool = None
+		self._cdp_attach_metrics = CDPAttachMetrics()
+		self._cdp_dedicated_sockets_opened = 0
+		self._network_idle_tracker.clear()
+		self._frame_registry.clear()
+		self._target_table.clear()
+		self._node_handles.clear()
 
 		self._cdp_client_root = None  # type: ignore
 		self._cached_browser_state_summary = None
@@ -729,6 +795,10 @@ class BrowserSession(BaseModel):
 
 	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
 		"""Handle tab closure - update focus if needed."""
+		self._network_idle_tracker.forget_target(event.target_id)
+		self._frame_registry.invalidate()
+		self._node_handles.invalidate()
+
 		if not self.agent_focus:
 			return
 
@@ -753,6 +823,7 @@ class BrowserSession(BaseModel):
 		# self.logger.debug('🔄 Clearing cached browser state...')
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
+		self._node_handles.invalidate()
 		self.logger.debug('🔄 Cached browser state cleared')
 		all_targets = await self._cdp_get_all_pages(include_chrome=True)
 
@@ -837,6 +908,87 @@ class BrowserSession(BaseModel):
 		assert self._cdp_client_root is not None, 'CDP client not initialized - browser may not be connected yet'
 		return self._cdp_client_root
 
+	def _get_cdp_connection_pool(self) -> CDPConnectionPool | None:
+		"""Connection pool for target sessions, None unless cdp_pool_max_sockets is configured."""
+		if not self.browser_profile.cdp_pool_max_sockets or not self.cdp_url:
+			return None
+		if self._cdp_connection_pool is None:
+			self._cdp_connection_pool = CDPConnectionPool(
+				cdp_url=self.cdp_url,
+				max_sockets=self.browser_profile.cdp_pool_max_sockets,
+				max_in_flight_per_socket=self.browser_profile.cdp_pool_max_in_flight,
+				headers=self.browser_profile.headers,
+			)
+		return self._cdp_connection_pool
+
+	def get_cdp_connection_stats(self) -> CDPConnectionStats:
+		"""Socket count and session-attach latency of the CDP connections used by this session."""
+		pool = self._cdp_connection_pool
+		root_sockets = 1 if self._cdp_client_root is not None else 0
+		dedicated_sockets = len({id(s.cdp_client) for s in self._cdp_session_pool.values() if s.owns_cdp_client})
+		metrics = self._cdp_attach_metrics
+		return CDPConnectionStats(
+			pooled=pool is not None,
+			sockets_open=root_sockets + dedicated_sockets + (len(pool.clients) if pool else 0),
+			sockets_opened_total=root_sockets + self._cdp_dedicated_sockets_opened + (pool.sockets_opened_total if pool else 0),
+			sessions=len(self._cdp_session_pool),
+			in_flight_requests=pool.in_flight if pool else 0,
+			attach_count=metrics.count,
+			attach_latency_avg_ms=metrics.average_seconds * 1000,
+			attach_latency_max_ms=metrics.max_seconds * 1000,
+			attach_latency_last_ms=metrics.last_seconds * 1000,
+		)
+
+	def get_download_stats(self) -> list[DownloadStats]:
+		"""Progress and throughput of the downloads in this session, in the order they were started."""
+		if self._downloads_watchdog is None:
+			return []
+		return self._downloads_watchdog.get_download_stats()
+
+	def get_video_recording_stats(self) -> VideoRecordingStats | None:
+		"""Dropped-frame and encode-latency counters of the running video recording, None if not recording."""
+		if self._recording_watchdog is None:
+			return None
+		return self._recording_watchdog.get_recording_stats()
+
+	async def _start_network_idle_tracking(self, cdp_session: CDPSession) -> None:
+		"""Subscribe to request and lifecycle events of a target session, used by wait_for_network_idle()."""
+		tracker = self._network_idle_tracker
+		if not self.browser_profile.network_idle_detection or tracker.is_tracking(cdp_session.session_id):
+			return
+		tracker.register(cdp_session.cdp_client)
+		tracker.track(cdp_session.session_id, cdp_session.target_id)
+		try:
+			await asyncio.gather(
+				cdp_session.cdp_client.send.Network.enable(session_id=cdp_session.session_id),
+				cdp_session.cdp_client.send.Page.setLifecycleEventsEnabled(
+					params={'enabled': True}, session_id=cdp_session.session_id
+				),
+			)
+		except Exception as e:
+			tracker.forget_target(cdp_session.target_id)
+			self.logger.debug(
+				f'Network idle tracking unavailable for target {cdp_session.target_id[-4:]}: {type(e).__name__}: {e}'
+			)
+
+	async def wait_for_network_idle(self, timeout: float, quiet_period: float = DEFAULT_QUIET_PERIOD) -> bool:
+		"""
+		Wait until the focused page has no relevant requests in flight, for at most `timeout` seconds.
+
+		Analytics beacons, websockets, event streams and long-poll requests are ignored. Falls back to sleeping
+		for the full `timeout` when network_idle_detection is disabled or the page isn't tracked.
+
+		Returns:
+			True if the page went quiet before the timeout.
+		"""
+		if timeout <= 0:
+			return True
+		session_id = self.agent_focus.session_id if self.agent_focus else None
+		if not session_id or not self._network_idle_tracker.is_tracking(session_id):
+			await asyncio.sleep(timeout)
+			return False
+		return await self._network_idle_tracker.wait_for_idle(session_id, timeout=timeout, quiet_period=quiet_period)
+
 	async def get_or_create_cdp_session(
 		self, target_id: TargetID | None = None, focus: bool = True, new_socket: bool | None = None
 	) -> CDPSession:
@@ -879,18 +1031,27 @@ class BrowserSession(BaseModel):
 			return self.agent_focus
 
 		# Create new session for this target
-		# Default to True for new sessions (each new target gets its own WebSocket)
+		# Default to True for new sessions (each new target gets its own WebSocket, or a pooled one in pool mode)
 		should_use_new_socket = True if new_socket is None else new_socket
+		connection_pool = self._get_cdp_connection_pool() if should_use_new_socket else None
 		self.logger.debug(
-			f'[get_or_create_cdp_session] Creating new CDP session for target {target_id} (new_socket={should_use_new_socket})'
+			f'[get_or_create_cdp_session] Creating new CDP session for target {target_id} (new_socket={should_use_new_socket}, pooled={connection_pool is not None})'
 		)
+		attach_started_at = time.perf_counter()
 		session = await CDPSession.for_target(
 			self._cdp_client_root,
 			target_id,
 			new_socket=should_use_new_socket,
 			cdp_url=self.cdp_url if should_use_new_socket else None,
+			connection_pool=connection_pool,
 		)
+		self._cdp_attach_metrics.record(attach_started_at)
+		if session.owns_cdp_client:
+			self._cdp_dedicated_sockets_opened += 1
 		self._cdp_session_pool[target_id] = session
+		self._frame_registry.register(session.cdp_client)
+		self._node_handles.register(session.cdp_client)
+		await self._start_network_idle_tracking(session)
 		# log length of _cdp_session_pool
 		self.logger.debug(f'[get_or_create_cdp_session] new _cdp_session_pool length: {len(self._cdp_session_pool)}')
 
@@ -931,7 +1092,7 @@ class BrowserSession(BaseModel):
 			selector_map = self._cached_browser_state_summary.dom_state.selector_map
 
 			# Don't use cached state if we need a screenshot but the cached state doesn't have one
-			if include_screenshot and not self._cached_browser_state_summary.screenshot:
+			if include_screenshot and not self._cached_browser_state_summary.screenshot_data:
 				self.logger.debug('⚠️ Cached browser state has no screenshot, fetching fresh state with screenshot')
 				# Fall through to fetch fresh state with screenshot
 			elif selector_map and len(selector_map) > 0:
@@ -1132,9 +1293,12 @@ class BrowserSession(BaseModel):
 			self._cdp_client_root = CDPClient(self.cdp_url)
 			assert self._cdp_client_root is not None
 			await self._cdp_client_root.start()
+			self._frame_registry.register(self._cdp_client_root)
+			self._node_handles.register(self._cdp_client_root)
 			await self._cdp_client_root.send.Target.setAutoAttach(
 				params={'autoAttach': True, 'waitForDebuggerOnStart': False, 'flatten': True}
 			)
+			await self._start_target_discovery()
 			self.logger.debug('CDP client connected successfully')
 
 			# Get browser targets to find available contexts/pages
@@ -1203,6 +1367,9 @@ class BrowserSession(BaseModel):
 				self.agent_focus = await CDPSession.for_target(self._cdp_client_root, target_id, new_socket=False)
 			if self.agent_focus:
 				self._cdp_session_pool[target_id] = self.agent_focus
+				self._frame_registry.register(self.agent_focus.cdp_client)
+				self._node_handles.register(self.agent_focus.cdp_client)
+				await self._start_network_idle_tracking(self.agent_focus)
 
 			# Enable proxy authentication handling if configured
 			await self._setup_proxy_auth()
@@ -1353,6 +1520,8 @@ class BrowserSession(BaseModel):
 
 			# Auto-enable Fetch on every newly attached target to ensure auth callbacks fire
 			def _on_attached(event: AttachedToTargetEvent, session_id: SessionID | None = None):
+				# replaces the frame registry's handler on the root client
+				self._frame_registry.on_attached_to_target(event, session_id)
 				sid = event.get('sessionId') or event.get('session_id') or session_id
 				if not sid:
 					return
@@ -1388,59 +1557,58 @@ class BrowserSession(BaseModel):
 		except Exception as e:
 			self.logger.debug(f'Skipping proxy auth setup: {type(e).__name__}: {e}')
 
+	async def _start_target_discovery(self) -> None:
+		"""Subscribe to target created/changed/destroyed events, used by get_tabs() to list tabs from memory."""
+		assert self._cdp_client_root is not None
+		self._target_table.register(self._cdp_client_root)
+		try:
+			await self._cdp_client_root.send.Target.setDiscoverTargets(params={'discover': True})
+			self._target_table.start_discovery()
+		except Exception as e:
+			self.logger.debug(f'Target discovery unavailable, tabs are listed with Target.getTargets: {type(e).__name__}: {e}')
+
 	async def get_tabs(self) -> list[TabInfo]:
-		"""Get information about all open tabs using CDP Target.getTargetInfo for speed."""
+		"""Get information about all open tabs, read from the live target table (see TargetTable)."""
 		tabs = []
 
 		# Safety check - return empty list if browser not connected yet
 		if not self._cdp_client_root:
 			return tabs
 
-		# Get all page targets using CDP
-		pages = await self._cdp_get_all_pages()
+		# Get all page targets, a stale table is reloaded with a single Target.getTargets call
+		targets = await self._target_table.get_targets(self.cdp_client.send.Target.getTargets)
+		pages = [
+			t
+			for t in targets
+			if self._is_valid_target(t, include_http=True, include_about=True, include_pages=True, include_iframes=False)
+		]
 
-		for i, page_target in enumerate(pages):
+		for page_target in pages:
 			target_id = page_target['targetId']
 			url = page_target['url']
+			# The title is kept current by Target.targetInfoChanged
+			title = page_target.get('title', '')
 
-			# Try to get the title directly from Target.getTargetInfo - much faster!
-			# The initial getTargets() doesn't include title, but getTargetInfo does
-			try:
-				target_info = await self.cdp_client.send.Target.getTargetInfo(params={'targetId': target_id})
-				# The title is directly available in targetInfo
-				title = target_info.get('targetInfo', {}).get('title', '')
-
-				# Skip JS execution for chrome:// pages and new tab pages
-				if is_new_tab_page(url) or url.startswith('chrome://'):
-					# Use URL as title for chrome pages, or mark new tabs as unusable
-					if is_new_tab_page(url):
-						title = 'ignore this tab and do not use it'
-					elif not title:
-						# For chrome:// pages without a title, use the URL itself
-						title = url
-
-				# Special handling for PDF pages without titles
-				if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
-					# PDF pages might not have a title, use URL filename
-					try:
-						from urllib.parse import urlparse
-
-						filename = urlparse(url).path.split('/')[-1]
-						if filename:
-							title = filename
-					except Exception:
-						pass
-
-			except Exception as e:
-				# Fallback to basic title handling
-				self.logger.debug(f'⚠️ Failed to get target info for tab #{i}: {_log_pretty_url(url)} - {type(e).__name__}')
-
+			# Skip JS execution for chrome:// pages and new tab pages
+			if is_new_tab_page(url) or url.startswith('chrome://'):
+				# Use URL as title for chrome pages, or mark new tabs as unusable
 				if is_new_tab_page(url):
 					title = 'ignore this tab and do not use it'
-				elif url.startswith('chrome://'):
+				elif not title:
+					# For chrome:// pages without a title, use the URL itself
 					title = url
-				else:
-					title = ''
+
+			# Special handling for PDF pages without titles
+			if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
+				# PDF pages might not have a title, use URL filename
+				try:
+					from urllib.parse import urlparse
+
+					filename = urlparse(url).path.split('/')[-1]
+					if filename:
+						title = filename
+				except Exception:
+					pass
 
 			tab_info = TabInfo(
 				target_id=target_id,
@@ -1521,6 +1689,8 @@ class BrowserSession(BaseModel):
 			selector_map: The new selector map from DOM serialization
 		"""
 		self._cached_selector_map = selector_map
+		# handles resolved for the previous tree may point at nodes that are gone now
+		self._node_handles.invalidate()
 
 	# Alias for backwards compatibility
 	async def get_element_by_index(self, index: int) -> EnhancedDOMTreeNode | None:
@@ -1986,11 +2156,29 @@ class BrowserSession(BaseModel):
 	async def get_all_frames(self) -> tuple[dict[str, dict], dict[str, str]]:
 		"""Get a complete frame hierarchy from all browser targets.
 
+		The hierarchy is cached until frames attach, detach or navigate (see FrameRegistry), so repeated lookups
+		between page changes don't cost any CDP round trips. Treat the returned dicts as read-only.
+
 		Returns:
 			Tuple of (all_frames, target_sessions) where:
 			- all_frames: dict mapping frame_id -> frame info dict with all metadata
 			- target_sessions: dict mapping target_id -> session_id for active sessions
 		"""
+		# without cross-origin support only the focused target is walked, so the hierarchy is only valid for it
+		focus_target_id = (
+			None if self.browser_profile.cross_origin_iframes or not self.agent_focus else self.agent_focus.target_id
+		)
+		cached = self._frame_registry.get(focus_target_id)
+		if cached is not None:
+			return cached
+
+		generation = self._frame_registry.generation
+		hierarchy = await self._build_all_frames()
+		self._frame_registry.store(hierarchy, generation, focus_target_id)
+		return hierarchy
+
+	async def _build_all_frames(self) -> tuple[dict[str, dict], dict[str, str]]:
+		"""Walk the frame trees of all targets (Page.getFrameTree per target), see get_all_frames()."""
 		all_frames = {}  # frame_id -> FrameInfo dict
 		target_sessions = {}  # target_id -> session_id (keep sessions alive during collection)
 
@@ -2214,6 +2402,38 @@ class BrowserSession(BaseModel):
 
 	async def cdp_client_for_node(self, node: EnhancedDOMTreeNode) -> CDPSession:
 		"""Get CDP client for a specific DOM node based on its frame."""
+		try:
+			return (await self.get_node_handle(node)).cdp_session
+		except Exception as e:
+			self.logger.debug(
+				f'Failed to resolve #{node.element_index} backendNodeId={node.backend_node_id}: {e}, using main session'
+			)
+			return await self.get_or_create_cdp_session()
+
+	async def get_node_handle(self, node: EnhancedDOMTreeNode) -> NodeHandle:
+		"""
+		Resolve a DOM node to a RemoteObject in the CDP session of its frame or target (falling back to the focused one).
+
+		Handles are cached until the DOM is rebuilt, the page navigates or `release_node_handles()` is called at the end
+		of the agent step, so all handlers of a step share one DOM.resolveNode per element.
+		"""
+		handle = self._node_handles.get(node.target_id, node.backend_node_id)
+		if handle is not None:
+			return handle
+
+		async def resolve(cdp_session: CDPSession) -> NodeHandle:
+			result = await cdp_session.cdp_client.send.DOM.resolveNode(
+				params={'backendNodeId': node.backend_node_id, 'objectGroup': NODE_HANDLE_OBJECT_GROUP},
+				session_id=cdp_session.session_id,
+			)
+			object_id = result.get('object', {}).get('objectId')
+			if not object_id:
+				raise ValueError(
+					f'Could not find #{node.element_index} backendNodeId={node.backend_node_id} in target_id={cdp_session.target_id}'
+				)
+			return NodeHandle(cdp_session, object_id)
+
+		handle = None
 		if node.frame_id:
 			# # If cross-origin iframes are disabled, always use the main session
 			# if not self.browser_profile.cross_origin_iframes:
@@ -2221,34 +2441,40 @@ class BrowserSession(BaseModel):
 			# 	return self.agent_focus
 			# Otherwise, try to get the frame-specific session
 			try:
-				cdp_session = await self.cdp_client_for_frame(node.frame_id)
-				result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': node.backend_node_id},
-					session_id=cdp_session.session_id,
-				)
-				object_id = result.get('object', {}).get('objectId')
-				if not object_id:
-					raise ValueError(
-						f'Could not find #{node.element_index} backendNodeId={node.backend_node_id} in target_id={cdp_session.target_id}'
-					)
-				return cdp_session
-			except (ValueError, Exception) as e:
+				handle = await resolve(await self.cdp_client_for_frame(node.frame_id))
+			except Exception as e:
 				# Fall back to main session if frame not found
 				self.logger.debug(f'Failed to get CDP client for frame {node.frame_id}: {e}, using main session')
 
-		if node.target_id:
+		if handle is None and node.target_id:
 			try:
-				cdp_session = await self.get_or_create_cdp_session(target_id=node.target_id, focus=False)
-				result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': node.backend_node_id},
-					session_id=cdp_session.session_id,
-				)
-				object_id = result.get('object', {}).get('objectId')
-				if not object_id:
-					raise ValueError(
-						f'Could not find #{node.element_index} backendNodeId={node.backend_node_id} in target_id={cdp_session.target_id}'
-					)
+				handle = await resolve(await self.get_or_create_cdp_session(target_id=node.target_id, focus=False))
 			except Exception as e:
 				self.logger.debug(f'Failed to get CDP client for target {node.target_id}: {e}, using main session')
 
-		return await self.get_or_create_cdp_session()
+		if handle is None:
+			handle = await resolve(await self.get_or_create_cdp_session())
+
+		self._node_handles.store(node.target_id, node.backend_node_id, handle)
+		return handle
+
+	async def release_node_handles(self) -> None:
+		"""Free the node handles resolved since the last call in the browser, called at the end of every agent step."""
+		await self._node_handles.release()
+
+	async def prefetch_node_handles(self, nodes: list[EnhancedDOMTreeNode]) -> int:
+		"""
+		Warm up the focused CDP session and resolve the handles of `nodes` ahead of the actions that may use them.
+
+		Handles are resolved one after another, so the sessions of their targets are only created once. Returns how
+		many handles are ready.
+		"""
+		await self.get_or_create_cdp_session()
+		ready = 0
+		for node in nodes:
+			try:
+				await self.get_node_handle(node)
+				ready += 1
+			except Exception as e:
+				self.logger.debug(f'Failed to prefetch the handle of #{node.element_index}: {type(e).__name__}: {e}')
+		return ready
@@ -0,0 +1,107 @@
+"""Live table of browser targets, kept current from CDP Target discovery events."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cdp_use import CDPClient
+from cdp_use.cdp.target.commands import GetTargetsReturns
+from cdp_use.cdp.target.types import TargetInfo
+
+from browser_use.browser.cdp_subscriber import CDPEventSubscriber
+
+
+class TargetTable(CDPEventSubscriber):
+	"""
+	Target infos (url, title, type, ...) of all targets, updated from Target.targetCreated / targetInfoChanged /
+	targetDestroyed once `Target.setDiscoverTargets` is on, so listing tabs doesn't need any CDP round trips.
+
+	Targets keep the order of the last full listing, targets created afterwards are appended. Until discovery is
+	confirmed with `start_discovery()` (or after `clear()`) the table is stale, and `get_targets()` reloads it with a
+	single `Target.getTargets` call that concurrent callers share.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._targets: dict[str, TargetInfo] = {}
+		self._discovering = False
+		self._loaded = False
+		self._refresh_task: asyncio.Task[None] | None = None
+		self._touched_during_refresh: set[str] | None = None
+
+	# --- setup -------------------------------------------------------------
+
+	def _register_handlers(self, cdp_client: CDPClient) -> None:
+		"""Add, update and remove table entries from the Target discovery events."""
+		cdp_client.register.Target.targetCreated(self.on_target_created)  # type: ignore[arg-type]
+		cdp_client.register.Target.targetInfoChanged(self.on_target_info_changed)  # type: ignore[arg-type]
+		cdp_client.register.Target.targetDestroyed(self.on_target_destroyed)  # type: ignore[arg-type]
+
+	def start_discovery(self) -> None:
+		"""Call once `Target.setDiscoverTargets` succeeded, events keep the table current from then on."""
+		self._discovering = True
+
+	@property
+	def is_stale(self) -> bool:
+		return not (self._discovering and self._loaded)
+
+	# --- CDP event handlers --------------------------------------------------
+
+	def _put(self, target_info: TargetInfo) -> None:
+		target_id = target_info['targetId']
+		self._targets[target_id] = target_info
+		if self._touched_during_refresh is not None:
+			self._touched_during_refresh.add(target_id)
+
+	def on_target_created(self, event: Any, session_id: str | None = None) -> None:
+		self._put(event['targetInfo'])
+
+	def on_target_info_changed(self, event: Any, session_id: str | None = None) -> None:
+		self._put(event['targetInfo'])
+
+	def on_target_destroyed(self, event: Any, session_id: str | None = None) -> None:
+		self._targets.pop(event['targetId'], None)
+		if self._touched_during_refresh is not None:
+			self._touched_during_refresh.add(event['targetId'])
+
+	# --- queries -------------------------------------------------------------
+
+	async def get_targets(self, get_targets: Callable[[], Awaitable[GetTargetsReturns]]) -> list[TargetInfo]:
+		"""All known targets, reloaded first with `get_targets` (= `Target.getTargets`) if the table is stale."""
+		if self.is_stale:
+			await self.refresh(get_targets)
+		return list(self._targets.values())
+
+	async def refresh(self, get_targets: Callable[[], Awaitable[GetTargetsReturns]]) -> None:
+		"""Reload the table from a full target listing, joining a reload that is already in flight."""
+		if self._refresh_task is None or self._refresh_task.done():
+			# events that arrive from now on are newer than the listing, they win over it
+			self._touched_during_refresh = set()
+			self._refresh_task = asyncio.create_task(self._refresh(get_targets, self._touched_during_refresh))
+		await asyncio.shield(self._refresh_task)
+
+	async def _refresh(self, get_targets: Callable[[], Awaitable[GetTargetsReturns]], touched: set[str]) -> None:
+		try:
+			result = await get_targets()
+		finally:
+			self._touched_during_refresh = None
+		targets: dict[str, TargetInfo] = {}
+		for info in result.get('targetInfos', []):
+			target_id = info['targetId']
+			if target_id not in touched:
+				targets[target_id] = info
+			elif target_id in self._targets:
+				targets[target_id] = self._targets[target_id]
+		for target_id, info in self._targets.items():
+			if target_id in touched and target_id not in targets:
+				targets[target_id] = info
+		self._targets = targets
+		self._loaded = True
+
+	def clear(self) -> None:
+		self._targets.clear()
+		self._discovering = False
+		self._loaded = False
+		self._refresh_task = None
+		self._touched_during_refresh = None
+		self._forget_clients()
@@ -1,19 +1,18 @@
 """Video Recording Service for Browser Use Sessions."""
 
+import asyncio
 import base64
 import logging
 import math
-import subprocess
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
 
 from browser_use.browser.profile import ViewportSize
+from browser_use.browser.views import VideoRecordingStats
 
 try:
-	import imageio.v2 as iio
 	import imageio_ffmpeg
-	import numpy as np
-	from imageio.core.format import Format
 
 	IMAGEIO_AVAILABLE = True
 except ImportError:
@@ -21,6 +20,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Output codec arguments per container, anything else is encoded like mp4
+_CODEC_ARGS: dict[str, list[str]] = {
+	'mp4': ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23'],
+	'webm': ['-c:v', 'libvpx-vp9', '-deadline', 'realtime', '-cpu-used', '8', '-crf', '32', '-b:v', '0'],
+}
+
 
 def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> ViewportSize:
 	"""Calculates the dimensions padded to the nearest multiple of macro_block_size."""
@@ -31,14 +36,14 @@ def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> Viewport
 
 class VideoRecorderService:
 	"""
-	Handles the video encoding process for a browser session using imageio.
+	Handles the video encoding process for a browser session with a single long-lived ffmpeg process.
 
-	This service captures individual frames from the CDP screencast, decodes them,
-	and appends them to a video file using a pip-installable ffmpeg backend.
-	It automatically resizes frames to match the target video dimensions.
+	PNG frames from the CDP screencast are queued by `add_frame()` and piped to ffmpeg's stdin by a background
+	task. ffmpeg decodes, scales, pads and encodes them in one pipeline. The queue is bounded: when the encoder
+	falls behind, new frames are dropped instead of piling up in memory or stalling CDP event handling.
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int | None = None):
 		"""
 		Initializes the video recorder.
 
@@ -46,17 +51,61 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: Frames that may wait for the encoder before new ones are dropped (default: 1s of video).
 		"""
 		self.output_path = output_path
 		self.size = size
 		self.framerate = framerate
-		self._writer: Optional['Format.Writer'] = None
+		self.max_queued_frames = max_queued_frames or max(framerate, 1)
 		self._is_active = False
 		self.padded_size = _get_padded_size(self.size)
 
-	def start(self) -> None:
+		self._process: asyncio.subprocess.Process | None = None
+		self._queue: asyncio.Queue[tuple[str, float] | None] | None = None
+		self._writer_task: asyncio.Task[None] | None = None
+		self._stderr_task: asyncio.Task[None] | None = None
+		self._stderr_tail: deque[str] = deque(maxlen=20)
+
+		self._frames_received = 0
+		self._frames_encoded = 0
+		self._frames_dropped = 0
+		self._latency_total = 0.0
+		self._latency_max = 0.0
+
+	def _build_command(self) -> list[str]:
+		# Build a filter chain for ffmpeg:
+		# 1. scale: Resizes the frame to the user-specified dimensions.
+		# 2. pad: Adds black bars to meet codec's macro-block requirements,
+		#    centering the original content.
+		vf_chain = (
+			f'scale={self.size["width"]}:{self.size["height"]},'
+			f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
+		)
+		return [
+			imageio_ffmpeg.get_ffmpeg_exe(),
+			'-y',
+			'-hide_banner',
+			'-loglevel',
+			'error',
+			'-f',
+			'image2pipe',  # Input format from a pipe
+			'-framerate',
+			str(self.framerate),
+			'-c:v',
+			'png',  # Specify input codec is PNG
+			'-i',
+			'-',  # Input from stdin
+			'-vf',
+			vf_chain,  # Video filter for resizing and padding
+			*_CODEC_ARGS.get(self.output_path.suffix.lstrip('.').lower(), _CODEC_ARGS['mp4']),
+			'-pix_fmt',
+			'yuv420p',  # Ensures compatibility with most players
+			str(self.output_path),
+		]
+
+	async def start(self) -> None:
 		"""
-		Prepares and starts the video writer.
+		Starts the ffmpeg encoder process and the task that feeds it.
 
 		If the required optional dependencies are not installed, this method will
 		log an error and do nothing.
@@ -69,94 +118,103 @@ class VideoRecorderService:
 
 		try:
 			self.output_path.parent.mkdir(parents=True, exist_ok=True)
-			# The macro_block_size is set to None because we handle padding ourselves
-			self._writer = iio.get_writer(
-				str(self.output_path),
-				fps=self.framerate,
-				codec='libx264',
-				quality=8,  # A good balance of quality and file size (1-10 scale)
-				pixelformat='yuv420p',  # Ensures compatibility with most players
-				macro_block_size=None,
+			self._process = await asyncio.create_subprocess_exec(
+				*self._build_command(),
+				stdin=asyncio.subprocess.PIPE,
+				stdout=asyncio.subprocess.DEVNULL,
+				stderr=asyncio.subprocess.PIPE,
 			)
+			# the bound is enforced in add_frame(), so the stop sentinel can always be queued
+			self._queue = asyncio.Queue()
+			self._writer_task = asyncio.create_task(self._feed_encoder(self._process, self._queue))
+			# ffmpeg blocks once the stderr pipe is full, so it is read while recording
+			self._stderr_task = asyncio.create_task(self._read_stderr(self._process))
 			self._is_active = True
 			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 		except Exception as e:
-			logger.error(f'Failed to initialize video writer: {e}')
+			logger.error(f'Failed to start video encoder: {e}')
 			self._is_active = False
 
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded PNG frame for the encoder, or drops it if the encoder is behind.
 
 		Args:
 		    frame_data_b64: A base64-encoded string of the PNG frame data.
 		"""
-		if not self._is_active or not self._writer:
+		if not self._is_active or not self._queue:
 			return
 
-		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Build a filter chain for ffmpeg:
-			# 1. scale: Resizes the frame to the user-specified dimensions.
-			# 2. pad: Adds black bars to meet codec's macro-block requirements,
-			#    centering the original content.
-			vf_chain = (
-				f'scale={self.size["width"]}:{self.size["height"]},'
-				f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
-			)
-
-			output_pix_fmt = 'rgb24'
-			command = [
-				imageio_ffmpeg.get_ffmpeg_exe(),
-				'-f',
-				'image2pipe',  # Input format from a pipe
-				'-c:v',
-				'png',  # Specify input codec is PNG
-				'-i',
-				'-',  # Input from stdin
-				'-vf',
-				vf_chain,  # Video filter for resizing and padding
-				'-f',
-				'rawvideo',  # Output format is raw video
-				'-pix_fmt',
-				output_pix_fmt,  # Output pixel format
-				'-',  # Output to stdout
-			]
-
-			# Execute ffmpeg as a subprocess
-			proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-			out, err = proc.communicate(input=frame_bytes)
-
-			if proc.returncode != 0:
-				err_msg = err.decode(errors='ignore').strip()
-				if 'deprecated pixel format used' not in err_msg.lower():
-					raise OSError(f'ffmpeg error during resizing/padding: {err_msg}')
-				else:
-					logger.debug(f'ffmpeg warning during resizing/padding: {err_msg}')
-
-			# Convert the raw output bytes to a numpy array with the padded dimensions
-			img_array = np.frombuffer(out, dtype=np.uint8).reshape((self.padded_size['height'], self.padded_size['width'], 3))
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
-
-	def stop_and_save(self) -> None:
+		self._frames_received += 1
+		if self._queue.qsize() >= self.max_queued_frames:
+			self._frames_dropped += 1
+			return
+		self._queue.put_nowait((frame_data_b64, time.perf_counter()))
+
+	async def _feed_encoder(self, process: asyncio.subprocess.Process, queue: asyncio.Queue[tuple[str, float] | None]) -> None:
+		assert process.stdin is not None
+		while (item := await queue.get()) is not None:
+			frame_data_b64, queued_at = item
+			try:
+				process.stdin.write(base64.b64decode(frame_data_b64))
+				await process.stdin.drain()
+			except Exception as e:
+				# ffmpeg exited (bad frame data, disk full, ...), nothing more can be encoded
+				logger.warning(f'Video encoder stopped accepting frames: {type(e).__name__}: {e}')
+				self._is_active = False
+				return
+			latency = time.perf_counter() - queued_at
+			self._frames_encoded += 1
+			self._latency_total += latency
+			self._latency_max = max(self._latency_max, latency)
+
+	async def _read_stderr(self, process: asyncio.subprocess.Process) -> None:
+		assert process.stderr is not None
+		async for line in process.stderr:
+			self._stderr_tail.append(line.decode(errors='ignore').rstrip())
+
+	@property
+	def stats(self) -> VideoRecordingStats:
+		"""Frame counters and the time frames spend between `add_frame()` and being handed to ffmpeg."""
+		return VideoRecordingStats(
+			frames_received=self._frames_received,
+			frames_encoded=self._frames_encoded,
+			frames_dropped=self._frames_dropped,
+			frames_queued=self._queue.qsize() if self._queue else 0,
+			encode_latency_avg_ms=self._latency_total / self._frames_encoded * 1000 if self._frames_encoded else 0.0,
+			encode_latency_max_ms=self._latency_max * 1000,
+		)
+
+	async def stop_and_save(self) -> None:
 		"""
-		Finalizes the video file by closing the writer.
+		Encodes the frames still queued and finalizes the video file.
 
 		This method should be called when the recording session is complete.
 		"""
-		if not self._is_active or not self._writer:
+		process, queue, writer_task, stderr_task = self._process, self._queue, self._writer_task, self._stderr_task
+		if not process or not queue or not writer_task or not stderr_task:
 			return
+		self._is_active = False
 
 		try:
-			self._writer.close()
-			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
+			queue.put_nowait(None)
+			await writer_task
+			assert process.stdin is not None
+			process.stdin.close()
+			await process.wait()
+			await stderr_task
+			if process.returncode != 0:
+				stderr = '\n'.join(self._stderr_tail)
+				raise OSError(f'ffmpeg exited with code {process.returncode}: {stderr}')
+			stats = self.stats
+			logger.info(
+				f'📹 Video recording saved successfully to: {self.output_path} '
+				f'({stats.frames_encoded} frames, {stats.frames_dropped} dropped)'
+			)
 		except Exception as e:
 			logger.error(f'Failed to finalize and save video: {e}')
 		finally:
-			self._is_active = False
-			self._writer = None
+			self._process = None
+			self._queue = None
+			self._writer_task = None
+			self._stderr_task = None
@@ -1,11 +1,17 @@
+import base64
+import mmap
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 from bubus import BaseEvent
 from cdp_use.cdp.target import TargetID
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_serializer
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, GetCoreSchemaHandler, field_serializer
+from pydantic_core import core_schema
 
+from browser_use.browser.profile import ScreenshotClip
 from browser_use.dom.views import DOMInteractedElement, SerializedDOMState
+from browser_use.utils import get_image_media_type
 
 # Known placeholder image data for about:blank pages - a 4x4 white PNG
 PLACEHOLDER_4PX_SCREENSHOT = (
@@ -41,6 +47,49 @@ class TabInfo(BaseModel):
 		return parent_target_id[-4:] if parent_target_id else None
 
 
+class CDPConnectionStats(BaseModel):
+	"""WebSocket and session-attach metrics of a browser session's CDP connections"""
+
+	pooled: bool  # whether target sessions are multiplexed over a connection pool
+	sockets_open: int  # including the root connection
+	sockets_opened_total: int
+	sessions: int
+	in_flight_requests: int  # only tracked for pooled connections
+	attach_count: int
+	attach_latency_avg_ms: float
+	attach_latency_max_ms: float
+	attach_latency_last_ms: float
+
+
+class VideoRecordingStats(BaseModel):
+	"""Frame counters of a session video recording"""
+
+	frames_received: int  # screencast frames handed to the recorder
+	frames_encoded: int  # frames written to the encoder
+	frames_dropped: int  # frames dropped because the encoder queue was full
+	frames_queued: int
+	encode_latency_avg_ms: float  # time from receiving a frame until the encoder accepted it
+	encode_latency_max_ms: float
+
+
+DownloadState = Literal['queued', 'in_progress', 'completed', 'canceled', 'failed']
+
+
+class DownloadStats(BaseModel):
+	"""Progress and throughput of a file download in a browser session"""
+
+	guid: str
+	url: str
+	file_name: str
+	state: DownloadState
+	received_bytes: int
+	total_bytes: int | None  # None if the size is not known
+	path: str | None  # where the file was saved, once completed
+	queued_ms: float  # time spent waiting for a download slot, see BrowserProfile.max_concurrent_downloads
+	duration_ms: float  # from start until finished, or until now while in progress
+	throughput_bytes_per_s: float
+
+
 class PageInfo(BaseModel):
 	"""Comprehensive page size and scroll information"""
 
@@ -65,7 +114,67 @@ class PageInfo(BaseModel):
 	# Page statistics are now computed dynamically instead of stored
 
 
-@dataclass
+class Screenshot:
+	"""
+	Encoded screenshot image (png, jpeg or webp), passed around by reference from capture to storage and the LLM.
+
+	The decoded bytes are kept once, the base64 string is only built (and then cached) when a serializer asks for it.
+	Stored screenshots are memory-mapped by `from_file()`, so their pages are only read from disk when accessed.
+	Close those (or use them as a context manager) once done, an open mapping keeps the file locked on Windows.
+	"""
+
+	__slots__ = ('data', 'clip', '_b64')
+
+	def __init__(self, data: bytes | mmap.mmap, clip: ScreenshotClip | None = None):
+		self.data = data
+		# region of the viewport the image covers, None if it shows the whole viewport at device pixel ratio
+		self.clip = clip
+		self._b64: str | None = None
+
+	@classmethod
+	def from_base64(cls, image_b64: str, clip: ScreenshotClip | None = None) -> 'Screenshot':
+		return cls(base64.b64decode(image_b64), clip)
+
+	@classmethod
+	def from_file(cls, path: str | Path) -> 'Screenshot':
+		with open(path, 'rb') as f:
+			return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+	@property
+	def b64(self) -> str:
+		if self._b64 is None:
+			self._b64 = base64.b64encode(self.data).decode('ascii')
+		return self._b64
+
+	@property
+	def media_type(self) -> str:
+		# 12 bytes encode to 16 base64 chars without padding, enough for every magic number
+		return get_image_media_type(base64.b64encode(self.data[:12]).decode('ascii'))
+
+	def close(self) -> None:
+		"""Release the memory mapping of a screenshot loaded with `from_file()`, the base64 string stays usable."""
+		if isinstance(self.data, mmap.mmap):
+			self.data.close()
+
+	def __enter__(self) -> 'Screenshot':
+		return self
+
+	def __exit__(self, *exc_info: Any) -> None:
+		self.close()
+
+	def __len__(self) -> int:
+		return len(self.data)
+
+	def __repr__(self) -> str:
+		return f'Screenshot({self.media_type}, {len(self.data)} bytes)'
+
+	@classmethod
+	def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+		# event results are validated by bubus, pass instances through untouched
+		return core_schema.is_instance_schema(cls)
+
+
+@dataclass(init=False)
 class BrowserStateSummary:
 	"""The summary of the browser's current state designed for an LLM to process"""
 
@@ -75,7 +184,7 @@ class BrowserStateSummary:
 	url: str
 	title: str
 	tabs: list[TabInfo]
-	screenshot: str | None = field(default=None, repr=False)
+	screenshot_data: Screenshot | None = field(default=None, repr=False)
 	page_info: PageInfo | None = None  # Enhanced page information
 
 	# Keep legacy fields for backward compatibility
@@ -85,6 +194,45 @@ class BrowserStateSummary:
 	is_pdf_viewer: bool = False  # Whether the current page is a PDF viewer
 	recent_events: str | None = None  # Text summary of recent browser events
 
+	def __init__(
+		self,
+		dom_state: SerializedDOMState,
+		url: str,
+		title: str,
+		tabs: list[TabInfo],
+		screenshot: str | None = None,
+		page_info: PageInfo | None = None,
+		pixels_above: int = 0,
+		pixels_below: int = 0,
+		browser_errors: list[str] | None = None,
+		is_pdf_viewer: bool = False,
+		recent_events: str | None = None,
+		screenshot_data: Screenshot | None = None,
+	):
+		"""`screenshot` is the base64 string taken before screenshot_data existed, it is decoded into screenshot_data"""
+		self.dom_state = dom_state
+		self.url = url
+		self.title = title
+		self.tabs = tabs
+		self.screenshot_data = screenshot_data
+		if screenshot and screenshot_data is None:
+			self.screenshot = screenshot
+		self.page_info = page_info
+		self.pixels_above = pixels_above
+		self.pixels_below = pixels_below
+		self.browser_errors = browser_errors if browser_errors is not None else []
+		self.is_pdf_viewer = is_pdf_viewer
+		self.recent_events = recent_events
+
+	@property
+	def screenshot(self) -> str | None:
+		"""Base64 encoded screenshot, built on first access. Use screenshot_data when the bytes are enough."""
+		return self.screenshot_data.b64 if self.screenshot_data else None
+
+	@screenshot.setter
+	def screenshot(self, screenshot_b64: str | None) -> None:
+		self.screenshot_data = Screenshot.from_base64(screenshot_b64) if screenshot_b64 else None
+
 
 @dataclass
 class BrowserStateHistory:
@@ -96,24 +244,23 @@ class BrowserStateHistory:
 	interacted_element: list[DOMInteractedElement | None] | list[None]
 	screenshot_path: str | None = None
 
-	def get_screenshot(self) -> str | None:
-		"""Load screenshot from disk and return as base64 string"""
+	def load_screenshot(self) -> Screenshot | None:
+		"""Memory-map the stored screenshot, None if there is none"""
 		if not self.screenshot_path:
 			return None
 
-		import base64
-		from pathlib import Path
-
-		path_obj = Path(self.screenshot_path)
-		if not path_obj.exists():
+		try:
+			return Screenshot.from_file(self.screenshot_path)
+		except (OSError, ValueError):
 			return None
 
-		try:
-			with open(path_obj, 'rb') as f:
-				screenshot_data = f.read()
-			return base64.b64encode(screenshot_data).decode('utf-8')
-		except Exception:
+	def get_screenshot(self) -> str | None:
+		"""Load screenshot from disk and return as base64 string"""
+		screenshot = self.load_screenshot()
+		if not screenshot:
 			return None
+		with screenshot:
+			return screenshot.b64
 
 	def to_dict(self) -> dict[str, Any]:
 		data = {}
@@ -108,8 +108,11 @@ class CrashWatchdog(BaseWatchdog):
 			# cdp_client.on('Network.loadingFinished', on_loading_finished, session_id=session_id)
 
 			def on_target_crashed(event: TargetCrashedEvent, session_id: SessionID | None = None):
+				# Pooled CDP clients carry several targets but keep only one handler per event, so the crashed target
+				# is resolved from the session the event arrived on instead of the target this handler was registered for
+				crashed_target_id = self._get_target_id_for_session(session_id) or event.get('targetId') or target_id
 				# Create and track the task
-				task = asyncio.create_task(self._on_target_crash_cdp(target_id))
+				task = asyncio.create_task(self._on_target_crash_cdp(crashed_target_id))
 				self._cdp_event_tasks.add(task)
 				# Remove from set when done
 				task.add_done_callback(lambda t: self._cdp_event_tasks.discard(t))
@@ -128,6 +131,15 @@ class CrashWatchdog(BaseWatchdog):
 		except Exception as e:
 			self.logger.warning(f'[CrashWatchdog] Failed to attach to target {target_id}: {e}')
 
+	def _get_target_id_for_session(self, session_id: SessionID | None) -> TargetID | None:
+		"""Find the target a CDP session is attached to."""
+		if session_id is None:
+			return None
+		for target_id, cdp_session in self.browser_session._cdp_session_pool.items():
+			if cdp_session.session_id == session_id:
+				return target_id
+		return None
+
 	async def _on_request_cdp(self, event: dict) -> None:
 		"""Track new network request from CDP event."""
 		request_id = event.get('requestId', '')
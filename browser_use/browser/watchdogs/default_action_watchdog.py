@@ -3,6 +3,9 @@
 import asyncio
 import json
 import platform
+from collections import deque
+
+from cdp_use.cdp.input.commands import DispatchKeyEventParameters
 
 from browser_use.browser.events import (
 	ClickElementEvent,
@@ -18,9 +21,11 @@ from browser_use.browser.events import (
 	UploadFileEvent,
 	WaitEvent,
 )
+from browser_use.browser.profile import TypingStrategy
 from browser_use.browser.views import BrowserError, URLNotAllowedError
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.dom.service import EnhancedDOMTreeNode
+from browser_use.utils import match_url_with_domain_pattern
 
 # Import EnhancedDOMTreeNode and rebuild event models that have forward references to it
 # This must be done after all imports are complete
@@ -31,6 +36,91 @@ TypeTextEvent.model_rebuild()
 ScrollEvent.model_rebuild()
 UploadFileEvent.model_rebuild()
 
+# input types whose value can't be typed character by character, e.g. a date input wants its value in yyyy-mm-dd
+_SET_VALUE_INPUT_TYPES = {'date', 'datetime-local', 'month', 'week', 'time', 'color', 'range'}
+_TEXT_INPUT_TYPES = {'text', 'search', 'email', 'url', 'tel', 'password', 'number'}
+
+# key events sent ahead of their replies by the pipelined_keys typing strategy
+_PIPELINED_KEY_EVENTS_IN_FLIGHT = 32
+
+# Center of the largest visible client rect of an element, scrolled into view first unless it's fully visible already.
+# Client rects in iframes are relative to the frame, leave those to DOM.getContentQuads.
+_CLICK_POINT_JS = """
+	function() {
+		if (!this.isConnected || window !== window.top || typeof this.getClientRects !== 'function') return null;
+		const visibleRect = () => {
+			const viewportWidth = document.documentElement.clientWidth || window.innerWidth;
+			const viewportHeight = document.documentElement.clientHeight || window.innerHeight;
+			let best = null;
+			for (const rect of this.getClientRects()) {
+				const left = Math.max(0, rect.left), right = Math.min(viewportWidth, rect.right);
+				const top = Math.max(0, rect.top), bottom = Math.min(viewportHeight, rect.bottom);
+				const area = (right - left) * (bottom - top);
+				if (right > left && bottom > top && (!best || area > best.area)) {
+					best = {x: (left + right) / 2, y: (top + bottom) / 2, area, clipped: area < rect.width * rect.height};
+				}
+			}
+			return best;
+		};
+		let rect = visibleRect();
+		if (!rect || rect.clipped) {
+			this.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
+			rect = visibleRect();
+		}
+		return rect && {x: rect.x, y: rect.y};
+	}
+"""
+
+# Resolves with the first reaction of the page to a click: a DOM mutation, a focus change or a navigation
+_CLICK_SIGNAL_JS = """
+	function(timeoutMs) {
+		const win = this.ownerDocument.defaultView;
+		return new Promise(resolve => {
+			const cleanups = [];
+			const done = reaction => {
+				cleanups.forEach(cleanup => cleanup());
+				resolve(reaction);
+			};
+			const observer = new MutationObserver(() => done('mutation'));
+			observer.observe(this.ownerDocument, {subtree: true, childList: true, attributes: true, characterData: true});
+			cleanups.push(() => observer.disconnect());
+			for (const [type, reaction] of [['focusin', 'focus'], ['beforeunload', 'navigation'], ['pagehide', 'navigation'], ['hashchange', 'navigation'], ['popstate', 'navigation']]) {
+				const listener = () => done(reaction);
+				win.addEventListener(type, listener, true);
+				cleanups.push(() => win.removeEventListener(type, listener, true));
+			}
+			const timer = setTimeout(() => done('timeout'), timeoutMs);
+			cleanups.push(() => clearTimeout(timer));
+		});
+	}
+"""
+# upper bound on waiting for the page to react to a click
+_CLICK_SIGNAL_TIMEOUT_MS = 100
+
+
+def _pick_typing_strategy(element_node: EnhancedDOMTreeNode) -> TypingStrategy:
+	"""Typing strategy for typing_strategy='auto', based on the element type."""
+	attributes = element_node.attributes or {}
+	tag_name = element_node.tag_name
+	input_type = attributes.get('type', 'text').lower()
+
+	if tag_name == 'input' and input_type in _SET_VALUE_INPUT_TYPES:
+		return 'set_value'
+	# comboboxes and autocomplete fields look up suggestions from their key handlers
+	if (
+		attributes.get('role') == 'combobox'
+		or attributes.get('aria-autocomplete', 'none') != 'none'
+		or (tag_name == 'input' and 'list' in attributes)
+	):
+		return 'pipelined_keys'
+	if (
+		(tag_name == 'input' and input_type in _TEXT_INPUT_TYPES)
+		or tag_name == 'textarea'
+		or attributes.get('contenteditable', 'false').lower() in ('', 'true', 'plaintext-only')
+	):
+		return 'insert_text'
+	return 'keystrokes'
+
 
 class DefaultActionWatchdog(BaseWatchdog):
 	"""Handles default browser actions like click, type, and scroll using CDP."""
@@ -248,308 +338,396 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Get CDP client
 			cdp_session = await self.browser_session.cdp_client_for_node(element_node)
+			modifiers = self._get_click_modifiers(while_holding_ctrl)
 
-			# Get the correct session ID for the element's frame
-			session_id = cdp_session.session_id
+			try:
+				# Fast path: one call to scroll the element into view and find the click point, mouse events sent back to back
+				click_point = await self._get_click_point(element_node, cdp_session)
+				if click_point:
+					object_id, click_x, click_y = click_point
+					return await self._dispatch_click_pipelined(cdp_session, object_id, click_x, click_y, modifiers)
+				return await self._click_element_by_quads(element_node, cdp_session, modifiers)
+			finally:
+				# always re-focus back to original top-level page session context in case click opened a new tab/popup/window/dialog/etc.
+				cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
+				await asyncio.gather(
+					cdp_session.cdp_client.send.Target.activateTarget(params={'targetId': cdp_session.target_id}),
+					cdp_session.cdp_client.send.Runtime.runIfWaitingForDebugger(session_id=cdp_session.session_id),
+				)
 
-			# Get element bounds
-			backend_node_id = element_node.backend_node_id
+		except URLNotAllowedError as e:
+			raise e
+		except BrowserError as e:
+			raise e
+		except Exception as e:
+			# Extract key element info for error message
+			element_info = f'<{element_node.tag_name or "unknown"}'
+			if element_node.element_index:
+				element_info += f' index={element_node.element_index}'
+			element_info += '>'
+			raise BrowserError(
+				message=f'Failed to click element: {e}',
+				long_term_memory=f'Failed to click element {element_info}. The element may not be interactable or visible.',
+			)
 
-			# Get viewport dimensions for visibility checks
-			layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
-			viewport_width = layout_metrics['layoutViewport']['clientWidth']
-			viewport_height = layout_metrics['layoutViewport']['clientHeight']
+	def _get_click_modifiers(self, while_holding_ctrl: bool) -> int:
+		"""Modifier bitmask for the mouse events of a click."""
+		# CDP Modifier bits: Alt=1, Control=2, Meta/Command=4, Shift=8
+		if not while_holding_ctrl:
+			return 0
+		# Use platform-appropriate modifier for "open in new tab"
+		if platform.system() == 'Darwin':
+			self.logger.debug('⌘ Using Cmd modifier for new tab click...')
+			return 4  # Meta/Cmd key
+		self.logger.debug('⌃ Using Ctrl modifier for new tab click...')
+		return 2  # Control key
+
+	async def _get_click_point(self, element_node: EnhancedDOMTreeNode, cdp_session) -> tuple[str, float, float] | None:
+		"""Scroll the element into view if needed and get its click point, in one Runtime.callFunctionOn.
+
+		Returns (object_id, x, y), or None if the element has no visible box or lives in an iframe, where only
+		DOM.getContentQuads knows the offset of the frame.
+		"""
+		try:
+			object_id = (await self.browser_session.get_node_handle(element_node)).object_id
+			point_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+				params={'functionDeclaration': _CLICK_POINT_JS, 'objectId': object_id, 'returnByValue': True},
+				session_id=cdp_session.session_id,
+			)
+		except Exception as e:
+			self.logger.debug(f'Getting the click point in one call failed: {type(e).__name__}: {e}')
+			return None
+
+		point = point_result.get('result', {}).get('value')
+		if not point:
+			return None
+		return object_id, point['x'], point['y']
 
-			# Try multiple methods to get element geometry
-			quads = []
+	async def _dispatch_click_pipelined(
+		self, cdp_session, object_id: str, click_x: float, click_y: float, modifiers: int
+	) -> dict | None:
+		"""Send the mouse events of a click without waiting for each reply, then wait for the page to react.
 
-			# Method 1: Try DOM.getContentQuads first (best for inline elements and complex layouts)
+		The browser handles the commands of a session in the order they arrive. Instead of fixed sleeps the click
+		returns on the first DOM mutation, focus change or navigation after it, or after _CLICK_SIGNAL_TIMEOUT_MS.
+		"""
+		send = cdp_session.cdp_client.send
+		session_id = cdp_session.session_id
+		button = {'x': click_x, 'y': click_y, 'button': 'left', 'clickCount': 1, 'modifiers': modifiers}
+
+		self.logger.debug(f'👆🏾 Clicking x: {click_x}px y: {click_y}px with modifiers: {modifiers} ...')
+		moved = asyncio.create_task(
+			send.Input.dispatchMouseEvent(params={'type': 'mouseMoved', 'x': click_x, 'y': click_y}, session_id=session_id)
+		)
+		# armed after the mouse move, so hover effects don't count as a reaction to the click. The command itself is
+		# queued here (not inside a wait_for, which runs it in yet another task) so it goes out before mousePressed.
+		signal = asyncio.create_task(
+			send.Runtime.callFunctionOn(
+				params={
+					'functionDeclaration': _CLICK_SIGNAL_JS,
+					'objectId': object_id,
+					'arguments': [{'value': _CLICK_SIGNAL_TIMEOUT_MS}],
+					'awaitPromise': True,
+					'returnByValue': True,
+				},
+				session_id=session_id,
+			)
+		)
+		pressed = asyncio.create_task(
+			send.Input.dispatchMouseEvent(params={'type': 'mousePressed', **button}, session_id=session_id)
+		)
+		released = asyncio.create_task(
+			send.Input.dispatchMouseEvent(params={'type': 'mouseReleased', **button}, session_id=session_id)
+		)
+		try:
 			try:
-				content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
-					params={'backendNodeId': backend_node_id}, session_id=session_id
+				await asyncio.wait_for(asyncio.gather(moved, pressed, released), timeout=3.0)
+			except TimeoutError:
+				self.logger.debug('⏱️ Mouse events timed out (possibly due to lag or dialog popup), continuing...')
+			reaction = await self._wait_for_click_signal(signal)
+		except Exception as e:
+			self.logger.warning(f'CDP click failed: {type(e).__name__}: {e}')
+			# Fall back to JavaScript click via CDP
+			try:
+				await send.Runtime.callFunctionOn(
+					params={'functionDeclaration': 'function() { this.click(); }', 'objectId': object_id}, session_id=session_id
 				)
-				if 'quads' in content_quads_result and content_quads_result['quads']:
-					quads = content_quads_result['quads']
-					self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
-			except Exception as e:
-				self.logger.debug(f'DOM.getContentQuads failed: {e}')
+				await asyncio.sleep(0.1)
+				# Navigation is handled by BrowserSession via events
+				return None
+			except Exception as js_e:
+				self.logger.error(f'CDP JavaScript click also failed: {js_e}')
+				raise Exception(f'Failed to click element: {e}')
+		finally:
+			signal.cancel()
+
+		self.logger.debug(f'🖱️ Clicked successfully using x,y coordinates, page reaction: {reaction}')
+		return {'click_x': click_x, 'click_y': click_y}
+
+	async def _wait_for_click_signal(self, signal: asyncio.Task) -> str:
+		"""Wait for the page to react to a click: 'mutation', 'focus', 'navigation' or 'timeout'."""
+		try:
+			# timers don't run while a dialog is open
+			result = await asyncio.wait_for(signal, timeout=1.0)
+		except TimeoutError:
+			return 'timeout'
+		except Exception:
+			# the execution context went away with the page
+			return 'navigation'
+		return result.get('result', {}).get('value') or 'timeout'
 
-			# Method 2: Fall back to DOM.getBoxModel
-			if not quads:
-				try:
-					box_model = await cdp_session.cdp_client.send.DOM.getBoxModel(
-						params={'backendNodeId': backend_node_id}, session_id=session_id
-					)
-					if 'model' in box_model and 'content' in box_model['model']:
-						content_quad = box_model['model']['content']
-						if len(content_quad) >= 8:
-							# Convert box model format to quad format
-							quads = [
-								[
-									content_quad[0],
-									content_quad[1],  # x1, y1
-									content_quad[2],
-									content_quad[3],  # x2, y2
-									content_quad[4],
-									content_quad[5],  # x3, y3
-									content_quad[6],
-									content_quad[7],  # x4, y4
-								]
-							]
-							self.logger.debug('Got quad from DOM.getBoxModel')
-				except Exception as e:
-					self.logger.debug(f'DOM.getBoxModel failed: {e}')
+	async def _click_element_by_quads(self, element_node, cdp_session, modifiers: int) -> dict | None:
+		"""Click an element at the center of its largest visible quad, trying several CDP methods to get its geometry."""
+		# Get the correct session ID for the element's frame
+		session_id = cdp_session.session_id
 
-			# Method 3: Fall back to JavaScript getBoundingClientRect
-			if not quads:
-				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
-					)
-					if 'object' in result and 'objectId' in result['object']:
-						object_id = result['object']['objectId']
+		# Get element bounds
+		backend_node_id = element_node.backend_node_id
 
-						# Get bounding rect via JavaScript
-						bounds_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
-							params={
-								'functionDeclaration': """
-									function() {
-										const rect = this.getBoundingClientRect();
-										return {
-											x: rect.left,
-											y: rect.top,
-											width: rect.width,
-											height: rect.height
-										};
-									}
-								""",
-								'objectId': object_id,
-								'returnByValue': True,
-							},
-							session_id=session_id,
-						)
+		# Get viewport dimensions for visibility checks
+		layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
+		viewport_width = layout_metrics['layoutViewport']['clientWidth']
+		viewport_height = layout_metrics['layoutViewport']['clientHeight']
 
-						if 'result' in bounds_result and 'value' in bounds_result['result']:
-							rect = bounds_result['result']['value']
-							# Convert rect to quad format
-							x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
-							quads = [
-								[
-									x,
-									y,  # top-left
-									x + w,
-									y,  # top-right
-									x + w,
-									y + h,  # bottom-right
-									x,
-									y + h,  # bottom-left
-								]
-							]
-							self.logger.debug('Got quad from getBoundingClientRect')
-				except Exception as e:
-					self.logger.debug(f'JavaScript getBoundingClientRect failed: {e}')
+		# Try multiple methods to get element geometry
+		quads = []
 
-			# If we still don't have quads, fall back to JS click
-			if not quads:
-				self.logger.warning('⚠️ Could not get element geometry from any method, falling back to JavaScript click')
-				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
-					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-					)
-					object_id = result['object']['objectId']
+		# Method 1: Try DOM.getContentQuads first (best for inline elements and complex layouts)
+		try:
+			content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
+				params={'backendNodeId': backend_node_id}, session_id=session_id
+			)
+			if 'quads' in content_quads_result and content_quads_result['quads']:
+				quads = content_quads_result['quads']
+				self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
+		except Exception as e:
+			self.logger.debug(f'DOM.getContentQuads failed: {e}')
 
-					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+		# Method 2: Fall back to DOM.getBoxModel
+		if not quads:
+			try:
+				box_model = await cdp_session.cdp_client.send.DOM.getBoxModel(
+					params={'backendNodeId': backend_node_id}, session_id=session_id
+				)
+				if 'model' in box_model and 'content' in box_model['model']:
+					content_quad = box_model['model']['content']
+					if len(content_quad) >= 8:
+						# Convert box model format to quad format
+						quads = [
+							[
+								content_quad[0],
+								content_quad[1],  # x1, y1
+								content_quad[2],
+								content_quad[3],  # x2, y2
+								content_quad[4],
+								content_quad[5],  # x3, y3
+								content_quad[6],
+								content_quad[7],  # x4, y4
+							]
+						]
+						self.logger.debug('Got quad from DOM.getBoxModel')
+			except Exception as e:
+				self.logger.debug(f'DOM.getBoxModel failed: {e}')
+
+		# Method 3: Fall back to JavaScript getBoundingClientRect
+		if not quads:
+			try:
+				object_id = (await self.browser_session.get_node_handle(element_node)).object_id
+				if object_id:
+					# Get bounding rect via JavaScript
+					bounds_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 						params={
-							'functionDeclaration': 'function() { this.click(); }',
+							'functionDeclaration': """
+								function() {
+									const rect = this.getBoundingClientRect();
+									return {
+										x: rect.left,
+										y: rect.top,
+										width: rect.width,
+										height: rect.height
+									};
+								}
+							""",
 							'objectId': object_id,
+							'returnByValue': True,
 						},
 						session_id=session_id,
 					)
-					await asyncio.sleep(0.05)
-					# Navigation is handled by BrowserSession via events
-					return None
-				except Exception as js_e:
-					self.logger.error(f'CDP JavaScript click also failed: {js_e}')
-					raise Exception(f'Failed to click element: {js_e}')
-
-			# Find the largest visible quad within the viewport
-			best_quad = None
-			best_area = 0
-
-			for quad in quads:
-				if len(quad) < 8:
-					continue
-
-				# Calculate quad bounds
-				xs = [quad[i] for i in range(0, 8, 2)]
-				ys = [quad[i] for i in range(1, 8, 2)]
-				min_x, max_x = min(xs), max(xs)
-				min_y, max_y = min(ys), max(ys)
-
-				# Check if quad intersects with viewport
-				if max_x < 0 or max_y < 0 or min_x > viewport_width or min_y > viewport_height:
-					continue  # Quad is completely outside viewport
-
-				# Calculate visible area (intersection with viewport)
-				visible_min_x = max(0, min_x)
-				visible_max_x = min(viewport_width, max_x)
-				visible_min_y = max(0, min_y)
-				visible_max_y = min(viewport_height, max_y)
-
-				visible_width = visible_max_x - visible_min_x
-				visible_height = visible_max_y - visible_min_y
-				visible_area = visible_width * visible_height
-
-				if visible_area > best_area:
-					best_area = visible_area
-					best_quad = quad
-
-			if not best_quad:
-				# No visible quad found, use the first quad anyway
-				best_quad = quads[0]
-				self.logger.warning('No visible quad found, using first quad')
-
-			# Calculate center point of the best quad
-			center_x = sum(best_quad[i] for i in range(0, 8, 2)) / 4
-			center_y = sum(best_quad[i] for i in range(1, 8, 2)) / 4
-
-			# Ensure click point is within viewport bounds
-			center_x = max(0, min(viewport_width - 1, center_x))
-			center_y = max(0, min(viewport_height - 1, center_y))
 
-			# Scroll element into view
-			try:
-				await cdp_session.cdp_client.send.DOM.scrollIntoViewIfNeeded(
-					params={'backendNodeId': backend_node_id}, session_id=session_id
-				)
-				await asyncio.sleep(0.05)  # Wait for scroll to complete
+					if 'result' in bounds_result and 'value' in bounds_result['result']:
+						rect = bounds_result['result']['value']
+						# Convert rect to quad format
+						x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
+						quads = [
+							[
+								x,
+								y,  # top-left
+								x + w,
+								y,  # top-right
+								x + w,
+								y + h,  # bottom-right
+								x,
+								y + h,  # bottom-left
+							]
+						]
+						self.logger.debug('Got quad from getBoundingClientRect')
 			except Exception as e:
-				self.logger.debug(f'Failed to scroll element into view: {e}')
+				self.logger.debug(f'JavaScript getBoundingClientRect failed: {e}')
 
-			# Perform the click using CDP
-			# TODO: do occlusion detection first, if element is not on the top, fire JS-based
-			# click event instead using xpath of x,y coordinate clicking, because we wont be able to click *through* occluding elements using x,y clicks
+		# If we still don't have quads, fall back to JS click
+		if not quads:
+			self.logger.warning('⚠️ Could not get element geometry from any method, falling back to JavaScript click')
 			try:
-				self.logger.debug(f'👆 Dragging mouse over element before clicking x: {center_x}px y: {center_y}px ...')
-				# Move mouse to element
-				await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+				object_id = (await self.browser_session.get_node_handle(element_node)).object_id
+
+				await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 					params={
-						'type': 'mouseMoved',
-						'x': center_x,
-						'y': center_y,
+						'functionDeclaration': 'function() { this.click(); }',
+						'objectId': object_id,
 					},
 					session_id=session_id,
 				)
 				await asyncio.sleep(0.05)
+				# Navigation is handled by BrowserSession via events
+				return None
+			except Exception as js_e:
+				self.logger.error(f'CDP JavaScript click also failed: {js_e}')
+				raise Exception(f'Failed to click element: {js_e}')
+
+		# Find the largest visible quad within the viewport
+		best_quad = None
+		best_area = 0
+
+		for quad in quads:
+			if len(quad) < 8:
+				continue
 
-				# Calculate modifier bitmask for CDP
-				# CDP Modifier bits: Alt=1, Control=2, Meta/Command=4, Shift=8
-				modifiers = 0
-				if while_holding_ctrl:
-					# Use platform-appropriate modifier for "open in new tab"
-					if platform.system() == 'Darwin':
-						modifiers = 4  # Meta/Cmd key
-						self.logger.debug('⌘ Using Cmd modifier for new tab click...')
-					else:
-						modifiers = 2  # Control key
-						self.logger.debug('⌃ Using Ctrl modifier for new tab click...')
+			# Calculate quad bounds
+			xs = [quad[i] for i in range(0, 8, 2)]
+			ys = [quad[i] for i in range(1, 8, 2)]
+			min_x, max_x = min(xs), max(xs)
+			min_y, max_y = min(ys), max(ys)
 
-				# Mouse down
-				self.logger.debug(f'👆🏾 Clicking x: {center_x}px y: {center_y}px with modifiers: {modifiers} ...')
-				try:
-					await asyncio.wait_for(
-						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
-							params={
-								'type': 'mousePressed',
-								'x': center_x,
-								'y': center_y,
-								'button': 'left',
-								'clickCount': 1,
-								'modifiers': modifiers,
-							},
-							session_id=session_id,
-						),
-						timeout=1.0,  # 1 second timeout for mousePressed
-					)
-					await asyncio.sleep(0.08)
-				except TimeoutError:
-					self.logger.debug('⏱️ Mouse down timed out (likely due to dialog), continuing...')
-					# Don't sleep if we timed out
+			# Check if quad intersects with viewport
+			if max_x < 0 or max_y < 0 or min_x > viewport_width or min_y > viewport_height:
+				continue  # Quad is completely outside viewport
 
-				# Mouse up
-				try:
-					await asyncio.wait_for(
-						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
-							params={
-								'type': 'mouseReleased',
-								'x': center_x,
-								'y': center_y,
-								'button': 'left',
-								'clickCount': 1,
-								'modifiers': modifiers,
-							},
-							session_id=session_id,
-						),
-						timeout=3.0,  # 1 second timeout for mouseReleased
-					)
-				except TimeoutError:
-					self.logger.debug('⏱️ Mouse up timed out (possibly due to lag or dialog popup), continuing...')
+			# Calculate visible area (intersection with viewport)
+			visible_min_x = max(0, min_x)
+			visible_max_x = min(viewport_width, max_x)
+			visible_min_y = max(0, min_y)
+			visible_max_y = min(viewport_height, max_y)
 
-				self.logger.debug('🖱️ Clicked successfully using x,y coordinates')
-				# Return coordinates as dict for metadata
-				return {'click_x': center_x, 'click_y': center_y}
+			visible_width = visible_max_x - visible_min_x
+			visible_height = visible_max_y - visible_min_y
+			visible_area = visible_width * visible_height
 
-			except Exception as e:
-				self.logger.warning(f'CDP click failed: {type(e).__name__}: {e}')
-				# Fall back to JavaScript click via CDP
-				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
+			if visible_area > best_area:
+				best_area = visible_area
+				best_quad = quad
+
+		if not best_quad:
+			# No visible quad found, use the first quad anyway
+			best_quad = quads[0]
+			self.logger.warning('No visible quad found, using first quad')
+
+		# Calculate center point of the best quad
+		center_x = sum(best_quad[i] for i in range(0, 8, 2)) / 4
+		center_y = sum(best_quad[i] for i in range(1, 8, 2)) / 4
+
+		# Ensure click point is within viewport bounds
+		center_x = max(0, min(viewport_width - 1, center_x))
+		center_y = max(0, min(viewport_height - 1, center_y))
+
+		# Scroll element into view
+		try:
+			await cdp_session.cdp_client.send.DOM.scrollIntoViewIfNeeded(
+				params={'backendNodeId': backend_node_id}, session_id=session_id
+			)
+			await asyncio.sleep(0.05)  # Wait for scroll to complete
+		except Exception as e:
+			self.logger.debug(f'Failed to scroll element into view: {e}')
+
+		# Perform the click using CDP
+		# TODO: do occlusion detection first, if element is not on the top, fire JS-based
+		# click event instead using xpath of x,y coordinate clicking, because we wont be able to click *through* occluding elements using x,y clicks
+		try:
+			self.logger.debug(f'👆 Dragging mouse over element before clicking x: {center_x}px y: {center_y}px ...')
+			# Move mouse to element
+			await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+				params={
+					'type': 'mouseMoved',
+					'x': center_x,
+					'y': center_y,
+				},
+				session_id=session_id,
+			)
+			await asyncio.sleep(0.05)
+
+			# Mouse down
+			self.logger.debug(f'👆🏾 Clicking x: {center_x}px y: {center_y}px with modifiers: {modifiers} ...')
+			try:
+				await asyncio.wait_for(
+					cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+						params={
+							'type': 'mousePressed',
+							'x': center_x,
+							'y': center_y,
+							'button': 'left',
+							'clickCount': 1,
+							'modifiers': modifiers,
+						},
 						session_id=session_id,
-					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-					)
-					object_id = result['object']['objectId']
+					),
+					timeout=1.0,  # 1 second timeout for mousePressed
+				)
+				await asyncio.sleep(0.08)
+			except TimeoutError:
+				self.logger.debug('⏱️ Mouse down timed out (likely due to dialog), continuing...')
+				# Don't sleep if we timed out
 
-					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+			# Mouse up
+			try:
+				await asyncio.wait_for(
+					cdp_session.cdp_client.send.Input.dispatchMouseEvent(
 						params={
-							'functionDeclaration': 'function() { this.click(); }',
-							'objectId': object_id,
+							'type': 'mouseReleased',
+							'x': center_x,
+							'y': center_y,
+							'button': 'left',
+							'clickCount': 1,
+							'modifiers': modifiers,
 						},
 						session_id=session_id,
-					)
-					await asyncio.sleep(0.1)
-					# Navigation is handled by BrowserSession via events
-					return None
-				except Exception as js_e:
-					self.logger.error(f'CDP JavaScript click also failed: {js_e}')
-					raise Exception(f'Failed to click element: {e}')
-			finally:
-				# always re-focus back to original top-level page session context in case click opened a new tab/popup/window/dialog/etc.
-				cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-				await cdp_session.cdp_client.send.Target.activateTarget(params={'targetId': cdp_session.target_id})
-				await cdp_session.cdp_client.send.Runtime.runIfWaitingForDebugger(session_id=cdp_session.session_id)
+					),
+					timeout=3.0,  # 1 second timeout for mouseReleased
+				)
+			except TimeoutError:
+				self.logger.debug('⏱️ Mouse up timed out (possibly due to lag or dialog popup), continuing...')
+
+			self.logger.debug('🖱️ Clicked successfully using x,y coordinates')
+			# Return coordinates as dict for metadata
+			return {'click_x': center_x, 'click_y': center_y}
 
-		except URLNotAllowedError as e:
-			raise e
-		except BrowserError as e:
-			raise e
 		except Exception as e:
-			# Extract key element info for error message
-			element_info = f'<{element_node.tag_name or "unknown"}'
-			if element_node.element_index:
-				element_info += f' index={element_node.element_index}'
-			element_info += '>'
-			raise BrowserError(
-				message=f'Failed to click element: {e}',
-				long_term_memory=f'Failed to click element {element_info}. The element may not be interactable or visible.',
-			)
+			self.logger.warning(f'CDP click failed: {type(e).__name__}: {e}')
+			# Fall back to JavaScript click via CDP
+			try:
+				object_id = (await self.browser_session.get_node_handle(element_node)).object_id
+
+				await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+					params={
+						'functionDeclaration': 'function() { this.click(); }',
+						'objectId': object_id,
+					},
+					session_id=session_id,
+				)
+				await asyncio.sleep(0.1)
+				# Navigation is handled by BrowserSession via events
+				return None
+			except Exception as js_e:
+				self.logger.error(f'CDP JavaScript click also failed: {js_e}')
+				raise Exception(f'Failed to click element: {e}')
 
 	async def _type_to_page(self, text: str):
 		"""
@@ -933,6 +1111,76 @@ class DefaultActionWatchdog(BaseWatchdog):
 		self.logger.warning('⚠️ All focus strategies failed')
 		return False
 
+	def _get_key_events_for_char(self, char: str) -> list[DispatchKeyEventParameters]:
+		"""Input.dispatchKeyEvent params for typing one character: keyDown, char, keyUp."""
+		# Get proper modifiers, VK code, and base key for the character
+		modifiers, vk_code, base_key = self._get_char_modifiers_and_vk(char)
+		key_code = self._get_key_code_for_char(base_key)
+		return [
+			# keyDown and keyUp have NO text parameter
+			{'type': 'keyDown', 'key': base_key, 'code': key_code, 'modifiers': modifiers, 'windowsVirtualKeyCode': vk_code},
+			# the char event carries the text - this is crucial for text input
+			{'type': 'char', 'text': char, 'key': char},
+			{'type': 'keyUp', 'key': base_key, 'code': key_code, 'modifiers': modifiers, 'windowsVirtualKeyCode': vk_code},
+		]
+
+	async def _get_typing_strategy(self, element_node: EnhancedDOMTreeNode) -> TypingStrategy:
+		"""Typing strategy for an element: a matching per-domain override, the profile setting, or picked from the element type."""
+		profile = self.browser_session.browser_profile
+		if profile.typing_strategy_overrides:
+			url = await self.browser_session.get_current_page_url()
+			for domain_pattern, strategy in profile.typing_strategy_overrides.items():
+				if match_url_with_domain_pattern(url, domain_pattern):
+					return strategy if strategy != 'auto' else _pick_typing_strategy(element_node)
+		if profile.typing_strategy == 'auto':
+			return _pick_typing_strategy(element_node)
+		return profile.typing_strategy
+
+	async def _set_element_value(self, object_id: str, text: str, clear_existing: bool, cdp_session) -> bool:
+		"""Set the value of an input in one call and fire input/change events. False if the element has no value."""
+		result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+			params={
+				'functionDeclaration': """
+					function(text, append) {
+						if (!('value' in this)) return false;
+						const value = append ? this.value + text : text;
+						// use the native setter, frameworks like React ignore values assigned through their own wrapper
+						const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(this), 'value')?.set;
+						if (setter) setter.call(this, value); else this.value = value;
+						this.dispatchEvent(new Event("input", { bubbles: true }));
+						this.dispatchEvent(new Event("change", { bubbles: true }));
+						return true;
+					}
+				""",
+				'objectId': object_id,
+				'arguments': [{'value': text}, {'value': not clear_existing}],
+				'returnByValue': True,
+			},
+			session_id=cdp_session.session_id,
+		)
+		return bool(result.get('result', {}).get('value'))
+
+	async def _dispatch_key_events_pipelined(self, key_events: list[DispatchKeyEventParameters], cdp_session) -> None:
+		"""Send key events without waiting for the reply to each one before sending the next.
+
+		The browser handles the commands of a session in the order they arrive, so the text still comes out in order.
+		"""
+		in_flight: deque[asyncio.Task] = deque()
+		try:
+			for params in key_events:
+				in_flight.append(
+					asyncio.create_task(
+						cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=params, session_id=cdp_session.session_id)
+					)
+				)
+				if len(in_flight) >= _PIPELINED_KEY_EVENTS_IN_FLIGHT:
+					await in_flight.popleft()
+			while in_flight:
+				await in_flight.popleft()
+		finally:
+			for task in in_flight:
+				task.cancel()
+
 	async def _input_text_element_node_impl(
 		self, element_node: EnhancedDOMTreeNode, text: str, clear_existing: bool = True
 	) -> dict | None:
@@ -941,9 +1189,6 @@ class DefaultActionWatchdog(BaseWatchdog):
 		"""
 
 		try:
-			# Get CDP client
-			cdp_client = self.browser_session.cdp_client
-
 			# Get the correct session ID for the element's iframe
 			# session_id = await self._get_session_id_for_element(element_node)
 
@@ -968,14 +1213,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 				)
 
 			# Get object ID for the element
-			result = await cdp_client.send.DOM.resolveNode(
-				params={'backendNodeId': backend_node_id},
-				session_id=cdp_session.session_id,
-			)
-			assert 'object' in result and 'objectId' in result['object'], (
-				'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-			)
-			object_id = result['object']['objectId']
+			object_id = (await self.browser_session.get_node_handle(element_node)).object_id
 
 			# Use element_node absolute_position coordinates (correct coordinates including iframe offsets)
 			if element_node.absolute_position:
@@ -1002,56 +1240,34 @@ class DefaultActionWatchdog(BaseWatchdog):
 				if not cleared_successfully:
 					self.logger.warning('⚠️ Text field clearing failed, typing may append to existing text')
 
-			# Step 3: Type the text character by character using proper human-like key events
-			# This emulates exactly how a human would type, which modern websites expect
-			self.logger.debug(f'🎯 Typing text character by character: "{text}"')
-
-			for i, char in enumerate(text):
-				# Get proper modifiers, VK code, and base key for the character
-				modifiers, vk_code, base_key = self._get_char_modifiers_and_vk(char)
-				key_code = self._get_key_code_for_char(base_key)
-
-				# self.logger.debug(f'🎯 Typing character {i + 1}/{len(text)}: "{char}" (base_key: {base_key}, code: {key_code}, modifiers: {modifiers}, vk: {vk_code})')
-
-				# Step 1: Send keyDown event (NO text parameter)
-				await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-					params={
-						'type': 'keyDown',
-						'key': base_key,
-						'code': key_code,
-						'modifiers': modifiers,
-						'windowsVirtualKeyCode': vk_code,
-					},
-					session_id=cdp_session.session_id,
-				)
-
-				# Small delay to emulate human typing speed
-				await asyncio.sleep(0.001)
-
-				# Step 2: Send char event (WITH text parameter) - this is crucial for text input
-				await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-					params={
-						'type': 'char',
-						'text': char,
-						'key': char,
-					},
-					session_id=cdp_session.session_id,
+			# Step 3: Type the text
+			strategy = await self._get_typing_strategy(element_node)
+			self.logger.debug(f'🎯 Typing text using {strategy}: "{text}"')
+
+			if strategy == 'set_value':
+				if not await self._set_element_value(object_id, text, clear_existing, cdp_session):
+					# no value property (e.g. a contenteditable element), insert the text where the caret is instead
+					strategy = 'insert_text'
+
+			if strategy == 'insert_text':
+				# a single call, fires beforeinput/input like typing but no key events
+				await cdp_session.cdp_client.send.Input.insertText(params={'text': text}, session_id=cdp_session.session_id)
+			elif strategy == 'pipelined_keys':
+				await self._dispatch_key_events_pipelined(
+					[params for char in text for params in self._get_key_events_for_char(char)], cdp_session
 				)
-
-				# Step 3: Send keyUp event (NO text parameter)
-				await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-					params={
-						'type': 'keyUp',
-						'key': base_key,
-						'code': key_code,
-						'modifiers': modifiers,
-						'windowsVirtualKeyCode': vk_code,
-					},
-					session_id=cdp_session.session_id,
-				)
-
-				# Small delay between characters to look human (realistic typing speed)
-				await asyncio.sleep(0.001)
+			elif strategy == 'keystrokes':
+				# Type the text character by character using proper human-like key events
+				# This emulates exactly how a human would type, which modern websites expect
+				for char in text:
+					key_down, key_char, key_up = self._get_key_events_for_char(char)
+					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=key_down, session_id=cdp_session.session_id)
+					# Small delay to emulate human typing speed
+					await asyncio.sleep(0.001)
+					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=key_char, session_id=cdp_session.session_id)
+					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=key_up, session_id=cdp_session.session_id)
+					# Small delay between characters to look human (realistic typing speed)
+					await asyncio.sleep(0.001)
 
 			# Return coordinates metadata if available
 			return input_coordinates
@@ -1119,14 +1335,8 @@ class DefaultActionWatchdog(BaseWatchdog):
 				backend_node_id = element_node.backend_node_id
 
 				# Resolve the node to get an object ID
-				result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': backend_node_id},
-					session_id=cdp_session.session_id,
-				)
-
-				if 'object' in result and 'objectId' in result['object']:
-					object_id = result['object']['objectId']
-
+				object_id = (await self.browser_session.get_node_handle(element_node)).object_id
+				if object_id:
 					# Scroll the iframe's content directly
 					scroll_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 						params={
@@ -1607,18 +1817,9 @@ class DefaultActionWatchdog(BaseWatchdog):
 			element_node = event.node
 			index_for_logging = element_node.element_index or 'unknown'
 
-			# Get CDP session for this node
-			cdp_session = await self.browser_session.cdp_client_for_node(element_node)
-
-			# Convert node to object ID for CDP operations
+			# Get CDP session and object ID for this node
 			try:
-				object_result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': element_node.backend_node_id}, session_id=cdp_session.session_id
-				)
-				remote_object = object_result.get('object', {})
-				object_id = remote_object.get('objectId')
-				if not object_id:
-					raise ValueError('Could not get object ID from resolved node')
+				cdp_session, object_id = await self.browser_session.get_node_handle(element_node)
 			except Exception as e:
 				raise ValueError(f'Failed to resolve node to object: {e}') from e
 
@@ -1828,18 +2029,9 @@ class DefaultActionWatchdog(BaseWatchdog):
 			index_for_logging = element_node.element_index or 'unknown'
 			target_text = event.text
 
-			# Get CDP session for this node
-			cdp_session = await self.browser_session.cdp_client_for_node(element_node)
-
-			# Convert node to object ID for CDP operations
+			# Get CDP session and object ID for this node
 			try:
-				object_result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': element_node.backend_node_id}, session_id=cdp_session.session_id
-				)
-				remote_object = object_result.get('object', {})
-				object_id = remote_object.get('objectId')
-				if not object_id:
-					raise ValueError('Could not get object ID from resolved node')
+				cdp_session, object_id = await self.browser_session.get_node_handle(element_node)
 			except Exception as e:
 				raise ValueError(f'Failed to resolve node to object: {e}') from e
 
@@ -20,7 +20,7 @@ from browser_use.observability import observe_debug
 from browser_use.utils import time_execution_async
 
 if TYPE_CHECKING:
-	from browser_use.browser.views import BrowserStateSummary, PageInfo
+	from browser_use.browser.views import BrowserStateSummary, PageInfo, Screenshot
 
 
 class DOMWatchdog(BaseWatchdog):
@@ -146,7 +146,7 @@ class DOMWatchdog(BaseWatchdog):
 				content = SerializedDOMState(_root=None, selector_map={})
 
 				# Skip screenshot for empty pages
-				screenshot_b64 = None
+				screenshot = None
 
 				# Try to get page info from CDP, fall back to defaults if unavailable
 				try:
@@ -173,7 +173,7 @@ class DOMWatchdog(BaseWatchdog):
 					url=page_url,
 					title='Empty Tab',
 					tabs=tabs_info,
-					screenshot=screenshot_b64,
+					screenshot_data=screenshot,
 					page_info=page_info,
 					pixels_above=0,
 					pixels_below=0,
@@ -205,7 +205,7 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Wait for both tasks to complete
 			content = None
-			screenshot_b64 = None
+			screenshot = None
 
 			if dom_task:
 				try:
@@ -219,14 +219,14 @@ class DOMWatchdog(BaseWatchdog):
 
 			if screenshot_task:
 				try:
-					screenshot_b64 = await screenshot_task
+					screenshot = await screenshot_task
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Clean screenshot captured')
 				except Exception as e:
 					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
-					screenshot_b64 = None
+					screenshot = None
 
 			# Apply Python-based highlighting if both DOM and screenshot are available
-			if screenshot_b64 and content and content.selector_map and self.browser_session.browser_profile.highlight_elements:
+			if screenshot and content and content.selector_map and self.browser_session.browser_profile.highlight_elements:
 				try:
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🎨 Applying Python-based highlighting...')
 					from browser_use.browser.python_highlights import create_highlighted_screenshot_async
@@ -234,11 +234,13 @@ class DOMWatchdog(BaseWatchdog):
 					# Get CDP session for viewport info
 					cdp_session = await self.browser_session.get_or_create_cdp_session()
 					start = time.time()
-					screenshot_b64 = await create_highlighted_screenshot_async(
-						screenshot_b64,
+					screenshot = await create_highlighted_screenshot_async(
+						screenshot,
 						content.selector_map,
 						cdp_session,
 						self.browser_session.browser_profile.filter_highlight_ids,
+						self.browser_session.browser_profile.screenshot_format,
+						self.browser_session.browser_profile.screenshot_quality,
 					)
 					self.logger.debug(
 						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Applied highlights to {len(content.selector_map)} elements in {time.time() - start:.2f}s'
@@ -289,9 +291,9 @@ class DOMWatchdog(BaseWatchdog):
 			is_pdf_viewer = page_url.endswith('.pdf') or '/pdf/' in page_url
 
 			# Build and cache the browser state summary
-			if screenshot_b64:
+			if screenshot:
 				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary with screenshot, length: {len(screenshot_b64)}'
+					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary with screenshot: {screenshot!r}'
 				)
 			else:
 				self.logger.debug(
@@ -303,7 +305,7 @@ class DOMWatchdog(BaseWatchdog):
 				url=page_url,
 				title=title,
 				tabs=tabs_info,
-				screenshot=screenshot_b64,
+				screenshot_data=screenshot,
 				page_info=page_info,
 				pixels_above=0,
 				pixels_below=0,
@@ -327,7 +329,7 @@ class DOMWatchdog(BaseWatchdog):
 				url=page_url if 'page_url' in locals() else '',
 				title='Error',
 				tabs=[],
-				screenshot=None,
+				screenshot_data=None,
 				page_info=PageInfo(
 					viewport_width=1280,
 					viewport_height=720,
@@ -360,7 +362,12 @@ class DOMWatchdog(BaseWatchdog):
 					browser_session=self.browser_session,
 					logger=self.logger,
 					cross_origin_iframes=self.browser_session.browser_profile.cross_origin_iframes,
+					max_iframes=self.browser_session.browser_profile.max_iframes,
+					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					max_concurrent_iframe_fetches=self.browser_session.browser_profile.max_concurrent_iframe_fetches,
+					iframe_fetch_timeout=self.browser_session.browser_profile.iframe_fetch_timeout,
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
+					incremental_updates=self.browser_session.browser_profile.incremental_dom_updates,
 				)
 
 			# Get serialized DOM tree using the service
@@ -403,8 +410,9 @@ class DOMWatchdog(BaseWatchdog):
 
 	@time_execution_async('capture_clean_screenshot')
 	@observe_debug(ignore_input=True, ignore_output=True, name='capture_clean_screenshot')
-	async def _capture_clean_screenshot(self) -> str:
+	async def _capture_clean_screenshot(self) -> 'Screenshot':
 		"""Capture a clean screenshot without JavaScript highlights."""
+		timeout = ScreenshotEvent.model_fields['event_timeout'].default
 		try:
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: Capturing clean screenshot...')
 
@@ -412,49 +420,36 @@ class DOMWatchdog(BaseWatchdog):
 			assert self.browser_session.agent_focus is not None, 'No current target ID'
 			await self.browser_session.get_or_create_cdp_session(target_id=self.browser_session.agent_focus.target_id, focus=True)
 
-			# Check if handler is registered
-			handlers = self.event_bus.handlers.get('ScreenshotEvent', [])
-			handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
-			self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
-
-			screenshot_event = self.event_bus.dispatch(ScreenshotEvent(full_page=False))
-			self.logger.debug('📸 Dispatched ScreenshotEvent, waiting for event to complete...')
-
-			# Wait for the event itself to complete (this waits for all handlers)
-			await screenshot_event
-
-			# Get the single handler result
-			screenshot_b64 = await screenshot_event.event_result(raise_if_any=True, raise_if_none=True)
-			if screenshot_b64 is None:
-				raise RuntimeError('Screenshot handler returned None')
+			# ScreenshotEvent results are base64 strings, the watchdog hands out the decoded bytes and captured region
+			screenshot_watchdog = self.browser_session._screenshot_watchdog
+			assert screenshot_watchdog is not None, 'ScreenshotWatchdog is not attached'
+			screenshot = await asyncio.wait_for(screenshot_watchdog.capture_screenshot(), timeout=timeout)
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: ✅ Clean screenshot captured successfully')
-			return str(screenshot_b64)
+			return screenshot
 
 		except TimeoutError:
-			self.logger.warning('📸 Clean screenshot timed out after 6 seconds - no handler registered or slow page?')
+			self.logger.warning(f'📸 Clean screenshot timed out after {timeout} seconds - slow page?')
 			raise
 		except Exception as e:
 			self.logger.warning(f'📸 Clean screenshot failed: {type(e).__name__}: {e}')
 			raise
 
 	async def _wait_for_stable_network(self):
-		"""Wait for page stability - simplified for CDP-only branch."""
+		"""Wait for page stability, returns as soon as no relevant requests are in flight (capped at the configured wait times)."""
 		start_time = time.time()
 
-		# Apply minimum wait time first (let page settle)
 		min_wait = self.browser_session.browser_profile.minimum_wait_page_load_time
-		if min_wait > 0:
-			self.logger.debug(f'⏳ Minimum wait: {min_wait}s')
-			await asyncio.sleep(min_wait)
-
-		# Apply network idle wait time (for dynamic content like iframes)
 		network_idle_wait = self.browser_session.browser_profile.wait_for_network_idle_page_load_time
-		if network_idle_wait > 0:
-			self.logger.debug(f'⏳ Network idle wait: {network_idle_wait}s')
-			await asyncio.sleep(network_idle_wait)
+		max_wait = min_wait + network_idle_wait
+		if max_wait <= 0:
+			return
+
+		# Without network idle detection this sleeps the full time (minimum wait + network idle wait)
+		self.logger.debug(f'⏳ Waiting up to {max_wait}s for network idle')
+		went_idle = await self.browser_session.wait_for_network_idle(timeout=max_wait)
 
 		elapsed = time.time() - start_time
-		self.logger.debug(f'✅ Page stability wait completed in {elapsed:.2f}s')
+		self.logger.debug(f'✅ Page stability wait completed in {elapsed:.2f}s (network idle: {went_idle})')
 
 	async def _get_page_info(self) -> 'PageInfo':
 		"""Get comprehensive page information using a single CDP call.
@@ -553,6 +548,8 @@ class DOMWatchdog(BaseWatchdog):
 		self.current_dom_state = None
 		self.enhanced_dom_tree = None
 		# Keep the DOM service instance to reuse its CDP client connection
+		if self._dom_service:
+			self._dom_service.invalidate_incremental_state()
 
 	def is_file_input(self, element: EnhancedDOMTreeNode) -> bool:
 		"""Check if element is a file input."""
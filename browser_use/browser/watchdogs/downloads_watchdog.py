@@ -1,9 +1,12 @@
 """Downloads watchdog for monitoring and handling file downloads."""
 
 import asyncio
+import base64
 import json
 import os
+import re
 import tempfile
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import urlparse
@@ -13,19 +16,102 @@ from bubus import BaseEvent
 from cdp_use.cdp.browser import DownloadProgressEvent, DownloadWillBeginEvent
 from cdp_use.cdp.target import SessionID, TargetID
 from pydantic import PrivateAttr
+from uuid_extensions import uuid7str
 
+from browser_use.browser.directory_watcher import DirectoryWatcher
 from browser_use.browser.events import (
 	BrowserLaunchEvent,
 	BrowserStoppedEvent,
 	FileDownloadedEvent,
+	FileDownloadProgressEvent,
 	NavigationCompleteEvent,
 	TabClosedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.views import DownloadState, DownloadStats
 from browser_use.browser.watchdog_base import BaseWatchdog
 
 if TYPE_CHECKING:
-	pass
+	from browser_use.browser.session import CDPSession
+
+# Bytes per IO.read call when streaming a download out of the browser, ~5.6MB of base64 per CDP message
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+_DOWNLOAD_OBJECT_GROUP = 'browser_use_download'
+
+# Minimum seconds between FileDownloadProgressEvents of a browser download, Chrome reports progress much more often
+_PROGRESS_EVENT_INTERVAL = 0.5
+
+
+def _matches_file_name(file_name: str, suggested_filename: str) -> bool:
+	"""Whether `file_name` is `suggested_filename`, or the "name (1).ext" variant browsers use when it is taken"""
+	if file_name == suggested_filename:
+		return True
+	stem, ext = os.path.splitext(suggested_filename)
+	return re.fullmatch(rf'{re.escape(stem)} \(\d+\){re.escape(ext)}', file_name) is not None
+
+
+class _Download:
+	"""Progress of a download, fed by CDP download events or by DownloadsWatchdog._stream_download()."""
+
+	__slots__ = (
+		'guid',
+		'url',
+		'file_name',
+		'native',
+		'state',
+		'received_bytes',
+		'total_bytes',
+		'path',
+		'queued_at',
+		'started_at',
+		'finished_at',
+		'progress_dispatched_at',
+	)
+
+	def __init__(self, guid: str, url: str, file_name: str, native: bool = True):
+		self.guid = guid
+		self.url = url
+		self.file_name = file_name
+		self.native = native  # saved by the browser itself, not streamed out of the page by the watchdog
+		self.state: DownloadState = 'in_progress' if native else 'queued'
+		self.received_bytes = 0
+		self.total_bytes: int | None = None
+		self.path: str | None = None
+		self.queued_at = time.perf_counter()
+		self.started_at = self.queued_at
+		self.finished_at: float | None = None
+		self.progress_dispatched_at = 0.0
+
+	@property
+	def is_finished(self) -> bool:
+		return self.finished_at is not None
+
+	def start(self) -> None:
+		self.state = 'in_progress'
+		self.started_at = time.perf_counter()
+
+	def finish(self, state: DownloadState) -> None:
+		self.state = state
+		self.finished_at = time.perf_counter()
+
+	def stats(self) -> DownloadStats:
+		now = time.perf_counter()
+		if self.state == 'queued':
+			queued_seconds, duration_seconds = now - self.queued_at, 0.0
+		else:
+			queued_seconds, duration_seconds = self.started_at - self.queued_at, (self.finished_at or now) - self.started_at
+		return DownloadStats(
+			guid=self.guid,
+			url=self.url,
+			file_name=self.file_name,
+			state=self.state,
+			received_bytes=self.received_bytes,
+			total_bytes=self.total_bytes,
+			path=self.path,
+			queued_ms=queued_seconds * 1000,
+			duration_ms=duration_seconds * 1000,
+			throughput_bytes_per_s=self.received_bytes / duration_seconds if duration_seconds > 0 else 0.0,
+		)
 
 
 class DownloadsWatchdog(BaseWatchdog):
@@ -43,6 +129,7 @@ class DownloadsWatchdog(BaseWatchdog):
 	# Events this watchdog emits
 	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = [
 		FileDownloadedEvent,
+		FileDownloadProgressEvent,
 	]
 
 	# Private state
@@ -52,7 +139,9 @@ class DownloadsWatchdog(BaseWatchdog):
 	_download_cdp_session_setup: bool = PrivateAttr(default=False)  # Track if CDP session is set up
 	_download_cdp_session: Any = PrivateAttr(default=None)  # Store CDP session reference
 	_cdp_event_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)  # Track CDP event handler tasks
-	_cdp_downloads_info: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)  # Map guid -> info
+	_downloads: dict[str, _Download] = PrivateAttr(default_factory=dict)  # Map guid -> progress, kept for get_download_stats()
+	_download_slots: asyncio.Semaphore | None = PrivateAttr(default=None)  # Limits downloads streamed at the same time
+	_downloads_dir_watcher: DirectoryWatcher | None = PrivateAttr(default=None)  # inotify fallback, see watch_downloads_dir
 	_use_js_fetch_for_local: bool = PrivateAttr(default=False)  # Guard JS fetch path for local regular downloads
 
 	async def on_BrowserLaunchEvent(self, event: BrowserLaunchEvent) -> None:
@@ -97,6 +186,11 @@ class DownloadsWatchdog(BaseWatchdog):
 		self._download_cdp_session = None
 		self._download_cdp_session_setup = False
 
+		if self._downloads_dir_watcher:
+			self._downloads_dir_watcher.stop()
+			self._downloads_dir_watcher = None
+		self._download_slots = None
+
 		# Clear other state
 		self._sessions_with_listeners.clear()
 		self._active_downloads.clear()
@@ -137,67 +231,18 @@ class DownloadsWatchdog(BaseWatchdog):
 		# Define CDP event handlers outside of try to avoid indentation/scope issues
 		async def download_will_begin_handler(event: DownloadWillBeginEvent, session_id: SessionID | None):
 			self.logger.debug(f'[DownloadsWatchdog] Download will begin: {event}')
-			# Cache info for later completion event handling (esp. remote browsers)
-			guid = event.get('guid', '')
-			try:
-				suggested_filename = event.get('suggestedFilename')
-				assert suggested_filename, 'CDP DownloadWillBegin missing suggestedFilename'
-				self._cdp_downloads_info[guid] = {
-					'url': event.get('url', ''),
-					'suggested_filename': suggested_filename,
-					'handled': False,
-				}
-			except (AssertionError, KeyError):
-				pass
-			# Create and track the task
-			task = asyncio.create_task(self._handle_cdp_download(event, target_id, session_id))
-			self._cdp_event_tasks.add(task)
-			# Remove from set when done
-			task.add_done_callback(lambda t: self._cdp_event_tasks.discard(t))
+			self._on_download_will_begin(event)
+
+			# Try manual JavaScript fetch as a fallback for local browsers (disabled for regular local downloads)
+			if self.browser_session.is_local and self._use_js_fetch_for_local:
+				# Create and track the task
+				task = asyncio.create_task(self._handle_cdp_download(event, target_id, session_id))
+				self._cdp_event_tasks.add(task)
+				# Remove from set when done
+				task.add_done_callback(lambda t: self._cdp_event_tasks.discard(t))
 
 		async def download_progress_handler(event: DownloadProgressEvent, session_id: SessionID | None):
-			# Check if download is complete
-			if event.get('state') == 'completed':
-				file_path = event.get('filePath')
-				guid = event.get('guid', '')
-				if self.browser_session.is_local:
-					if file_path:
-						self.logger.debug(f'[DownloadsWatchdog] Download completed: {file_path}')
-						# Track the download
-						self._track_download(file_path)
-						# Mark as handled to prevent fallback duplicate dispatch
-						try:
-							if guid in self._cdp_downloads_info:
-								self._cdp_downloads_info[guid]['handled'] = True
-						except (KeyError, AttributeError):
-							pass
-					else:
-						# No local file path provided, local polling in _handle_cdp_download will handle it
-						self.logger.debug(
-							'[DownloadsWatchdog] No filePath in progress event (local); polling will handle detection'
-						)
-				else:
-					# Remote browser: do not touch local filesystem. Fallback to downloadPath+suggestedFilename
-					info = self._cdp_downloads_info.get(guid, {})
-					try:
-						suggested_filename = info.get('suggested_filename') or (Path(file_path).name if file_path else 'download')
-						downloads_path = str(self.browser_session.browser_profile.downloads_path or '')
-						effective_path = file_path or str(Path(downloads_path) / suggested_filename)
-						file_name = Path(effective_path).name
-						file_ext = Path(file_name).suffix.lower().lstrip('.')
-						self.event_bus.dispatch(
-							FileDownloadedEvent(
-								url=info.get('url', ''),
-								path=str(effective_path),
-								file_name=file_name,
-								file_size=0,
-								file_type=file_ext if file_ext else None,
-							)
-						)
-						self.logger.debug(f'[DownloadsWatchdog] ✅ (remote) Download completed: {effective_path}')
-					finally:
-						if guid in self._cdp_downloads_info:
-							del self._cdp_downloads_info[guid]
+			await self._on_download_progress(event)
 
 		try:
 			downloads_path_raw = self.browser_session.browser_profile.downloads_path
@@ -242,237 +287,294 @@ class DownloadsWatchdog(BaseWatchdog):
 				self._download_cdp_session_setup = True
 				self.logger.debug('[DownloadsWatchdog] Set up CDP download listeners')
 
+				if self.browser_session.browser_profile.watch_downloads_dir and self.browser_session.is_local:
+					self._start_downloads_dir_watcher(expanded_downloads_path)
+
 			# No need to track individual targets since download listener is browser-level
 			# logger.debug(f'[DownloadsWatchdog] Successfully set up CDP download listener for target: {target_id}')
 
 		except Exception as e:
 			self.logger.warning(f'[DownloadsWatchdog] Failed to set up CDP download listener for target {target_id}: {e}')
 
-	def _track_download(self, file_path: str) -> None:
-		"""Track a completed download and dispatch the appropriate event.
+	def _get_downloads_dir(self) -> Path:
+		return (
+			Path(
+				self.browser_session.browser_profile.downloads_path
+				or f'{tempfile.gettempdir()}/browser_use_downloads.{str(self.browser_session.id)[-4:]}'
+			)
+			.expanduser()
+			.resolve()
+		)  # Ensure path is properly expanded
 
-		Args:
-			file_path: The path to the downloaded file
-		"""
-		try:
-			# Get file info
-			path = Path(file_path)
-			if path.exists():
-				file_size = path.stat().st_size
-				self.logger.debug(f'[DownloadsWatchdog] Tracked download: {path.name} ({file_size} bytes)')
+	def get_download_stats(self) -> list[DownloadStats]:
+		"""Progress and throughput of every download of the session, in the order they were started"""
+		return [download.stats() for download in self._downloads.values()]
+
+	def _on_download_will_begin(self, event: DownloadWillBeginEvent) -> None:
+		guid = event['guid']
+		self._downloads[guid] = _Download(guid, event.get('url', ''), event.get('suggestedFilename') or 'download')
+
+	async def _on_download_progress(self, event: DownloadProgressEvent) -> None:
+		"""Follow a browser download through its Browser.downloadProgress state changes."""
+		guid = event['guid']
+		download = self._downloads.get(guid)
+		if download is None:
+			# began before the listeners were set up
+			download = self._downloads[guid] = _Download(guid, '', 'download')
+		if not download.native or download.is_finished:
+			return
 
-				# Dispatch download event
-				from browser_use.browser.events import FileDownloadedEvent
+		download.received_bytes = int(event['receivedBytes'])
+		download.total_bytes = int(event['totalBytes']) or None  # 0 if the server did not send a Content-Length
 
+		state = event['state']
+		if state == 'inProgress':
+			now = time.perf_counter()
+			if now - download.progress_dispatched_at >= _PROGRESS_EVENT_INTERVAL:
+				download.progress_dispatched_at = now
 				self.event_bus.dispatch(
-					FileDownloadedEvent(
-						url=str(path),  # Use the file path as URL for local files
-						path=str(path),
-						file_name=path.name,
-						file_size=file_size,
+					FileDownloadProgressEvent(
+						url=download.url,
+						path=str(self._get_downloads_dir() / download.file_name),
+						received_bytes=download.received_bytes,
+						total_bytes=download.total_bytes,
 					)
 				)
-			else:
-				self.logger.warning(f'[DownloadsWatchdog] Downloaded file not found: {file_path}')
-		except Exception as e:
-			self.logger.error(f'[DownloadsWatchdog] Error tracking download: {e}')
+		elif state == 'completed':
+			await self._complete_download(download, event.get('filePath'))
+		elif state == 'canceled':
+			download.finish('canceled')
+			self.logger.debug(f'[DownloadsWatchdog] Download canceled: {download.file_name}')
+
+	def _on_file_written(self, path: Path) -> None:
+		"""Complete the browser download a file that landed in the downloads directory belongs to (inotify fallback)."""
+		# browsers write to a temporary name first and rename the file when done
+		if path.name.startswith('.') or path.suffix == '.crdownload':
+			return
+
+		pending = [d for d in self._downloads.values() if not d.is_finished]
+		if any(not d.native and d.path == str(path) for d in pending):
+			return  # written by _stream_download
+		pending = [d for d in pending if d.native]
+		download = next((d for d in pending if _matches_file_name(path.name, d.file_name)), None)
+		if download is None and len(pending) == 1:
+			download = pending[0]  # the browser sanitized the suggested name
+		if download is None:
+			return
+
+		task = asyncio.create_task(self._complete_download(download, str(path)))
+		self._cdp_event_tasks.add(task)
+		task.add_done_callback(lambda t: self._cdp_event_tasks.discard(t))
+
+	def _start_downloads_dir_watcher(self, downloads_dir: Path) -> None:
+		if not DirectoryWatcher.is_supported():
+			self.logger.warning('[DownloadsWatchdog] watch_downloads_dir needs inotify (Linux), relying on CDP download events')
+			return
+		watcher = DirectoryWatcher(downloads_dir, self._on_file_written)
+		try:
+			watcher.start()
+		except OSError as e:
+			self.logger.warning(f'[DownloadsWatchdog] Could not watch downloads directory {downloads_dir}: {e}')
+			return
+		self._downloads_dir_watcher = watcher
+
+	async def _complete_download(self, download: _Download, file_path: str | None) -> None:
+		"""Dispatch the FileDownloadedEvent of a finished browser download, once even if it is reported several times."""
+		if download.is_finished:
+			return
+		download.finish('completed')
+
+		if self.browser_session.is_local:
+			path = Path(file_path) if file_path else self._get_downloads_dir() / download.file_name
+			try:
+				file_size = (await anyio.Path(path).stat()).st_size
+			except OSError:
+				self.logger.warning(f'[DownloadsWatchdog] Downloaded file not found: {path}')
+				download.finish('failed')
+				return
+		else:
+			# Remote browser: do not touch local filesystem. Fallback to downloadPath+suggestedFilename
+			downloads_path = str(self.browser_session.browser_profile.downloads_path or '')
+			path = Path(file_path) if file_path else Path(downloads_path) / download.file_name
+			file_size = download.received_bytes
+
+		download.path = str(path)
+		download.received_bytes = max(download.received_bytes, file_size)
+		file_ext = path.suffix.lower().lstrip('.')
+		self.event_bus.dispatch(
+			FileDownloadedEvent(
+				url=download.url,
+				path=str(path),
+				file_name=path.name,
+				file_size=file_size,
+				file_type=file_ext if file_ext else None,
+			)
+		)
+		stats = download.stats()
+		self.logger.debug(
+			f'[DownloadsWatchdog] ✅ Download completed: {path} ({file_size} bytes in {stats.duration_ms:.0f}ms, '
+			f'{stats.throughput_bytes_per_s / 1e6:.1f}MB/s)'
+		)
 
 	async def _handle_cdp_download(
 		self, event: DownloadWillBeginEvent, target_id: TargetID, session_id: SessionID | None
 	) -> None:
-		"""Handle a CDP Page.downloadWillBegin event."""
-		downloads_dir = (
-			Path(
-				self.browser_session.browser_profile.downloads_path
-				or f'{tempfile.gettempdir()}/browser_use_downloads.{str(self.browser_session.id)[-4:]}'
-			)
-			.expanduser()
-			.resolve()
-		)  # Ensure path is properly expanded
-
-		# Initialize variables that may be used outside try blocks
-		unique_filename = None
-		file_size = 0
-		expected_path = None
-		download_result = None
+		"""Fetch the file of a Browser.downloadWillBegin event in the page that started it (JS fetch fallback)."""
+		downloads_dir = self._get_downloads_dir()
 		download_url = event.get('url', '')
 		suggested_filename = event.get('suggestedFilename', 'download')
-		guid = event.get('guid', '')
 
+		self.logger.debug(f'[DownloadsWatchdog] Attempting JS fetch fallback for {download_url}')
 		try:
-			self.logger.debug(f'[DownloadsWatchdog] ⬇️ File download starting: {suggested_filename} from {download_url[:100]}...')
-			self.logger.debug(f'[DownloadsWatchdog] Full CDP event: {event}')
+			# Get the proper session for the frame that initiated the download
+			cdp_session = await self.browser_session.cdp_client_for_frame(event.get('frameId'))
+			assert cdp_session
 
-			# Since Browser.setDownloadBehavior is already configured, the browser will download the file
-			# We just need to wait for it to appear in the downloads directory
-			expected_path = downloads_dir / suggested_filename
+			# Ensure unique filename
+			unique_filename = await self._get_unique_filename(str(downloads_dir), suggested_filename)
+			final_path = downloads_dir / unique_filename
 
-			# Debug: List current directory contents
-			self.logger.debug(f'[DownloadsWatchdog] Downloads directory: {downloads_dir}')
-			if downloads_dir.exists():
-				files_before = list(downloads_dir.iterdir())
-				self.logger.debug(f'[DownloadsWatchdog] Files before download: {[f.name for f in files_before]}')
+			file_size, content_type, _ = await self._stream_download(cdp_session, download_url, final_path, guid=event['guid'])
 
-			# Try manual JavaScript fetch as a fallback for local browsers (disabled for regular local downloads)
-			if self.browser_session.is_local and self._use_js_fetch_for_local:
-				self.logger.debug(f'[DownloadsWatchdog] Attempting JS fetch fallback for {download_url}')
+			self.logger.debug(f'[DownloadsWatchdog] ✅ Downloaded and saved file: {final_path} ({file_size} bytes)')
+			file_ext = final_path.suffix.lower().lstrip('.')
+			self.event_bus.dispatch(
+				FileDownloadedEvent(
+					url=download_url,
+					path=str(final_path),
+					file_name=unique_filename,
+					file_size=file_size,
+					file_type=file_ext if file_ext else None,
+					mime_type=content_type,
+					from_cache=False,
+					auto_download=False,
+				)
+			)
+		except Exception as fetch_error:
+			# the browser download is still tracked through its progress events
+			self.logger.error(f'[DownloadsWatchdog] ❌ Failed to download file via fetch: {fetch_error}')
+
+	async def _stream_download(
+		self,
+		cdp_session: 'CDPSession',
+		url: str,
+		download_path: Path,
+		fetch_options: dict[str, Any] | None = None,
+		guid: str | None = None,
+	) -> tuple[int, str | None, bool]:
+		"""Fetch `url` in the page of `cdp_session` and stream the response body to `download_path`.
+
+		The body stays a Blob in the browser and is read with IO.read in base64 chunks, so only one chunk is held in
+		memory here. Dispatches a FileDownloadProgressEvent per chunk, removes the partial file if the download fails.
+		Waits in a queue while BrowserProfile.max_concurrent_downloads downloads are streamed already.
+
+		`guid` is the browser download this replaces, it is tracked again from CDP events if streaming fails.
+
+		Returns the file size, the content type and whether the response was served from the browser cache.
+		"""
+		browser_download = self._downloads.get(guid) if guid else None
+		download = _Download(guid or f'fetch-{uuid7str()}', url, download_path.name, native=False)
+		download.path = str(download_path)
+		self._downloads[download.guid] = download
 
-				unique_filename = None
-				file_size = None
-				download_result = None
-				try:
-					# Escape the URL for JavaScript
-					import json
-
-					escaped_url = json.dumps(download_url)
-
-					# Get the proper session for the frame that initiated the download
-					cdp_session = await self.browser_session.cdp_client_for_frame(event.get('frameId'))
-					assert cdp_session
-
-					result = await cdp_session.cdp_client.send.Runtime.evaluate(
-						params={
-							'expression': f"""
-						(async () => {{
-							try {{
-								const response = await fetch({escaped_url});
-								if (!response.ok) {{
-									throw new Error(`HTTP error! status: ${{response.status}}`);
-								}}
-								const blob = await response.blob();
-								const arrayBuffer = await blob.arrayBuffer();
-								const uint8Array = new Uint8Array(arrayBuffer);
-								return {{
-									data: Array.from(uint8Array),
-									size: uint8Array.length,
-									contentType: response.headers.get('content-type') || 'application/octet-stream'
-								}};
-							}} catch (error) {{
-								throw new Error(`Fetch failed: ${{error.message}}`);
-							}}
-						}})()
-						""",
-							'awaitPromise': True,
-							'returnByValue': True,
-						},
-						session_id=cdp_session.session_id,
-					)
-					download_result = result.get('result', {}).get('value')
-
-					if download_result and download_result.get('data'):
-						# Save the file
-						file_data = bytes(download_result['data'])
-						file_size = len(file_data)
-
-						# Ensure unique filename
-						unique_filename = await self._get_unique_filename(str(downloads_dir), suggested_filename)
-						final_path = downloads_dir / unique_filename
-
-						# Write the file
-						import anyio
-
-						async with await anyio.open_file(final_path, 'wb') as f:
-							await f.write(file_data)
-
-						self.logger.debug(f'[DownloadsWatchdog] ✅ Downloaded and saved file: {final_path} ({file_size} bytes)')
-						expected_path = final_path
-						# Emit download event immediately
-						file_ext = expected_path.suffix.lower().lstrip('.')
-						file_type = file_ext if file_ext else None
-						self.event_bus.dispatch(
-							FileDownloadedEvent(
-								url=download_url,
-								path=str(expected_path),
-								file_name=unique_filename or expected_path.name,
-								file_size=file_size or 0,
-								file_type=file_type,
-								mime_type=(download_result.get('contentType') if download_result else None),
-								from_cache=False,
-								auto_download=False,
-							)
-						)
-						# Mark as handled to prevent duplicate dispatch from progress/polling paths
-						try:
-							if guid in self._cdp_downloads_info:
-								self._cdp_downloads_info[guid]['handled'] = True
-						except (KeyError, AttributeError):
-							pass
-						self.logger.debug(
-							f'[DownloadsWatchdog] ✅ File download completed via CDP: {suggested_filename} ({file_size} bytes) saved to {expected_path}'
-						)
-						return
-					else:
-						self.logger.error('[DownloadsWatchdog] ❌ No data received from fetch')
+		if self._download_slots is None:
+			self._download_slots = asyncio.Semaphore(self.browser_session.browser_profile.max_concurrent_downloads)
+		try:
+			async with self._download_slots:
+				download.start()
+				content_type, from_cache = await self._fetch_to_file(cdp_session, download, fetch_options)
+		except BaseException:
+			download.finish('failed')
+			if browser_download is not None:
+				self._downloads[browser_download.guid] = browser_download
+			raise
+
+		download.finish('completed')
+		return download.received_bytes, content_type, from_cache
+
+	async def _fetch_to_file(
+		self, cdp_session: 'CDPSession', download: _Download, fetch_options: dict[str, Any] | None
+	) -> tuple[str | None, bool]:
+		url = download.url
+		download_path = Path(download.path or download.file_name)
+		cdp_client = cdp_session.cdp_client
+		session_id = cdp_session.session_id
+		# one group per download, releasing it must not free the objects of other downloads in the same page
+		object_group = f'{_DOWNLOAD_OBJECT_GROUP}-{download.guid}'
+
+		result = await cdp_client.send.Runtime.evaluate(
+			params={
+				'expression': f"""
+				(async () => {{
+					const response = await fetch({json.dumps(url)}, {json.dumps(fetch_options or {})});
+					if (!response.ok) {{
+						throw new Error(`HTTP error! status: ${{response.status}}`);
+					}}
+					const blob = await response.blob();
+					return {{
+						blob: blob,
+						size: blob.size,
+						contentType: response.headers.get('content-type'),
+						// Check if served from cache
+						fromCache: response.headers.has('age') || !response.headers.has('date'),
+					}};
+				}})()
+				""",
+				'awaitPromise': True,
+				'objectGroup': object_group,
+			},
+			session_id=session_id,
+		)
+		try:
+			if 'exceptionDetails' in result:
+				exception = result['exceptionDetails'].get('exception', {})
+				raise RuntimeError(f'Fetch failed: {exception.get("description") or result["exceptionDetails"].get("text")}')
 
-				except Exception as fetch_error:
-					self.logger.error(f'[DownloadsWatchdog] ❌ Failed to download file via fetch: {fetch_error}')
+			properties = await cdp_client.send.Runtime.getProperties(
+				params={'objectId': result['result']['objectId'], 'ownProperties': True}, session_id=session_id
+			)
+			response: dict[str, Any] = {prop['name']: prop.get('value', {}) for prop in properties['result']}
+			download.total_bytes = response['size'].get('value')
+			content_type = response['contentType'].get('value')
+			from_cache = bool(response['fromCache'].get('value'))
 
-			# For remote browsers, don't poll local filesystem; downloadProgress handler will emit the event
-			if not self.browser_session.is_local:
-				return
-		except Exception as e:
-			self.logger.error(f'[DownloadsWatchdog] ❌ Error handling CDP download: {type(e).__name__} {e}')
-
-		# If we reach here, the fetch method failed, so wait for native download
-		# Poll the downloads directory for new files
-		self.logger.debug(f'[DownloadsWatchdog] Checking if browser auto-download saved the file for us: {suggested_filename}')
-
-		# Get initial list of files in downloads directory
-		initial_files = set()
-		if Path(downloads_dir).exists():
-			for f in Path(downloads_dir).iterdir():
-				if f.is_file() and not f.name.startswith('.'):
-					initial_files.add(f.name)
-
-		# Poll for new files
-		max_wait = 20  # seconds
-		start_time = asyncio.get_event_loop().time()
-
-		while asyncio.get_event_loop().time() - start_time < max_wait:
-			await asyncio.sleep(5.0)  # Check every 5 seconds
-
-			if Path(downloads_dir).exists():
-				for file_path in Path(downloads_dir).iterdir():
-					# Skip hidden files and files that were already there
-					if file_path.is_file() and not file_path.name.startswith('.') and file_path.name not in initial_files:
-						# Check if file has content (> 4 bytes)
-						try:
-							file_size = file_path.stat().st_size
-							if file_size > 4:
-								# Found a new download!
-								self.logger.debug(
-									f'[DownloadsWatchdog] ✅ Found downloaded file: {file_path} ({file_size} bytes)'
+			blob = await cdp_client.send.IO.resolveBlob(params={'objectId': response['blob']['objectId']}, session_id=session_id)
+			handle = f'blob:{blob["uuid"]}'
+			try:
+				async with await anyio.open_file(download_path, 'wb') as f:
+					while True:
+						chunk = await cdp_client.send.IO.read(
+							params={'handle': handle, 'size': _DOWNLOAD_CHUNK_SIZE}, session_id=session_id
+						)
+						data = base64.b64decode(chunk['data']) if chunk.get('base64Encoded') else chunk['data'].encode()
+						if data:
+							await f.write(data)
+							download.received_bytes += len(data)
+							self.event_bus.dispatch(
+								FileDownloadProgressEvent(
+									url=url,
+									path=str(download_path),
+									received_bytes=download.received_bytes,
+									total_bytes=download.total_bytes,
 								)
+							)
+						if chunk['eof']:
+							break
+			except BaseException:
+				await anyio.Path(download_path).unlink(missing_ok=True)
+				raise
+			finally:
+				try:
+					await cdp_client.send.IO.close(params={'handle': handle}, session_id=session_id)
+				except Exception:
+					pass
 
-								# Determine file type from extension
-								file_ext = file_path.suffix.lower().lstrip('.')
-								file_type = file_ext if file_ext else None
-
-								# Dispatch download event
-								# Skip if already handled by progress/JS fetch
-								info = self._cdp_downloads_info.get(guid, {})
-								if info.get('handled'):
-									return
-								self.event_bus.dispatch(
-									FileDownloadedEvent(
-										url=download_url,
-										path=str(file_path),
-										file_name=file_path.name,
-										file_size=file_size,
-										file_type=file_type,
-									)
-								)
-								# Mark as handled after dispatch
-								try:
-									if guid in self._cdp_downloads_info:
-										self._cdp_downloads_info[guid]['handled'] = True
-								except (KeyError, AttributeError):
-									pass
-								return
-						except Exception as e:
-							self.logger.debug(f'[DownloadsWatchdog] Error checking file {file_path}: {e}')
-
-		self.logger.warning(f'[DownloadsWatchdog] Download did not complete within {max_wait} seconds')
+			return content_type, from_cache
+		finally:
+			try:
+				await cdp_client.send.Runtime.releaseObjectGroup(params={'objectGroup': object_group}, session_id=session_id)
+			except Exception:
+				pass
 
 	async def _handle_download(self, download: Any) -> None:
 		"""Handle a download event."""
@@ -789,101 +891,43 @@ class DownloadsWatchdog(BaseWatchdog):
 
 			self.logger.debug(f'[DownloadsWatchdog] Starting PDF download from: {pdf_url[:100]}...')
 
-			# Download using JavaScript fetch to leverage browser cache
+			# Download using JavaScript fetch to leverage browser cache, streamed to disk in chunks
 			try:
-				# Properly escape the URL to prevent JavaScript injection
-				escaped_pdf_url = json.dumps(pdf_url)
-
-				result = await asyncio.wait_for(
-					temp_session.cdp_client.send.Runtime.evaluate(
-						params={
-							'expression': f"""
-					(async () => {{
-						try {{
-							// Use fetch with cache: 'force-cache' to prioritize cached version
-							const response = await fetch({escaped_pdf_url}, {{
-								cache: 'force-cache'
-							}});
-							if (!response.ok) {{
-								throw new Error(`HTTP error! status: ${{response.status}}`);
-							}}
-							const blob = await response.blob();
-							const arrayBuffer = await blob.arrayBuffer();
-							const uint8Array = new Uint8Array(arrayBuffer);
-							
-							// Check if served from cache
-							const fromCache = response.headers.has('age') || 
-											 !response.headers.has('date');
-											 
-							return {{ 
-								data: Array.from(uint8Array),
-								fromCache: fromCache,
-								responseSize: uint8Array.length,
-								transferSize: response.headers.get('content-length') || 'unknown'
-							}};
-						}} catch (error) {{
-							throw new Error(`Fetch failed: ${{error.message}}`);
-						}}
-					}})()
-					""",
-							'awaitPromise': True,
-							'returnByValue': True,
-						},
-						session_id=temp_session.session_id,
-					),
+				downloads_dir = str(self.browser_session.browser_profile.downloads_path)
+				# Ensure downloads directory exists
+				os.makedirs(downloads_dir, exist_ok=True)
+				# Ensure unique filename
+				unique_filename = await self._get_unique_filename(downloads_dir, pdf_filename)
+				download_path = os.path.join(downloads_dir, unique_filename)
+
+				response_size, _, from_cache = await asyncio.wait_for(
+					self._stream_download(temp_session, pdf_url, Path(download_path), fetch_options={'cache': 'force-cache'}),
 					timeout=10.0,  # 10 second timeout for download operation
 				)
-				download_result = result.get('result', {}).get('value', {})
-
-				if download_result and download_result.get('data') and len(download_result['data']) > 0:
-					# Ensure unique filename
-					downloads_dir = str(self.browser_session.browser_profile.downloads_path)
-					# Ensure downloads directory exists
-					os.makedirs(downloads_dir, exist_ok=True)
-					unique_filename = await self._get_unique_filename(downloads_dir, pdf_filename)
-					download_path = os.path.join(downloads_dir, unique_filename)
-
-					# Save the PDF asynchronously
-					async with await anyio.open_file(download_path, 'wb') as f:
-						await f.write(bytes(download_result['data']))
-
-					# Verify file was written successfully
-					if os.path.exists(download_path):
-						actual_size = os.path.getsize(download_path)
-						self.logger.debug(
-							f'[DownloadsWatchdog] PDF file written successfully: {download_path} ({actual_size} bytes)'
-						)
-					else:
-						self.logger.error(f'[DownloadsWatchdog] ❌ Failed to write PDF file to: {download_path}')
-						return None
-
-					# Log cache information
-					cache_status = 'from cache' if download_result.get('fromCache') else 'from network'
-					response_size = download_result.get('responseSize', 0)
-					self.logger.debug(
-						f'[DownloadsWatchdog] ✅ Auto-downloaded PDF ({cache_status}, {response_size:,} bytes): {download_path}'
-					)
 
-					# Emit file downloaded event
-					self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {unique_filename}')
-					self.event_bus.dispatch(
-						FileDownloadedEvent(
-							url=pdf_url,
-							path=download_path,
-							file_name=unique_filename,
-							file_size=response_size,
-							file_type='pdf',
-							mime_type='application/pdf',
-							from_cache=download_result.get('fromCache', False),
-							auto_download=True,
-						)
+				# Log cache information
+				cache_status = 'from cache' if from_cache else 'from network'
+				self.logger.debug(
+					f'[DownloadsWatchdog] ✅ Auto-downloaded PDF ({cache_status}, {response_size:,} bytes): {download_path}'
+				)
+
+				# Emit file downloaded event
+				self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {unique_filename}')
+				self.event_bus.dispatch(
+					FileDownloadedEvent(
+						url=pdf_url,
+						path=download_path,
+						file_name=unique_filename,
+						file_size=response_size,
+						file_type='pdf',
+						mime_type='application/pdf',
+						from_cache=from_cache,
+						auto_download=True,
 					)
+				)
 
-					# No need to detach - session is cached
-					return download_path
-				else:
-					self.logger.warning(f'[DownloadsWatchdog] No data received when downloading PDF from {pdf_url}')
-					return None
+				# No need to detach - session is cached
+				return download_path
 
 			except Exception as e:
 				self.logger.warning(f'[DownloadsWatchdog] Failed to auto-download PDF from {pdf_url}: {type(e).__name__}: {e}')
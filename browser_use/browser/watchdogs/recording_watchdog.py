@@ -11,6 +11,7 @@ from uuid_extensions import uuid7str
 from browser_use.browser.events import BrowserConnectedEvent, BrowserStopEvent
 from browser_use.browser.profile import ViewportSize
 from browser_use.browser.video_recorder import VideoRecorderService
+from browser_use.browser.views import VideoRecordingStats
 from browser_use.browser.watchdog_base import BaseWatchdog
 
 
@@ -24,6 +25,10 @@ class RecordingWatchdog(BaseWatchdog):
 
 	_recorder: VideoRecorderService | None = None
 
+	def get_recording_stats(self) -> VideoRecordingStats | None:
+		"""Dropped-frame and encode-latency counters of the running recording, None if not recording."""
+		return self._recorder.stats if self._recorder else None
+
 	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
 		"""
 		Starts video recording if it is configured in the browser profile.
@@ -47,7 +52,7 @@ class RecordingWatchdog(BaseWatchdog):
 
 		self.logger.debug(f'Initializing video recorder for format: {video_format}')
 		self._recorder = VideoRecorderService(output_path=output_path, size=size, framerate=profile.record_video_framerate)
-		self._recorder.start()
+		await self._recorder.start()
 
 		if not self._recorder._is_active:
 			self._recorder = None
@@ -71,7 +76,7 @@ class RecordingWatchdog(BaseWatchdog):
 		except Exception as e:
 			self.logger.error(f'Failed to start screencast via CDP: {e}')
 			if self._recorder:
-				self._recorder.stop_and_save()
+				await self._recorder.stop_and_save()
 				self._recorder = None
 
 	async def _get_current_viewport_size(self) -> ViewportSize | None:
@@ -122,5 +127,5 @@ class RecordingWatchdog(BaseWatchdog):
 			self._recorder = None
 
 			self.logger.debug('Stopping video recording and saving file...')
-			loop = asyncio.get_event_loop()
-			await loop.run_in_executor(None, recorder.stop_and_save)
+			await recorder.stop_and_save()
+			self.logger.debug(f'Video recording stats: {recorder.stats}')
@@ -4,15 +4,52 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
 from cdp_use.cdp.page import CaptureScreenshotParameters
+from cdp_use.cdp.page.commands import GetLayoutMetricsReturns
+from cdp_use.cdp.page.types import Viewport
 
 from browser_use.browser.events import ScreenshotEvent
-from browser_use.browser.views import BrowserError
+from browser_use.browser.profile import ScreenshotClip
+from browser_use.browser.views import BrowserError, Screenshot
 from browser_use.browser.watchdog_base import BaseWatchdog
 
 if TYPE_CHECKING:
 	pass
 
 
+def get_capture_region(
+	metrics: GetLayoutMetricsReturns, clip: ScreenshotClip | None, max_dimension: int | None
+) -> tuple[Viewport, ScreenshotClip]:
+	"""CDP clip (document coordinates, with a downscale factor) for capturing `clip` of the viewport, or all of it.
+
+	Returns the CDP clip and the captured region relative to the viewport.
+	"""
+	css_viewport = metrics['cssVisualViewport']
+	viewport_width = css_viewport['clientWidth']
+	viewport_height = css_viewport['clientHeight']
+	device_pixel_ratio = metrics['visualViewport']['clientWidth'] / viewport_width if viewport_width > 0 else 1.0
+
+	if clip is None:
+		clip = ScreenshotClip(x=0, y=0, width=viewport_width, height=viewport_height)
+	else:
+		# keep the region inside the viewport, Chrome would render what lies beyond it
+		x = min(clip.x, max(viewport_width - 1, 0))
+		y = min(clip.y, max(viewport_height - 1, 0))
+		clip = ScreenshotClip(
+			x=x, y=y, width=max(min(clip.width, viewport_width - x), 1), height=max(min(clip.height, viewport_height - y), 1)
+		)
+
+	scale = 1.0
+	if max_dimension:
+		longest_side = max(clip.width, clip.height) * device_pixel_ratio
+		if longest_side > max_dimension:
+			scale = max_dimension / longest_side
+
+	cdp_clip = Viewport(
+		x=css_viewport['pageX'] + clip.x, y=css_viewport['pageY'] + clip.y, width=clip.width, height=clip.height, scale=scale
+	)
+	return cdp_clip, clip
+
+
 class ScreenshotWatchdog(BaseWatchdog):
 	"""Handles screenshot requests using CDP."""
 
@@ -29,24 +66,42 @@ class ScreenshotWatchdog(BaseWatchdog):
 			event: ScreenshotEvent with optional full_page and clip parameters
 
 		Returns:
-			Dict with 'screenshot' key containing base64-encoded screenshot or None
+			Base64 encoded screenshot in BrowserProfile.screenshot_format, downscaled and clipped as configured
 		"""
 		self.logger.debug('[ScreenshotWatchdog] Handler START - on_ScreenshotEvent called')
+		screenshot = await self.capture_screenshot(ScreenshotClip(**event.clip) if event.clip else None)
+		return screenshot.b64
+
+	async def capture_screenshot(self, clip: ScreenshotClip | None = None) -> Screenshot:
+		"""Capture the viewport, or `clip` of it (default: BrowserProfile.screenshot_clip).
+
+		The DOM watchdog calls this directly, it keeps the decoded bytes and the captured region instead of base64.
+		"""
+		profile = self.browser_session.browser_profile
 		try:
 			# Get CDP client and session for current target
 			cdp_session = await self.browser_session.get_or_create_cdp_session()
 
 			# Prepare screenshot parameters
-			params = CaptureScreenshotParameters(format='png', captureBeyondViewport=False)
+			params = CaptureScreenshotParameters(format=profile.screenshot_format, captureBeyondViewport=False)
+			if profile.screenshot_format != 'png':
+				params['quality'] = profile.screenshot_quality
+
+			# Clipping and downscaling happen in the browser, they need the viewport size and scroll position
+			clip = clip or profile.screenshot_clip
+			region = None
+			if clip or profile.screenshot_max_dimension:
+				metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+				params['clip'], region = get_capture_region(metrics, clip, profile.screenshot_max_dimension)
 
 			# Take screenshot using CDP
 			self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot with params: {params}')
 			result = await cdp_session.cdp_client.send.Page.captureScreenshot(params=params, session_id=cdp_session.session_id)
 
-			# Return base64-encoded screenshot data
+			# Decode once, base64 is rebuilt lazily only if the screenshot gets serialized
 			if result and 'data' in result:
 				self.logger.debug('[ScreenshotWatchdog] Screenshot captured successfully')
-				return result['data']
+				return Screenshot.from_base64(result['data'], clip=region)
 
 			raise BrowserError('[ScreenshotWatchdog] Screenshot result missing data')
 		except Exception as e:
@@ -209,6 +209,12 @@ class FlatEnvConfig(BaseSettings):
 	SKIP_LLM_API_KEY_VERIFICATION: bool = Field(default=False)
 	DEFAULT_LLM: str = Field(default='')
 
+	# LLM HTTP connection pools
+	BROWSER_USE_LLM_MAX_CONNECTIONS: int = Field(default=1000)
+	BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=100)
+	BROWSER_USE_LLM_KEEPALIVE_EXPIRY: float = Field(default=60.0)
+	BROWSER_USE_LLM_HTTP2: bool = Field(default=True)
+
 	# Runtime hints
 	IN_DOCKER: bool | None = Field(default=None)
 	IS_IN_EVALS: bool = Field(default=False)
@@ -5,11 +5,12 @@ This module provides stateless functions for parsing Chrome DevTools Protocol (C
 to extract visibility, clickability, cursor styles, and other layout information.
 """
 
+from collections.abc import Iterator, Mapping
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
 	NodeTreeSnapshot,
-	RareBooleanData,
 )
 
 from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
@@ -30,11 +31,6 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
-
-
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
 	"""Parse computed styles from layout tree using string indices."""
 	styles = {}
@@ -44,118 +40,179 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
-def build_snapshot_lookup(
-	snapshot: CaptureSnapshotReturns,
-	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
+class _SnapshotDocument:
+	"""Column references + index maps for one snapshot document (no per-node data is copied)."""
 
-	if not snapshot['documents']:
-		return snapshot_lookup
+	__slots__ = (
+		'backend_node_to_snapshot_index',
+		'layout_index_map',
+		'clickable_indices',
+		'bounds',
+		'styles',
+		'paint_orders',
+		'client_rects',
+		'scroll_rects',
+		'stacking_contexts',
+	)
 
-	strings = snapshot['strings']
+	def __init__(self, nodes: NodeTreeSnapshot, layout: LayoutTreeSnapshot):
+		# Build backend node id to snapshot index lookup (last occurrence wins, same as assigning in a loop)
+		backend_node_ids = nodes.get('backendNodeId', [])
+		self.backend_node_to_snapshot_index: dict[int, int] = dict(zip(backend_node_ids, range(len(backend_node_ids))))
 
-	for document in snapshot['documents']:
-		nodes: NodeTreeSnapshot = document['nodes']
-		layout: LayoutTreeSnapshot = document['layout']
+		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
+		# Preserve original behavior: use FIRST occurrence for duplicates (inserting in reverse lets the first one win)
+		node_indices = layout.get('nodeIndex', []) if layout else []
+		self.layout_index_map: dict[int, int] = dict(zip(reversed(node_indices), range(len(node_indices) - 1, -1, -1)))
+
+		self.clickable_indices: set[int] | None = set(nodes['isClickable']['index']) if 'isClickable' in nodes else None
+
+		# the CDP layout arrays already are columns indexed by layout index, keep references instead of copying
+		self.bounds = layout.get('bounds', [])
+		self.styles = layout.get('styles', [])
+		self.paint_orders = layout.get('paintOrders', [])
+		self.client_rects = layout.get('clientRects', [])
+		self.scroll_rects = layout.get('scrollRects', [])
+		self.stacking_contexts = layout.get('stackingContexts', [])
+
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""
+	Columnar, read-only mapping of backend node ID to enhanced snapshot data.
+
+	Only index maps are built upfront. `EnhancedSnapshotNode`s are materialized on first access and memoized,
+	so the same backend node ID always returns the same object (callers adjust bounds in place).
+	Computed style dicts are shared between nodes with identical styles and must be treated as read-only.
+	"""
+
+	__slots__ = ('_documents', '_strings', '_device_pixel_ratio', '_nodes', '_styles_cache')
+
+	def __init__(self, snapshot: CaptureSnapshotReturns, device_pixel_ratio: float = 1.0):
+		self._strings: list[str] = snapshot['strings'] if snapshot['documents'] else []
+		self._device_pixel_ratio = device_pixel_ratio
+		# later documents win for duplicate backend node ids, so they are searched first
+		self._documents = [
+			_SnapshotDocument(document['nodes'], document['layout']) for document in reversed(snapshot['documents'])
+		]
+		self._nodes: dict[int, EnhancedSnapshotNode] = {}
+		self._styles_cache: dict[tuple[int, ...], dict[str, str]] = {}
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		node = self._nodes.get(backend_node_id)
+		if node is not None:
+			return node
+
+		for document in self._documents:
+			snapshot_index = document.backend_node_to_snapshot_index.get(backend_node_id)
+			if snapshot_index is not None:
+				node = self._nodes[backend_node_id] = self._materialize(document, snapshot_index)
+				return node
+
+		raise KeyError(backend_node_id)
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return any(backend_node_id in document.backend_node_to_snapshot_index for document in self._documents)
+
+	def __iter__(self) -> Iterator[int]:
+		seen: set[int] = set()
+		for document in self._documents:
+			for backend_node_id in document.backend_node_to_snapshot_index:
+				if backend_node_id not in seen:
+					seen.add(backend_node_id)
+					yield backend_node_id
+
+	def __len__(self) -> int:
+		if len(self._documents) == 1:
+			return len(self._documents[0].backend_node_to_snapshot_index)
+		return sum(1 for _ in self)
+
+	def _computed_styles(self, style_indices: list[int]) -> dict[str, str]:
+		key = tuple(style_indices)
+		styles = self._styles_cache.get(key)
+		if styles is None:
+			styles = self._styles_cache[key] = _parse_computed_styles(self._strings, style_indices)
+		return styles
+
+	def _materialize(self, document: _SnapshotDocument, snapshot_index: int) -> EnhancedSnapshotNode:
+		is_clickable = None
+		if document.clickable_indices is not None:
+			is_clickable = snapshot_index in document.clickable_indices
+
+		# Find corresponding layout node
+		cursor_style = None
+		bounding_box = None
+		computed_styles = {}
+
+		# Look for layout tree node that corresponds to this snapshot node
+		paint_order = None
+		client_rects = None
+		scroll_rects = None
+		stacking_contexts = None
+		layout_idx = document.layout_index_map.get(snapshot_index)
+		if layout_idx is not None and layout_idx < len(document.bounds):
+			# Parse bounding box
+			bounds = document.bounds[layout_idx]
+			if len(bounds) >= 4:
+				# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
+				# by dividing by the device pixel ratio
+				device_pixel_ratio = self._device_pixel_ratio
+				bounding_box = DOMRect(
+					x=bounds[0] / device_pixel_ratio,
+					y=bounds[1] / device_pixel_ratio,
+					width=bounds[2] / device_pixel_ratio,
+					height=bounds[3] / device_pixel_ratio,
+				)
+
+			# Parse computed styles for this layout node
+			if layout_idx < len(document.styles):
+				computed_styles = self._computed_styles(document.styles[layout_idx])
+				cursor_style = computed_styles.get('cursor')
+
+			# Extract paint order if available
+			if layout_idx < len(document.paint_orders):
+				paint_order = document.paint_orders[layout_idx]
+
+			# Extract client rects if available
+			if layout_idx < len(document.client_rects):
+				client_rect_data = document.client_rects[layout_idx]
+				if client_rect_data and len(client_rect_data) >= 4:
+					client_rects = DOMRect(
+						x=client_rect_data[0],
+						y=client_rect_data[1],
+						width=client_rect_data[2],
+						height=client_rect_data[3],
+					)
+
+			# Extract scroll rects if available
+			if layout_idx < len(document.scroll_rects):
+				scroll_rect_data = document.scroll_rects[layout_idx]
+				if scroll_rect_data and len(scroll_rect_data) >= 4:
+					scroll_rects = DOMRect(
+						x=scroll_rect_data[0],
+						y=scroll_rect_data[1],
+						width=scroll_rect_data[2],
+						height=scroll_rect_data[3],
+					)
+
+			# Extract stacking contexts if available
+			if layout_idx < len(document.stacking_contexts):
+				stacking_contexts = document.stacking_contexts.get('index', [])[layout_idx]
+
+		return EnhancedSnapshotNode(
+			is_clickable=is_clickable,
+			cursor_style=cursor_style,
+			bounds=bounding_box,
+			clientRects=client_rects,
+			scrollRects=scroll_rects,
+			computed_styles=computed_styles if computed_styles else None,
+			paint_order=paint_order,
+			stacking_contexts=stacking_contexts,
+		)
 
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
 
-		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
-		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
-
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
-			)
-
-	return snapshot_lookup
+def build_snapshot_lookup(
+	snapshot: CaptureSnapshotReturns,
+	device_pixel_ratio: float = 1.0,
+) -> SnapshotLookup:
+	"""Build a lazy lookup table of backend node ID to enhanced snapshot data."""
+	return SnapshotLookup(snapshot, device_pixel_ratio)
@@ -0,0 +1,285 @@
+"""
+Incremental DOM tree maintenance for browser-use DOM tree extraction.
+
+Instead of re-running DOM.getDocument(depth=-1) and rebuilding every EnhancedDOMTreeNode on every step,
+the cached enhanced tree of a target is kept alive between steps and patched in place from the CDP DOM
+mutation events Chrome sends for every node it has already pushed to us:
+	- DOM.childNodeInserted / DOM.childNodeRemoved / DOM.setChildNodes
+	- DOM.attributeModified / DOM.attributeRemoved
+	- DOM.characterDataModified
+	- DOM.shadowRootPushed / DOM.shadowRootPopped
+	- DOM.childNodeCountUpdated (children we never received, need to be requested)
+
+DOM.documentUpdated (navigation, document.open(), another DOM.getDocument call on the same session) or a mutation
+log that grew past its limit invalidate the cache and force a full rebuild.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.target import SessionID, TargetID
+
+from browser_use.dom.views import EnhancedDOMTreeNode
+
+DEFAULT_MUTATION_LOG_LIMIT = 2000
+"""Maximum number of mutation events buffered between two DOM builds before we give up and rebuild from scratch."""
+
+MUTATION_EVENTS = [
+	'DOM.childNodeInserted',
+	'DOM.childNodeRemoved',
+	'DOM.setChildNodes',
+	'DOM.attributeModified',
+	'DOM.attributeRemoved',
+	'DOM.characterDataModified',
+	'DOM.childNodeCountUpdated',
+	'DOM.shadowRootPushed',
+	'DOM.shadowRootPopped',
+	'DOM.documentUpdated',
+]
+
+
+class DOMMutationLog:
+	"""Buffers the CDP DOM mutation events of one target between two DOM builds."""
+
+	__slots__ = ('limit', 'events', 'overflowed', 'document_updated')
+
+	def __init__(self, limit: int = DEFAULT_MUTATION_LOG_LIMIT):
+		self.limit = limit
+		self.events: list[tuple[str, dict[str, Any]]] = []
+		self.overflowed = False
+		self.document_updated = False
+
+	def record(self, method: str, params: dict[str, Any]) -> None:
+		if method == 'DOM.documentUpdated':
+			# every nodeId we know is now invalid, no point in keeping anything around
+			self.document_updated = True
+			self.events.clear()
+			return
+
+		if self.needs_full_rebuild:
+			return
+
+		if len(self.events) >= self.limit:
+			self.overflowed = True
+			self.events.clear()
+			return
+
+		self.events.append((method, params))
+
+	@property
+	def needs_full_rebuild(self) -> bool:
+		return self.overflowed or self.document_updated
+
+	def drain(self) -> list[tuple[str, dict[str, Any]]]:
+		"""Return and forget all buffered events (in the order they were received)."""
+		events = self.events
+		self.events = []
+		return events
+
+	def reset(self) -> None:
+		self.events = []
+		self.overflowed = False
+		self.document_updated = False
+
+
+@dataclass
+class IncrementalTreeState:
+	"""Cached enhanced DOM tree of a single target, kept in sync with the page by DOMTreePatcher."""
+
+	target_id: TargetID
+	session_id: SessionID
+	root: EnhancedDOMTreeNode
+	node_lookup: dict[int, EnhancedDOMTreeNode]
+	"""NodeId (NOT backend node id) -> enhanced dom tree node, only nodes of this target's own documents"""
+	log: DOMMutationLog
+	min_node_id: int
+	"""Lowest nodeId of the current document, anything below was issued before our DOM.getDocument and is stale"""
+	has_remote_frames: bool = False
+	"""True if the tree contains cross-origin iframe documents from other targets (we can't track their mutations)"""
+	dirty_backend_node_ids: set[int] = field(default_factory=set)
+
+
+class DOMTreePatcher:
+	"""
+	Applies buffered CDP DOM mutation events to a cached enhanced DOM tree in place.
+
+	`build_subtree` turns a raw CDP Node (and all of its children it carries) into enhanced nodes, registering
+	every created node in `state.node_lookup` and linking parent pointers. Snapshot and AX data of new nodes are
+	filled in later by the caller (layout is always refreshed for the whole tree, AX only for dirty nodes).
+	"""
+
+	def __init__(
+		self,
+		state: IncrementalTreeState,
+		build_subtree: Callable[[Node, EnhancedDOMTreeNode | None], EnhancedDOMTreeNode],
+	):
+		self.state = state
+		self.build_subtree = build_subtree
+		self.pending_child_requests: set[int] = set()
+		"""nodeIds whose children Chrome did not send yet (need DOM.requestChildNodes)"""
+
+	def apply(self, events: list[tuple[str, dict[str, Any]]]) -> bool:
+		"""Apply events in order. Returns False if the tree can't be patched and must be rebuilt from scratch."""
+		for method, params in events:
+			if not self._apply_one(method, params):
+				return False
+		return True
+
+	# --- helpers -----------------------------------------------------------
+
+	def _is_stale(self, node_id: int) -> bool:
+		return node_id < self.state.min_node_id
+
+	def _mark_dirty(self, node: EnhancedDOMTreeNode) -> None:
+		self.state.dirty_backend_node_ids.add(node.backend_node_id)
+
+	def _forget_subtree(self, node: EnhancedDOMTreeNode) -> None:
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self.state.node_lookup.pop(current.node_id, None)
+			self.state.dirty_backend_node_ids.discard(current.backend_node_id)
+			self.pending_child_requests.discard(current.node_id)
+			stack.extend(current.children_nodes or [])
+			stack.extend(current.shadow_roots or [])
+			if current.content_document:
+				stack.append(current.content_document)
+
+	def _mark_subtree_dirty(self, node: EnhancedDOMTreeNode) -> None:
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self._mark_dirty(current)
+			stack.extend(current.children_nodes or [])
+			stack.extend(current.shadow_roots or [])
+			if current.content_document:
+				stack.append(current.content_document)
+
+	def _build(self, raw_node: Node, parent: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+		new_node = self.build_subtree(raw_node, parent)
+		self._mark_subtree_dirty(new_node)
+		# Chrome only sends the node itself on insertion, children have to be requested explicitly
+		self._queue_missing_children(raw_node)
+		return new_node
+
+	def _queue_missing_children(self, raw_node: Node) -> None:
+		stack = [raw_node]
+		while stack:
+			current = stack.pop()
+			if current.get('childNodeCount') and 'children' not in current:
+				self.pending_child_requests.add(current['nodeId'])
+			stack.extend(current.get('children') or [])
+			stack.extend(current.get('shadowRoots') or [])
+			if content_document := current.get('contentDocument'):
+				stack.append(content_document)
+
+	# --- event handlers ----------------------------------------------------
+
+	def _apply_one(self, method: str, params: dict[str, Any]) -> bool:
+		lookup = self.state.node_lookup
+
+		if method == 'DOM.attributeModified' or method == 'DOM.attributeRemoved':
+			node_id = params['nodeId']
+			node = lookup.get(node_id)
+			if node is None:
+				return self._is_stale(node_id)
+			if method == 'DOM.attributeModified':
+				node.attributes[params['name']] = params['value']
+			else:
+				node.attributes.pop(params['name'], None)
+			self._mark_dirty(node)
+			return True
+
+		if method == 'DOM.characterDataModified':
+			node_id = params['nodeId']
+			node = lookup.get(node_id)
+			if node is None:
+				return self._is_stale(node_id)
+			node.node_value = params['characterData']
+			self._mark_dirty(node)
+			# the accessible name of the parent element is derived from its text
+			if node.parent_node:
+				self._mark_dirty(node.parent_node)
+			return True
+
+		if method == 'DOM.childNodeInserted':
+			parent_id = params['parentNodeId']
+			parent = lookup.get(parent_id)
+			if parent is None:
+				return self._is_stale(parent_id)
+			new_node = self._build(params['node'], parent)
+			children = parent.children_nodes if parent.children_nodes is not None else []
+			previous_id = params.get('previousNodeId') or 0
+			insert_at = 0
+			if previous_id:
+				for i, child in enumerate(children):
+					if child.node_id == previous_id:
+						insert_at = i + 1
+						break
+				else:
+					return False  # previous sibling unknown, our children list is out of sync
+			children.insert(insert_at, new_node)
+			parent.children_nodes = children
+			self._mark_dirty(parent)
+			return True
+
+		if method == 'DOM.childNodeRemoved':
+			parent_id = params['parentNodeId']
+			parent = lookup.get(parent_id)
+			node = lookup.get(params['nodeId'])
+			if parent is None or node is None:
+				return self._is_stale(parent_id) and self._is_stale(params['nodeId'])
+			if parent.children_nodes and node in parent.children_nodes:
+				parent.children_nodes.remove(node)
+			self._forget_subtree(node)
+			self._mark_dirty(parent)
+			return True
+
+		if method == 'DOM.setChildNodes':
+			parent_id = params['parentId']
+			parent = lookup.get(parent_id)
+			if parent is None:
+				return self._is_stale(parent_id)
+			for old_child in parent.children_nodes or []:
+				self._forget_subtree(old_child)
+			parent.children_nodes = [self._build(raw_child, parent) for raw_child in params['nodes']]
+			self.pending_child_requests.discard(parent_id)
+			self._mark_dirty(parent)
+			return True
+
+		if method == 'DOM.childNodeCountUpdated':
+			node_id = params['nodeId']
+			node = lookup.get(node_id)
+			if node is None:
+				return self._is_stale(node_id)
+			# Chrome sends this instead of childNodeInserted for nodes whose children it never pushed to us
+			if params.get('childNodeCount'):
+				self.pending_child_requests.add(node_id)
+			return True
+
+		if method == 'DOM.shadowRootPushed':
+			host_id = params['hostId']
+			host = lookup.get(host_id)
+			if host is None:
+				return self._is_stale(host_id)
+			shadow_root = self._build(params['root'], host)
+			host.shadow_roots = (host.shadow_roots or []) + [shadow_root]
+			self._mark_dirty(host)
+			return True
+
+		if method == 'DOM.shadowRootPopped':
+			host_id = params['hostId']
+			host = lookup.get(host_id)
+			root = lookup.get(params['rootId'])
+			if host is None or root is None:
+				return self._is_stale(host_id)
+			if host.shadow_roots and root in host.shadow_roots:
+				host.shadow_roots.remove(root)
+			self._forget_subtree(root)
+			self._mark_dirty(host)
+			return True
+
+		# unknown / irrelevant event types are ignored
+		return True
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
+from math import floor
 
 from browser_use.dom.views import SimplifiedNode
 
@@ -71,6 +72,16 @@ class RectUnionPure:
 
 		return parts
 
+	def _candidates(self, r: Rect) -> list[Rect]:
+		"""
+		Stored rectangles that may touch r, in insertion order.
+		Subclasses narrow this down with an index, everything else in the algorithm stays the same.
+		"""
+		return self._rects
+
+	def _store(self, pieces: list[Rect]) -> None:
+		self._rects.extend(pieces)
+
 	# -----------------------------------------------------------------
 	def contains(self, r: Rect) -> bool:
 		"""
@@ -79,8 +90,21 @@ class RectUnionPure:
 		if not self._rects:
 			return False
 
+		candidates = self._candidates(r)
+
+		# Cheap necessary condition: the stored rects are disjoint, so they can only cover r if their overlap
+		# with it adds up to its whole area. Skips the piece splitting below for big, mostly uncovered rects.
+		area = r.area()
+		if area > 0:
+			covered_area = 0.0
+			for s in candidates:
+				if s.intersects(r):
+					covered_area += (min(s.x2, r.x2) - max(s.x1, r.x1)) * (min(s.y2, r.y2) - max(s.y1, r.y1))
+			if covered_area < area * (1 - 1e-9):
+				return False
+
 		stack = [r]
-		for s in self._rects:
+		for s in candidates:
 			new_stack = []
 			for piece in stack:
 				if s.contains(piece):
@@ -105,29 +129,91 @@ class RectUnionPure:
 			return False
 
 		pending = [r]
-		i = 0
-		while i < len(self._rects):
-			s = self._rects[i]
+		for s in self._candidates(r):
 			new_pending = []
-			changed = False
 			for piece in pending:
 				if piece.intersects(s):
 					new_pending.extend(self._split_diff(piece, s))
-					changed = True
 				else:
 					new_pending.append(piece)
 			pending = new_pending
-			if changed:
-				# s unchanged; proceed with next existing rectangle
-				i += 1
-			else:
-				i += 1
 
 		# Any left‑over pieces are new, non‑overlapping areas
-		self._rects.extend(pending)
+		self._store(pending)
 		return True
 
 
+class RectUnionGrid(RectUnionPure):
+	"""
+	RectUnionPure backed by a uniform grid (spatial hash) of the stored rectangles.
+
+	`contains` and `add` only look at rectangles registered in the grid cells the query touches
+	(closed bounds, so touching edges count), processed in insertion order. Rectangles that don't touch
+	the query can neither cover nor split any part of it, so results are identical to RectUnionPure.
+	"""
+
+	__slots__ = ('_cell_size', '_cells', '_oversized')
+
+	MAX_CELLS_PER_RECT = 4096
+	"""Rectangles spanning more cells than this are kept in a plain list that is checked on every query."""
+
+	def __init__(self, cell_size: float = 128.0):
+		super().__init__()
+		self._cell_size = cell_size
+		self._cells: dict[tuple[int, int], list[int]] = {}
+		self._oversized: list[int] = []
+
+	def _cell_range(self, r: Rect) -> tuple[int, int, int, int] | None:
+		size = self._cell_size
+		try:
+			cx1, cy1, cx2, cy2 = floor(r.x1 / size), floor(r.y1 / size), floor(r.x2 / size), floor(r.y2 / size)
+		except (OverflowError, ValueError):  # inf / nan coordinates
+			return None
+		if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > self.MAX_CELLS_PER_RECT:
+			return None
+		return cx1, cy1, cx2, cy2
+
+	def _candidates(self, r: Rect) -> list[Rect]:
+		cell_range = self._cell_range(r)
+		if cell_range is None:
+			return self._rects
+
+		cx1, cy1, cx2, cy2 = cell_range
+		cells = self._cells
+		ids: set[int] = set(self._oversized)
+		for cx in range(cx1, cx2 + 1):
+			for cy in range(cy1, cy2 + 1):
+				bucket = cells.get((cx, cy))
+				if bucket:
+					ids.update(bucket)
+		rects = self._rects
+		return [rects[i] for i in sorted(ids)]
+
+	def _store(self, pieces: list[Rect]) -> None:
+		for piece in pieces:
+			rect_id = len(self._rects)
+			self._rects.append(piece)
+			cell_range = self._cell_range(piece)
+			if cell_range is None:
+				self._oversized.append(rect_id)
+				continue
+			cx1, cy1, cx2, cy2 = cell_range
+			for cx in range(cx1, cx2 + 1):
+				for cy in range(cy1, cy2 + 1):
+					self._cells.setdefault((cx, cy), []).append(rect_id)
+
+
+GRID_RECT_UNION_THRESHOLD = 500
+"""Number of painted rectangles above which the grid-indexed union is used instead of the flat list."""
+
+
+def create_rect_union(rect_count: int) -> RectUnionPure:
+	"""Pick the union backend for the expected number of rectangles (both give identical results)."""
+	if rect_count > GRID_RECT_UNION_THRESHOLD:
+		return RectUnionGrid()
+	return RectUnionPure()
+
+
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
@@ -158,7 +244,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union = create_rect_union(len(all_simplified_nodes_with_paint_order))
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -1,5 +1,6 @@
 # @file purpose: Serializes enhanced DOM trees to string format for LLM consumption
 
+from collections.abc import Callable, Iterator
 
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
 from browser_use.dom.serializer.paint_order import PaintOrderRemover
@@ -7,6 +8,7 @@ from browser_use.dom.utils import cap_text_length
 from browser_use.dom.views import (
 	DOMRect,
 	DOMSelectorMap,
+	DOMSerializationPriority,
 	EnhancedDOMTreeNode,
 	NodeType,
 	PropagatingBounds,
@@ -17,6 +19,26 @@ from browser_use.dom.views import (
 DISABLED_ELEMENTS = {'style', 'script', 'head', 'meta', 'link', 'title'}
 
 
+def _viewport_first_rank(node: SimplifiedNode) -> int:
+	is_interactive = node.interactive_index is not None
+	if node.original_node.is_visible:
+		return 0 if is_interactive else 1
+	return 2 if is_interactive else 3
+
+
+def _interactive_first_rank(node: SimplifiedNode) -> int:
+	if node.interactive_index is not None:
+		return 0 if node.original_node.is_visible else 1
+	return 2 if node.original_node.is_visible else 3
+
+
+SERIALIZATION_PRIORITY_RANKS: dict[str, Callable[[SimplifiedNode], int]] = {
+	'viewport': _viewport_first_rank,
+	'interactive': _interactive_first_rank,
+}
+"""Lower rank = kept first when the serialized tree has to be cut down to a budget."""
+
+
 class DOMTreeSerializer:
 	"""Serializes enhanced DOM trees to string format."""
 
@@ -414,95 +436,128 @@ class DOMTreeSerializer:
 	@staticmethod
 	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
 		"""Serialize the optimized tree to string format."""
-		if not node:
-			return ''
+		return '\n'.join(line for _, line in DOMTreeSerializer.iter_serialized_lines(node, include_attributes, depth))
 
-		# Skip rendering excluded nodes, but process their children
-		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
-			formatted_text = []
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-				if child_text:
-					formatted_text.append(child_text)
-			return '\n'.join(formatted_text)
-
-		formatted_text = []
-		depth_str = depth * '\t'
-		next_depth = depth
-
-		if node.original_node.node_type == NodeType.ELEMENT_NODE:
-			# Skip displaying nodes marked as should_display=False
-			if not node.should_display:
-				for child in node.children:
-					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-					if child_text:
-						formatted_text.append(child_text)
-				return '\n'.join(formatted_text)
-
-			# Add element with interactive_index if clickable, scrollable, or iframe
-			is_any_scrollable = node.original_node.is_actually_scrollable or node.original_node.is_scrollable
-			should_show_scroll = node.original_node.should_show_scroll_info
-			if (
-				node.interactive_index is not None
-				or is_any_scrollable
-				or node.original_node.tag_name.upper() == 'IFRAME'
-				or node.original_node.tag_name.upper() == 'FRAME'
-			):
-				next_depth += 1
-
-				# Build attributes string
-				attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
-
-				# Build the line
-				if should_show_scroll and node.interactive_index is None:
-					# Scrollable container but not clickable
-					line = f'{depth_str}|SCROLL|<{node.original_node.tag_name}'
-				elif node.interactive_index is not None:
-					# Clickable (and possibly scrollable)
-					new_prefix = '*' if node.is_new else ''
-					scroll_prefix = '|SCROLL+' if should_show_scroll else '['
-					line = f'{depth_str}{new_prefix}{scroll_prefix}{node.interactive_index}]<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'IFRAME':
-					# Iframe element (not interactive)
-					line = f'{depth_str}|IFRAME|<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'FRAME':
-					# Frame element (not interactive)
-					line = f'{depth_str}|FRAME|<{node.original_node.tag_name}'
-				else:
-					line = f'{depth_str}<{node.original_node.tag_name}'
-
-				if attributes_html_str:
-					line += f' {attributes_html_str}'
-
-				line += ' />'
-
-				# Add scroll information only when we should show it
-				if should_show_scroll:
-					scroll_info_text = node.original_node.get_scroll_info_text()
-					if scroll_info_text:
-						line += f' ({scroll_info_text})'
-
-				formatted_text.append(line)
-
-		elif node.original_node.node_type == NodeType.TEXT_NODE:
-			# Include visible text
-			is_visible = node.original_node.snapshot_node and node.original_node.is_visible
-			if (
-				is_visible
-				and node.original_node.node_value
-				and node.original_node.node_value.strip()
-				and len(node.original_node.node_value.strip()) > 1
-			):
-				clean_text = node.original_node.node_value.strip()
-				formatted_text.append(f'{depth_str}{clean_text}')
+	@staticmethod
+	def serialize_tree_with_budget(
+		node: SimplifiedNode | None,
+		include_attributes: list[str],
+		max_length: int,
+		priority: DOMSerializationPriority = 'document',
+	) -> tuple[str, bool]:
+		"""
+		Serialize the optimized tree to at most `max_length` characters, returns (text, truncated).
 
-		# Process children
-		for child in node.children:
-			child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-			if child_text:
-				formatted_text.append(child_text)
+		With priority='document' lines are produced lazily and serialization stops once the budget is used up,
+		the result is exactly `serialize_tree(...)[:max_length]`. The other modes walk the whole tree and fill the
+		budget with the highest ranked lines first (see SERIALIZATION_PRIORITY_RANKS), kept in document order.
+		"""
+		lines = DOMTreeSerializer.iter_serialized_lines(node, include_attributes)
+
+		if priority == 'document':
+			parts: list[str] = []
+			length = -1  # no newline before the first line
+			for _, line in lines:
+				parts.append(line)
+				length += len(line) + 1
+				if length > max_length:
+					return '\n'.join(parts)[:max_length], True
+			return '\n'.join(parts), False
+
+		rank = SERIALIZATION_PRIORITY_RANKS[priority]
+		entries = [(rank(simplified_node), position, line) for position, (simplified_node, line) in enumerate(lines)]
+		if sum(len(line) for _, _, line in entries) + len(entries) - 1 <= max_length:
+			return '\n'.join(line for _, _, line in entries), False
+
+		selected: list[tuple[int, str]] = []
+		used = 0
+		for _, position, line in sorted(entries):
+			cost = len(line) + (1 if selected else 0)
+			if used + cost <= max_length:
+				selected.append((position, line))
+				used += cost
+		selected.sort()
+		return '\n'.join(line for _, line in selected), True
 
-		return '\n'.join(formatted_text)
+	@staticmethod
+	def iter_serialized_lines(
+		node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0
+	) -> Iterator[tuple[SimplifiedNode, str]]:
+		"""Yield (node, line) for every line of the serialized tree in document order, without recursion."""
+		if not node:
+			return
+
+		stack: list[tuple[SimplifiedNode, int]] = [(node, depth)]
+		while stack:
+			node, depth = stack.pop()
+			depth_str = depth * '\t'
+			next_depth = depth
+
+			# Skip rendering excluded nodes and nodes marked as should_display=False, but process their children
+			if node.excluded_by_parent or (node.original_node.node_type == NodeType.ELEMENT_NODE and not node.should_display):
+				pass
+
+			elif node.original_node.node_type == NodeType.ELEMENT_NODE:
+				# Add element with interactive_index if clickable, scrollable, or iframe
+				is_any_scrollable = node.original_node.is_actually_scrollable or node.original_node.is_scrollable
+				should_show_scroll = node.original_node.should_show_scroll_info
+				if (
+					node.interactive_index is not None
+					or is_any_scrollable
+					or node.original_node.tag_name.upper() == 'IFRAME'
+					or node.original_node.tag_name.upper() == 'FRAME'
+				):
+					next_depth += 1
+
+					# Build attributes string
+					attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
+
+					# Build the line
+					if should_show_scroll and node.interactive_index is None:
+						# Scrollable container but not clickable
+						line = f'{depth_str}|SCROLL|<{node.original_node.tag_name}'
+					elif node.interactive_index is not None:
+						# Clickable (and possibly scrollable)
+						new_prefix = '*' if node.is_new else ''
+						scroll_prefix = '|SCROLL+' if should_show_scroll else '['
+						line = f'{depth_str}{new_prefix}{scroll_prefix}{node.interactive_index}]<{node.original_node.tag_name}'
+					elif node.original_node.tag_name.upper() == 'IFRAME':
+						# Iframe element (not interactive)
+						line = f'{depth_str}|IFRAME|<{node.original_node.tag_name}'
+					elif node.original_node.tag_name.upper() == 'FRAME':
+						# Frame element (not interactive)
+						line = f'{depth_str}|FRAME|<{node.original_node.tag_name}'
+					else:
+						line = f'{depth_str}<{node.original_node.tag_name}'
+
+					if attributes_html_str:
+						line += f' {attributes_html_str}'
+
+					line += ' />'
+
+					# Add scroll information only when we should show it
+					if should_show_scroll:
+						scroll_info_text = node.original_node.get_scroll_info_text()
+						if scroll_info_text:
+							line += f' ({scroll_info_text})'
+
+					yield node, line
+
+			elif node.original_node.node_type == NodeType.TEXT_NODE:
+				# Include visible text
+				is_visible = node.original_node.snapshot_node and node.original_node.is_visible
+				if (
+					is_visible
+					and node.original_node.node_value
+					and node.original_node.node_value.strip()
+					and len(node.original_node.node_value.strip()) > 1
+				):
+					clean_text = node.original_node.node_value.strip()
+					yield node, f'{depth_str}{clean_text}'
+
+			# Process children (pushed in reverse so they pop in document order)
+			for child in reversed(node.children):
+				stack.append((child, next_depth))
 
 	@staticmethod
 	def _build_attributes_string(node: EnhancedDOMTreeNode, include_attributes: list[str], text: str) -> str:
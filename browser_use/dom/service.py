@@ -1,17 +1,27 @@
 import asyncio
 import logging
 import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXNode
 from cdp_use.cdp.dom.types import Node
-from cdp_use.cdp.target import TargetID
+from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
+from cdp_use.cdp.target import SessionID, TargetID
 
 from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
+	SnapshotLookup,
 	build_snapshot_lookup,
 )
+from browser_use.dom.incremental import (
+	DEFAULT_MUTATION_LOG_LIMIT,
+	MUTATION_EVENTS,
+	DOMMutationLog,
+	DOMTreePatcher,
+	IncrementalTreeState,
+)
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
 from browser_use.dom.views import (
 	CurrentPageTargets,
@@ -27,9 +37,8 @@ from browser_use.dom.views import (
 if TYPE_CHECKING:
 	from browser_use.browser.session import BrowserSession
 
-# Global limits to prevent iframe explosion
-MAX_TOTAL_IFRAMES = 3  # Maximum number of iframe documents to process (very conservative to prevent explosions)
-MAX_IFRAME_DEPTH = 1  # Maximum depth for cross-origin iframe recursion (only 1 level deep)
+# Above this many changed nodes it is cheaper to refetch the full accessibility tree than to query each node separately
+MAX_PARTIAL_AX_REFRESH_NODES = 100
 
 
 class DomService:
@@ -38,7 +47,8 @@ class DomService:
 
 	Either browser or page must be provided.
 
-	TODO: currently we start a new websocket connection PER STEP, we should definitely keep this persistent
+	CDP sessions come from `BrowserSession.get_or_create_cdp_session`, which keeps them (and their sockets) alive
+	across steps and can multiplex them over a bounded connection pool (see `BrowserProfile.cdp_pool_max_sockets`).
 	"""
 
 	logger: logging.Logger
@@ -48,12 +58,30 @@ class DomService:
 		browser_session: 'BrowserSession',
 		logger: logging.Logger | None = None,
 		cross_origin_iframes: bool = False,
+		max_iframes: int = 3,
+		max_iframe_depth: int = 1,
+		max_concurrent_iframe_fetches: int = 3,
+		iframe_fetch_timeout: float = 5.0,
 		paint_order_filtering: bool = True,
+		incremental_updates: bool = False,
+		mutation_log_limit: int = DEFAULT_MUTATION_LOG_LIMIT,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
 		self.cross_origin_iframes = cross_origin_iframes
+		# limits to prevent iframe explosion: documents per page, cross-origin nesting depth, concurrent fetches, time budget
+		self.max_iframes = max_iframes
+		self.max_iframe_depth = max_iframe_depth
+		self.max_concurrent_iframe_fetches = max_concurrent_iframe_fetches
+		self.iframe_fetch_timeout = iframe_fetch_timeout
 		self.paint_order_filtering = paint_order_filtering
+		self.incremental_updates = incremental_updates
+		self.mutation_log_limit = mutation_log_limit
+
+		# incremental DOM updates: cached trees per target + mutation logs per CDP session
+		self._incremental_states: dict[TargetID, IncrementalTreeState] = {}
+		self._mutation_logs: dict[SessionID, DOMMutationLog] = {}
+		self._mutation_listening_clients: set[int] = set()
 
 	async def __aenter__(self):
 		return self
@@ -202,7 +230,7 @@ class DomService:
 			):
 				iframe_bounds = frame.snapshot_node.bounds
 
-				# negate the values added in `_construct_enhanced_node`
+				# negate the values added in `_refresh_layout`
 				current_bounds.x += iframe_bounds.x
 				current_bounds.y += iframe_bounds.y
 
@@ -284,6 +312,38 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
+	async def _capture_snapshot(self, cdp_session) -> CaptureSnapshotReturns:
+		return await cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
+			params={
+				'computedStyles': REQUIRED_COMPUTED_STYLES,
+				'includePaintOrder': True,
+				'includeDOMRects': True,
+				'includeBlendedBackgroundColors': False,
+				'includeTextColorOpacities': False,
+			},
+			session_id=cdp_session.session_id,
+		)
+
+	def _limit_snapshot_documents(self, snapshot: CaptureSnapshotReturns) -> None:
+		# DEBUG: Log snapshot info and limit documents to prevent explosion
+		if snapshot and 'documents' in snapshot:
+			original_doc_count = len(snapshot['documents'])
+			# Limit to max_iframes documents to prevent iframe explosion
+			if original_doc_count > self.max_iframes:
+				self.logger.warning(
+					f'⚠️ Limiting processing of {original_doc_count} iframes on page to only first {self.max_iframes} to prevent crashes!'
+				)
+				snapshot['documents'] = snapshot['documents'][: self.max_iframes]
+
+			total_nodes = sum(len(doc.get('nodes', [])) for doc in snapshot['documents'])
+			self.logger.debug(f'🔍 DEBUG: Snapshot contains {len(snapshot["documents"])} frames with {total_nodes} total nodes')
+			# Log iframe-specific info
+			for doc_idx, doc in enumerate(snapshot['documents']):
+				if doc_idx > 0:  # Not the main document
+					self.logger.debug(
+						f'🔍 DEBUG: Iframe #{doc_idx} {doc.get("frameId", "no-frame-id")} {doc.get("url", "no-url")} has {len(doc.get("nodes", []))} nodes'
+					)
+
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
@@ -337,16 +397,7 @@ class DomService:
 
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
-			return cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
-				params={
-					'computedStyles': REQUIRED_COMPUTED_STYLES,
-					'includePaintOrder': True,
-					'includeDOMRects': True,
-					'includeBlendedBackgroundColors': False,
-					'includeTextColorOpacities': False,
-				},
-				session_id=cdp_session.session_id,
-			)
+			return self._capture_snapshot(cdp_session)
 
 		def create_dom_tree_request():
 			return cdp_session.cdp_client.send.DOM.getDocument(
@@ -416,24 +467,7 @@ class DomService:
 		end = time.time()
 		cdp_timing = {'cdp_calls_total': end - start}
 
-		# DEBUG: Log snapshot info and limit documents to prevent explosion
-		if snapshot and 'documents' in snapshot:
-			original_doc_count = len(snapshot['documents'])
-			# Limit to MAX_TOTAL_IFRAMES documents to prevent iframe explosion
-			if original_doc_count > MAX_TOTAL_IFRAMES:
-				self.logger.warning(
-					f'⚠️ Limiting processing of {original_doc_count} iframes on page to only first {MAX_TOTAL_IFRAMES} to prevent crashes!'
-				)
-				snapshot['documents'] = snapshot['documents'][:MAX_TOTAL_IFRAMES]
-
-			total_nodes = sum(len(doc.get('nodes', [])) for doc in snapshot['documents'])
-			self.logger.debug(f'🔍 DEBUG: Snapshot contains {len(snapshot["documents"])} frames with {total_nodes} total nodes')
-			# Log iframe-specific info
-			for doc_idx, doc in enumerate(snapshot['documents']):
-				if doc_idx > 0:  # Not the main document
-					self.logger.debug(
-						f'🔍 DEBUG: Iframe #{doc_idx} {doc.get("frameId", "no-frame-id")} {doc.get("url", "no-url")} has {len(doc.get("nodes", []))} nodes'
-					)
+		self._limit_snapshot_documents(snapshot)
 
 		return TargetAllTrees(
 			snapshot=snapshot,
@@ -443,6 +477,397 @@ class DomService:
 			cdp_timing=cdp_timing,
 		)
 
+	def _create_enhanced_node(
+		self, node: Node, target_id: TargetID, ax_tree_lookup: dict[int, AXNode], session_id: SessionID | None
+	) -> EnhancedDOMTreeNode:
+		"""Create a single enhanced node from a CDP DOM node, without tree links and layout information."""
+		ax_node = ax_tree_lookup.get(node['backendNodeId'])
+		if ax_node:
+			enhanced_ax_node = self._build_enhanced_ax_node(ax_node)
+		else:
+			enhanced_ax_node = None
+
+		# To make attributes more readable
+		attributes: dict[str, str] | None = None
+		if raw_attributes := node.get('attributes'):
+			# flat [name1, value1, name2, value2, ...] list
+			attributes = dict(zip(raw_attributes[::2], raw_attributes[1::2]))
+
+		shadow_root_type = None
+		if 'shadowRootType' in node and node['shadowRootType']:
+			try:
+				shadow_root_type = node['shadowRootType']
+			except ValueError:
+				pass
+
+		return EnhancedDOMTreeNode(
+			node_id=node['nodeId'],
+			backend_node_id=node['backendNodeId'],
+			node_type=NodeType(node['nodeType']),
+			node_name=node['nodeName'],
+			node_value=node['nodeValue'],
+			attributes=attributes or {},
+			is_scrollable=node.get('isScrollable', None),
+			frame_id=node.get('frameId', None),
+			session_id=session_id,
+			target_id=target_id,
+			content_document=None,
+			shadow_root_type=shadow_root_type,
+			shadow_roots=None,
+			parent_node=None,
+			children_nodes=None,
+			ax_node=enhanced_ax_node,
+			snapshot_node=None,
+			is_visible=None,
+			absolute_position=None,
+			element_index=None,
+		)
+
+	# --- Incremental DOM updates ------------------------------------------------
+
+	def _on_dom_mutation(self, method: str):
+		def handler(event, session_id: SessionID | None = None) -> None:
+			log = self._mutation_logs.get(session_id) if session_id else None
+			if log is not None:
+				log.record(method, event)  # type: ignore[arg-type]
+
+		return handler
+
+	def _start_mutation_log(self, cdp_session) -> DOMMutationLog:
+		"""Start recording DOM mutations of a CDP session (must happen before DOM.getDocument so no event is missed)."""
+		cdp_client = cdp_session.cdp_client
+		if id(cdp_client) not in self._mutation_listening_clients:
+			for method in MUTATION_EVENTS:
+				domain, event_name = method.split('.')
+				getattr(getattr(cdp_client.register, domain), event_name)(self._on_dom_mutation(method))
+			self._mutation_listening_clients.add(id(cdp_client))
+
+		log = DOMMutationLog(limit=self.mutation_log_limit)
+		self._mutation_logs[cdp_session.session_id] = log
+		return log
+
+	def invalidate_incremental_state(self, target_id: TargetID | None = None) -> None:
+		"""Drop cached DOM trees so the next get_dom_tree call rebuilds from scratch."""
+		states = list(self._incremental_states.values()) if target_id is None else [self._incremental_states.get(target_id)]
+		for state in states:
+			if state is None:
+				continue
+			self._incremental_states.pop(state.target_id, None)
+			self._mutation_logs.pop(state.session_id, None)
+
+	def _build_enhanced_subtree(
+		self,
+		raw_root: Node,
+		target_id: TargetID,
+		node_lookup: dict[int, EnhancedDOMTreeNode],
+		ax_tree_lookup: dict[int, AXNode],
+		parent: EnhancedDOMTreeNode | None = None,
+	) -> EnhancedDOMTreeNode:
+		"""Build linked enhanced nodes for a CDP node and all its descendants, without layout information.
+
+		Iterative pre-order walk (content document, then shadow roots, then children), so arbitrarily deep documents
+		don't hit the recursion limit. Every created node is registered in `node_lookup` under its CDP node id.
+		"""
+		session_id = self.browser_session.agent_focus.session_id if self.browser_session.agent_focus else None
+		root: EnhancedDOMTreeNode | None = None
+		stack: list[tuple[Node, EnhancedDOMTreeNode | None, str]] = [(raw_root, parent, 'root')]
+		while stack:
+			raw_node, parent_node, relation = stack.pop()
+			enhanced_node = self._create_enhanced_node(raw_node, target_id, ax_tree_lookup, session_id)
+			enhanced_node.parent_node = parent_node
+			node_lookup[raw_node['nodeId']] = enhanced_node
+
+			if relation == 'root':
+				root = enhanced_node
+			elif relation == 'content_document':
+				assert parent_node is not None
+				parent_node.content_document = enhanced_node
+			elif relation == 'shadow_root':
+				assert parent_node is not None and parent_node.shadow_roots is not None
+				parent_node.shadow_roots.append(enhanced_node)
+			else:
+				assert parent_node is not None and parent_node.children_nodes is not None
+				parent_node.children_nodes.append(enhanced_node)
+
+			# pushed in reverse so they are popped in document order
+			if children := raw_node.get('children'):
+				enhanced_node.children_nodes = []
+				stack.extend((child, enhanced_node, 'child') for child in reversed(children))
+			if shadow_roots := raw_node.get('shadowRoots'):
+				enhanced_node.shadow_roots = []
+				stack.extend((shadow_root, enhanced_node, 'shadow_root') for shadow_root in reversed(shadow_roots))
+			if content_document := raw_node.get('contentDocument'):
+				stack.append((content_document, enhanced_node, 'content_document'))
+
+		assert root is not None
+		return root
+
+	def _refresh_layout(
+		self,
+		root: EnhancedDOMTreeNode,
+		snapshot_lookup: SnapshotLookup,
+		initial_html_frames: list[EnhancedDOMTreeNode] | None,
+		initial_total_frame_offset: DOMRect | None,
+	) -> None:
+		"""Attach snapshot data to a tree and compute absolute positions and visibility.
+
+		Positions are computed top-down, visibility bottom-up (`is_element_visible_according_to_all_parents` shifts
+		the bounds of the frames it walks through). Frame lists and offsets are shared between siblings and only
+		copied when a frame adds to them.
+		"""
+		if initial_total_frame_offset is None:
+			initial_total_frame_offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+
+		visit_order: list[tuple[EnhancedDOMTreeNode, list[EnhancedDOMTreeNode]]] = []
+		stack: list[tuple[EnhancedDOMTreeNode, list[EnhancedDOMTreeNode], DOMRect]] = [
+			(root, initial_html_frames or [], initial_total_frame_offset)
+		]
+		while stack:
+			node, html_frames, total_frame_offset = stack.pop()
+
+			snapshot_data = snapshot_lookup.get(node.backend_node_id, None)
+			bounds = snapshot_data.bounds if snapshot_data else None
+			node.snapshot_node = snapshot_data
+			node.element_index = None
+			node.absolute_position = None
+			if bounds:
+				node.absolute_position = DOMRect(
+					x=bounds.x + total_frame_offset.x,
+					y=bounds.y + total_frame_offset.y,
+					width=bounds.width,
+					height=bounds.height,
+				)
+
+			if node.node_type == NodeType.ELEMENT_NODE and node.node_name == 'HTML' and node.frame_id is not None:
+				html_frames = [*html_frames, node]
+				# adjust the total frame offset by scroll
+				if snapshot_data and snapshot_data.scrollRects:
+					total_frame_offset = DOMRect(
+						total_frame_offset.x - snapshot_data.scrollRects.x,
+						total_frame_offset.y - snapshot_data.scrollRects.y,
+						total_frame_offset.width,
+						total_frame_offset.height,
+					)
+
+			# content documents of iframes are offset by the iframe position
+			if bounds and node.node_name.upper() in ('IFRAME', 'FRAME'):
+				html_frames = [*html_frames, node]
+				total_frame_offset = DOMRect(
+					total_frame_offset.x + bounds.x,
+					total_frame_offset.y + bounds.y,
+					total_frame_offset.width,
+					total_frame_offset.height,
+				)
+
+			visit_order.append((node, html_frames))
+
+			# push in reverse so nodes are visited in document order
+			for child in reversed(node.children_nodes or []):
+				stack.append((child, html_frames, total_frame_offset))
+			for shadow_root in reversed(node.shadow_roots or []):
+				stack.append((shadow_root, html_frames, total_frame_offset))
+			if node.content_document:
+				stack.append((node.content_document, html_frames, total_frame_offset))
+
+		# every descendant comes after its ancestors in visit_order, so walking it backwards is a valid post-order
+		for node, html_frames in reversed(visit_order):
+			node.is_visible = self.is_element_visible_according_to_all_parents(node, html_frames)
+
+	async def _refresh_ax_nodes(self, state: IncrementalTreeState, cdp_session) -> None:
+		"""Refetch accessibility info of nodes touched by mutations (or of everything if too many changed)."""
+		dirty = state.dirty_backend_node_ids
+		if not dirty:
+			return
+
+		nodes_by_backend_id: dict[int, EnhancedDOMTreeNode] = {
+			node.backend_node_id: node for node in state.node_lookup.values() if node.backend_node_id in dirty
+		}
+
+		if len(nodes_by_backend_id) > MAX_PARTIAL_AX_REFRESH_NODES:
+			ax_tree = await self._get_ax_tree_for_all_frames(state.target_id)
+			ax_tree_lookup = {
+				ax_node['backendDOMNodeId']: ax_node for ax_node in ax_tree['nodes'] if 'backendDOMNodeId' in ax_node
+			}
+			for node in state.node_lookup.values():
+				ax_node = ax_tree_lookup.get(node.backend_node_id)
+				node.ax_node = self._build_enhanced_ax_node(ax_node) if ax_node else None
+			return
+
+		backend_node_ids = list(nodes_by_backend_id.keys())
+		results = await asyncio.gather(
+			*(
+				cdp_session.cdp_client.send.Accessibility.getPartialAXTree(
+					params={'backendNodeId': backend_node_id, 'fetchRelatives': False}, session_id=cdp_session.session_id
+				)
+				for backend_node_id in backend_node_ids
+			),
+			return_exceptions=True,
+		)
+		for backend_node_id, result in zip(backend_node_ids, results):
+			if isinstance(result, BaseException):
+				continue
+			ax_node = next((n for n in result['nodes'] if n.get('backendDOMNodeId') == backend_node_id), None)
+			nodes_by_backend_id[backend_node_id].ax_node = self._build_enhanced_ax_node(ax_node) if ax_node else None
+
+	async def _update_dom_tree_incrementally(
+		self,
+		state: IncrementalTreeState,
+		initial_html_frames: list[EnhancedDOMTreeNode] | None,
+		initial_total_frame_offset: DOMRect | None,
+	) -> EnhancedDOMTreeNode | None:
+		"""Bring a cached DOM tree up to date from its mutation log. Returns None if a full rebuild is needed."""
+		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=state.target_id, focus=False)
+		if cdp_session.session_id != state.session_id or self._mutation_logs.get(state.session_id) is not state.log:
+			return None
+
+		patcher = DOMTreePatcher(
+			state, lambda raw_node, parent: self._build_enhanced_subtree(raw_node, state.target_id, state.node_lookup, {}, parent)
+		)
+		for _ in range(3):
+			if state.log.needs_full_rebuild or not patcher.apply(state.log.drain()):
+				return None
+			if not patcher.pending_child_requests:
+				break
+
+			# inserted nodes only come with their child count, ask for the rest (answered by DOM.setChildNodes
+			# events, which always arrive before the command response)
+			node_ids = list(patcher.pending_child_requests)
+			patcher.pending_child_requests.clear()
+			try:
+				await asyncio.gather(
+					*(
+						cdp_session.cdp_client.send.DOM.requestChildNodes(
+							params={'nodeId': node_id, 'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
+						)
+						for node_id in node_ids
+					)
+				)
+			except Exception as e:
+				self.logger.debug(f'Failed to request child nodes for incremental DOM update: {e}')
+				return None
+		else:
+			return None
+
+		# layout can't be captured for a subtree only, so the snapshot is always taken for the whole page
+		try:
+			snapshot, device_pixel_ratio, _ = await asyncio.wait_for(
+				asyncio.gather(
+					self._capture_snapshot(cdp_session),
+					self._get_viewport_ratio(state.target_id),
+					self._refresh_ax_nodes(state, cdp_session),
+				),
+				timeout=10.0,
+			)
+		except Exception as e:
+			self.logger.debug(f'Incremental DOM update failed, falling back to full rebuild: {type(e).__name__}: {e}')
+			return None
+
+		self._limit_snapshot_documents(snapshot)
+		self._refresh_layout(
+			state.root, build_snapshot_lookup(snapshot, device_pixel_ratio), initial_html_frames, initial_total_frame_offset
+		)
+		self.logger.debug(
+			f'🔍 Incrementally updated DOM tree of {state.target_id[-4:]} ({len(state.dirty_backend_node_ids)} changed nodes)'
+		)
+		state.dirty_backend_node_ids.clear()
+		return state.root
+
+	def _collect_cross_origin_iframes(self, nodes: Iterable[EnhancedDOMTreeNode], iframe_depth: int) -> list[EnhancedDOMTreeNode]:
+		"""Iframe elements without a content document (= cross-origin) that are worth fetching from their own target."""
+		# TODO: hacky way to disable cross origin iframes for now
+		if not self.cross_origin_iframes:
+			return []
+
+		iframes: list[EnhancedDOMTreeNode] = []
+		for node in nodes:
+			if node.node_name.upper() != 'IFRAME' or node.content_document is not None:
+				continue
+
+			# Check iframe depth to prevent infinite recursion
+			if iframe_depth >= self.max_iframe_depth:
+				self.logger.debug(
+					f'Skipping iframe at depth {iframe_depth} to prevent infinite recursion (max depth: {self.max_iframe_depth})'
+				)
+				continue
+
+			# only do this if the iframe is visible and large enough (>= 200px in both dimensions), otherwise it's not worth it
+			if not node.is_visible:
+				self.logger.debug('Skipping invisible cross-origin iframe')
+				continue
+			if not node.snapshot_node or not node.snapshot_node.bounds:
+				self.logger.debug('Skipping cross-origin iframe: no bounds available')
+				continue
+			width, height = node.snapshot_node.bounds.width, node.snapshot_node.bounds.height
+			if width < 200 or height < 200:
+				self.logger.debug(f'Skipping small cross-origin iframe: width={width}, height={height} (needs >= 200px)')
+				continue
+
+			if len(iframes) >= self.max_iframes:
+				self.logger.debug(f'Skipping cross-origin iframe: already fetching {self.max_iframes} iframes on this page')
+				continue
+
+			self.logger.debug(f'Processing cross-origin iframe: visible=True, width={width}, height={height}')
+			iframes.append(node)
+		return iframes
+
+	async def _attach_cross_origin_iframes(self, iframes: list[EnhancedDOMTreeNode], iframe_depth: int) -> bool:
+		"""
+		Build the DOM trees of cross-origin iframes from their own targets, returns True if any was attached.
+
+		At most `max_concurrent_iframe_fetches` trees are fetched at the same time. Iframes that fail or are not done
+		within `iframe_fetch_timeout` seconds are left without a content document instead of stalling the whole step.
+		"""
+		if not iframes:
+			return False
+		semaphore = asyncio.Semaphore(self.max_concurrent_iframe_fetches)
+
+		all_frames, _ = await self.browser_session.get_all_frames()
+		targets = await self.browser_session.cdp_client.send.Target.getTargets()
+		existing_target_ids = {target['targetId'] for target in targets['targetInfos']}
+
+		async def attach(iframe: EnhancedDOMTreeNode) -> bool:
+			frame_info = all_frames.get(iframe.frame_id) if iframe.frame_id else None
+			iframe_target_id = frame_info.get('frameTargetId') if frame_info else None
+			# if target actually exists in one of the frames, just recursively build the dom tree for it
+			if not iframe_target_id or iframe_target_id not in existing_target_ids or not iframe.absolute_position:
+				return False
+
+			async with semaphore:
+				self.logger.debug(f'Getting content document for iframe {iframe.frame_id} at depth {iframe_depth + 1}')
+				content_document = await self.get_dom_tree(
+					target_id=iframe_target_id,
+					# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
+					# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
+					# initial_html_frames=updated_html_frames,
+					# content of the iframe is offset by the iframe position
+					initial_total_frame_offset=DOMRect(
+						x=iframe.absolute_position.x, y=iframe.absolute_position.y, width=0.0, height=0.0
+					),
+					iframe_depth=iframe_depth + 1,
+				)
+			# only link the content document once the fetch completed, a dropped iframe leaves the tree untouched
+			iframe.content_document = content_document
+			content_document.parent_node = iframe
+			return True
+
+		tasks = {asyncio.create_task(attach(iframe)): iframe for iframe in iframes}
+		done, pending = await asyncio.wait(tasks, timeout=self.iframe_fetch_timeout)
+		for task in pending:
+			task.cancel()
+			self.logger.debug(
+				f'Dropping cross-origin iframe {tasks[task].frame_id}: not fetched within {self.iframe_fetch_timeout}s budget'
+			)
+		if pending:
+			await asyncio.wait(pending)
+
+		attached = False
+		for task in done:
+			if task.exception() is not None:
+				self.logger.debug(f'Failed to get content document for iframe {tasks[task].frame_id}: {task.exception()}')
+			elif task.result():
+				attached = True
+		return attached
+
 	async def get_dom_tree(
 		self,
 		target_id: TargetID,
@@ -459,6 +884,18 @@ class DomService:
 			iframe_depth: Current depth of iframe nesting to prevent infinite recursion
 		"""
 
+		incremental = self.incremental_updates and iframe_depth == 0
+		if incremental:
+			state = self._incremental_states.get(target_id)
+			if state is not None:
+				updated_root = await self._update_dom_tree_incrementally(state, initial_html_frames, initial_total_frame_offset)
+				if updated_root is not None:
+					return updated_root
+				self.invalidate_incremental_state(target_id)
+
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+			mutation_log = self._start_mutation_log(cdp_session)
+
 		trees = await self._get_all_trees(target_id)
 
 		dom_tree = trees.dom_tree
@@ -476,235 +913,29 @@ class DomService:
 		# Parse snapshot data with everything calculated upfront
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
 
-		async def _construct_enhanced_node(
-			node: Node, html_frames: list[EnhancedDOMTreeNode] | None, total_frame_offset: DOMRect | None
-		) -> EnhancedDOMTreeNode:
-			"""
-			Recursively construct enhanced DOM tree nodes.
-
-			Args:
-				node: The DOM node to construct
-				html_frames: List of HTML frame nodes encountered so far
-				accumulated_iframe_offset: Accumulated coordinate translation from parent iframes (includes scroll corrections)
-			"""
-
-			# Initialize lists if not provided
-			if html_frames is None:
-				html_frames = []
-
-			# to get rid of the pointer references
-			if total_frame_offset is None:
-				total_frame_offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
-			else:
-				total_frame_offset = DOMRect(
-					total_frame_offset.x, total_frame_offset.y, total_frame_offset.width, total_frame_offset.height
-				)
+		# Pure CPU pass: build the tree, then positions and visibility
+		enhanced_dom_tree_node = self._build_enhanced_subtree(
+			dom_tree['root'], target_id, enhanced_dom_tree_node_lookup, ax_tree_lookup
+		)
+		self._refresh_layout(enhanced_dom_tree_node, snapshot_lookup, initial_html_frames, initial_total_frame_offset)
 
-			# memoize the mf (I don't know if some nodes are duplicated)
-			if node['nodeId'] in enhanced_dom_tree_node_lookup:
-				return enhanced_dom_tree_node_lookup[node['nodeId']]
+		# Only cross-origin iframes need more CDP calls, they are fetched afterwards in one go
+		cross_origin_iframes = self._collect_cross_origin_iframes(enhanced_dom_tree_node_lookup.values(), iframe_depth)
+		has_remote_frames = await self._attach_cross_origin_iframes(cross_origin_iframes, iframe_depth)
 
-			ax_node = ax_tree_lookup.get(node['backendNodeId'])
-			if ax_node:
-				enhanced_ax_node = self._build_enhanced_ax_node(ax_node)
+		if incremental:
+			if has_remote_frames:
+				# mutations inside cross-origin iframes happen on other targets, always rebuild pages that include them
+				self._mutation_logs.pop(cdp_session.session_id, None)
 			else:
-				enhanced_ax_node = None
-
-			# To make attributes more readable
-			attributes: dict[str, str] | None = None
-			if 'attributes' in node and node['attributes']:
-				attributes = {}
-				for i in range(0, len(node['attributes']), 2):
-					attributes[node['attributes'][i]] = node['attributes'][i + 1]
-
-			shadow_root_type = None
-			if 'shadowRootType' in node and node['shadowRootType']:
-				try:
-					shadow_root_type = node['shadowRootType']
-				except ValueError:
-					pass
-
-			# Get snapshot data and calculate absolute position
-			snapshot_data = snapshot_lookup.get(node['backendNodeId'], None)
-			absolute_position = None
-			if snapshot_data and snapshot_data.bounds:
-				absolute_position = DOMRect(
-					x=snapshot_data.bounds.x + total_frame_offset.x,
-					y=snapshot_data.bounds.y + total_frame_offset.y,
-					width=snapshot_data.bounds.width,
-					height=snapshot_data.bounds.height,
-				)
-
-			dom_tree_node = EnhancedDOMTreeNode(
-				node_id=node['nodeId'],
-				backend_node_id=node['backendNodeId'],
-				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
-				node_value=node['nodeValue'],
-				attributes=attributes or {},
-				is_scrollable=node.get('isScrollable', None),
-				frame_id=node.get('frameId', None),
-				session_id=self.browser_session.agent_focus.session_id if self.browser_session.agent_focus else None,
-				target_id=target_id,
-				content_document=None,
-				shadow_root_type=shadow_root_type,
-				shadow_roots=None,
-				parent_node=None,
-				children_nodes=None,
-				ax_node=enhanced_ax_node,
-				snapshot_node=snapshot_data,
-				is_visible=None,
-				absolute_position=absolute_position,
-				element_index=None,
-			)
-
-			enhanced_dom_tree_node_lookup[node['nodeId']] = dom_tree_node
-
-			if 'parentId' in node and node['parentId']:
-				dom_tree_node.parent_node = enhanced_dom_tree_node_lookup[
-					node['parentId']
-				]  # parents should always be in the lookup
-
-			# Check if this is an HTML frame node and add it to the list
-			updated_html_frames = html_frames.copy()
-			if node['nodeType'] == NodeType.ELEMENT_NODE.value and node['nodeName'] == 'HTML' and node.get('frameId') is not None:
-				updated_html_frames.append(dom_tree_node)
-
-				# and adjust the total frame offset by scroll
-				if snapshot_data and snapshot_data.scrollRects:
-					total_frame_offset.x -= snapshot_data.scrollRects.x
-					total_frame_offset.y -= snapshot_data.scrollRects.y
-					# DEBUG: Log iframe scroll information
-					self.logger.debug(
-						f'🔍 DEBUG: HTML frame scroll - scrollY={snapshot_data.scrollRects.y}, scrollX={snapshot_data.scrollRects.x}, frameId={node.get("frameId")}, nodeId={node["nodeId"]}'
-					)
-
-			# Calculate new iframe offset for content documents, accounting for iframe scroll
-			if (
-				(node['nodeName'].upper() == 'IFRAME' or node['nodeName'].upper() == 'FRAME')
-				and snapshot_data
-				and snapshot_data.bounds
-			):
-				if snapshot_data.bounds:
-					updated_html_frames.append(dom_tree_node)
-
-					total_frame_offset.x += snapshot_data.bounds.x
-					total_frame_offset.y += snapshot_data.bounds.y
-
-			if 'contentDocument' in node and node['contentDocument']:
-				dom_tree_node.content_document = await _construct_enhanced_node(
-					node['contentDocument'], updated_html_frames, total_frame_offset
+				self._incremental_states[target_id] = IncrementalTreeState(
+					target_id=target_id,
+					session_id=cdp_session.session_id,
+					root=enhanced_dom_tree_node,
+					node_lookup=enhanced_dom_tree_node_lookup,
+					log=mutation_log,
+					min_node_id=min(enhanced_dom_tree_node_lookup),
 				)
-				dom_tree_node.content_document.parent_node = dom_tree_node
-				# forcefully set the parent node to the content document node (helps traverse the tree)
-
-			if 'shadowRoots' in node and node['shadowRoots']:
-				dom_tree_node.shadow_roots = []
-				for shadow_root in node['shadowRoots']:
-					shadow_root_node = await _construct_enhanced_node(shadow_root, updated_html_frames, total_frame_offset)
-					# forcefully set the parent node to the shadow root node (helps traverse the tree)
-					shadow_root_node.parent_node = dom_tree_node
-					dom_tree_node.shadow_roots.append(shadow_root_node)
-
-			if 'children' in node and node['children']:
-				dom_tree_node.children_nodes = []
-				for child in node['children']:
-					dom_tree_node.children_nodes.append(
-						await _construct_enhanced_node(child, updated_html_frames, total_frame_offset)
-					)
-
-			# Set visibility using the collected HTML frames
-			dom_tree_node.is_visible = self.is_element_visible_according_to_all_parents(dom_tree_node, updated_html_frames)
-
-			# DEBUG: Log visibility info for form elements in iframes
-			if dom_tree_node.tag_name and dom_tree_node.tag_name.upper() in ['INPUT', 'SELECT', 'TEXTAREA', 'LABEL']:
-				attrs = dom_tree_node.attributes or {}
-				elem_id = attrs.get('id', '')
-				elem_name = attrs.get('name', '')
-				if (
-					'city' in elem_id.lower()
-					or 'city' in elem_name.lower()
-					or 'state' in elem_id.lower()
-					or 'state' in elem_name.lower()
-					or 'zip' in elem_id.lower()
-					or 'zip' in elem_name.lower()
-				):
-					self.logger.debug(
-						f"🔍 DEBUG: Form element {dom_tree_node.tag_name} id='{elem_id}' name='{elem_name}' - visible={dom_tree_node.is_visible}, bounds={dom_tree_node.snapshot_node.bounds if dom_tree_node.snapshot_node else 'NO_SNAPSHOT'}"
-					)
-
-			# handle cross origin iframe (just recursively call the main function with the proper target if it exists in iframes)
-			# only do this if the iframe is visible (otherwise it's not worth it)
-
-			if (
-				# TODO: hacky way to disable cross origin iframes for now
-				self.cross_origin_iframes and node['nodeName'].upper() == 'IFRAME' and node.get('contentDocument', None) is None
-			):  # None meaning there is no content
-				# Check iframe depth to prevent infinite recursion
-				if iframe_depth >= MAX_IFRAME_DEPTH:
-					self.logger.debug(
-						f'Skipping iframe at depth {iframe_depth} to prevent infinite recursion (max depth: {MAX_IFRAME_DEPTH})'
-					)
-				else:
-					# Check if iframe is visible and large enough (>= 200px in both dimensions)
-					should_process_iframe = False
-
-					# First check if the iframe element itself is visible
-					if dom_tree_node.is_visible:
-						# Check iframe dimensions
-						if dom_tree_node.snapshot_node and dom_tree_node.snapshot_node.bounds:
-							bounds = dom_tree_node.snapshot_node.bounds
-							width = bounds.width
-							height = bounds.height
-
-							# Only process if iframe is at least 200px in both dimensions
-							if width >= 200 and height >= 200:
-								should_process_iframe = True
-								self.logger.debug(f'Processing cross-origin iframe: visible=True, width={width}, height={height}')
-							else:
-								self.logger.debug(
-									f'Skipping small cross-origin iframe: width={width}, height={height} (needs >= 200px)'
-								)
-						else:
-							self.logger.debug('Skipping cross-origin iframe: no bounds available')
-					else:
-						self.logger.debug('Skipping invisible cross-origin iframe')
-
-					if should_process_iframe:
-						# Use get_all_frames to find the iframe's target
-						frame_id = node.get('frameId', None)
-						if frame_id:
-							all_frames, _ = await self.browser_session.get_all_frames()
-							frame_info = all_frames.get(frame_id)
-							iframe_document_target = None
-							if frame_info and frame_info.get('frameTargetId'):
-								# Get the target info for this iframe
-								targets = await self.browser_session.cdp_client.send.Target.getTargets()
-								iframe_document_target = next(
-									(t for t in targets['targetInfos'] if t['targetId'] == frame_info['frameTargetId']), None
-								)
-						else:
-							iframe_document_target = None
-						# if target actually exists in one of the frames, just recursively build the dom tree for it
-						if iframe_document_target:
-							self.logger.debug(
-								f'Getting content document for iframe {node.get("frameId", None)} at depth {iframe_depth + 1}'
-							)
-							content_document = await self.get_dom_tree(
-								target_id=iframe_document_target.get('targetId'),
-								# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
-								# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
-								# initial_html_frames=updated_html_frames,
-								initial_total_frame_offset=total_frame_offset,
-								iframe_depth=iframe_depth + 1,
-							)
-
-							dom_tree_node.content_document = content_document
-							dom_tree_node.content_document.parent_node = dom_tree_node
-
-			return dom_tree_node
-
-		enhanced_dom_tree_node = await _construct_enhanced_node(dom_tree['root'], initial_html_frames, initial_total_frame_offset)
 
 		return enhanced_dom_tree_node
 
@@ -1,7 +1,7 @@
 import hashlib
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXPropertyName
@@ -708,6 +708,9 @@ class EnhancedDOMTreeNode:
 
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
 
+DOMSerializationPriority = Literal['document', 'viewport', 'interactive']
+"""Which lines of the serialized DOM to keep when it exceeds its length budget, 'document' keeps the plain prefix."""
+
 
 @dataclass
 class SerializedDOMState:
@@ -731,6 +734,23 @@ class SerializedDOMState:
 
 		return DOMTreeSerializer.serialize_tree(self._root, include_attributes)
 
+	@observe_debug(ignore_input=True, ignore_output=True, name='llm_representation_with_budget')
+	def llm_representation_with_budget(
+		self,
+		max_length: int,
+		include_attributes: list[str] | None = None,
+		priority: DOMSerializationPriority = 'document',
+	) -> tuple[str, bool]:
+		"""Like `llm_representation`, but stops serializing once `max_length` characters are produced. Returns (text, truncated)."""
+		from browser_use.dom.serializer.serializer import DOMTreeSerializer
+
+		if not self._root:
+			return 'Empty DOM tree (you might have to wait for the page to load)', False
+
+		include_attributes = include_attributes or DEFAULT_INCLUDE_ATTRIBUTES
+
+		return DOMTreeSerializer.serialize_tree_with_budget(self._root, include_attributes, max_length, priority)
+
 
 @dataclass
 class DOMInteractedElement:
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -50,6 +51,7 @@ class ChatAnthropic(BaseChatModel):
 	max_retries: int = 10
 	default_headers: Mapping[str, str] | None = None
 	default_query: Mapping[str, object] | None = None
+	http_client: httpx.AsyncClient | None = None
 
 	# Static
 	@property
@@ -67,6 +69,7 @@ class ChatAnthropic(BaseChatModel):
 			'max_retries': self.max_retries,
 			'default_headers': self.default_headers,
 			'default_query': self.default_query,
+			'http_client': self.http_client,
 		}
 
 		# Create client_params dict with non-None values and non-NotGiven values
@@ -104,6 +107,10 @@ class ChatAnthropic(BaseChatModel):
 			AsyncAnthropic: An instance of the AsyncAnthropic client.
 		"""
 		client_params = self._get_client_params()
+		if 'http_client' not in client_params:
+			client_params['http_client'] = http_clients.get_http_client(
+				self.provider, self.base_url, (self.api_key, self.auth_token)
+			)
 		return AsyncAnthropic(**client_params)
 
 	@property
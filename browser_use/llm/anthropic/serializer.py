@@ -61,7 +61,9 @@ class AnthropicMessageSerializer:
 	def _serialize_content_part_text(part: ContentPartTextParam, use_cache: bool) -> TextBlockParam:
 		"""Convert a text content part to Anthropic's TextBlockParam."""
 		return TextBlockParam(
-			text=part.text, type='text', cache_control=AnthropicMessageSerializer._serialize_cache_control(use_cache)
+			text=part.text,
+			type='text',
+			cache_control=AnthropicMessageSerializer._serialize_cache_control(use_cache or part.cache),
 		)
 
 	@staticmethod
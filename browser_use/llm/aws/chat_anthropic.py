@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
@@ -125,6 +126,11 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 			AsyncAnthropicBedrock: An instance of the AsyncAnthropicBedrock client.
 		"""
 		client_params = self._get_client_params()
+		client_params['http_client'] = http_clients.get_http_client(
+			self.provider,
+			client_params.get('aws_region'),
+			(client_params.get('aws_access_key'), client_params.get('aws_secret_key'), client_params.get('aws_session_token')),
+		)
 		return AsyncAnthropicBedrock(**client_params)
 
 	@property
@@ -2,10 +2,10 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.shared import ChatModel
 
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.openai.like import ChatOpenAILike
 
 
@@ -78,14 +78,9 @@ class ChatAzureOpenAI(ChatOpenAILike):
 
 		_client_params: dict[str, Any] = self._get_client_params()
 
-		if self.http_client:
-			_client_params['http_client'] = self.http_client
-		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6)
+		if 'http_client' not in _client_params:
+			_client_params['http_client'] = http_clients.get_http_client(
+				self.provider, self.azure_endpoint or self.base_url, (self.api_key, self.azure_ad_token)
 			)
 
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+		return AsyncAzureOpenAIClient(**_client_params)
@@ -4,6 +4,7 @@ We have switched all of our code from langchain to openai.types.chat.chat_comple
 For easier transition we have
 """
 
+from collections.abc import AsyncIterator
 from typing import Any, Protocol, TypeVar, overload, runtime_checkable
 
 from pydantic import BaseModel
@@ -41,6 +42,25 @@ class BaseChatModel(Protocol):
 		self, messages: list[BaseMessage], output_format: type[T] | None = None
 	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]: ...
 
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel] | None = None
+	) -> AsyncIterator[ChatInvokeCompletion[str]]:
+		"""
+		Stream the completion as text deltas, with the usage on the last chunk. With an output_format the deltas are
+		the raw JSON of the structured output.
+
+		Models without native streaming yield the whole completion from `ainvoke` as a single chunk (its usage is
+		already reported by `ainvoke`).
+		"""
+		response = await self.ainvoke(messages, output_format)
+		completion = response.completion
+		yield ChatInvokeCompletion(
+			completion=completion.model_dump_json() if isinstance(completion, BaseModel) else completion,
+			thinking=response.thinking,
+			redacted_thinking=response.redacted_thinking,
+			usage=None,
+		)
+
 	@classmethod
 	def __get_pydantic_core_schema__(
 		cls,
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -130,7 +131,14 @@ class ChatGoogle(BaseChatModel):
 			genai.Client: An instance of the Google genai client.
 		"""
 		client_params = self._get_client_params()
-		return genai.Client(**client_params)
+		# the whole client is shared, it also caches the credentials of Vertex AI
+		return http_clients.get_client(
+			self.provider,
+			self.location,
+			client_params,
+			lambda: genai.Client(**client_params),
+			lambda client: client.aio.aclose(),
+		)
 
 	@property
 	def name(self) -> str:
@@ -236,9 +244,11 @@ class ChatGoogle(BaseChatModel):
 					# Use native JSON mode
 					config['response_mime_type'] = 'application/json'
 					# Convert Pydantic model to Gemini-compatible schema
-					optimized_schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-
-					gemini_schema = self._fix_gemini_schema(optimized_schema)
+					gemini_schema = SchemaOptimizer.get_cached_schema(
+						output_format,
+						'gemini',
+						lambda model: self._fix_gemini_schema(SchemaOptimizer.create_optimized_json_schema(model)),
+					)
 					config['response_schema'] = gemini_schema
 
 					response = await self.get_client().aio.models.generate_content(
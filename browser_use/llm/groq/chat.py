@@ -23,6 +23,7 @@ from browser_use.llm.base import BaseChatModel, ChatInvokeCompletion
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.groq.parser import try_parse_groq_failed_generation
 from browser_use.llm.groq.serializer import GroqMessageSerializer
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeUsage
@@ -74,7 +75,13 @@ class ChatGroq(BaseChatModel):
 	max_retries: int = 10  # Increase default retries for automation reliability
 
 	def get_client(self) -> AsyncGroq:
-		return AsyncGroq(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, max_retries=self.max_retries)
+		return AsyncGroq(
+			api_key=self.api_key,
+			base_url=self.base_url,
+			timeout=self.timeout,
+			max_retries=self.max_retries,
+			http_client=http_clients.get_http_client(self.provider, self.base_url, self.api_key),
+		)
 
 	@property
 	def provider(self) -> str:
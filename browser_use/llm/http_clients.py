@@ -0,0 +1,142 @@
+"""
+Process-wide registry of long-lived HTTP clients shared by the chat models.
+
+Building a provider SDK client per call also builds a new connection pool, so every LLM call paid for a new TCP + TLS
+handshake. The chat models get their clients from here instead: one client per (provider, base_url, credentials),
+reused by every model instance and agent of the process, so the keep-alive connections are reused across calls.
+
+Pool limits are read from the environment when a client is created:
+
+- `BROWSER_USE_LLM_MAX_CONNECTIONS` (default: `1000`)
+- `BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS` (default: `100`)
+- `BROWSER_USE_LLM_KEEPALIVE_EXPIRY` (default: `60` seconds idle before a connection is closed)
+- `BROWSER_USE_LLM_HTTP2` (default: `true`, only used if the `h2` package is installed)
+
+Connections are bound to the event loop that opened them, so clients are shared per event loop. They are closed when
+the last agent running in the loop shuts down, or explicitly with `await close_http_clients()`.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple, TypeVar
+
+import httpx
+
+from browser_use.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class _SharedClient(NamedTuple):
+	client: Any
+	close: Callable[[], Awaitable[Any]]
+
+
+def _credentials_fingerprint(credentials: Any) -> str:
+	"""Hash the credentials, so the registry never holds on to API keys."""
+	return hashlib.sha256(repr(credentials).encode()).hexdigest()
+
+
+def http2_available() -> bool:
+	return bool(CONFIG.BROWSER_USE_LLM_HTTP2) and importlib.util.find_spec('h2') is not None
+
+
+def create_http_client() -> httpx.AsyncClient:
+	"""A new httpx client with the configured pool limits, for the provider SDKs that accept an `http_client`."""
+	return httpx.AsyncClient(
+		limits=httpx.Limits(
+			max_connections=CONFIG.BROWSER_USE_LLM_MAX_CONNECTIONS,
+			max_keepalive_connections=CONFIG.BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS,
+			keepalive_expiry=CONFIG.BROWSER_USE_LLM_KEEPALIVE_EXPIRY,
+		),
+		http2=http2_available(),
+		follow_redirects=True,
+	)
+
+
+class HTTPClientRegistry:
+	"""Shared clients per event loop, keyed by (provider, base_url, credentials fingerprint)."""
+
+	def __init__(self):
+		self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str, str], _SharedClient]] = (
+			weakref.WeakKeyDictionary()
+		)
+		self._users: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int] = weakref.WeakKeyDictionary()
+
+	def get_client(
+		self,
+		provider: str,
+		base_url: Any,
+		credentials: Any,
+		factory: Callable[[], T],
+		close: Callable[[T], Awaitable[Any]],
+	) -> T:
+		"""
+		Return the shared client for this provider, base_url and credentials, creating it with `factory` on first use.
+
+		Outside of a running event loop there is nothing to share the connections with, a new client is returned.
+		"""
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			return factory()
+
+		clients = self._clients.setdefault(loop, {})
+		key = (provider, str(base_url or ''), _credentials_fingerprint(credentials))
+		shared = clients.get(key)
+		if shared is None:
+			client = factory()
+			shared = _SharedClient(client, lambda: close(client))
+			clients[key] = shared
+			logger.debug(f'Created shared {provider} client for {base_url or "default base_url"}')
+		return shared.client
+
+	def get_http_client(self, provider: str, base_url: Any, credentials: Any) -> httpx.AsyncClient:
+		"""Return the shared httpx client to pass as `http_client` to a provider SDK."""
+		return self.get_client(provider, base_url, credentials, create_http_client, lambda client: client.aclose())
+
+	def __len__(self) -> int:
+		try:
+			return len(self._clients.get(asyncio.get_running_loop(), {}))
+		except RuntimeError:
+			return 0
+
+	# --- lifecycle -----------------------------------------------------------
+
+	def retain(self) -> None:
+		"""Mark the clients of the running event loop as in use, until the matching `release()`."""
+		loop = asyncio.get_running_loop()
+		self._users[loop] = self._users.get(loop, 0) + 1
+
+	async def release(self) -> None:
+		"""Drop one user of the running event loop's clients, and close them once nobody uses them anymore."""
+		loop = asyncio.get_running_loop()
+		users = self._users.get(loop, 0) - 1
+		if users > 0:
+			self._users[loop] = users
+			return
+		self._users.pop(loop, None)
+		await self.aclose()
+
+	async def aclose(self) -> None:
+		"""Close all clients of the running event loop."""
+		clients = self._clients.pop(asyncio.get_running_loop(), {})
+		for (provider, base_url, _), shared in clients.items():
+			try:
+				await shared.close()
+			except Exception as e:
+				logger.debug(f'Failed to close shared {provider} client for {base_url}: {type(e).__name__}: {e}')
+
+
+http_clients = HTTPClientRegistry()
+
+
+async def close_http_clients() -> None:
+	"""Close the shared LLM clients of the running event loop, for scripts that call the chat models directly."""
+	await http_clients.aclose()
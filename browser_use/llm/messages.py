@@ -30,6 +30,11 @@ class ContentPartTextParam(BaseModel):
 	text: str
 	type: Literal['text'] = 'text'
 
+	cache: bool = False
+	"""Whether to place a cache breakpoint after this part. This is only applicable when using Anthropic models,
+	other providers cache stable prompt prefixes implicitly.
+	"""
+
 	def __str__(self) -> str:
 		return f'Text: {_truncate(self.text)}'
 
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.ollama.serializer import OllamaMessageSerializer
 from browser_use.llm.views import ChatInvokeCompletion
@@ -51,7 +52,14 @@ class ChatOllama(BaseChatModel):
 		"""
 		Returns an OllamaAsyncClient client.
 		"""
-		return OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {})
+		# the SDK builds its httpx client itself, so the whole client is shared
+		return http_clients.get_client(
+			self.provider,
+			self.host,
+			(self.timeout, self.client_params),
+			lambda: OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {}),
+			lambda client: client.close(),
+		)
 
 	@property
 	def name(self) -> str:
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Mapping
+from collections.abc import AsyncIterator, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal, TypeVar, overload
 
@@ -6,6 +6,7 @@ import httpx
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
 from openai.types.chat import ChatCompletionContentPartTextParam
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
 from openai.types.shared_params.response_format_json_schema import JSONSchema, ResponseFormatJSONSchema
@@ -13,6 +14,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
@@ -107,13 +109,17 @@ class ChatOpenAI(BaseChatModel):
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
 		client_params = self._get_client_params()
+		if 'http_client' not in client_params:
+			client_params['http_client'] = http_clients.get_http_client(
+				self.provider, self.base_url, (self.api_key, self.organization, self.project)
+			)
 		return AsyncOpenAI(**client_params)
 
 	@property
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			completion_tokens = response.usage.completion_tokens
 			completion_token_details = response.usage.completion_tokens_details
@@ -138,6 +144,87 @@ class ChatOpenAI(BaseChatModel):
 
 		return usage
 
+	def _get_model_params(self) -> dict[str, Any]:
+		"""Prepare the request parameters of the model."""
+		model_params: dict[str, Any] = {}
+
+		if self.temperature is not None:
+			model_params['temperature'] = self.temperature
+
+		if self.frequency_penalty is not None:
+			model_params['frequency_penalty'] = self.frequency_penalty
+
+		if self.max_completion_tokens is not None:
+			model_params['max_completion_tokens'] = self.max_completion_tokens
+
+		if self.top_p is not None:
+			model_params['top_p'] = self.top_p
+
+		if self.seed is not None:
+			model_params['seed'] = self.seed
+
+		if self.service_tier is not None:
+			model_params['service_tier'] = self.service_tier
+
+		if self.reasoning_models and any(str(m).lower() in str(self.model).lower() for m in self.reasoning_models):
+			model_params['reasoning_effort'] = self.reasoning_effort
+			del model_params['temperature']
+			del model_params['frequency_penalty']
+
+		return model_params
+
+	def _get_response_format(self, output_format: type[BaseModel], openai_messages: list[Any]) -> ResponseFormatJSONSchema:
+		"""JSON schema response format for structured output, also added to the system prompt if requested."""
+		response_format: JSONSchema = {
+			'name': 'agent_output',
+			'strict': True,
+			'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
+		}
+
+		# Add JSON schema to system prompt if requested
+		if self.add_schema_to_system_prompt and openai_messages and openai_messages[0]['role'] == 'system':
+			schema_text = f'\n<json_schema>\n{response_format}\n</json_schema>'
+			if isinstance(openai_messages[0]['content'], str):
+				openai_messages[0]['content'] += schema_text
+			elif isinstance(openai_messages[0]['content'], Iterable):
+				openai_messages[0]['content'] = list(openai_messages[0]['content']) + [
+					ChatCompletionContentPartTextParam(text=schema_text, type='text')
+				]
+
+		return ResponseFormatJSONSchema(json_schema=response_format, type='json_schema')
+
+	def _get_provider_error(self, e: Exception) -> ModelProviderError:
+		"""Convert an error of the OpenAI client to a ModelProviderError."""
+		if isinstance(e, RateLimitError):
+			error_message = e.response.json().get('error', {})
+			error_message = (
+				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
+			)
+			return ModelProviderError(
+				message=error_message,
+				status_code=e.response.status_code,
+				model=self.name,
+			)
+
+		if isinstance(e, APIConnectionError):
+			return ModelProviderError(message=str(e), model=self.name)
+
+		if isinstance(e, APIStatusError):
+			try:
+				error_message = e.response.json().get('error', {})
+			except Exception:
+				error_message = e.response.text
+			error_message = (
+				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
+			)
+			return ModelProviderError(
+				message=error_message,
+				status_code=e.response.status_code,
+				model=self.name,
+			)
+
+		return ModelProviderError(message=str(e), model=self.name)
+
 	@overload
 	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
 
@@ -161,30 +248,7 @@ class ChatOpenAI(BaseChatModel):
 		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
 
 		try:
-			model_params: dict[str, Any] = {}
-
-			if self.temperature is not None:
-				model_params['temperature'] = self.temperature
-
-			if self.frequency_penalty is not None:
-				model_params['frequency_penalty'] = self.frequency_penalty
-
-			if self.max_completion_tokens is not None:
-				model_params['max_completion_tokens'] = self.max_completion_tokens
-
-			if self.top_p is not None:
-				model_params['top_p'] = self.top_p
-
-			if self.seed is not None:
-				model_params['seed'] = self.seed
-
-			if self.service_tier is not None:
-				model_params['service_tier'] = self.service_tier
-
-			if self.reasoning_models and any(str(m).lower() in str(self.model).lower() for m in self.reasoning_models):
-				model_params['reasoning_effort'] = self.reasoning_effort
-				del model_params['temperature']
-				del model_params['frequency_penalty']
+			model_params = self._get_model_params()
 
 			if output_format is None:
 				# Return string response
@@ -201,27 +265,11 @@ class ChatOpenAI(BaseChatModel):
 				)
 
 			else:
-				response_format: JSONSchema = {
-					'name': 'agent_output',
-					'strict': True,
-					'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
-				}
-
-				# Add JSON schema to system prompt if requested
-				if self.add_schema_to_system_prompt and openai_messages and openai_messages[0]['role'] == 'system':
-					schema_text = f'\n<json_schema>\n{response_format}\n</json_schema>'
-					if isinstance(openai_messages[0]['content'], str):
-						openai_messages[0]['content'] += schema_text
-					elif isinstance(openai_messages[0]['content'], Iterable):
-						openai_messages[0]['content'] = list(openai_messages[0]['content']) + [
-							ChatCompletionContentPartTextParam(text=schema_text, type='text')
-						]
-
 				# Return structured response
 				response = await self.get_client().chat.completions.create(
 					model=self.model,
 					messages=openai_messages,
-					response_format=ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
+					response_format=self._get_response_format(output_format, openai_messages),
 					**model_params,
 				)
 
@@ -241,33 +289,38 @@ class ChatOpenAI(BaseChatModel):
 					usage=usage,
 				)
 
-		except RateLimitError as e:
-			error_message = e.response.json().get('error', {})
-			error_message = (
-				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
-			)
-			raise ModelProviderError(
-				message=error_message,
-				status_code=e.response.status_code,
-				model=self.name,
-			) from e
+		except Exception as e:
+			raise self._get_provider_error(e) from e
 
-		except APIConnectionError as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel] | None = None
+	) -> AsyncIterator[ChatInvokeCompletion[str]]:
+		"""
+		Stream the completion as text deltas, the last chunk carries the usage.
 
-		except APIStatusError as e:
-			try:
-				error_message = e.response.json().get('error', {})
-			except Exception:
-				error_message = e.response.text
-			error_message = (
-				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
+		With an output_format the deltas are the raw JSON of the structured output, to be validated once complete.
+		"""
+
+		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
+
+		try:
+			model_params = self._get_model_params()
+			if output_format is not None:
+				model_params['response_format'] = self._get_response_format(output_format, openai_messages)
+
+			stream = await self.get_client().chat.completions.create(
+				model=self.model,
+				messages=openai_messages,
+				stream=True,
+				stream_options={'include_usage': True},
+				**model_params,
 			)
-			raise ModelProviderError(
-				message=error_message,
-				status_code=e.response.status_code,
-				model=self.name,
-			) from e
+
+			async for chunk in stream:
+				if chunk.choices and chunk.choices[0].delta.content:
+					yield ChatInvokeCompletion(completion=chunk.choices[0].delta.content, usage=None)
+				if chunk.usage is not None:
+					yield ChatInvokeCompletion(completion='', usage=self._get_usage(chunk))
 
 		except Exception as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+			raise self._get_provider_error(e) from e
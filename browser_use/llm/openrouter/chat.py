@@ -13,6 +13,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_clients import http_clients
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openrouter.serializer import OpenRouterMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
@@ -85,10 +86,10 @@ class ChatOpenRouter(BaseChatModel):
 		Returns:
 		    AsyncOpenAI: An instance of the AsyncOpenAI client with OpenRouter base URL.
 		"""
-		if not hasattr(self, '_client'):
-			client_params = self._get_client_params()
-			self._client = AsyncOpenAI(**client_params)
-		return self._client
+		client_params = self._get_client_params()
+		if 'http_client' not in client_params:
+			client_params['http_client'] = http_clients.get_http_client(self.provider, self.base_url, self.api_key)
+		return AsyncOpenAI(**client_params)
 
 	@property
 	def name(self) -> str:
@@ -2,10 +2,16 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import weakref
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
 
+# Schemas per output model class and provider dialect. Model classes are weak keys, so the schemas of an action model
+# that was replaced (e.g. after registering a new action) go away together with the model.
+_schema_cache: weakref.WeakKeyDictionary[type[BaseModel], dict[str, dict[str, Any]]] = weakref.WeakKeyDictionary()
+
 
 class SchemaOptimizer:
 	@staticmethod
@@ -14,12 +20,45 @@ class SchemaOptimizer:
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
 
+		The schema is built once per model class and served from the cache afterwards, see `get_cached_schema`.
+
 		Args:
 			model: The Pydantic model to optimize
 
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		return SchemaOptimizer.get_cached_schema(model, 'optimized', SchemaOptimizer._build_optimized_json_schema)
+
+	@staticmethod
+	def get_cached_schema(
+		model: type[BaseModel], dialect: str, build: Callable[[type[BaseModel]], dict[str, Any]]
+	) -> dict[str, Any]:
+		"""
+		Return the schema of `model` for a provider dialect, building it with `build` on first use.
+
+		The returned dict is a copy of the cached top level, so callers may add or remove top-level keys (like `title`),
+		but nested values are shared between calls and must not be mutated.
+		"""
+		schemas = _schema_cache.get(model)
+		if schemas is None:
+			schemas = _schema_cache[model] = {}
+		schema = schemas.get(dialect)
+		if schema is None:
+			schema = schemas[dialect] = build(model)
+		return dict(schema)
+
+	@staticmethod
+	def clear_cache(model: type[BaseModel] | None = None) -> None:
+		"""Drop the cached schemas of `model`, or of all models."""
+		if model is None:
+			_schema_cache.clear()
+		else:
+			_schema_cache.pop(model, None)
+
+	@staticmethod
+	def _build_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+		"""Build the optimized schema of `model`, uncached."""
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
@@ -0,0 +1,92 @@
+"""
+Incremental parsing of streamed structured output.
+"""
+
+import json
+
+
+class JSONArrayStreamParser:
+	"""
+	Finds the complete elements of one top-level array (e.g. `action`) in a JSON object streamed as text deltas.
+
+	Every `feed()` returns the raw JSON text of the array elements completed by that delta, so they can be validated and
+	used before the rest of the object has been generated. Text around the object (like markdown fences) is ignored.
+	"""
+
+	def __init__(self, key: str):
+		self.key = key
+		self.text = ''
+		self._pos = 0
+		self._depth = 0
+		self._in_string = False
+		self._escape = False
+		self._string_start = -1
+		self._last_string: str | None = None
+		self._current_key: str | None = None
+		self._array_depth: int | None = None  # depth inside the array, while we are in it
+		self._element_start = -1
+		self.done = False
+		"""Whether the array was closed, no more elements will follow."""
+
+	def feed(self, delta: str) -> list[str]:
+		"""Add the next chunk of text, return the array elements it completed."""
+		self.text += delta
+		elements: list[str] = []
+		text = self.text
+
+		for pos in range(self._pos, len(text)):
+			char = text[pos]
+
+			if self._in_string:
+				if self._escape:
+					self._escape = False
+				elif char == '\\':
+					self._escape = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1:
+						self._last_string = json.loads(text[self._string_start : pos + 1])
+				continue
+
+			if self._array_depth is not None and self._depth == self._array_depth and self._element_start < 0:
+				# between elements of the array: the next non-separator starts an element
+				if char not in ' \t\r\n,]':
+					self._element_start = pos
+
+			if char == '"':
+				self._in_string = True
+				self._string_start = pos
+			elif char in '{[':
+				self._depth += 1
+				if char == '[' and self._depth == 2 and self._current_key == self.key and self._array_depth is None:
+					self._array_depth = 2
+					self._element_start = -1
+			elif char in '}]':
+				if self._array_depth is not None and self._depth == self._array_depth and char == ']':
+					# end of the array, flush a trailing scalar element
+					self._flush_element(text, pos, elements)
+					self._array_depth = None
+					self.done = True
+				self._depth -= 1
+				if self._array_depth is not None and self._depth == self._array_depth and self._element_start >= 0:
+					# an object / array element was closed
+					elements.append(text[self._element_start : pos + 1])
+					self._element_start = -1
+			elif char == ':' and self._depth == 1:
+				self._current_key = self._last_string
+			elif char == ',':
+				if self._depth == 1:
+					self._current_key = None
+				elif self._array_depth is not None and self._depth == self._array_depth:
+					self._flush_element(text, pos, elements)
+
+		self._pos = len(text)
+		return elements
+
+	def _flush_element(self, text: str, end: int, elements: list[str]) -> None:
+		"""Finish a scalar element that ends at `end` (a `,` or `]`)."""
+		if self._element_start >= 0:
+			element = text[self._element_start : end].strip()
+			if element:
+				elements.append(element)
+			self._element_start = -1
@@ -2,14 +2,21 @@
 Screenshot storage service for browser-use agents.
 """
 
-import base64
+import hashlib
+import os
 from pathlib import Path
 
 import anyio
 
+from browser_use.browser.views import Screenshot
+
 
 class ScreenshotService:
-	"""Simple screenshot storage service that saves screenshots to disk"""
+	"""Content-addressed screenshot storage: each distinct image is written to disk once, named after its sha256.
+
+	Identical screenshots (e.g. of a page that did not change between steps) share one file, and history items only
+	keep its path, so long runs don't hold screenshots in memory.
+	"""
 
 	def __init__(self, agent_directory: str | Path):
 		"""Initialize with agent directory path"""
@@ -19,30 +26,44 @@ class ScreenshotService:
 		self.screenshots_dir = self.agent_directory / 'screenshots'
 		self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
-	async def store_screenshot(self, screenshot_b64: str, step_number: int) -> str:
-		"""Store screenshot to disk and return the full path as string"""
-		screenshot_filename = f'step_{step_number}.png'
-		screenshot_path = self.screenshots_dir / screenshot_filename
+		# digests known to be on disk, spares the existence check for repeated frames
+		self._stored: set[str] = set()
+
+	async def store_screenshot(self, screenshot: Screenshot | str, step_number: int) -> str:
+		"""Store screenshot (or a base64 encoded one) unless an identical one is stored already, return its path"""
+		if isinstance(screenshot, str):
+			screenshot = Screenshot.from_base64(screenshot)
 
-		# Decode base64 and save to disk
-		screenshot_data = base64.b64decode(screenshot_b64)
+		digest = hashlib.sha256(screenshot.data).hexdigest()
+		# screenshots are png unless BrowserProfile.screenshot_format says otherwise
+		extension = screenshot.media_type.split('/')[1]
+		screenshot_path = self.screenshots_dir / f'{digest}.{extension}'
 
-		async with await anyio.open_file(screenshot_path, 'wb') as f:
-			await f.write(screenshot_data)
+		if digest not in self._stored:
+			if not await anyio.Path(screenshot_path).exists():
+				# write under a temporary name first, so a crash never leaves a truncated file behind the digest
+				tmp_path = screenshot_path.with_name(f'.{screenshot_path.name}.{step_number}.tmp')
+				async with await anyio.open_file(tmp_path, 'wb') as f:
+					await f.write(screenshot.data)
+				await anyio.to_thread.run_sync(os.replace, tmp_path, screenshot_path)
+			self._stored.add(digest)
 
 		return str(screenshot_path)
 
-	async def get_screenshot(self, screenshot_path: str) -> str | None:
-		"""Load screenshot from disk path and return as base64"""
+	async def load_screenshot(self, screenshot_path: str) -> Screenshot | None:
+		"""Memory-map a stored screenshot, None if it doesn't exist"""
 		if not screenshot_path:
 			return None
 
-		path = Path(screenshot_path)
-		if not path.exists():
+		try:
+			return await anyio.to_thread.run_sync(Screenshot.from_file, screenshot_path)
+		except (OSError, ValueError):
 			return None
 
-		# Load from disk and encode to base64
-		async with await anyio.open_file(path, 'rb') as f:
-			screenshot_data = await f.read()
-
-		return base64.b64encode(screenshot_data).decode('utf-8')
+	async def get_screenshot(self, screenshot_path: str) -> str | None:
+		"""Load screenshot from disk path and return as base64"""
+		screenshot = await self.load_screenshot(screenshot_path)
+		if not screenshot:
+			return None
+		with screenshot:
+			return screenshot.b64
@@ -343,6 +343,23 @@ class TokenCost:
 		# Using setattr to avoid type checking issues with overloaded methods
 		setattr(llm, 'ainvoke', tracked_ainvoke)
 
+		# Streamed completions report their usage on the last chunk
+		original_astream = getattr(llm, 'astream', None)
+		if original_astream is not None:
+
+			async def tracked_astream(messages, output_format=None):
+				async for chunk in original_astream(messages, output_format):
+					if chunk.usage:
+						usage = token_cost_service.add_usage(llm.model, chunk.usage)
+
+						logger.debug(f'Token cost service: {usage}')
+
+						asyncio.create_task(token_cost_service._log_usage(llm.model, usage))
+
+					yield chunk
+
+			setattr(llm, 'astream', tracked_astream)
+
 		return llm
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
@@ -399,6 +416,7 @@ class TokenCost:
 
 			stats = model_stats[entry.model]
 			stats.prompt_tokens += entry.usage.prompt_tokens
+			stats.prompt_cached_tokens += entry.usage.prompt_cached_tokens or 0
 			stats.completion_tokens += entry.usage.completion_tokens
 			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
 			stats.invocations += 1
@@ -416,12 +434,15 @@ class TokenCost:
 		for stats in model_stats.values():
 			if stats.invocations > 0:
 				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
+			if stats.prompt_tokens > 0:
+				stats.prompt_cache_hit_rate = stats.prompt_cached_tokens / stats.prompt_tokens
 
 		return UsageSummary(
 			total_prompt_tokens=total_prompt,
 			total_prompt_cost=total_prompt_cost,
 			total_prompt_cached_tokens=total_prompt_cached,
 			total_prompt_cached_cost=total_prompt_cached_cost,
+			prompt_cache_hit_rate=total_prompt_cached / total_prompt if total_prompt > 0 else 0.0,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
 			total_tokens=total_tokens,
@@ -478,6 +499,7 @@ class TokenCost:
 			cost_logger.debug(
 				f'💲 {C_BOLD}Total Usage Summary{C_RESET}: {C_BLUE}{total_tokens_fmt} tokens{C_RESET}{total_cost_part} | '
 				f'⬅️ {C_YELLOW}{prompt_tokens_fmt}{prompt_cost_part}{C_RESET} | ➡️ {C_GREEN}{completion_tokens_fmt}{completion_cost_part}{C_RESET}'
+				+ (f' | 💾 {summary.prompt_cache_hit_rate:.0%} cached' if summary.total_prompt_cached_tokens else '')
 			)
 
 		# Log per-model breakdown
@@ -520,10 +542,12 @@ class TokenCost:
 				prompt_part = f'{C_YELLOW}{model_prompt_fmt}{C_RESET}'
 				completion_part = f'{C_GREEN}{model_completion_fmt}{C_RESET}'
 
+			cache_part = f' | 💾 {stats.prompt_cache_hit_rate:.0%} cached' if stats.prompt_cached_tokens else ''
+
 			cost_logger.debug(
 				f'  🤖 {C_CYAN}{model}{C_RESET}: {C_BLUE}{model_total_fmt} tokens{C_RESET}{cost_part} | '
 				f'⬅️ {prompt_part} | ➡️ {completion_part} | '
-				f'📞 {stats.invocations} calls | 📈 {avg_tokens_fmt}/call'
+				f'📞 {stats.invocations} calls | 📈 {avg_tokens_fmt}/call{cache_part}'
 			)
 
 	async def get_cost_by_model(self) -> dict[str, ModelUsageStats]:
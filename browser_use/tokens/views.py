@@ -73,11 +73,14 @@ class ModelUsageStats(BaseModel):
 
 	model: str
 	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
 	completion_tokens: int = 0
 	total_tokens: int = 0
 	cost: float = 0.0
 	invocations: int = 0
 	average_tokens_per_invocation: float = 0.0
+	prompt_cache_hit_rate: float = 0.0
+	"""Share of the prompt tokens that were read from the provider's prompt cache."""
 
 
 class ModelUsageTokens(BaseModel):
@@ -98,6 +101,8 @@ class UsageSummary(BaseModel):
 
 	total_prompt_cached_tokens: int
 	total_prompt_cached_cost: float
+	prompt_cache_hit_rate: float = 0.0
+	"""Share of the prompt tokens that were read from the provider's prompt cache."""
 
 	total_completion_tokens: int
 	total_completion_cost: float
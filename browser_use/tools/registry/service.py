@@ -36,6 +36,9 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# Action models by the actions they were built from, so unchanged action sets keep the same model class
+		# (and with it the cached JSON schema of the LLM output model)
+		self._action_models: dict[tuple[tuple[str, int], ...], tuple[list[RegisteredAction], type[ActionModel]]] = {}
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -300,6 +303,7 @@ class Registry(Generic[Context]):
 				domains=final_domains,
 			)
 			self.registry.actions[func.__name__] = action
+			self._action_models.clear()
 
 			# Return the normalized function so it can be called with kwargs
 			return normalized_func
@@ -478,8 +482,6 @@ class Registry(Generic[Context]):
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
 		"""
-		from typing import Union
-
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
 		#   if page_url is provided, only include actions that match the URL
@@ -502,6 +504,21 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		# Reuse the model built for the same actions, a new model class would also invalidate all schemas built from it
+		cache_key = tuple((name, id(action)) for name, action in available_actions.items())
+		cached = self._action_models.get(cache_key)
+		if cached is not None:
+			return cached[1]
+
+		result_model = self._build_action_model(available_actions)
+		# The actions are kept alive with the model, so their ids in the key can not be reused
+		self._action_models[cache_key] = (list(available_actions.values()), result_model)
+		return result_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Build the Union action model of the given actions"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
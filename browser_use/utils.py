@@ -10,7 +10,7 @@ from fnmatch import fnmatch
 from functools import cache, wraps
 from pathlib import Path
 from sys import stderr
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, Literal, ParamSpec, TypeVar
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
@@ -431,6 +431,23 @@ def is_new_tab_page(url: str) -> bool:
 	return url in ('about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/', 'chrome://newtab')
 
 
+# Base64 prefixes of the image magic bytes, screenshots can be png, jpeg or webp depending on BrowserProfile.screenshot_format
+_BASE64_IMAGE_PREFIXES: dict[str, Literal['image/png', 'image/jpeg', 'image/webp', 'image/gif']] = {
+	'iVBORw0KGgo': 'image/png',
+	'/9j/': 'image/jpeg',
+	'UklGR': 'image/webp',
+	'R0lGOD': 'image/gif',
+}
+
+
+def get_image_media_type(image_b64: str) -> Literal['image/png', 'image/jpeg', 'image/webp', 'image/gif']:
+	"""Media type of a base64 encoded image, sniffed from its first bytes (defaults to image/png)."""
+	for prefix, media_type in _BASE64_IMAGE_PREFIXES.items():
+		if image_b64.startswith(prefix):
+			return media_type
+	return 'image/png'
+
+
 def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: bool = False) -> bool:
 	"""
 	Check if a URL matches a domain pattern. SECURITY CRITICAL.
@@ -7,6 +7,8 @@ Sets up environment variables to ensure tests never connect to production servic
 import os
 import socketserver
 import tempfile
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -35,6 +37,7 @@ from bubus import BaseEvent
 
 from browser_use import Agent
 from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
 from browser_use.sync.service import CloudSync
 
 
@@ -154,6 +157,58 @@ def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	return llm
 
 
+def create_dom_node(
+	tag_name: str = 'button', attributes: dict[str, str] | None = None, backend_node_id: int = 1
+) -> EnhancedDOMTreeNode:
+	"""Create an element node on target 'target', for tests that drive the watchdogs without a browser"""
+	return EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=NodeType.ELEMENT_NODE,
+		node_name=tag_name.upper(),
+		node_value='',
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+		element_index=backend_node_id,
+	)
+
+
+def create_cdp_session(browser: Any) -> Any:
+	"""Create a CDP session on target 'target' whose commands are answered by `browser`, a fake with one attribute per domain"""
+	return SimpleNamespace(cdp_client=SimpleNamespace(send=browser), session_id='session', target_id='target')
+
+
+def connect_fake_browser(browser: Any, monkeypatch: pytest.MonkeyPatch) -> Any:
+	"""Make BrowserSession.get_or_create_cdp_session return a session on the fake `browser`"""
+	cdp_session = create_cdp_session(browser)
+
+	async def get_or_create_cdp_session(self, *args, **kwargs):
+		return cdp_session
+
+	monkeypatch.setattr(BrowserSession, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	return cdp_session
+
+
+@pytest.fixture(scope='function')
+async def session():
+	"""Create a browser session that is never started, for tests that use a fake CDP client"""
+	session = BrowserSession()
+	yield session
+	await session.event_bus.stop(clear=True)
+
+
 @pytest.fixture(scope='module')
 async def browser_session():
 	"""Create a real browser session for testing"""
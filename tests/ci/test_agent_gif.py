@@ -0,0 +1,131 @@
+"""
+Tests for rendering the agent history to GIF and video (browser_use.agent.gif.create_history_gif).
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import types
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import imageio_ffmpeg
+import pytest
+from PIL import Image, ImageChops
+
+from browser_use.agent.gif import _get_mp_context, _main_module_is_importable, create_history_gif
+from browser_use.agent.views import AgentHistory, AgentHistoryList, AgentOutput
+from browser_use.browser.views import BrowserStateHistory
+
+STEPS = 20
+
+
+def make_history(tmp_path: Path) -> AgentHistoryList:
+	items = []
+	for step in range(STEPS):
+		screenshot_path = tmp_path / f'step_{step}.png'
+		# odd sizes, video frames get padded to even dimensions
+		Image.new('RGB', (321, 201), (step * 12, 80, 255 - step * 12)).save(screenshot_path)
+		state = BrowserStateHistory(
+			url='https://example.com', title='Example', tabs=[], interacted_element=[None], screenshot_path=str(screenshot_path)
+		)
+		model_output = AgentOutput(next_goal=f'Go to step {step + 1}', action=[])
+		items.append(AgentHistory(model_output=model_output, result=[], state=state))
+	return AgentHistoryList(history=items)
+
+
+@contextmanager
+def threading_running() -> Iterator[None]:
+	stop = threading.Event()
+	thread = threading.Thread(target=stop.wait)
+	thread.start()
+	try:
+		yield
+	finally:
+		stop.set()
+		thread.join()
+
+
+def read_frames(path: Path) -> list[bytes]:
+	frames = []
+	with Image.open(path) as gif:
+		for index in range(getattr(gif, 'n_frames')):
+			gif.seek(index)
+			frames.append(gif.convert('RGB').tobytes())
+	return frames
+
+
+def test_frames_rendered_by_workers_match_inline_rendering(tmp_path):
+	history = make_history(tmp_path)
+
+	create_history_gif('Walk through the steps', history, output_path=str(tmp_path / 'inline.gif'), margin=10, workers=1)
+	create_history_gif('Walk through the steps', history, output_path=str(tmp_path / 'workers.gif'), margin=10, workers=2)
+
+	inline_frames = read_frames(tmp_path / 'inline.gif')
+	assert len(inline_frames) == STEPS + 1  # task frame + one per step
+	assert read_frames(tmp_path / 'workers.gif') == inline_frames
+
+	with Image.open(tmp_path / 'inline.gif') as gif:
+		gif.seek(1)
+		# the goal overlay is drawn over the screenshot
+		original = Image.open(tmp_path / 'step_0.png').convert('RGB')
+		assert ImageChops.difference(gif.convert('RGB'), original).getbbox() is not None
+
+
+async def test_workers_render_frames_from_the_agents_thread(tmp_path, monkeypatch):
+	history = make_history(tmp_path)
+	create_history_gif('Walk through the steps', history, output_path=str(tmp_path / 'inline.gif'), margin=10, workers=1)
+
+	contexts = []
+
+	def get_mp_context():
+		contexts.append(_get_mp_context())
+		return contexts[-1]
+
+	monkeypatch.setattr('browser_use.agent.gif._get_mp_context', get_mp_context)
+	# like the agent, which renders the history from a worker thread next to its event loop
+	await asyncio.to_thread(
+		create_history_gif, 'Walk through the steps', history, output_path=str(tmp_path / 'workers.gif'), margin=10, workers=2
+	)
+
+	assert [context.get_start_method() for context in contexts] in (['forkserver'], ['spawn'])
+	assert read_frames(tmp_path / 'workers.gif') == read_frames(tmp_path / 'inline.gif')
+
+
+@pytest.mark.parametrize(
+	'script, importable',
+	[
+		("from browser_use import Agent\n\nif __name__ == '__main__':\n\tAgent(task='x').run_sync()\n", True),
+		('import asyncio\n\nif "__main__" == __name__:\n\tasyncio.run(main())\n', True),
+		("from browser_use import Agent\n\nAgent(task='x').run_sync()\n", False),
+		("def main():\n\tif __name__ == '__main__':\n\t\tpass\n\nmain()\n", False),
+	],
+)
+def test_workers_are_only_started_for_scripts_with_a_main_guard(tmp_path, monkeypatch, script, importable):
+	script_path = tmp_path / 'script.py'
+	script_path.write_text(script)
+	main_module = types.ModuleType('__main__')
+	main_module.__file__ = str(script_path)
+	monkeypatch.setitem(sys.modules, '__main__', main_module)
+
+	assert _main_module_is_importable() is importable
+	with threading_running():
+		assert (_get_mp_context() is not None) is importable
+
+
+@pytest.mark.parametrize('extension', ['.mp4', '.webm'])
+def test_video_output_streams_all_frames(tmp_path, extension):
+	history = make_history(tmp_path)
+	output_path = tmp_path / f'history{extension}'
+
+	create_history_gif('Walk through the steps', history, output_path=str(output_path), margin=10, workers=2)
+	create_history_gif('Walk through the steps', history, output_path=str(tmp_path / 'history.gif'), margin=10, workers=2)
+
+	result = subprocess.run(
+		[imageio_ffmpeg.get_ffmpeg_exe(), '-i', str(output_path), '-f', 'framecrc', '-'], capture_output=True, text=True
+	)
+	frames = [line for line in result.stdout.splitlines() if line and not line.startswith('#')]
+	assert len(frames) == STEPS + 1
+	assert output_path.stat().st_size < (tmp_path / 'history.gif').stat().st_size
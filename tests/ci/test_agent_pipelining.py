@@ -0,0 +1,83 @@
+"""
+Tests for Agent(pipeline_steps=True): the next browser state is built at the end of the previous step.
+"""
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.agent.service import Agent
+from browser_use.browser import BrowserSession
+from browser_use.browser.profile import BrowserProfile
+from tests.ci.conftest import create_mock_llm
+
+SCROLL_ACTION = """
+{
+	"thinking": "null",
+	"evaluation_previous_goal": "Page opened",
+	"memory": "Looking at the list",
+	"next_goal": "Scroll down",
+	"action": [{"scroll": {"down": true, "num_pages": 1.0}}]
+}
+"""
+
+
+@pytest.fixture(scope='module')
+async def browser_session():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+	await browser_session.start()
+	yield browser_session
+	await browser_session.kill()
+
+
+@pytest.fixture
+def page_url(httpserver: HTTPServer) -> str:
+	buttons = ''.join(f'<p><button>Button {i}</button></p>' for i in range(100))
+	httpserver.expect_request('/list').respond_with_data(
+		f'<html><head><title>List</title></head><body>{buttons}</body></html>', content_type='text/html'
+	)
+	return httpserver.url_for('/list')
+
+
+async def run_agent(browser_session: BrowserSession, page_url: str, **run_kwargs) -> tuple[Agent, list[bool]]:
+	"""Run a scroll step and a done step, return which steps got a prefetched browser state."""
+	agent = Agent(
+		task='Scroll the list',
+		llm=create_mock_llm([SCROLL_ACTION]),
+		browser_session=browser_session,
+		initial_actions=[{'go_to_url': {'url': page_url, 'new_tab': False}}],
+		pipeline_steps=True,
+	)
+	prefetched = []
+	take_state_prefetch = agent._take_state_prefetch
+
+	async def record_state_prefetch():
+		browser_state_summary = await take_state_prefetch()
+		prefetched.append(browser_state_summary is not None)
+		return browser_state_summary
+
+	agent._take_state_prefetch = record_state_prefetch
+	history = await agent.run(max_steps=3, **run_kwargs)
+	assert history.is_done()
+	return agent, prefetched
+
+
+async def test_next_step_uses_the_prefetched_browser_state(browser_session, page_url):
+	agent, prefetched = await run_agent(browser_session, page_url)
+
+	# nothing to prefetch for the first step, and nothing is prefetched after the done step
+	assert prefetched == [False, True]
+	assert agent._state_prefetch is None
+	assert agent._node_handle_prefetch is None
+
+
+async def test_prefetched_browser_state_is_dropped_after_step_hooks(browser_session, page_url):
+	hook_calls = []
+
+	async def on_step_end(agent: Agent):
+		hook_calls.append(agent.state.n_steps)
+
+	_, prefetched = await run_agent(browser_session, page_url, on_step_end=on_step_end)
+
+	# the hook may have changed the page, the state is requested again
+	assert len(hook_calls) == 2
+	assert prefetched == [False, False]
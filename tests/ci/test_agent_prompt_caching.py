@@ -0,0 +1,133 @@
+"""
+Tests for the prefix-stable prompt layout: append-only history blocks, the Anthropic cache breakpoint and the cache hit rate.
+"""
+
+import os
+import tempfile
+import uuid
+from typing import cast
+
+import pytest
+from anthropic.types import TextBlockParam
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm import SystemMessage, UserMessage
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.aws.serializer import AWSBedrockMessageSerializer
+from browser_use.llm.messages import ContentPartTextParam
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+@pytest.fixture
+def message_manager():
+	return MessageManager(
+		task='Find the cheapest flight',
+		system_message=SystemMessage(content='System message', cache=True),
+		state=MessageManagerState(),
+		file_system=FileSystem(os.path.join(tempfile.gettempdir(), str(uuid.uuid4()))),
+	)
+
+
+def run_step(message_manager: MessageManager, step: int) -> list:
+	url = f'https://example.com/{step}'
+	browser_state = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url=url,
+		title=f'Page {step}',
+		tabs=[TabInfo(url=url, title=f'Page {step}', target_id='TARGET0001')],
+	)
+	model_output = AgentOutput(
+		evaluation_previous_goal='Success', memory=f'Visited page {step - 1}', next_goal=f'Visit page {step}', action=[]
+	)
+	message_manager.create_state_messages(
+		browser_state,
+		model_output=model_output if step > 0 else None,
+		result=[ActionResult(extracted_content=f'Opened page {step - 1}')],
+		step_info=AgentStepInfo(step_number=step, max_steps=10),
+	)
+	return message_manager.get_messages()
+
+
+def usage(prompt_tokens: int, prompt_cached_tokens: int | None) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt_tokens,
+		prompt_cached_tokens=prompt_cached_tokens,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=10,
+		total_tokens=prompt_tokens + 10,
+	)
+
+
+def history_parts(state: UserMessage) -> list[ContentPartTextParam]:
+	assert isinstance(state.content, list)
+	end = next(i for i, part in enumerate(state.content) if part.type == 'text' and part.text.endswith('</agent_history>\n\n'))
+	return cast(list[ContentPartTextParam], state.content[: end + 1])
+
+
+def test_history_blocks_are_append_only(message_manager):
+	previous_blocks: list[str] = []
+	for step in range(4):
+		system, state = run_step(message_manager, step)
+		assert isinstance(state, UserMessage) and isinstance(state.content, list)
+		parts = history_parts(state)
+		blocks = [part.text for part in parts]
+
+		# everything but the closing tag of the previous step is repeated unchanged, new items are appended
+		stable_blocks = previous_blocks[:-1]
+		assert blocks[: len(stable_blocks)] == stable_blocks
+		assert len(blocks) > len(previous_blocks)
+		assert [part.cache for part in parts] == [False] * (len(blocks) - 2) + [True, False]
+		assert ''.join(blocks) == f'<agent_history>\n{message_manager.agent_history_description}\n</agent_history>\n\n'
+
+		# the volatile state comes after the history and is not cached
+		state_parts = cast(list[ContentPartTextParam], state.content[len(parts) :])
+		assert not any(part.cache for part in state_parts)
+		state_description = ''.join(part.text for part in state_parts)
+		assert '<agent_history>' not in state_description
+		assert f'https://example.com/{step}' in state_description
+		assert not state.cache
+		previous_blocks = blocks
+
+	# history items are rendered once, not on every step
+	assert [item for item, _ in message_manager._rendered_history_items] == message_manager.state.agent_history_items
+
+
+def test_anthropic_cache_breakpoint_after_the_last_history_item(message_manager):
+	for step in range(3):
+		messages = run_step(message_manager, step)
+	serialized_messages, system_message = AnthropicMessageSerializer.serialize_messages(messages)
+
+	assert isinstance(system_message, list) and system_message[0].get('cache_control')
+	blocks = cast(list[TextBlockParam], serialized_messages[0]['content'])
+	# the history blocks, then the state block
+	assert [bool(block.get('cache_control')) for block in blocks] == [False] * (len(blocks) - 3) + [True, False, False]
+
+
+def test_history_and_state_are_one_user_turn(message_manager):
+	for step in range(3):
+		messages = run_step(message_manager, step)
+
+	# Bedrock Converse rejects consecutive user messages, it does not merge them
+	bedrock_messages, system_message = AWSBedrockMessageSerializer.serialize_messages(messages)
+	assert system_message is not None
+	assert [message['role'] for message in bedrock_messages] == ['user']
+
+
+async def test_usage_summary_reports_the_cache_hit_rate():
+	token_cost = TokenCost()
+	token_cost.add_usage('model-a', usage(prompt_tokens=1000, prompt_cached_tokens=0))
+	token_cost.add_usage('model-a', usage(prompt_tokens=1000, prompt_cached_tokens=800))
+	token_cost.add_usage('model-b', usage(prompt_tokens=2000, prompt_cached_tokens=None))
+
+	summary = await token_cost.get_usage_summary()
+
+	assert summary.prompt_cache_hit_rate == pytest.approx(800 / 4000)
+	assert summary.by_model['model-a'].prompt_cached_tokens == 800
+	assert summary.by_model['model-a'].prompt_cache_hit_rate == pytest.approx(0.4)
+	assert summary.by_model['model-b'].prompt_cache_hit_rate == 0.0
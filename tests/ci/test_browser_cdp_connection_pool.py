@@ -0,0 +1,129 @@
+"""
+Tests for multiplexing CDP target sessions over a bounded number of WebSockets (browser_use.browser.cdp_pool).
+
+Uses a minimal local CDP endpoint that answers every command, so no browser is needed.
+"""
+
+import asyncio
+import json
+from itertools import count
+
+import pytest
+import websockets
+
+from browser_use.browser.cdp_pool import CDPConnectionPool
+from browser_use.browser.session import BrowserSession, CDPSession
+from browser_use.browser.watchdogs.crash_watchdog import CrashWatchdog
+
+
+@pytest.fixture
+async def cdp_server():
+	"""Fake CDP endpoint: attachToTarget hands out session ids, Runtime.evaluate answers after a short delay."""
+	state = {'connections': 0, 'in_flight': 0, 'max_in_flight': 0}
+	session_ids = count(1)
+
+	async def answer(ws, message: dict) -> None:
+		method = message['method']
+		result: dict = {}
+		if method == 'Target.attachToTarget':
+			result = {'sessionId': f'session-{next(session_ids)}'}
+		elif method == 'Target.getTargetInfo':
+			target_id = message['params']['targetId']
+			result = {'targetInfo': {'targetId': target_id, 'type': 'page', 'title': target_id, 'url': 'about:blank'}}
+		elif method == 'Target.getTargets':
+			result = {'targetInfos': []}
+		elif method == 'Runtime.evaluate':
+			state['in_flight'] += 1
+			state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+			await asyncio.sleep(0.02)
+			state['in_flight'] -= 1
+		await ws.send(json.dumps({'id': message['id'], 'result': result}))
+
+	async def handler(ws):
+		state['connections'] += 1
+		async for raw in ws:
+			asyncio.create_task(answer(ws, json.loads(raw)))
+
+	async with websockets.serve(handler, '127.0.0.1', 0) as server:
+		port = server.sockets[0].getsockname()[1]
+		yield f'ws://127.0.0.1:{port}', state
+
+
+async def test_sessions_are_multiplexed_over_bounded_sockets(cdp_server):
+	cdp_url, state = cdp_server
+	pool = CDPConnectionPool(cdp_url, max_sockets=2)
+	try:
+		sessions = await asyncio.gather(
+			*(
+				CDPSession.for_target(None, f'target-{i}', new_socket=True, cdp_url=cdp_url, connection_pool=pool)  # type: ignore[arg-type]
+				for i in range(6)
+			)
+		)
+
+		assert state['connections'] == 2
+		assert len(pool.clients) == 2
+		assert sorted(len(client.session_ids) for client in pool.clients) == [3, 3]
+		assert len({session.session_id for session in sessions}) == 6
+		assert all(not session.owns_cdp_client for session in sessions)
+
+		# disconnecting a pooled session only detaches it, the socket stays up for the others
+		await sessions[0].disconnect()
+		assert pool.session_count == 5
+		assert all(client.is_alive for client in pool.clients)
+	finally:
+		await pool.close()
+
+
+async def test_in_flight_requests_are_limited_per_socket(cdp_server):
+	cdp_url, state = cdp_server
+	pool = CDPConnectionPool(cdp_url, max_sockets=1, max_in_flight_per_socket=3)
+	try:
+		session = await CDPSession.for_target(None, 'target', new_socket=True, cdp_url=cdp_url, connection_pool=pool)  # type: ignore[arg-type]
+		await asyncio.gather(
+			*(
+				session.cdp_client.send.Runtime.evaluate(params={'expression': '1'}, session_id=session.session_id)
+				for _ in range(12)
+			)
+		)
+		assert state['max_in_flight'] == 3
+		assert pool.in_flight == 0
+	finally:
+		await pool.close()
+
+
+async def test_crashes_are_reported_for_the_right_target_on_a_shared_socket(cdp_server, monkeypatch):
+	cdp_url, _ = cdp_server
+	pool = CDPConnectionPool(cdp_url, max_sockets=1)
+	browser_session = BrowserSession()
+	try:
+		sessions = [
+			await CDPSession.for_target(None, f'target-{i}', new_socket=True, cdp_url=cdp_url, connection_pool=pool)  # type: ignore[arg-type]
+			for i in range(2)
+		]
+		assert sessions[0].cdp_client is sessions[1].cdp_client
+		browser_session._cdp_session_pool.update({session.target_id: session for session in sessions})
+
+		async def get_cdp_session(self, target_id, focus=True):
+			return self._cdp_session_pool[target_id]
+
+		crashed: list[str] = []
+
+		async def on_target_crash(self, target_id):
+			crashed.append(target_id)
+
+		monkeypatch.setattr(BrowserSession, 'get_or_create_cdp_session', get_cdp_session)
+		monkeypatch.setattr(CrashWatchdog, '_on_target_crash_cdp', on_target_crash)
+		watchdog = CrashWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+		for session in sessions:
+			await watchdog.attach_to_target(session.target_id)
+
+		# both targets registered a handler on the same client, each crash is still reported for its own target
+		client = sessions[0].cdp_client
+		for session in sessions:
+			await client.emit_event('Target.targetCrashed', {'status': 'crashed', 'errorCode': 0}, session.session_id)
+		await asyncio.sleep(0)
+
+		assert crashed == ['target-0', 'target-1']
+	finally:
+		await pool.close()
+		await browser_session.event_bus.stop(clear=True)
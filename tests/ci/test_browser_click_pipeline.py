@@ -0,0 +1,110 @@
+"""
+Tests for the pipelined click fast path of DefaultActionWatchdog._click_element_node_impl.
+
+Uses a fake CDP client that answers every command after a short delay, no browser needed.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs import default_action_watchdog
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+from tests.ci.conftest import connect_fake_browser, create_dom_node
+
+LATENCY = 0.01
+
+
+class FakeBrowser:
+	"""A page with one button, every command is answered after LATENCY seconds"""
+
+	def __init__(self, click_point: dict | None = None, navigates: bool = False):
+		self.click_point = click_point
+		self.navigates = navigates
+		self.sent: list[str] = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+		self.released = asyncio.Event()
+		self.DOM = SimpleNamespace(
+			resolveNode=self.resolve_node, getContentQuads=self.get_content_quads, scrollIntoViewIfNeeded=self.reply
+		)
+		self.Page = SimpleNamespace(getLayoutMetrics=self.get_layout_metrics)
+		self.Runtime = SimpleNamespace(callFunctionOn=self.call_function_on, runIfWaitingForDebugger=self.reply)
+		self.Input = SimpleNamespace(dispatchMouseEvent=self.dispatch_mouse_event)
+		self.Target = SimpleNamespace(activateTarget=self.reply)
+
+	async def command(self, name: str, result: Any = None) -> Any:
+		self.sent.append(name)
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+		await asyncio.sleep(LATENCY)
+		self.in_flight -= 1
+		return {} if result is None else result
+
+	async def reply(self, params: dict | None = None, session_id: str | None = None) -> Any:
+		return {}
+
+	async def resolve_node(self, params: dict, session_id: str | None = None) -> Any:
+		return await self.command('DOM.resolveNode', {'object': {'objectId': 'button'}})
+
+	async def get_layout_metrics(self, params: dict | None = None, session_id: str | None = None) -> Any:
+		return await self.command('Page.getLayoutMetrics', {'layoutViewport': {'clientWidth': 800, 'clientHeight': 600}})
+
+	async def get_content_quads(self, params: dict, session_id: str | None = None) -> Any:
+		return await self.command('DOM.getContentQuads', {'quads': [[10, 10, 30, 10, 30, 20, 10, 20]]})
+
+	async def call_function_on(self, params: dict, session_id: str | None = None) -> Any:
+		if params['functionDeclaration'] == default_action_watchdog._CLICK_POINT_JS:
+			return await self.command('click point', {'result': {'type': 'object', 'value': self.click_point}})
+		assert params['functionDeclaration'] == default_action_watchdog._CLICK_SIGNAL_JS
+		self.sent.append('click signal')
+		# the click handler changes the page as soon as the button is released
+		await self.released.wait()
+		if self.navigates:
+			raise RuntimeError('Execution context was destroyed.')
+		return {'result': {'type': 'string', 'value': 'mutation'}}
+
+	async def dispatch_mouse_event(self, params: dict, session_id: str | None = None) -> Any:
+		result = await self.command(params['type'])
+		if params['type'] == 'mouseReleased':
+			self.released.set()
+		return result
+
+
+async def click(session: BrowserSession, browser: FakeBrowser, monkeypatch) -> tuple[dict | None, float]:
+	connect_fake_browser(browser, monkeypatch)
+	watchdog = DefaultActionWatchdog(event_bus=session.event_bus, browser_session=session)
+	start = time.perf_counter()
+	result = await watchdog._click_element_node_impl(create_dom_node())
+	return result, time.perf_counter() - start
+
+
+async def test_mouse_events_are_sent_back_to_back(session, monkeypatch):
+	browser = FakeBrowser(click_point={'x': 50, 'y': 20})
+	result, elapsed = await click(session, browser, monkeypatch)
+
+	assert result == {'click_x': 50, 'click_y': 20}
+	# the reaction watcher is armed between the mouse move and the press, nothing else needed for geometry
+	assert browser.sent == ['DOM.resolveNode', 'click point', 'mouseMoved', 'click signal', 'mousePressed', 'mouseReleased']
+	assert browser.max_in_flight == 3
+	# two round trips for the click point and one for the mouse events, the page reacted right away
+	assert elapsed < 5 * LATENCY + default_action_watchdog._CLICK_SIGNAL_TIMEOUT_MS / 1000
+
+
+async def test_navigation_away_counts_as_a_reaction(session, monkeypatch):
+	browser = FakeBrowser(click_point={'x': 50, 'y': 20}, navigates=True)
+	result, _ = await click(session, browser, monkeypatch)
+
+	assert result == {'click_x': 50, 'click_y': 20}
+
+
+async def test_elements_without_a_click_point_fall_back_to_content_quads(session, monkeypatch):
+	# e.g. an element inside an iframe
+	browser = FakeBrowser(click_point=None)
+	result, _ = await click(session, browser, monkeypatch)
+
+	assert result == {'click_x': 20, 'click_y': 15}
+	assert browser.sent[:4] == ['DOM.resolveNode', 'click point', 'Page.getLayoutMetrics', 'DOM.getContentQuads']
+	assert browser.sent[-3:] == ['mouseMoved', 'mousePressed', 'mouseReleased']
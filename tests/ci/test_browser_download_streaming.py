@@ -0,0 +1,120 @@
+"""
+Tests for streaming downloads out of the browser in chunks (DownloadsWatchdog._stream_download).
+
+Uses a fake CDP client serving a Blob over IO.read, no browser needed.
+"""
+
+import base64
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from browser_use.browser.events import FileDownloadProgressEvent
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs import downloads_watchdog
+from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
+from tests.ci.conftest import create_cdp_session
+
+
+class FakeBrowser:
+	"""Runtime and IO domains of a page whose fetch() resolved to a Blob holding `body`"""
+
+	def __init__(self, body: bytes, fail_after_chunks: int | None = None):
+		self.body = body
+		self.fail_after_chunks = fail_after_chunks
+		self.offset = 0
+		self.reads = 0
+		self.closed_handles: list[str] = []
+		self.object_groups: list[str] = []
+		self.released_groups: list[str] = []
+		self.Runtime = SimpleNamespace(
+			evaluate=self.evaluate, getProperties=self.get_properties, releaseObjectGroup=self.release_object_group
+		)
+		self.IO = SimpleNamespace(resolveBlob=self.resolve_blob, read=self.read, close=self.close)
+
+	async def evaluate(self, params: dict, session_id: str | None = None) -> Any:
+		assert params['awaitPromise'] and not params.get('returnByValue')
+		self.object_groups.append(params['objectGroup'])
+		return {'result': {'type': 'object', 'objectId': 'response'}}
+
+	async def get_properties(self, params: dict, session_id: str | None = None) -> Any:
+		assert params['objectId'] == 'response'
+		return {
+			'result': [
+				{'name': 'blob', 'value': {'type': 'object', 'objectId': 'blob'}},
+				{'name': 'size', 'value': {'type': 'number', 'value': len(self.body)}},
+				{'name': 'contentType', 'value': {'type': 'string', 'value': 'application/pdf'}},
+				{'name': 'fromCache', 'value': {'type': 'boolean', 'value': True}},
+			]
+		}
+
+	async def resolve_blob(self, params: dict, session_id: str | None = None) -> Any:
+		assert params['objectId'] == 'blob'
+		return {'uuid': '1234'}
+
+	async def read(self, params: dict, session_id: str | None = None) -> Any:
+		assert params['handle'] == 'blob:1234'
+		self.reads += 1
+		if self.fail_after_chunks is not None and self.reads > self.fail_after_chunks:
+			raise ConnectionError('target detached')
+		chunk = self.body[self.offset : self.offset + params['size']]
+		self.offset += len(chunk)
+		return {'base64Encoded': True, 'data': base64.b64encode(chunk).decode(), 'eof': self.offset >= len(self.body)}
+
+	async def close(self, params: dict, session_id: str | None = None) -> Any:
+		self.closed_handles.append(params['handle'])
+		return {}
+
+	async def release_object_group(self, params: dict, session_id: str | None = None) -> Any:
+		self.released_groups.append(params['objectGroup'])
+		return {}
+
+
+def make_watchdog(
+	session: BrowserSession, browser: FakeBrowser
+) -> tuple[DownloadsWatchdog, Any, list[FileDownloadProgressEvent]]:
+	progress: list[FileDownloadProgressEvent] = []
+
+	def on_progress(event: FileDownloadProgressEvent) -> None:
+		progress.append(event)
+
+	session.event_bus.on(FileDownloadProgressEvent, on_progress)
+	watchdog = DownloadsWatchdog(event_bus=session.event_bus, browser_session=session)
+	return watchdog, create_cdp_session(browser), progress
+
+
+async def test_body_is_streamed_to_disk_in_chunks(session, tmp_path, monkeypatch):
+	monkeypatch.setattr(downloads_watchdog, '_DOWNLOAD_CHUNK_SIZE', 1000)
+	# every byte value, the old JSON number array path had to round-trip each of them
+	body = bytes(range(256)) * 10
+	browser = FakeBrowser(body)
+	watchdog, cdp_session, progress = make_watchdog(session, browser)
+
+	path = tmp_path / 'report.pdf'
+	size, content_type, from_cache = await watchdog._stream_download(cdp_session, 'https://example.com/report.pdf', path)
+	await watchdog.event_bus.wait_until_idle()
+
+	assert (size, content_type, from_cache) == (len(body), 'application/pdf', True)
+	assert path.read_bytes() == body
+	assert browser.reads == 3
+	assert [event.received_bytes for event in progress] == [1000, 2000, 2560]
+	assert {event.total_bytes for event in progress} == {2560}
+	assert browser.closed_handles == ['blob:1234']
+	assert browser.released_groups == browser.object_groups
+	assert browser.object_groups[0].startswith(f'{downloads_watchdog._DOWNLOAD_OBJECT_GROUP}-')
+
+
+async def test_partial_file_is_removed_when_the_stream_breaks(session, tmp_path, monkeypatch):
+	monkeypatch.setattr(downloads_watchdog, '_DOWNLOAD_CHUNK_SIZE', 1000)
+	browser = FakeBrowser(b'x' * 5000, fail_after_chunks=2)
+	watchdog, cdp_session, _ = make_watchdog(session, browser)
+
+	path = tmp_path / 'archive.zip'
+	with pytest.raises(ConnectionError):
+		await watchdog._stream_download(cdp_session, 'https://example.com/archive.zip', path)
+
+	assert not path.exists()
+	assert browser.closed_handles == ['blob:1234']
+	assert browser.released_groups == browser.object_groups
+	assert browser.object_groups[0].startswith(f'{downloads_watchdog._DOWNLOAD_OBJECT_GROUP}-')
@@ -0,0 +1,164 @@
+"""
+Tests for tracking download completion from CDP download events, the inotify fallback and the download queue.
+
+Feeds Browser.downloadWillBegin / Browser.downloadProgress events to the DownloadsWatchdog directly, no browser needed.
+"""
+
+import asyncio
+import base64
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from browser_use.browser.directory_watcher import DirectoryWatcher
+from browser_use.browser.events import FileDownloadedEvent, FileDownloadProgressEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
+from tests.ci.conftest import create_cdp_session
+
+
+@pytest.fixture
+async def session(tmp_path):
+	session = BrowserSession(browser_profile=BrowserProfile(is_local=True, downloads_path=tmp_path, max_concurrent_downloads=1))
+	yield session
+	await session.event_bus.stop(clear=True)
+
+
+def collect(session: BrowserSession) -> tuple[DownloadsWatchdog, list[FileDownloadedEvent], list[FileDownloadProgressEvent]]:
+	downloaded: list[FileDownloadedEvent] = []
+	progress: list[FileDownloadProgressEvent] = []
+
+	def on_downloaded(event: FileDownloadedEvent) -> None:
+		downloaded.append(event)
+
+	def on_progress(event: FileDownloadProgressEvent) -> None:
+		progress.append(event)
+
+	session.event_bus.on(FileDownloadedEvent, on_downloaded)
+	session.event_bus.on(FileDownloadProgressEvent, on_progress)
+	watchdog = DownloadsWatchdog(event_bus=session.event_bus, browser_session=session)
+	session._downloads_watchdog = watchdog
+	return watchdog, downloaded, progress
+
+
+def progress_event(guid: str, state: str, received: int, total: int = 3000, file_path: str | None = None) -> Any:
+	event = {'guid': guid, 'state': state, 'receivedBytes': received, 'totalBytes': total}
+	if file_path:
+		event['filePath'] = file_path
+	return event
+
+
+async def test_completion_follows_progress_state_changes(session, tmp_path):
+	watchdog, downloaded, progress = collect(session)
+	watchdog._on_download_will_begin({'guid': 'a', 'url': 'https://example.com/a.zip', 'suggestedFilename': 'a.zip'})  # type: ignore[typeddict-item]
+	watchdog._on_download_will_begin({'guid': 'b', 'url': 'https://example.com/b.zip', 'suggestedFilename': 'b.zip'})  # type: ignore[typeddict-item]
+
+	for received in (1000, 2000):
+		await watchdog._on_download_progress(progress_event('a', 'inProgress', received))
+	await watchdog._on_download_progress(progress_event('b', 'canceled', 10))
+
+	(tmp_path / 'a.zip').write_bytes(b'a' * 3000)
+	# reported twice, e.g. by CDP and the directory watcher, dispatched once
+	await watchdog._on_download_progress(progress_event('a', 'completed', 3000, file_path=str(tmp_path / 'a.zip')))
+	await watchdog._on_download_progress(progress_event('a', 'completed', 3000, file_path=str(tmp_path / 'a.zip')))
+	await session.event_bus.wait_until_idle()
+
+	# progress events are throttled, the second one came too soon
+	assert [event.received_bytes for event in progress] == [1000]
+	assert [(event.url, event.file_name, event.file_size) for event in downloaded] == [
+		('https://example.com/a.zip', 'a.zip', 3000)
+	]
+
+	stats = {download.guid: download for download in session.get_download_stats()}
+	assert stats['a'].state == 'completed' and stats['a'].path == str(tmp_path / 'a.zip')
+	assert stats['a'].received_bytes == 3000 and stats['a'].throughput_bytes_per_s > 0
+	assert stats['b'].state == 'canceled'
+
+
+@pytest.mark.skipif(not DirectoryWatcher.is_supported(), reason='inotify is only available on Linux')
+async def test_directory_watcher_completes_downloads_without_cdp_completion(session, tmp_path):
+	watchdog, downloaded, _ = collect(session)
+	watchdog._start_downloads_dir_watcher(tmp_path)
+	try:
+		watchdog._on_download_will_begin({'guid': 'c', 'url': 'https://example.com/c.pdf', 'suggestedFilename': 'c.pdf'})  # type: ignore[typeddict-item]
+		(tmp_path / 'unrelated.txt.crdownload').write_bytes(b'partial')
+		(tmp_path / 'c (1).pdf.crdownload').write_bytes(b'%PDF-1.7')
+		os.rename(tmp_path / 'c (1).pdf.crdownload', tmp_path / 'c (1).pdf')
+
+		for _ in range(50):
+			await asyncio.sleep(0.01)
+			if downloaded:
+				break
+		await session.event_bus.wait_until_idle()
+	finally:
+		if watchdog._downloads_dir_watcher:
+			watchdog._downloads_dir_watcher.stop()
+
+	assert [event.path for event in downloaded] == [str(tmp_path / 'c (1).pdf')]
+
+
+class GatedBrowser:
+	"""Serves one blob per fetch, IO.read of the first blob waits until `release` is set"""
+
+	def __init__(self):
+		self.release = asyncio.Event()
+		self.fetches = 0
+		self.Runtime = SimpleNamespace(
+			evaluate=self.evaluate, getProperties=self.get_properties, releaseObjectGroup=self.release_object_group
+		)
+		self.IO = SimpleNamespace(resolveBlob=self.resolve_blob, read=self.read, close=self.close)
+
+	async def evaluate(self, params: dict, session_id: str | None = None) -> Any:
+		self.fetches += 1
+		return {'result': {'type': 'object', 'objectId': f'response-{self.fetches}'}}
+
+	async def get_properties(self, params: dict, session_id: str | None = None) -> Any:
+		blob_id = params['objectId'].replace('response', 'blob')
+		return {
+			'result': [
+				{'name': 'blob', 'value': {'type': 'object', 'objectId': blob_id}},
+				{'name': 'size', 'value': {'type': 'number', 'value': 4}},
+				{'name': 'contentType', 'value': {'type': 'string', 'value': 'text/plain'}},
+				{'name': 'fromCache', 'value': {'type': 'boolean', 'value': False}},
+			]
+		}
+
+	async def resolve_blob(self, params: dict, session_id: str | None = None) -> Any:
+		return {'uuid': params['objectId']}
+
+	async def read(self, params: dict, session_id: str | None = None) -> Any:
+		if params['handle'] == 'blob:blob-1':
+			await self.release.wait()
+		return {'base64Encoded': True, 'data': base64.b64encode(b'data').decode(), 'eof': True}
+
+	async def close(self, params: dict, session_id: str | None = None) -> Any:
+		return {}
+
+	async def release_object_group(self, params: dict, session_id: str | None = None) -> Any:
+		return {}
+
+
+async def test_streamed_downloads_wait_for_a_free_slot(session, tmp_path: Path):
+	watchdog, _, _ = collect(session)
+	browser = GatedBrowser()
+	cdp_session = create_cdp_session(browser)
+
+	first = asyncio.create_task(watchdog._stream_download(cdp_session, 'https://example.com/1', tmp_path / '1.txt'))
+	second = asyncio.create_task(watchdog._stream_download(cdp_session, 'https://example.com/2', tmp_path / '2.txt'))
+	await asyncio.sleep(0.05)
+
+	# max_concurrent_downloads=1, the second download has not been fetched yet
+	assert [download.state for download in session.get_download_stats()] == ['in_progress', 'queued']
+	assert browser.fetches == 1
+
+	browser.release.set()
+	assert await asyncio.gather(first, second) == [(4, 'text/plain', False), (4, 'text/plain', False)]
+
+	first_stats, second_stats = session.get_download_stats()
+	assert first_stats.state == second_stats.state == 'completed'
+	assert second_stats.queued_ms >= 40
+	assert (tmp_path / '2.txt').read_bytes() == b'data'
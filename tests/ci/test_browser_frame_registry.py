@@ -0,0 +1,98 @@
+"""
+Tests for the cached frame hierarchy (browser_use.browser.frames.FrameRegistry) behind BrowserSession.get_all_frames().
+
+Feeds synthetic CDP Page/Target events into the registry, no browser needed.
+"""
+
+import asyncio
+
+from browser_use.browser.frames import FrameRegistry
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+
+
+def make_hierarchy() -> tuple[dict[str, dict], dict[str, str]]:
+	"""page (main) -> ad-frame -> nested-frame, and a cross-origin widget-frame with its own target."""
+	all_frames = {
+		'main': {'id': 'main', 'url': 'https://example.com/', 'frameTargetId': 'page', 'childFrameIds': ['ad-frame']},
+		'ad-frame': {
+			'id': 'ad-frame',
+			'parentId': 'main',
+			'url': 'https://example.com/ad',
+			'frameTargetId': 'page',
+			'parentFrameId': 'main',
+			'childFrameIds': ['nested-frame'],
+		},
+		'nested-frame': {
+			'id': 'nested-frame',
+			'parentId': 'ad-frame',
+			'frameTargetId': 'page',
+			'parentFrameId': 'ad-frame',
+			'childFrameIds': [],
+		},
+		'widget-frame': {'id': 'widget-frame', 'parentId': 'main', 'frameTargetId': 'widget', 'isCrossOrigin': True},
+	}
+	return all_frames, {'page': 'page-session', 'widget': 'widget-session'}
+
+
+def test_child_frame_events_patch_the_cached_hierarchy():
+	registry = FrameRegistry()
+	registry.store(make_hierarchy(), registry.generation)
+
+	registry.on_frame_navigated(
+		{'frame': {'id': 'ad-frame', 'parentId': 'main', 'url': 'https://example.com/ad2'}}, 'page-session'
+	)
+	hierarchy = registry.get()
+	assert hierarchy is not None
+	all_frames, _ = hierarchy
+	assert all_frames['ad-frame']['url'] == 'https://example.com/ad2'
+	assert all_frames['ad-frame']['frameTargetId'] == 'page'
+
+	registry.on_frame_detached({'frameId': 'ad-frame', 'reason': 'remove'}, 'page-session')
+	assert registry.get() is hierarchy
+	assert set(all_frames) == {'main', 'widget-frame'}
+	assert all_frames['main']['childFrameIds'] == []
+
+
+def test_structural_events_drop_the_cache():
+	events = [
+		(FrameRegistry.on_frame_attached, {'frameId': 'new-frame', 'parentFrameId': 'main'}),
+		(FrameRegistry.on_frame_detached, {'frameId': 'ad-frame', 'reason': 'swap'}),
+		(FrameRegistry.on_frame_navigated, {'frame': {'id': 'main', 'url': 'https://example.com/next'}}),
+		(FrameRegistry.on_attached_to_target, {'sessionId': 'new-session', 'targetInfo': {'targetId': 'new'}}),
+		(FrameRegistry.on_detached_from_target, {'sessionId': 'widget-session'}),
+	]
+	for handler, event in events:
+		registry = FrameRegistry()
+		registry.store(make_hierarchy(), registry.generation)
+		handler(registry, event, 'page-session')
+		assert registry.get() is None, handler.__name__
+
+	# a rebuild that raced with a frame change is not cached
+	registry = FrameRegistry()
+	generation = registry.generation
+	registry.on_frame_attached({'frameId': 'new-frame', 'parentFrameId': 'main'}, 'page-session')
+	registry.store(make_hierarchy(), generation)
+	assert registry.get() is None
+
+
+async def test_get_all_frames_only_walks_targets_after_frame_changes(monkeypatch):
+	builds = 0
+
+	async def build_all_frames(self):
+		nonlocal builds
+		builds += 1
+		await asyncio.sleep(0)
+		return make_hierarchy()
+
+	monkeypatch.setattr(BrowserSession, '_build_all_frames', build_all_frames)
+	session = BrowserSession(browser_profile=BrowserProfile(cross_origin_iframes=True))
+
+	first = await session.get_all_frames()
+	assert await session.get_all_frames() is first
+	assert await session.get_all_frames() is first
+	assert builds == 1
+
+	session._frame_registry.on_frame_attached({'frameId': 'new-frame', 'parentFrameId': 'main'}, 'page-session')
+	await session.get_all_frames()
+	assert builds == 2
@@ -0,0 +1,61 @@
+"""
+Tests for event-driven network idle detection (browser_use.browser.network_idle).
+
+Feeds synthetic CDP Network/Page events into the tracker, no browser needed.
+"""
+
+import asyncio
+import time
+
+from browser_use.browser.network_idle import NetworkIdleTracker, is_ignored_request
+
+
+def request_event(request_id: str, url: str, resource_type: str = 'XHR') -> dict:
+	return {'requestId': request_id, 'request': {'url': url}, 'type': resource_type}
+
+
+def test_ignore_rules():
+	assert is_ignored_request('https://www.google-analytics.com/g/collect?v=2')
+	assert is_ignored_request('https://example.com/chat/longpoll?cursor=1')
+	assert is_ignored_request('wss://example.com/socket', 'WebSocket')
+	assert is_ignored_request('https://example.com/events', 'EventSource')
+	assert is_ignored_request('data:image/png;base64,AAAA', 'Image')
+	assert not is_ignored_request('https://example.com/api/products', 'Fetch')
+
+
+async def test_wait_returns_once_requests_finish():
+	tracker = NetworkIdleTracker()
+	tracker.track('session', 'target')
+	tracker.on_request_will_be_sent(request_event('1', 'https://example.com/api/items'), 'session')
+	tracker.on_request_will_be_sent(request_event('2', 'https://www.googletagmanager.com/gtm.js', 'Script'), 'session')
+	tracker.on_request_will_be_sent(request_event('3', 'https://other.com/api', 'Fetch'), 'other-session')
+	assert tracker.pending_requests('session') == 1
+
+	async def finish_later():
+		await asyncio.sleep(0.2)
+		tracker.on_loading_finished({'requestId': '1'}, 'session')
+
+	started = time.monotonic()
+	finisher = asyncio.create_task(finish_later())
+	assert await tracker.wait_for_idle('session', timeout=3.0, quiet_period=0.05)
+	elapsed = time.monotonic() - started
+	await finisher
+
+	assert 0.2 <= elapsed < 1.0
+	assert not tracker.is_busy('session')
+
+
+async def test_wait_is_capped_while_page_is_loading():
+	tracker = NetworkIdleTracker()
+	tracker.track('session', 'target')
+	tracker.on_lifecycle_event({'frameId': 'target', 'name': 'init'}, 'session')
+	tracker.on_lifecycle_event({'frameId': 'child-frame', 'name': 'DOMContentLoaded'}, 'session')
+	assert tracker.is_busy('session')
+
+	started = time.monotonic()
+	assert not await tracker.wait_for_idle('session', timeout=0.2, quiet_period=0.05)
+	assert 0.2 <= time.monotonic() - started < 0.5
+
+	tracker.on_lifecycle_event({'frameId': 'target', 'name': 'DOMContentLoaded'}, 'session')
+	assert not tracker.is_busy('session')
+	assert await tracker.wait_for_idle('session', timeout=1.0, quiet_period=0.05)
@@ -0,0 +1,90 @@
+"""
+Tests for the per-step node handle cache of BrowserSession.get_node_handle.
+
+Uses a fake CDP client that counts the commands it receives, no browser needed.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from browser_use.browser.node_handles import NODE_HANDLE_OBJECT_GROUP
+from tests.ci.conftest import connect_fake_browser, create_dom_node
+
+
+class FakeBrowser:
+	"""DOM and Runtime domains of a page, hands out a new object id for every DOM.resolveNode"""
+
+	def __init__(self):
+		self.resolved: list[dict] = []
+		self.released: list[tuple[str, str | None]] = []
+		self.DOM = SimpleNamespace(resolveNode=self.resolve_node)
+		self.Runtime = SimpleNamespace(releaseObjectGroup=self.release_object_group)
+
+	async def resolve_node(self, params: dict, session_id: str | None = None) -> Any:
+		self.resolved.append(params)
+		return {'object': {'objectId': f'object-{len(self.resolved)}'}}
+
+	async def release_object_group(self, params: dict, session_id: str | None = None) -> Any:
+		self.released.append((params['objectGroup'], session_id))
+		return {}
+
+
+@pytest.fixture
+def browser(session, monkeypatch) -> FakeBrowser:
+	browser = FakeBrowser()
+	connect_fake_browser(browser, monkeypatch)
+	return browser
+
+
+async def test_node_is_resolved_once_per_step(session, browser):
+	node = create_dom_node()
+	cdp_session = await session.cdp_client_for_node(node)
+	handle = await session.get_node_handle(node)
+
+	assert handle.cdp_session is cdp_session
+	assert handle.object_id == 'object-1'
+	assert browser.resolved == [{'backendNodeId': 1, 'objectGroup': NODE_HANDLE_OBJECT_GROUP}]
+
+	await session.get_node_handle(create_dom_node(backend_node_id=2))
+	assert len(browser.resolved) == 2
+
+
+async def test_handles_are_dropped_when_the_dom_is_rebuilt_or_the_page_navigates(session, browser):
+	node = create_dom_node()
+	await session.get_node_handle(node)
+
+	session.update_cached_selector_map({})
+	assert (await session.get_node_handle(node)).object_id == 'object-2'
+
+	session._node_handles.on_execution_context_gone({'executionContextId': 1}, session_id='other-session')
+	assert (await session.get_node_handle(node)).object_id == 'object-2'
+
+	session._node_handles.on_execution_context_gone({'executionContextId': 1}, session_id='session')
+	assert (await session.get_node_handle(node)).object_id == 'object-3'
+
+
+async def test_release_frees_the_object_group_once_per_session(session, browser):
+	await session.get_node_handle(create_dom_node(backend_node_id=1))
+	await session.get_node_handle(create_dom_node(backend_node_id=2))
+	session.update_cached_selector_map({})
+	await session.get_node_handle(create_dom_node(backend_node_id=1))
+
+	await session.release_node_handles()
+	assert browser.released == [(NODE_HANDLE_OBJECT_GROUP, 'session')]
+
+	# nothing resolved since, nothing to release
+	await session.release_node_handles()
+	assert len(browser.released) == 1
+	assert (await session.get_node_handle(create_dom_node(backend_node_id=1))).object_id == 'object-4'
+
+
+async def test_prefetched_handles_are_used_by_the_actions(session, browser):
+	nodes = [create_dom_node(backend_node_id=1), create_dom_node(backend_node_id=2), create_dom_node(backend_node_id=3)]
+
+	assert await session.prefetch_node_handles(nodes) == 3
+	assert len(browser.resolved) == 3
+
+	await session.get_node_handle(nodes[0])
+	assert len(browser.resolved) == 3
@@ -0,0 +1,115 @@
+"""
+Tests for the screenshot capture settings (BrowserProfile.screenshot_*) and the shared Screenshot buffer.
+
+Uses a fake CDP client, no browser needed.
+"""
+
+import base64
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.events import ScreenshotEvent
+from browser_use.browser.profile import BrowserProfile, ScreenshotClip
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary, Screenshot
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog, get_capture_region
+from browser_use.dom.views import SerializedDOMState
+
+JPEG_B64 = base64.b64encode(b'\xff\xd8\xff\xe0' + b'\x00' * 32).decode()
+
+# 1280x720 CSS pixels on a 2x display, scrolled down by 400px
+LAYOUT_METRICS: Any = {
+	'cssVisualViewport': {'clientWidth': 1280, 'clientHeight': 720, 'pageX': 0, 'pageY': 400},
+	'visualViewport': {'clientWidth': 2560, 'clientHeight': 1440},
+}
+
+
+class FakePage:
+	def __init__(self):
+		self.capture_params: list[dict] = []
+
+	async def getLayoutMetrics(self, session_id: str | None = None) -> Any:
+		return LAYOUT_METRICS
+
+	async def captureScreenshot(self, params: dict, session_id: str | None = None) -> Any:
+		self.capture_params.append(params)
+		return {'data': JPEG_B64}
+
+
+def make_watchdog(profile: BrowserProfile) -> tuple[ScreenshotWatchdog, FakePage]:
+	session = BrowserSession(browser_profile=profile)
+	page = FakePage()
+	cdp_session = SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Page=page)), session_id='session')
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	async def remove_highlights():
+		pass
+
+	object.__setattr__(session, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	object.__setattr__(session, 'remove_highlights', remove_highlights)
+	return ScreenshotWatchdog(event_bus=session.event_bus, browser_session=session), page
+
+
+def test_capture_region_clips_and_downscales_in_document_coordinates():
+	cdp_clip, region = get_capture_region(LAYOUT_METRICS, None, max_dimension=1280)
+	assert cdp_clip == {'x': 0, 'y': 400, 'width': 1280, 'height': 720, 'scale': 0.5}
+	assert region == ScreenshotClip(x=0, y=0, width=1280, height=720)
+
+	# regions reaching beyond the viewport are cut at its edge
+	cdp_clip, region = get_capture_region(LAYOUT_METRICS, ScreenshotClip(x=100, y=600, width=800, height=400), None)
+	assert cdp_clip == {'x': 100, 'y': 1000, 'width': 800, 'height': 120, 'scale': 1.0}
+	assert region == ScreenshotClip(x=100, y=600, width=800, height=120)
+
+
+async def test_screenshot_capture_follows_profile_settings():
+	watchdog, page = make_watchdog(BrowserProfile())
+	screenshot = await watchdog.capture_screenshot()
+	assert page.capture_params[0] == {'format': 'png', 'captureBeyondViewport': False}
+	assert screenshot.clip is None
+
+	profile = BrowserProfile(screenshot_format='jpeg', screenshot_quality=55, screenshot_max_dimension=640)
+	watchdog, page = make_watchdog(profile)
+	screenshot = await watchdog.capture_screenshot(ScreenshotClip(x=0, y=0, width=640, height=360))
+	params = page.capture_params[0]
+	assert params['format'] == 'jpeg'
+	assert params['quality'] == 55
+	assert params['clip'] == {'x': 0, 'y': 400, 'width': 640, 'height': 360, 'scale': 0.5}
+	assert screenshot.clip == ScreenshotClip(x=0, y=0, width=640, height=360)
+	assert screenshot.media_type == 'image/jpeg'
+
+
+async def test_screenshot_event_returns_base64():
+	watchdog, page = make_watchdog(BrowserProfile(screenshot_max_dimension=640))
+	screenshot_b64 = await watchdog.on_ScreenshotEvent(ScreenshotEvent(clip={'x': 0, 'y': 0, 'width': 640, 'height': 360}))
+
+	assert screenshot_b64 == JPEG_B64
+	assert page.capture_params[0]['clip'] == {'x': 0, 'y': 400, 'width': 640, 'height': 360, 'scale': 0.5}
+
+
+def test_base64_is_only_built_when_serialized():
+	screenshot = Screenshot.from_base64(JPEG_B64)
+	assert screenshot._b64 is None
+	assert screenshot.data[:2] == b'\xff\xd8'
+
+	state = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}), url='', title='', tabs=[], screenshot_data=screenshot
+	)
+	assert screenshot._b64 is None
+	assert state.screenshot == JPEG_B64
+	assert state.screenshot is screenshot.b64
+
+	state.screenshot = None
+	assert state.screenshot_data is None
+
+
+def test_state_summary_still_accepts_a_base64_screenshot():
+	dom_state = SerializedDOMState(_root=None, selector_map={})
+
+	state = BrowserStateSummary(dom_state=dom_state, url='', title='', tabs=[], screenshot=JPEG_B64)
+	assert state.screenshot_data is not None and state.screenshot_data.data[:2] == b'\xff\xd8'
+	assert state.screenshot == JPEG_B64
+	assert 'screenshot' not in repr(state)
+
+	assert BrowserStateSummary(dom_state=dom_state, url='', title='', tabs=[], screenshot='').screenshot is None
@@ -0,0 +1,94 @@
+"""
+Tests for the live target table (browser_use.browser.targets.TargetTable) behind BrowserSession.get_tabs().
+
+Feeds synthetic CDP Target discovery events into the table, no browser needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.targets import TargetTable
+
+
+def target(target_id: str, url: str, title: str = '', target_type: str = 'page') -> dict:
+	return {'targetId': target_id, 'type': target_type, 'url': url, 'title': title, 'attached': True, 'canAccessOpener': False}
+
+
+class FakeGetTargets:
+	"""Stands in for Target.getTargets, counts calls and lets the test fire events while a call is in flight."""
+
+	def __init__(self, targets: list[dict]):
+		self.targets = targets
+		self.calls = 0
+		self.release = asyncio.Event()
+
+	async def __call__(self) -> Any:
+		self.calls += 1
+		await self.release.wait()
+		return {'targetInfos': list(self.targets)}
+
+
+async def test_stale_table_is_loaded_once_for_concurrent_callers():
+	table = TargetTable()
+	table.start_discovery()
+	get_targets = FakeGetTargets([target('a', 'https://a.com', 'A'), target('b', 'https://b.com', 'B')])
+
+	waiters = [asyncio.create_task(table.get_targets(get_targets)) for _ in range(5)]
+	await asyncio.sleep(0)
+	# events that arrive while the listing is in flight are newer than the listing
+	table.on_target_info_changed({'targetInfo': target('a', 'https://a.com/next', 'A next')})
+	table.on_target_destroyed({'targetId': 'b'})
+	table.on_target_created({'targetInfo': target('c', 'https://c.com', 'C')})
+	get_targets.release.set()
+	results = await asyncio.gather(*waiters)
+
+	assert get_targets.calls == 1
+	assert all(result == results[0] for result in results)
+	assert [(t['targetId'], t['title']) for t in results[0]] == [('a', 'A next'), ('c', 'C')]
+	assert not table.is_stale
+
+
+async def test_events_keep_the_table_current_without_listing_again():
+	table = TargetTable()
+	table.start_discovery()
+	get_targets = FakeGetTargets([target('a', 'https://a.com', 'A')])
+	get_targets.release.set()
+	await table.get_targets(get_targets)
+
+	table.on_target_created({'targetInfo': target('b', 'about:blank')})
+	table.on_target_info_changed({'targetInfo': target('b', 'https://b.com', 'B')})
+	table.on_target_destroyed({'targetId': 'a'})
+	assert [(t['targetId'], t['title']) for t in await table.get_targets(get_targets)] == [('b', 'B')]
+	assert get_targets.calls == 1
+
+	# without discovery events every lookup lists the targets again
+	table.clear()
+	await table.get_targets(get_targets)
+	await table.get_targets(get_targets)
+	assert get_targets.calls == 3
+
+
+async def test_get_tabs_reads_titles_from_the_table():
+	get_targets = FakeGetTargets(
+		[
+			target('page', 'https://example.com', 'Example'),
+			target('frame', 'https://ads.example.com', 'Ad', target_type='iframe'),
+			target('newtab', 'chrome://newtab/', 'New Tab'),
+			target('pdf', 'https://example.com/files/report.pdf'),
+		]
+	)
+	get_targets.release.set()
+	session = BrowserSession()
+	session._cdp_client_root = SimpleNamespace(send=SimpleNamespace(Target=SimpleNamespace(getTargets=get_targets)))  # type: ignore[assignment]
+	session._target_table.start_discovery()
+
+	tabs = await session.get_tabs()
+	assert [(tab.target_id, tab.title) for tab in tabs] == [
+		('page', 'Example'),
+		('newtab', 'ignore this tab and do not use it'),
+		('pdf', 'report.pdf'),
+	]
+	await session.get_tabs()
+	assert get_targets.calls == 1
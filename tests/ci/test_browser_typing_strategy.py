@@ -0,0 +1,136 @@
+"""
+Tests for the typing strategies of DefaultActionWatchdog._input_text_element_node_impl.
+
+Uses a fake CDP client that records the commands it receives, no browser needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog, _pick_typing_strategy
+from browser_use.dom.views import EnhancedDOMTreeNode
+from tests.ci.conftest import connect_fake_browser, create_dom_node
+
+
+class FakeBrowser:
+	"""DOM, Runtime and Input domains of a page with one text field, records the commands it receives"""
+
+	def __init__(self, has_value: bool = True, key_event_latency: float = 0.0):
+		self.has_value = has_value
+		self.key_event_latency = key_event_latency
+		self.commands: list[tuple[str, Any]] = []
+		self.typed = ''
+		self.key_events_in_flight = 0
+		self.max_key_events_in_flight = 0
+		self.DOM = SimpleNamespace(scrollIntoViewIfNeeded=self.ignore, resolveNode=self.resolve_node, focus=self.ignore)
+		self.Runtime = SimpleNamespace(callFunctionOn=self.call_function_on, releaseObjectGroup=self.ignore)
+		self.Input = SimpleNamespace(insertText=self.insert_text, dispatchKeyEvent=self.dispatch_key_event)
+
+	async def ignore(self, params: dict, session_id: str | None = None) -> Any:
+		return {}
+
+	async def resolve_node(self, params: dict, session_id: str | None = None) -> Any:
+		return {'object': {'objectId': 'field'}}
+
+	async def call_function_on(self, params: dict, session_id: str | None = None) -> Any:
+		self.commands.append(('Runtime.callFunctionOn', params.get('arguments')))
+		if 'arguments' in params:
+			if not self.has_value:
+				return {'result': {'type': 'boolean', 'value': False}}
+			text, append = (argument['value'] for argument in params['arguments'])
+			self.typed = self.typed + text if append else text
+			return {'result': {'type': 'boolean', 'value': True}}
+		return {'result': {'type': 'string', 'value': ''}}
+
+	async def insert_text(self, params: dict, session_id: str | None = None) -> Any:
+		self.commands.append(('Input.insertText', params['text']))
+		self.typed += params['text']
+		return {}
+
+	async def dispatch_key_event(self, params: dict, session_id: str | None = None) -> Any:
+		self.commands.append(('Input.dispatchKeyEvent', params['type']))
+		self.key_events_in_flight += 1
+		self.max_key_events_in_flight = max(self.max_key_events_in_flight, self.key_events_in_flight)
+		await asyncio.sleep(self.key_event_latency)
+		self.key_events_in_flight -= 1
+		if params['type'] == 'char':
+			self.typed += params['text']
+		return {}
+
+
+async def type_into(
+	session: BrowserSession, browser: FakeBrowser, node: EnhancedDOMTreeNode, text: str, monkeypatch, clear_existing: bool = False
+) -> None:
+	cdp_session = connect_fake_browser(browser, monkeypatch)
+
+	async def get_current_page_url(self):
+		return 'https://shop.example.com/checkout'
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page_url', get_current_page_url)
+	session._cdp_client_root = cdp_session.cdp_client
+	watchdog = DefaultActionWatchdog(event_bus=session.event_bus, browser_session=session)
+	await watchdog._input_text_element_node_impl(node, text, clear_existing=clear_existing)
+	# every call is its own agent step
+	await session.release_node_handles()
+
+
+@pytest.mark.parametrize(
+	'tag_name, attributes, strategy',
+	[
+		('input', {}, 'insert_text'),
+		('input', {'type': 'email'}, 'insert_text'),
+		('textarea', {}, 'insert_text'),
+		('div', {'contenteditable': 'true'}, 'insert_text'),
+		('input', {'type': 'date'}, 'set_value'),
+		('input', {'type': 'range'}, 'set_value'),
+		('input', {'role': 'combobox'}, 'pipelined_keys'),
+		('input', {'aria-autocomplete': 'list'}, 'pipelined_keys'),
+		('input', {'list': 'cities'}, 'pipelined_keys'),
+		('div', {}, 'keystrokes'),
+		('custom-editor', {'contenteditable': 'false'}, 'keystrokes'),
+	],
+)
+def test_auto_strategy_follows_element_type(tag_name, attributes, strategy):
+	assert _pick_typing_strategy(create_dom_node(tag_name, attributes)) == strategy
+
+
+async def test_text_inputs_get_the_text_in_one_call(session, monkeypatch):
+	browser = FakeBrowser()
+	await type_into(session, browser, create_dom_node('textarea'), 'x' * 2000, monkeypatch)
+
+	assert browser.commands == [('Input.insertText', 'x' * 2000)]
+
+
+async def test_set_value_replaces_the_value_and_falls_back_to_insert_text(session, monkeypatch):
+	browser = FakeBrowser()
+	await type_into(session, browser, create_dom_node('input', {'type': 'date'}), '2025-01-31', monkeypatch, clear_existing=True)
+	assert browser.typed == '2025-01-31'
+	assert ('Runtime.callFunctionOn', [{'value': '2025-01-31'}, {'value': False}]) in browser.commands
+
+	session.browser_profile.typing_strategy = 'set_value'
+	browser = FakeBrowser(has_value=False)
+	await type_into(session, browser, create_dom_node('div', {'contenteditable': 'true'}), 'hello', monkeypatch)
+	assert browser.commands[-1] == ('Input.insertText', 'hello')
+
+
+async def test_pipelined_keys_keep_several_events_in_flight_in_order(session, monkeypatch):
+	browser = FakeBrowser(key_event_latency=0.01)
+	await type_into(session, browser, create_dom_node('input', {'role': 'combobox'}), 'Berlin', monkeypatch)
+
+	assert browser.typed == 'Berlin'
+	assert [command for _, command in browser.commands] == ['keyDown', 'char', 'keyUp'] * 6
+	assert browser.max_key_events_in_flight == 18
+
+
+async def test_domain_override_forces_keystrokes(session, monkeypatch):
+	session.browser_profile.typing_strategy_overrides = {'*.example.com': 'keystrokes'}
+	browser = FakeBrowser()
+	await type_into(session, browser, create_dom_node('textarea'), 'Hi!', monkeypatch)
+
+	assert browser.typed == 'Hi!'
+	assert [command for _, command in browser.commands] == ['keyDown', 'char', 'keyUp'] * 3
+	assert browser.max_key_events_in_flight == 1
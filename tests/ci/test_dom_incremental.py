@@ -0,0 +1,155 @@
+"""
+Tests for the incremental DOM tree patching (browser_use.dom.incremental).
+
+The patcher is fed the same event payloads Chrome sends over CDP and must keep the cached
+enhanced tree identical to what a full rebuild would produce, or report that it can't.
+"""
+
+from browser_use.dom.incremental import DOMMutationLog, DOMTreePatcher, IncrementalTreeState
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+
+def make_node(
+	node_id: int, node_name: str, node_type: NodeType = NodeType.ELEMENT_NODE, node_value: str = ''
+) -> EnhancedDOMTreeNode:
+	return EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id + 1000,
+		node_type=node_type,
+		node_name=node_name,
+		node_value=node_value,
+		attributes={},
+		is_scrollable=None,
+		is_visible=None,
+		absolute_position=None,
+		target_id='target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+	)
+
+
+def make_state(log_limit: int = 100) -> IncrementalTreeState:
+	"""<html id=10><body id=11><div id=12/><span id=13>text id=14</span></body></html>"""
+	html, body, div, span = make_node(10, 'HTML'), make_node(11, 'BODY'), make_node(12, 'DIV'), make_node(13, 'SPAN')
+	text = make_node(14, '#text', NodeType.TEXT_NODE, 'hello')
+	html.children_nodes = [body]
+	body.children_nodes = [div, span]
+	span.children_nodes = [text]
+	body.parent_node = html
+	div.parent_node = body
+	span.parent_node = body
+	text.parent_node = span
+	lookup = {node.node_id: node for node in (html, body, div, span, text)}
+	return IncrementalTreeState(
+		target_id='target',
+		session_id='session',
+		root=html,
+		node_lookup=lookup,
+		log=DOMMutationLog(limit=log_limit),
+		min_node_id=10,
+	)
+
+
+def make_patcher(state: IncrementalTreeState) -> DOMTreePatcher:
+	def build_subtree(raw_node, parent):
+		node = make_node(raw_node['nodeId'], raw_node['nodeName'], NodeType(raw_node['nodeType']), raw_node['nodeValue'])
+		node.parent_node = parent
+		state.node_lookup[node.node_id] = node
+		return node
+
+	return DOMTreePatcher(state, build_subtree)
+
+
+def raw_node(node_id: int, node_name: str, child_node_count: int = 0) -> dict:
+	return {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': NodeType.ELEMENT_NODE.value,
+		'nodeName': node_name,
+		'localName': node_name.lower(),
+		'nodeValue': '',
+		'childNodeCount': child_node_count,
+	}
+
+
+def test_mutation_log_overflow_and_document_updated():
+	log = DOMMutationLog(limit=2)
+	log.record('DOM.attributeModified', {'nodeId': 12, 'name': 'a', 'value': '1'})
+	log.record('DOM.attributeModified', {'nodeId': 12, 'name': 'b', 'value': '2'})
+	assert not log.needs_full_rebuild
+	log.record('DOM.attributeModified', {'nodeId': 12, 'name': 'c', 'value': '3'})
+	assert log.needs_full_rebuild
+	assert log.drain() == []
+
+	log.reset()
+	log.record('DOM.attributeRemoved', {'nodeId': 12, 'name': 'a'})
+	log.record('DOM.documentUpdated', {})
+	assert log.needs_full_rebuild
+	assert log.drain() == []
+
+
+def test_patcher_applies_attribute_and_text_changes():
+	state = make_state()
+	patcher = make_patcher(state)
+
+	assert patcher.apply(
+		[
+			('DOM.attributeModified', {'nodeId': 12, 'name': 'class', 'value': 'open'}),
+			('DOM.attributeModified', {'nodeId': 13, 'name': 'title', 'value': 'x'}),
+			('DOM.attributeRemoved', {'nodeId': 13, 'name': 'title'}),
+			('DOM.characterDataModified', {'nodeId': 14, 'characterData': 'bye'}),
+		]
+	)
+
+	assert state.node_lookup[12].attributes == {'class': 'open'}
+	assert state.node_lookup[13].attributes == {}
+	assert state.node_lookup[14].node_value == 'bye'
+	# the text node and its parent element (accessible name) need new AX data
+	assert {1012, 1013, 1014} <= state.dirty_backend_node_ids
+
+
+def test_patcher_inserts_and_removes_nodes_in_order():
+	state = make_state()
+	patcher = make_patcher(state)
+
+	assert patcher.apply(
+		[
+			('DOM.childNodeInserted', {'parentNodeId': 11, 'previousNodeId': 12, 'node': raw_node(20, 'BUTTON')}),
+			('DOM.childNodeInserted', {'parentNodeId': 11, 'previousNodeId': 0, 'node': raw_node(21, 'NAV', child_node_count=3)}),
+			('DOM.childNodeRemoved', {'parentNodeId': 11, 'nodeId': 13}),
+		]
+	)
+
+	body = state.node_lookup[11]
+	assert body.children_nodes is not None
+	assert [child.node_id for child in body.children_nodes] == [21, 12, 20]
+	assert state.node_lookup[20].parent_node is body
+	# removed subtree is forgotten, including its descendants
+	assert 13 not in state.node_lookup and 14 not in state.node_lookup
+	# the inserted NAV came without its children, they have to be requested
+	assert patcher.pending_child_requests == {21}
+
+	assert patcher.apply([('DOM.setChildNodes', {'parentId': 21, 'nodes': [raw_node(22, 'A'), raw_node(23, 'A')]})])
+	nav = state.node_lookup[21]
+	assert nav.children_nodes is not None
+	assert [child.node_id for child in nav.children_nodes] == [22, 23]
+	assert patcher.pending_child_requests == set()
+
+
+def test_patcher_ignores_stale_and_rejects_unknown_nodes():
+	state = make_state()
+	patcher = make_patcher(state)
+
+	# ids lower than the current document's were issued before our DOM.getDocument call
+	assert patcher.apply([('DOM.attributeModified', {'nodeId': 3, 'name': 'class', 'value': 'x'})])
+	# ids we never saw mean the cached tree is out of sync
+	assert not patcher.apply([('DOM.attributeModified', {'nodeId': 99, 'name': 'class', 'value': 'x'})])
+	# so does an insertion after a sibling we don't know about
+	assert not patcher.apply([('DOM.childNodeInserted', {'parentNodeId': 11, 'previousNodeId': 98, 'node': raw_node(30, 'P')})])
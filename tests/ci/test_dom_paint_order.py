@@ -0,0 +1,47 @@
+"""
+Tests for the rectangle union backends used by paint order filtering.
+"""
+
+import random
+
+from browser_use.dom.serializer.paint_order import Rect, RectUnionGrid, RectUnionPure, create_rect_union
+
+
+def random_rect(rng: random.Random, max_size: float) -> Rect:
+	x, y = rng.uniform(-100, 2000), rng.uniform(-100, 4000)
+	return Rect(x, y, x + rng.uniform(0, max_size), y + rng.uniform(0, max_size))
+
+
+def test_grid_union_matches_flat_union():
+	rng = random.Random(1234)
+	pure, grid = RectUnionPure(), RectUnionGrid(cell_size=64)
+
+	for i in range(1500):
+		# mostly small rects with a few huge ones (page backgrounds, overlays) and some degenerate ones
+		max_size = 5000 if i % 97 == 0 else 300
+		rect = random_rect(rng, max_size)
+		if i % 50 == 0:
+			rect = Rect(rect.x1, rect.y1, rect.x1, rect.y2)
+
+		assert pure.contains(rect) == grid.contains(rect)
+		assert pure.add(rect) == grid.add(rect)
+
+	assert pure._rects == grid._rects
+
+
+def test_union_contains_requires_full_coverage():
+	union = RectUnionGrid(cell_size=10)
+	union.add(Rect(0, 0, 50, 50))
+	union.add(Rect(50, 0, 100, 50))
+
+	assert union.contains(Rect(10, 10, 90, 40))
+	assert union.contains(Rect(50, 0, 50, 50))  # zero-width rect on the shared edge
+	assert not union.contains(Rect(10, 10, 90, 60))
+	assert not union.add(Rect(0, 0, 100, 50))
+	assert union.add(Rect(0, 0, 100, 60))
+	assert union.contains(Rect(0, 0, 100, 60))
+
+
+def test_create_rect_union_picks_backend_by_count():
+	assert type(create_rect_union(10)) is RectUnionPure
+	assert type(create_rect_union(10_000)) is RectUnionGrid
@@ -0,0 +1,133 @@
+"""
+Tests for serializing the simplified DOM tree under a character budget (DOMTreeSerializer.serialize_tree_with_budget).
+"""
+
+import random
+
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.views import (
+	DEFAULT_INCLUDE_ATTRIBUTES,
+	DOMRect,
+	EnhancedDOMTreeNode,
+	EnhancedSnapshotNode,
+	NodeType,
+	SimplifiedNode,
+)
+
+
+def make_node(
+	node_id: int,
+	node_type: NodeType,
+	node_name: str,
+	node_value: str = '',
+	attributes: dict[str, str] | None = None,
+	visible: bool = True,
+	children: list[SimplifiedNode] | None = None,
+	interactive_index: int | None = None,
+) -> SimplifiedNode:
+	bounds = DOMRect(0, node_id * 20 if visible else 5000 + node_id * 20, 100, 20)
+	snapshot_node = EnhancedSnapshotNode(
+		is_clickable=None,
+		cursor_style=None,
+		bounds=bounds,
+		clientRects=None,
+		scrollRects=None,
+		computed_styles={},
+		paint_order=None,
+		stacking_contexts=None,
+	)
+	original_node = EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id,
+		node_type=node_type,
+		node_name=node_name,
+		node_value=node_value,
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=visible,
+		absolute_position=bounds,
+		target_id='target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot_node,
+	)
+	return SimplifiedNode(original_node=original_node, children=children or [], interactive_index=interactive_index)
+
+
+def make_page(seed: int = 0, sections: int = 30) -> SimplifiedNode:
+	rng = random.Random(seed)
+	node_ids = iter(range(1, 100_000))
+	interactive_indices = iter(range(1, 100_000))
+	section_nodes = []
+	for section in range(sections):
+		visible = section < 3
+		children = [make_node(next(node_ids), NodeType.TEXT_NODE, '#text', f'Section {section} heading', visible=visible)]
+		for _ in range(rng.randint(1, 5)):
+			link = make_node(
+				next(node_ids),
+				NodeType.ELEMENT_NODE,
+				'a',
+				attributes={'title': f'link {rng.random():.4f}'},
+				visible=visible,
+				children=[make_node(next(node_ids), NodeType.TEXT_NODE, '#text', 'Read more', visible=visible)],
+				interactive_index=next(interactive_indices),
+			)
+			link.is_new = rng.random() < 0.2
+			children.append(link)
+		section_node = make_node(next(node_ids), NodeType.ELEMENT_NODE, 'div', visible=visible, children=children)
+		section_node.should_display = rng.random() < 0.5
+		section_node.excluded_by_parent = rng.random() < 0.1
+		section_nodes.append(section_node)
+	return make_node(0, NodeType.DOCUMENT_NODE, '#document', children=section_nodes)
+
+
+def test_document_order_budget_matches_truncated_full_output():
+	root = make_page()
+	full_text = DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+	assert '[1]<a title=' in full_text and '\tRead more' in full_text
+
+	for max_length in [0, 1, 17, 250, 1000, len(full_text) - 1, len(full_text), len(full_text) + 50]:
+		text, truncated = DOMTreeSerializer.serialize_tree_with_budget(root, DEFAULT_INCLUDE_ATTRIBUTES, max_length)
+		assert text == full_text[:max_length]
+		assert truncated == (len(full_text) > max_length)
+
+
+def test_serialization_stops_once_budget_is_used(monkeypatch):
+	root = make_page(sections=500)
+	calls = 0
+	build_attributes_string = DOMTreeSerializer._build_attributes_string
+
+	def counting_build_attributes_string(*args):
+		nonlocal calls
+		calls += 1
+		return build_attributes_string(*args)
+
+	monkeypatch.setattr(DOMTreeSerializer, '_build_attributes_string', staticmethod(counting_build_attributes_string))
+
+	DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+	full_calls, calls = calls, 0
+	DOMTreeSerializer.serialize_tree_with_budget(root, DEFAULT_INCLUDE_ATTRIBUTES, 500)
+	assert calls < full_calls / 20
+
+
+def test_interactive_priority_keeps_all_links_within_budget():
+	root = make_page()
+	full_text = DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+	link_lines = [line for line in full_text.split('\n') if ']<a' in line]
+	budget = sum(len(line) + 1 for line in link_lines)
+
+	text, truncated = DOMTreeSerializer.serialize_tree_with_budget(root, DEFAULT_INCLUDE_ATTRIBUTES, budget, 'interactive')
+	assert truncated
+	assert len(text) <= budget
+	assert text.split('\n')[: len(link_lines)] == link_lines
+
+	# viewport priority keeps the visible sections (headings included) ahead of off-screen links
+	text, _ = DOMTreeSerializer.serialize_tree_with_budget(root, DEFAULT_INCLUDE_ATTRIBUTES, budget, 'viewport')
+	assert 'Section 0 heading' in text
+	assert 'Section 29 heading' not in text
@@ -0,0 +1,66 @@
+"""
+Tests for the columnar snapshot lookup built from DOMSnapshot.captureSnapshot results.
+"""
+
+from browser_use.dom.enhanced_snapshot import build_snapshot_lookup
+from browser_use.dom.views import DOMRect
+
+
+def make_snapshot() -> dict:
+	strings = ['block', 'visible', '1', 'pointer', 'none']
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'nodes': {'backendNodeId': [1, 2, 3], 'isClickable': {'index': [1]}},
+				'layout': {
+					'nodeIndex': [1, 2, 1],
+					'bounds': [[10, 20, 200, 100], [0, 0, 50, 50], [99, 99, 99, 99]],
+					'styles': [[0, 1, 2, -1, -1, -1, 3], [4, 1, 2], [0]],
+					'paintOrders': [5, 6, 7],
+					'clientRects': [[], [0, 0, 30, 40], []],
+					'scrollRects': [[], [], []],
+				},
+			},
+			{
+				# backend node 3 also shows up in an iframe document, the later document wins
+				'nodes': {'backendNodeId': [3]},
+				'layout': {'nodeIndex': [0], 'bounds': [[4, 4, 8, 8]], 'styles': [[0]], 'paintOrders': [1]},
+			},
+		],
+	}
+
+
+def test_snapshot_lookup_materializes_nodes_lazily():
+	lookup = build_snapshot_lookup(make_snapshot(), device_pixel_ratio=2.0)  # type: ignore[arg-type]
+
+	assert len(lookup) == 3
+	assert set(lookup) == {1, 2, 3}
+	assert lookup.get(42) is None
+
+	# node 1 has no layout node
+	node_1 = lookup[1]
+	assert node_1.bounds is None and node_1.paint_order is None and node_1.is_clickable is False
+
+	# node 2 uses the FIRST layout node that references it, bounds are converted to CSS pixels
+	node_2 = lookup[2]
+	assert node_2.is_clickable is True
+	assert node_2.bounds == DOMRect(x=5, y=10, width=100, height=50)
+	assert node_2.paint_order == 5
+	assert node_2.cursor_style == 'pointer'
+	assert node_2.computed_styles == {'display': 'block', 'visibility': 'visible', 'opacity': '1', 'cursor': 'pointer'}
+	assert node_2.clientRects is None
+
+	# same object on every access, callers adjust bounds in place
+	assert lookup[2] is node_2
+
+	node_3 = lookup[3]
+	assert node_3.bounds == DOMRect(x=2, y=2, width=4, height=4)
+	assert node_3.is_clickable is None
+	assert node_3.computed_styles == {'display': 'block'}
+
+
+def test_snapshot_lookup_empty_snapshot():
+	lookup = build_snapshot_lookup({'documents': [], 'strings': []})  # type: ignore[arg-type]
+	assert len(lookup) == 0
+	assert lookup.get(1) is None
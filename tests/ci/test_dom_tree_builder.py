@@ -0,0 +1,177 @@
+"""
+Tests for building the enhanced DOM tree from CDP payloads (DomService.get_dom_tree), fed with recorded-style
+getDocument / DOMSnapshot / AX responses instead of a live browser.
+"""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import NodeType, TargetAllTrees
+
+
+def raw_node(node_id: int, node_name: str, node_type: NodeType = NodeType.ELEMENT_NODE, **extra) -> dict:
+	return {
+		'nodeId': node_id,
+		'backendNodeId': node_id,
+		'nodeType': node_type.value,
+		'nodeName': node_name,
+		'localName': node_name.lower(),
+		'nodeValue': '',
+		**extra,
+	}
+
+
+def make_snapshot(layout: dict[int, list[float]], scroll: dict[int, list[float]] | None = None) -> dict:
+	"""Snapshot with one layout entry per backend node id in `layout` ({id: [x, y, width, height]})."""
+	backend_node_ids = sorted(layout)
+	scroll = scroll or {}
+	return {
+		'strings': ['block', 'visible', '1'],
+		'documents': [
+			{
+				'nodes': {'backendNodeId': backend_node_ids},
+				'layout': {
+					'nodeIndex': list(range(len(backend_node_ids))),
+					'bounds': [layout[i] for i in backend_node_ids],
+					'styles': [[0, 1, 2] for _ in backend_node_ids],
+					'clientRects': [[0, 0, 1000, 800] if i in scroll else [] for i in backend_node_ids],
+					'scrollRects': [scroll.get(i, []) for i in backend_node_ids],
+				},
+			}
+		],
+	}
+
+
+async def build_tree(root: dict, snapshot: dict):
+	dom_service = DomService(SimpleNamespace(agent_focus=None, logger=logging.getLogger('test')))  # type: ignore[arg-type]
+
+	async def get_all_trees(target_id):
+		return TargetAllTrees(
+			snapshot=snapshot,  # type: ignore[arg-type]
+			dom_tree={'root': root},  # type: ignore[arg-type]
+			ax_tree={'nodes': []},
+			device_pixel_ratio=1.0,
+			cdp_timing={},
+		)
+
+	dom_service._get_all_trees = get_all_trees  # type: ignore[method-assign]
+	return await dom_service.get_dom_tree(target_id='target')
+
+
+async def test_deep_documents_do_not_hit_the_recursion_limit():
+	depth = 5000
+	root = parent = raw_node(1, '#document', NodeType.DOCUMENT_NODE)
+	for node_id in range(2, depth + 2):
+		node = raw_node(node_id, 'DIV', parentId=parent['nodeId'])
+		parent['children'] = [node]
+		parent = node
+
+	tree = await build_tree(root, make_snapshot({node_id: [0, 0, 10, 10] for node_id in range(2, depth + 2)}))
+
+	node, levels = tree, 0
+	while node.children_nodes:
+		assert node.children_nodes[0].parent_node is node
+		node = node.children_nodes[0]
+		levels += 1
+	assert levels == depth
+	assert node.is_visible
+
+
+async def test_frames_offset_positions_and_link_nodes():
+	"""<html><body><iframe>#document<html (scrolled)><button/></html></iframe><my-widget>#shadow-root<a/></my-widget></body></html>"""
+	button = raw_node(8, 'BUTTON', parentId=7)
+	frame_html = raw_node(7, 'HTML', parentId=6, frameId='child-frame', children=[button])
+	frame_document = raw_node(6, '#document', NodeType.DOCUMENT_NODE, children=[frame_html])
+	iframe = raw_node(5, 'IFRAME', parentId=3, frameId='child-frame', contentDocument=frame_document)
+	link = raw_node(11, 'A', parentId=10)
+	shadow_root = raw_node(10, '#document-fragment', NodeType.DOCUMENT_FRAGMENT_NODE, shadowRootType='open', children=[link])
+	widget = raw_node(9, 'MY-WIDGET', parentId=3, shadowRoots=[shadow_root])
+	body = raw_node(3, 'BODY', parentId=2, children=[iframe, widget])
+	html = raw_node(2, 'HTML', parentId=1, frameId='main-frame', children=[body])
+	document = raw_node(1, '#document', NodeType.DOCUMENT_NODE, children=[html])
+
+	snapshot = make_snapshot(
+		{2: [0, 0, 1000, 3000], 3: [0, 0, 1000, 3000], 5: [100, 200, 400, 300], 7: [0, 0, 400, 300], 8: [10, 60, 50, 20]},
+		scroll={2: [0, 0, 1000, 3000], 7: [0, 50, 400, 1000]},
+	)
+	tree = await build_tree(document, snapshot)
+
+	html_node = tree.children_nodes[0]  # type: ignore[index]
+	body_node = html_node.children_nodes[0]  # type: ignore[index]
+	iframe_node, widget_node = body_node.children_nodes  # type: ignore[misc]
+	assert iframe_node.content_document is not None and iframe_node.content_document.parent_node is iframe_node
+	button_node = iframe_node.content_document.children_nodes[0].children_nodes[0]  # type: ignore[index]
+
+	# iframe position + button position - iframe document scroll
+	assert button_node.absolute_position is not None
+	assert (button_node.absolute_position.x, button_node.absolute_position.y) == (110, 210)
+	assert button_node.is_visible
+
+	assert widget_node.shadow_roots and widget_node.shadow_roots[0].parent_node is widget_node
+	assert widget_node.shadow_roots[0].children_nodes[0].tag_name == 'a'  # type: ignore[index]
+
+
+async def test_cross_origin_iframes_are_fetched_concurrently_within_budget():
+	"""Three cross-origin iframes: fetched two at a time, the one that hangs is dropped once the time budget is used."""
+	iframes = [raw_node(3 + i, 'IFRAME', parentId=2, frameId=f'frame-{i}') for i in range(3)]
+	body = raw_node(2, 'BODY', parentId=1, frameId='main-frame', children=iframes)
+	document = raw_node(1, '#document', NodeType.DOCUMENT_NODE, children=[body])
+	snapshot = make_snapshot({2: [0, 0, 1000, 3000], 3: [0, 0, 300, 300], 4: [0, 300, 300, 300], 5: [0, 600, 300, 300]})
+
+	frame_document = raw_node(1, '#document', NodeType.DOCUMENT_NODE, children=[raw_node(2, 'BUTTON', parentId=1)])
+	frame_snapshot = make_snapshot({2: [10, 10, 50, 20]})
+
+	async def get_all_frames():
+		return {f'frame-{i}': {'frameTargetId': f'iframe-target-{i}', 'isCrossOrigin': True} for i in range(3)}, {}
+
+	async def get_targets():
+		return {'targetInfos': [{'targetId': 'target'}] + [{'targetId': f'iframe-target-{i}'} for i in range(3)]}
+
+	fake_session = SimpleNamespace(
+		agent_focus=None,
+		logger=logging.getLogger('test'),
+		get_all_frames=get_all_frames,
+		cdp_client=SimpleNamespace(send=SimpleNamespace(Target=SimpleNamespace(getTargets=get_targets))),
+	)
+	dom_service = DomService(
+		fake_session,  # type: ignore[arg-type]
+		cross_origin_iframes=True,
+		max_concurrent_iframe_fetches=2,
+		iframe_fetch_timeout=0.5,
+	)
+
+	in_flight = max_in_flight = 0
+
+	async def get_all_trees(target_id):
+		nonlocal in_flight, max_in_flight
+		if target_id == 'target':
+			tree, tree_snapshot = document, snapshot
+		else:
+			in_flight += 1
+			max_in_flight = max(max_in_flight, in_flight)
+			try:
+				await asyncio.sleep(30 if target_id == 'iframe-target-1' else 0.05)
+			finally:
+				in_flight -= 1
+			tree, tree_snapshot = frame_document, frame_snapshot
+		return TargetAllTrees(
+			snapshot=tree_snapshot,  # type: ignore[arg-type]
+			dom_tree={'root': tree},  # type: ignore[arg-type]
+			ax_tree={'nodes': []},
+			device_pixel_ratio=1.0,
+			cdp_timing={},
+		)
+
+	dom_service._get_all_trees = get_all_trees  # type: ignore[method-assign]
+	started = time.monotonic()
+	tree = await dom_service.get_dom_tree(target_id='target')
+	assert time.monotonic() - started < 2
+
+	assert max_in_flight == 2
+	assert in_flight == 0  # the hanging fetch was cancelled
+	iframe_nodes = tree.children_nodes[0].children_nodes  # type: ignore[index]
+	assert [node.content_document is not None for node in iframe_nodes] == [True, False, True]  # type: ignore[union-attr]
+	assert iframe_nodes[2].content_document.parent_node is iframe_nodes[2]  # type: ignore[index,union-attr]
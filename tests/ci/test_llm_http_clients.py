@@ -0,0 +1,76 @@
+"""
+Tests for the shared LLM HTTP clients of browser_use.llm.http_clients, no network needed.
+"""
+
+import asyncio
+
+import httpx
+
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.http_clients import HTTPClientRegistry, http_clients
+from browser_use.llm.ollama.chat import ChatOllama
+from browser_use.llm.openai.chat import ChatOpenAI
+
+
+async def test_clients_are_shared_per_provider_base_url_and_credentials():
+	registry = HTTPClientRegistry()
+	client = registry.get_http_client('openai', None, 'key-1')
+
+	assert registry.get_http_client('openai', None, 'key-1') is client
+	assert registry.get_http_client('openai', None, 'key-2') is not client
+	assert registry.get_http_client('openai', 'https://proxy.example.com/v1', 'key-1') is not client
+	assert registry.get_http_client('anthropic', None, 'key-1') is not client
+	assert len(registry) == 4
+	await registry.aclose()
+
+
+def test_clients_are_not_shared_across_event_loops():
+	registry = HTTPClientRegistry()
+
+	async def get_client() -> httpx.AsyncClient:
+		return registry.get_http_client('openai', None, 'key')
+
+	assert asyncio.run(get_client()) is not asyncio.run(get_client())
+	# outside of an event loop every call gets its own client
+	assert registry.get_http_client('openai', None, 'key') is not registry.get_http_client('openai', None, 'key')
+
+
+async def test_chat_models_reuse_the_connection_pool():
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='key')
+	client = llm.get_client()
+
+	assert llm.get_client()._client is client._client
+	assert ChatOpenAI(model='gpt-4.1', api_key='key').get_client()._client is client._client
+	assert ChatOpenAI(model='gpt-4.1', api_key='other-key').get_client()._client is not client._client
+	assert ChatAnthropic(model='claude-sonnet-4-0', api_key='key').get_client()._client is not client._client
+	# the Ollama SDK builds its own httpx client, the whole client is shared
+	assert (
+		ChatOllama(model='llama3.1', host='http://localhost:11434').get_client()
+		is ChatOllama(model='qwen3', host='http://localhost:11434').get_client()
+	)
+	await http_clients.aclose()
+
+
+async def test_an_explicit_http_client_is_not_replaced():
+	async with httpx.AsyncClient() as http_client:
+		assert ChatOpenAI(model='gpt-4.1', api_key='key', http_client=http_client).get_client()._client is http_client
+		assert (
+			ChatAnthropic(model='claude-sonnet-4-0', api_key='key', http_client=http_client).get_client()._client is http_client
+		)
+	assert len(http_clients) == 0
+
+
+async def test_clients_are_closed_when_the_last_user_releases_them():
+	registry = HTTPClientRegistry()
+	registry.retain()
+	registry.retain()
+	client = registry.get_http_client('openai', None, 'key')
+
+	await registry.release()
+	assert not client.is_closed
+
+	await registry.release()
+	assert client.is_closed
+	assert len(registry) == 0
+	assert registry.get_http_client('openai', None, 'key') is not client
+	await registry.aclose()
@@ -64,3 +64,30 @@ def test_optimizer_preserves_all_fields_in_structured_done_action():
 		f'Missing from optimized: {original_fields - optimized_fields}\n'
 		f'Unexpected in optimized: {optimized_fields - original_fields}'
 	)
+
+
+def test_schema_is_cached_until_the_action_set_changes():
+	"""
+	The action model and its optimized schema are reused across steps, and rebuilt once a new action is registered.
+	"""
+	tools = Tools()
+	action_model = tools.registry.create_action_model()
+	assert tools.registry.create_action_model() is action_model
+
+	agent_output_model = AgentOutput.type_with_custom_actions(action_model)
+	schema = SchemaOptimizer.create_optimized_json_schema(agent_output_model)
+	assert SchemaOptimizer.create_optimized_json_schema(agent_output_model) == schema
+
+	# callers may drop top-level keys without affecting the cached schema
+	schema.pop('properties')
+	assert 'properties' in SchemaOptimizer.create_optimized_json_schema(agent_output_model)
+
+	@tools.registry.action('A new custom action')
+	async def new_custom_action(query: str):
+		return None
+
+	new_action_model = tools.registry.create_action_model()
+	assert new_action_model is not action_model
+	new_schema = SchemaOptimizer.create_optimized_json_schema(AgentOutput.type_with_custom_actions(new_action_model))
+	actions_schemas = new_schema['properties']['action']['items']['anyOf']
+	assert any('new_custom_action' in action_schema['properties'] for action_schema in actions_schemas)
@@ -0,0 +1,143 @@
+"""
+Tests for streamed model output: incremental parsing of the action list and early dispatch of the first action.
+"""
+
+import asyncio
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.streaming import JSONArrayStreamParser
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_mock_llm
+
+MODEL_OUTPUT = json.dumps(
+	{
+		'thinking': 'The "action" list is next, [brackets] and {braces} in strings are ignored',
+		'evaluation_previous_goal': 'Success',
+		'memory': 'Nothing yet',
+		'next_goal': 'Search and then finish',
+		'action': [
+			{'search_google': {'query': 'browser "use" ]}'}},
+			{'done': {'text': 'Finished', 'success': True}},
+		],
+	}
+)
+
+
+def feed_in_chunks(parser: JSONArrayStreamParser, text: str, size: int) -> list[tuple[int, str]]:
+	"""Feed the text in chunks of `size` characters, return the elements with the offset they completed at."""
+	elements = []
+	for offset in range(0, len(text), size):
+		for element in parser.feed(text[offset : offset + size]):
+			elements.append((offset + size, element))
+	return elements
+
+
+def test_parser_yields_each_action_once_it_is_complete():
+	for chunk_size in (1, 3, 17, len(MODEL_OUTPUT)):
+		parser = JSONArrayStreamParser('action')
+		elements = feed_in_chunks(parser, MODEL_OUTPUT, chunk_size)
+
+		assert [json.loads(element) for _, element in elements] == json.loads(MODEL_OUTPUT)['action']
+		assert parser.done
+		assert parser.text == MODEL_OUTPUT
+
+	# the first action is available long before the end of the output
+	parser = JSONArrayStreamParser('action')
+	(first_offset, _), _ = feed_in_chunks(parser, MODEL_OUTPUT, 1)
+	assert first_offset < MODEL_OUTPUT.index('"done"')
+
+
+def test_parser_only_reads_the_top_level_key():
+	text = '```json\n{"memory": {"action": [1, 2]}, "note": "\\"action\\": [3]", "action": [4, "five", {"six": [6]}]}\n```'
+	parser = JSONArrayStreamParser('action')
+
+	assert parser.feed(text) == ['4', '"five"', '{"six": [6]}']
+	assert parser.done
+
+
+SPLIT = MODEL_OUTPUT.index('{"done"')
+
+
+def create_streaming_agent(chunks: list[str], **kwargs) -> tuple[Agent, list[tuple[dict, int | None]]]:
+	"""An agent whose LLM streams `chunks` and whose actions are recorded instead of executed"""
+
+	async def astream(messages, output_format=None):
+		for chunk in chunks:
+			yield ChatInvokeCompletion(completion=chunk, usage=None)
+
+	llm = create_mock_llm()
+	llm.astream = astream
+	agent = Agent(task='Test streaming', llm=llm, stream_actions=True, **kwargs)
+
+	executed = []
+
+	async def execute_action(action, index, total_actions):
+		executed.append((action.model_dump(exclude_unset=True), total_actions))
+		return ActionResult(extracted_content='searched')
+
+	agent._execute_action = execute_action
+	return agent, executed
+
+
+async def test_first_action_starts_while_the_output_is_still_streaming():
+	first_action_started = asyncio.Event()
+
+	async def astream(messages, output_format=None):
+		yield ChatInvokeCompletion(completion=MODEL_OUTPUT[:SPLIT], usage=None)
+		# the rest of the output is only generated once the first action runs
+		await asyncio.wait_for(first_action_started.wait(), timeout=5)
+		yield ChatInvokeCompletion(completion=MODEL_OUTPUT[SPLIT:], usage=None)
+
+	llm = create_mock_llm()
+	llm.astream = astream
+	agent = Agent(task='Test streaming', llm=llm, stream_actions=True)
+
+	executed = []
+
+	async def execute_action(action, index, total_actions):
+		executed.append((action.model_dump(exclude_unset=True), total_actions))
+		first_action_started.set()
+		return ActionResult(extracted_content='searched')
+
+	agent._execute_action = execute_action
+
+	model_output = await agent.get_model_output([UserMessage(content='Search and then finish')])
+
+	assert [action.model_dump(exclude_unset=True) for action in model_output.action] == json.loads(MODEL_OUTPUT)['action']
+	assert executed == [({'search_google': {'query': 'browser "use" ]}'}}, None)]
+	assert agent._first_action_task is not None
+	assert (await agent._first_action_task).extracted_content == 'searched'
+
+
+async def test_first_action_waits_for_the_step_callback():
+	agent, executed = create_streaming_agent(
+		[MODEL_OUTPUT[:SPLIT], MODEL_OUTPUT[SPLIT:]], register_new_step_callback=lambda *args: None
+	)
+
+	await agent.get_model_output([UserMessage(content='Search and then finish')])
+	await asyncio.sleep(0)
+
+	# multi_act runs all actions once the callback has approved the output
+	assert agent._first_action_task is None
+	assert executed == []
+
+
+async def test_first_action_of_an_invalid_output_is_recorded():
+	agent, executed = create_streaming_agent([MODEL_OUTPUT[:SPLIT], '{"done": '])
+
+	with pytest.raises(ValidationError) as error:
+		await agent.get_model_output([UserMessage(content='Search and then finish')])
+	await agent._handle_step_error(error.value)
+	await agent._finish_first_action()
+
+	assert len(executed) == 1
+	assert agent.state.last_result is not None
+	first, failure = agent.state.last_result
+	assert first.extracted_content == 'searched'
+	assert failure.error is not None
@@ -0,0 +1,87 @@
+"""
+Tests for drawing element highlights onto screenshots (browser_use.browser.python_highlights).
+"""
+
+import io
+import threading
+from types import SimpleNamespace
+
+from PIL import Image
+
+from browser_use.browser import python_highlights
+from browser_use.browser.profile import ScreenshotClip
+from browser_use.browser.python_highlights import ElementHighlight, create_highlighted_screenshot, render_highlighted_screenshot
+from browser_use.browser.views import Screenshot
+
+
+def make_screenshot(width: int = 1280, height: int = 720) -> bytes:
+	# noisy content like photos / anti-aliased text, a flat color would make every format tiny
+	image = Image.effect_noise((width, height), 20).convert('RGB')
+	buffer = io.BytesIO()
+	image.save(buffer, format='PNG')
+	return buffer.getvalue()
+
+
+def decode(image_data: bytes) -> Image.Image:
+	return Image.open(io.BytesIO(image_data)).convert('RGB')
+
+
+def test_dashed_border_is_drawn_on_all_edges():
+	highlight = ElementHighlight(element_id=1, bbox=(100, 100, 300, 200), color='#FF6B6B', tag_name='button', index_text=None)
+	image = decode(render_highlighted_screenshot(make_screenshot(), [highlight]))
+
+	red = (255, 107, 107)
+	for x, y in [(100, 100), (300, 100), (100, 200), (300, 200), (112, 100), (112, 200), (100, 112), (300, 112)]:
+		assert image.getpixel((x, y)) == red, (x, y)
+	# gaps between dashes keep the page visible
+	assert image.getpixel((106, 100)) != red
+	assert image.getpixel((100, 106)) != red
+
+
+def test_lossy_formats_are_smaller_and_detectable():
+	screenshot = make_screenshot()
+	highlights = [
+		ElementHighlight(i, (40 * i, 30 * i, 40 * i + 120, 30 * i + 40), '#4ECDC4', 'input', str(i)) for i in range(1, 15)
+	]
+	png = render_highlighted_screenshot(screenshot, highlights)
+	jpeg = render_highlighted_screenshot(screenshot, highlights, 'jpeg', 70)
+	webp = render_highlighted_screenshot(screenshot, highlights, 'webp', 70)
+
+	assert [Screenshot(image).media_type for image in (png, jpeg, webp)] == ['image/png', 'image/jpeg', 'image/webp']
+	assert len(jpeg) * 2 < len(png)
+	assert len(webp) * 2 < len(png)
+	assert decode(webp).size == decode(png).size == (1280, 720)
+
+
+async def test_rendering_runs_off_the_event_loop(monkeypatch):
+	threads = []
+	render = python_highlights.render_highlighted_screenshot
+
+	def recording_render(*args):
+		threads.append(threading.get_ident())
+		return render(*args)
+
+	monkeypatch.setattr(python_highlights, 'render_highlighted_screenshot', recording_render)
+	screenshot = Screenshot(make_screenshot(400, 300))
+	result = await create_highlighted_screenshot(screenshot, {}, image_format='jpeg', quality=60)
+
+	assert threads and threads[0] != threading.get_ident()
+	assert result.media_type == 'image/jpeg'
+
+
+async def test_boxes_follow_a_clipped_and_downscaled_screenshot():
+	# the browser captured the viewport region x=100..500, y=50..350 at half size
+	screenshot = Screenshot(make_screenshot(200, 150), clip=ScreenshotClip(x=100, y=50, width=400, height=300))
+	element = SimpleNamespace(
+		absolute_position=SimpleNamespace(x=200, y=150, width=100, height=60),
+		tag_name='button',
+		attributes={},
+		element_index=None,
+	)
+	result = await create_highlighted_screenshot(screenshot, {7: element}, device_pixel_ratio=2.0)  # type: ignore[arg-type]
+
+	image = decode(bytes(result.data))
+	assert image.size == (200, 150)
+	assert result.clip == screenshot.clip
+	# (200 - 100) / 2, (150 - 50) / 2
+	assert image.getpixel((50, 50)) == (255, 107, 107)
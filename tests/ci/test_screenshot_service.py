@@ -0,0 +1,81 @@
+"""
+Tests for the content-addressed screenshot store (browser_use.screenshots.service.ScreenshotService).
+"""
+
+import io
+import mmap
+from pathlib import Path
+
+from PIL import Image
+
+from browser_use.agent.gif import create_history_gif
+from browser_use.agent.views import AgentHistory, AgentHistoryList
+from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT, BrowserStateHistory, Screenshot
+from browser_use.screenshots.service import ScreenshotService
+
+
+def make_screenshot(color: tuple[int, int, int], image_format: str = 'PNG') -> Screenshot:
+	buffer = io.BytesIO()
+	Image.new('RGB', (320, 200), color).save(buffer, format=image_format)
+	return Screenshot(buffer.getvalue())
+
+
+def history_item(screenshot_path: str | None, url: str = 'https://example.com') -> AgentHistory:
+	state = BrowserStateHistory(url=url, title='Example', tabs=[], interacted_element=[None], screenshot_path=screenshot_path)
+	return AgentHistory(model_output=None, result=[], state=state)
+
+
+def modified_at(path: str) -> int:
+	return Path(path).stat().st_mtime_ns
+
+
+async def test_identical_screenshots_are_stored_once(tmp_path):
+	service = ScreenshotService(tmp_path)
+	idle_page = make_screenshot((200, 200, 200))
+
+	paths = [await service.store_screenshot(idle_page, step) for step in range(1, 4)]
+	other = await service.store_screenshot(make_screenshot((10, 20, 30), 'JPEG'), 4)
+	legacy = await service.store_screenshot(idle_page.b64, 5)
+
+	assert len(set(paths)) == 1 and legacy == paths[0]
+	assert other.endswith('.jpeg')
+	assert set(service.screenshots_dir.iterdir()) == {Path(paths[0]), Path(other)}
+
+	# a fresh service on the same directory finds the existing file instead of rewriting it
+	mtime = modified_at(paths[0])
+	assert await ScreenshotService(tmp_path).store_screenshot(idle_page, 6) == paths[0]
+	assert modified_at(paths[0]) == mtime
+
+	loaded = await service.load_screenshot(paths[0])
+	assert loaded is not None and isinstance(loaded.data, mmap.mmap)
+	with loaded:
+		assert loaded.data[:] == idle_page.data
+	assert loaded.data.closed
+	assert await service.get_screenshot(paths[0]) == idle_page.b64
+	assert await service.load_screenshot(str(tmp_path / 'missing.png')) is None
+
+
+async def test_history_and_gif_read_the_stored_files(tmp_path):
+	service = ScreenshotService(tmp_path)
+	placeholder = await service.store_screenshot(PLACEHOLDER_4PX_SCREENSHOT, 1)
+	red = await service.store_screenshot(make_screenshot((255, 0, 0)), 2)
+	blue = await service.store_screenshot(make_screenshot((0, 0, 255)), 3)
+	history = AgentHistoryList(
+		history=[history_item(placeholder, 'about:blank'), history_item(red), history_item(None), history_item(blue)]
+	)
+
+	assert history.screenshots() == [
+		PLACEHOLDER_4PX_SCREENSHOT,
+		make_screenshot((255, 0, 0)).b64,
+		None,
+		make_screenshot((0, 0, 255)).b64,
+	]
+
+	output_path = tmp_path / 'history.gif'
+	create_history_gif('Check the colors', history, output_path=str(output_path), show_goals=False)
+	with Image.open(output_path) as gif:
+		# task frame + red + blue, the placeholder and the step without screenshot are skipped
+		assert getattr(gif, 'n_frames') == 3
+		assert gif.size == (320, 200)
+		gif.seek(1)
+		assert gif.convert('RGB').getpixel((100, 100)) == (255, 0, 0)
@@ -0,0 +1,115 @@
+"""
+Tests for the persistent ffmpeg encoder behind session video recording (browser_use.browser.video_recorder).
+"""
+
+import asyncio
+import base64
+import io
+import subprocess
+import sys
+
+import pytest
+from PIL import Image
+
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+imageio_ffmpeg = pytest.importorskip('imageio_ffmpeg')
+
+
+def make_frame(width: int, height: int, color: tuple[int, int, int]) -> str:
+	buffer = io.BytesIO()
+	Image.new('RGB', (width, height), color).save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode()
+
+
+def count_frames(path) -> int:
+	result = subprocess.run(
+		[imageio_ffmpeg.get_ffmpeg_exe(), '-v', 'error', '-i', str(path), '-map', '0:v:0', '-f', 'framecrc', '-'],
+		capture_output=True,
+		text=True,
+	)
+	return sum(1 for line in result.stdout.splitlines() if line and not line.startswith('#'))
+
+
+class SlowEncoder(VideoRecorderService):
+	"""Replaces ffmpeg with a process that never reads stdin, so the pipe fills up like with a stalled encoder."""
+
+	def _build_command(self) -> list[str]:
+		return [sys.executable, '-c', 'import time; time.sleep(30)']
+
+
+class NoisyEncoder(VideoRecorderService):
+	"""Replaces ffmpeg with a process that writes more to stderr than the OS pipe holds while consuming frames."""
+
+	def _build_command(self) -> list[str]:
+		script = (
+			'import sys\n'
+			'for line in range(20000):\n'
+			'    sys.stderr.write(f"warning {line}\\n")\n'
+			'sys.stdin.buffer.read()\n'
+			'sys.exit(1)\n'
+		)
+		return [sys.executable, '-c', script]
+
+
+async def test_frames_of_any_size_are_encoded_by_one_process(tmp_path):
+	output_path = tmp_path / 'session.mp4'
+	recorder = VideoRecorderService(output_path, ViewportSize(width=300, height=200), framerate=10)
+	await recorder.start()
+	process = recorder._process
+	assert process is not None
+
+	# screencast frames don't always match the video size, ffmpeg scales and pads them
+	for i in range(8):
+		recorder.add_frame(make_frame(600 if i % 2 else 300, 400 if i % 2 else 200, (30 * i, 80, 160)))
+		await asyncio.sleep(0.01)
+	assert recorder._process is process
+	await recorder.stop_and_save()
+
+	assert output_path.stat().st_size > 0
+	assert count_frames(output_path) == 8
+	stats = recorder.stats
+	assert (stats.frames_received, stats.frames_encoded, stats.frames_dropped, stats.frames_queued) == (8, 8, 0, 0)
+	assert stats.encode_latency_max_ms >= stats.encode_latency_avg_ms > 0
+
+
+async def test_frames_are_dropped_when_the_encoder_falls_behind(tmp_path):
+	recorder = SlowEncoder(tmp_path / 'session.mp4', ViewportSize(width=64, height=64), framerate=5, max_queued_frames=3)
+	await recorder.start()
+	process = recorder._process
+	assert process is not None
+
+	# large incompressible frames fill the OS pipe buffer after a few writes
+	frame = base64.b64encode(bytes(range(256)) * 4096).decode()
+	for _ in range(50):
+		recorder.add_frame(frame)
+		await asyncio.sleep(0.001)
+
+	stats = recorder.stats
+	assert stats.frames_received == 50
+	assert stats.frames_dropped > 0
+	assert stats.frames_queued <= 3
+	assert stats.frames_encoded + stats.frames_dropped + stats.frames_queued <= 50
+
+	process.kill()
+	await recorder.stop_and_save()
+	assert recorder._process is None
+
+
+async def test_encoder_output_is_drained_while_recording(tmp_path):
+	recorder = NoisyEncoder(tmp_path / 'session.mp4', ViewportSize(width=64, height=64), framerate=5, max_queued_frames=10)
+	await recorder.start()
+
+	# without a reader the process blocks writing stderr and stops consuming frames once the stdin pipe is full
+	frame = base64.b64encode(bytes(range(256)) * 4096).decode()
+	for _ in range(5):
+		recorder.add_frame(frame)
+	for _ in range(100):
+		if recorder.stats.frames_encoded == 5:
+			break
+		await asyncio.sleep(0.05)
+	assert recorder.stats.frames_encoded == 5
+
+	await recorder.stop_and_save()
+	assert list(recorder._stderr_tail)[-1] == 'warning 19999'
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark clicking elements: the previous sequential click (DOM.getContentQuads geometry, one awaited command per
+stage and fixed sleeps between them) against the pipelined fast path of DefaultActionWatchdog._click_element_node_impl
+(one Runtime.callFunctionOn for the geometry, mouse events sent back to back, waiting for the page to react instead of
+sleeping).
+
+Clicks every button of a local fixture page: a long grid of buttons that toggle classes, change text, add rows, move
+focus or do nothing at all. Reports p50 / p95 / mean click latency per method.
+
+By default a headless browser is launched. With --rtt-ms the browser is replaced by a fake CDP client that answers
+every command after that many milliseconds, to see how the two methods scale with the latency to a remote browser.
+
+Usage: python tests/scripts/benchmark_click_pipeline.py [--rounds N] [--rtt-ms MS]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs import default_action_watchdog
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+BUTTONS = 60
+
+BUTTON_SCRIPTS = [
+	"this.classList.toggle('active')",
+	"this.textContent = 'clicked ' + Date.now()",
+	"document.getElementById('log').insertAdjacentHTML('beforeend', '<li>row</li>')",
+	"document.getElementById('search').focus()",
+	'',  # no visible reaction
+]
+
+
+def fixture_html() -> str:
+	buttons = '\n'.join(
+		f'<button style="margin: 40px" onclick="{BUTTON_SCRIPTS[i % len(BUTTON_SCRIPTS)]}">Button {i}</button>'
+		for i in range(BUTTONS)
+	)
+	return f"""<html><head><title>Click fixture</title><style>.active {{ background: gold; }}</style></head>
+<body><input id="search" placeholder="Search"><div style="width: 300px">{buttons}</div><ul id="log"></ul></body></html>"""
+
+
+async def sequential_click(watchdog: DefaultActionWatchdog, node: EnhancedDOMTreeNode) -> None:
+	"""The click as it was before the fast path: every stage awaited in turn."""
+	browser_session = watchdog.browser_session
+	cdp_session = await browser_session.cdp_client_for_node(node)
+	try:
+		await watchdog._click_element_by_quads(node, cdp_session, modifiers=0)
+	finally:
+		cdp_session = await browser_session.get_or_create_cdp_session(focus=True)
+		await cdp_session.cdp_client.send.Target.activateTarget(params={'targetId': cdp_session.target_id})
+		await cdp_session.cdp_client.send.Runtime.runIfWaitingForDebugger(session_id=cdp_session.session_id)
+
+
+async def pipelined_click(watchdog: DefaultActionWatchdog, node: EnhancedDOMTreeNode) -> None:
+	await watchdog._click_element_node_impl(node)
+
+
+async def measure(
+	watchdog: DefaultActionWatchdog,
+	nodes: list[EnhancedDOMTreeNode],
+	click: Callable[[DefaultActionWatchdog, EnhancedDOMTreeNode], Awaitable[None]],
+	rounds: int,
+) -> list[float]:
+	timings = []
+	for _ in range(rounds):
+		for node in nodes:
+			start = time.perf_counter()
+			await click(watchdog, node)
+			timings.append(time.perf_counter() - start)
+			# every click is its own agent step
+			await watchdog.browser_session.release_node_handles()
+	return timings
+
+
+def report(method: str, timings: list[float]) -> None:
+	timings = sorted(timings)
+	p50 = timings[len(timings) // 2]
+	p95 = timings[int(len(timings) * 0.95)]
+	print(f'{method:<12} {len(timings):>6} {p50 * 1000:>8.1f}ms {p95 * 1000:>8.1f}ms {statistics.mean(timings) * 1000:>8.1f}ms')
+
+
+async def run_in_browser(rounds: int) -> None:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=False))
+	await browser_session.start()
+	try:
+		with tempfile.TemporaryDirectory() as tmp:
+			page = Path(tmp) / 'clicks.html'
+			page.write_text(fixture_html())
+			await browser_session.navigate_to(page.as_uri())
+			await browser_session.get_browser_state_summary(include_screenshot=False)
+			selector_map = await browser_session.get_selector_map()
+			nodes = [node for node in selector_map.values() if node.tag_name == 'button']
+			watchdog = browser_session._default_action_watchdog
+			assert isinstance(watchdog, DefaultActionWatchdog)
+
+			print(f'{len(nodes)} buttons, {rounds} rounds, headless browser')
+			for method, click in (('sequential', sequential_click), ('pipelined', pipelined_click)):
+				await browser_session.navigate_to(page.as_uri())
+				report(method, await measure(watchdog, nodes, click, rounds))
+	finally:
+		await browser_session.kill()
+
+
+class SimulatedBrowser:
+	"""Answers every CDP command after `rtt` seconds, the page reacts to 4 out of 5 clicks within a few milliseconds"""
+
+	def __init__(self, rtt: float):
+		self.rtt = rtt
+		self.rng = random.Random(0)
+		self.DOM = SimpleNamespace(
+			resolveNode=self.resolve_node, getContentQuads=self.get_content_quads, scrollIntoViewIfNeeded=self.reply
+		)
+		self.Page = SimpleNamespace(getLayoutMetrics=self.get_layout_metrics)
+		self.Runtime = SimpleNamespace(callFunctionOn=self.call_function_on, runIfWaitingForDebugger=self.reply)
+		self.Input = SimpleNamespace(dispatchMouseEvent=self.reply)
+		self.Target = SimpleNamespace(activateTarget=self.reply)
+
+	async def reply(self, params: Any = None, session_id: str | None = None, result: Any = None) -> Any:
+		await asyncio.sleep(self.rtt)
+		return result or {}
+
+	async def resolve_node(self, params: dict, session_id: str | None = None) -> Any:
+		return await self.reply(result={'object': {'objectId': 'button'}})
+
+	async def get_layout_metrics(self, params: Any = None, session_id: str | None = None) -> Any:
+		return await self.reply(result={'layoutViewport': {'clientWidth': 1280, 'clientHeight': 720}})
+
+	async def get_content_quads(self, params: dict, session_id: str | None = None) -> Any:
+		return await self.reply(result={'quads': [[100, 100, 200, 100, 200, 130, 100, 130]]})
+
+	async def call_function_on(self, params: dict, session_id: str | None = None) -> Any:
+		if params['functionDeclaration'] == default_action_watchdog._CLICK_SIGNAL_JS:
+			# armed before the mouse events, answered once the click handler ran
+			await asyncio.sleep(3 * self.rtt)
+			if self.rng.random() < 0.2:
+				await asyncio.sleep(params['arguments'][0]['value'] / 1000)
+				return {'result': {'value': 'timeout'}}
+			await asyncio.sleep(self.rng.uniform(0, 0.005))
+			return {'result': {'value': 'mutation'}}
+		return await self.reply(result={'result': {'value': {'x': 150, 'y': 115}}})
+
+
+async def run_simulated(rounds: int, rtt: float) -> None:
+	browser_session = BrowserSession()
+	cdp_session: Any = SimpleNamespace(
+		cdp_client=SimpleNamespace(send=SimulatedBrowser(rtt)), session_id='session', target_id='target'
+	)
+
+	async def get_cdp_session(*args, **kwargs):
+		# cdp_client_for_node resolves the node to check it exists
+		await asyncio.sleep(rtt)
+		return cdp_session
+
+	object.__setattr__(browser_session, 'cdp_client_for_node', get_cdp_session)
+	object.__setattr__(browser_session, 'get_or_create_cdp_session', get_cdp_session)
+	watchdog = DefaultActionWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+	nodes = [
+		EnhancedDOMTreeNode(
+			node_id=i,
+			backend_node_id=i,
+			node_type=NodeType.ELEMENT_NODE,
+			node_name='BUTTON',
+			node_value='',
+			attributes={},
+			is_scrollable=None,
+			is_visible=True,
+			absolute_position=None,
+			target_id='target',
+			frame_id=None,
+			session_id=None,
+			content_document=None,
+			shadow_root_type=None,
+			shadow_roots=None,
+			parent_node=None,
+			children_nodes=None,
+			ax_node=None,
+			snapshot_node=None,
+			element_index=i,
+		)
+		for i in range(1, BUTTONS + 1)
+	]
+
+	print(f'{len(nodes)} buttons, {rounds} rounds, simulated browser with {rtt * 1000:.0f}ms round trips')
+	try:
+		for method, click in (('sequential', sequential_click), ('pipelined', pipelined_click)):
+			report(method, await measure(watchdog, nodes, click, rounds))
+	finally:
+		await browser_session.event_bus.stop(clear=True)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--rounds', type=int, default=3)
+	parser.add_argument('--rtt-ms', type=float, default=None, help='simulate a browser with this round trip time')
+	args = parser.parse_args()
+
+	logging.getLogger('browser_use').setLevel(logging.ERROR)
+	print(f'{"method":<12} {"clicks":>6} {"p50":>10} {"p95":>10} {"mean":>10}')
+	if args.rtt_ms is None:
+		asyncio.run(run_in_browser(args.rounds))
+	else:
+		asyncio.run(run_simulated(args.rounds, args.rtt_ms / 1000))
+
+
+if __name__ == '__main__':
+	main()
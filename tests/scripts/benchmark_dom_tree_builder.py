@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark building the enhanced DOM tree (DomService.get_dom_tree) from CDP getDocument / DOMSnapshot / AX payloads.
+
+Runs the pure-CPU part of get_dom_tree against fixtures instead of a live browser. By default a synthetic
+product-listing page with N nodes (default 30k) is generated, alternatively pass a JSON file recorded from a real page
+with the keys `dom_tree` (DOM.getDocument(depth=-1, pierce=True)), `snapshot` (DOMSnapshot.captureSnapshot) and
+`ax_tree` (Accessibility.getFullAXTree). A deep (nested 5k levels) document is built as well, to check that deep
+pages don't hit the recursion limit.
+
+Usage: python tests/scripts/benchmark_dom_tree_builder.py [node_count | fixture.json]
+"""
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from itertools import count
+from types import SimpleNamespace
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode, TargetAllTrees
+
+ROUNDS = 5
+
+
+def make_fixture(node_count: int, max_depth: int = 12, seed: int = 0) -> dict:
+	"""Synthetic getDocument tree with a matching snapshot and accessibility tree."""
+	rng = random.Random(seed)
+	node_ids = count(1)
+	flat: list[dict] = []
+
+	def make_node(node_type: int, name: str, parent_id: int | None, value: str = '', attributes: list[str] | None = None) -> dict:
+		node_id = next(node_ids)
+		node: dict = {
+			'nodeId': node_id,
+			'backendNodeId': node_id,
+			'nodeType': node_type,
+			'nodeName': name,
+			'localName': name.lower(),
+			'nodeValue': value,
+			'attributes': attributes or [],
+		}
+		if parent_id is not None:
+			node['parentId'] = parent_id
+		flat.append(node)
+		return node
+
+	document = make_node(9, '#document', None)
+	html = make_node(1, 'HTML', document['nodeId'])
+	html['frameId'] = 'main-frame'
+	body = make_node(1, 'BODY', html['nodeId'])
+	document['children'] = [html]
+	html['children'] = [body]
+
+	open_elements = [(body, 2)]
+	while len(flat) < node_count:
+		parent, depth = rng.choice(open_elements)
+		roll = rng.random()
+		if depth < max_depth - 3 and roll < 0.002:
+			# same-origin iframe with its own (scrolled) document
+			iframe = make_node(1, 'IFRAME', parent['nodeId'], attributes=['src', '/embed'])
+			iframe['frameId'] = f'frame-{iframe["nodeId"]}'
+			frame_document = make_node(9, '#document', None)
+			frame_html = make_node(1, 'HTML', frame_document['nodeId'])
+			frame_html['frameId'] = iframe['frameId']
+			frame_body = make_node(1, 'BODY', frame_html['nodeId'])
+			iframe['contentDocument'] = frame_document
+			frame_document['children'] = [frame_html]
+			frame_html['children'] = [frame_body]
+			parent.setdefault('children', []).append(iframe)
+			open_elements.append((frame_body, depth + 3))
+			continue
+		if depth < max_depth - 1 and roll < 0.004:
+			# custom element with an open shadow root
+			host = make_node(1, 'MY-WIDGET', parent['nodeId'])
+			shadow_root = make_node(11, '#document-fragment', None)
+			shadow_root['shadowRootType'] = 'open'
+			host['shadowRoots'] = [shadow_root]
+			parent.setdefault('children', []).append(host)
+			open_elements.append((shadow_root, depth + 1))
+			continue
+		if depth < max_depth and roll < 0.35:
+			child = make_node(
+				1, rng.choice(['DIV', 'SECTION', 'UL', 'LI', 'SPAN']), parent['nodeId'], attributes=['class', 'card']
+			)
+			open_elements.append((child, depth + 1))
+		elif rng.random() < 0.3:
+			child = make_node(
+				1, rng.choice(['A', 'BUTTON', 'INPUT']), parent['nodeId'], attributes=['href', '/item', 'title', 'Item']
+			)
+		else:
+			child = make_node(3, '#text', parent['nodeId'], value=f'Product {rng.randrange(10_000)} description')
+		parent.setdefault('children', []).append(child)
+
+	return {'dom_tree': {'root': document}, 'snapshot': make_snapshot(flat, rng), 'ax_tree': make_ax_tree(flat, rng)}
+
+
+def make_deep_fixture(depth: int) -> dict:
+	flat: list[dict] = []
+	root = parent = {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document', 'nodeValue': ''}
+	flat.append(root)
+	for node_id in range(2, depth + 2):
+		node = {
+			'nodeId': node_id,
+			'backendNodeId': node_id,
+			'nodeType': 1,
+			'nodeName': 'DIV',
+			'nodeValue': '',
+			'parentId': parent['nodeId'],
+		}
+		parent['children'] = [node]
+		flat.append(node)
+		parent = node
+	rng = random.Random(1)
+	return {'dom_tree': {'root': root}, 'snapshot': make_snapshot(flat, rng), 'ax_tree': {'nodes': []}}
+
+
+def make_snapshot(flat: list[dict], rng: random.Random) -> dict:
+	strings = ['block', 'inline', 'none', 'visible', 'hidden', '1', 'auto', 'pointer', 'default', 'rgba(0, 0, 0, 0)']
+	layout_node_indices = [i for i, node in enumerate(flat) if node['nodeType'] in (1, 3)]
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'nodes': {
+					'backendNodeId': [node['backendNodeId'] for node in flat],
+					'isClickable': {'index': [i for i, node in enumerate(flat) if node['nodeName'] in ('A', 'BUTTON', 'INPUT')]},
+				},
+				'layout': {
+					'nodeIndex': layout_node_indices,
+					'bounds': [
+						[rng.uniform(0, 1200), rng.uniform(0, 30_000), rng.uniform(10, 400), rng.uniform(10, 200)]
+						for _ in layout_node_indices
+					],
+					'styles': [[0, 3, 5, 6, 8] for _ in layout_node_indices],
+					'paintOrders': list(range(len(layout_node_indices))),
+					'clientRects': [[0, 0, 1280, 720] if flat[i]['nodeName'] == 'HTML' else [] for i in layout_node_indices],
+					'scrollRects': [
+						[0, rng.uniform(0, 500), 1280, 30_000] if flat[i]['nodeName'] == 'HTML' else []
+						for i in layout_node_indices
+					],
+					'stackingContexts': {'index': [0]},
+				},
+			}
+		],
+	}
+
+
+def make_ax_tree(flat: list[dict], rng: random.Random) -> dict:
+	return {
+		'nodes': [
+			{
+				'nodeId': str(node['nodeId']),
+				'ignored': False,
+				'role': {'type': 'role', 'value': 'link' if node['nodeName'] == 'A' else 'generic'},
+				'name': {'type': 'computedString', 'value': 'Item'},
+				'backendDOMNodeId': node['backendNodeId'],
+			}
+			for node in flat
+			if node['nodeType'] == 1 and rng.random() < 0.5
+		]
+	}
+
+
+def count_nodes(root: EnhancedDOMTreeNode) -> int:
+	total, stack = 0, [root]
+	while stack:
+		node = stack.pop()
+		total += 1
+		stack.extend(node.children_nodes or [])
+		stack.extend(node.shadow_roots or [])
+		if node.content_document:
+			stack.append(node.content_document)
+	return total
+
+
+async def build(fixture: dict) -> tuple[float, EnhancedDOMTreeNode]:
+	fake_session = SimpleNamespace(agent_focus=None, logger=logging.getLogger('benchmark'))
+	dom_service = DomService(fake_session)  # type: ignore[arg-type]
+
+	async def get_all_trees(target_id):
+		return TargetAllTrees(
+			snapshot=fixture['snapshot'],
+			dom_tree=fixture['dom_tree'],
+			ax_tree=fixture['ax_tree'],
+			device_pixel_ratio=1.0,
+			cdp_timing={},
+		)
+
+	dom_service._get_all_trees = get_all_trees  # type: ignore[method-assign]
+	start = time.perf_counter()
+	root = await dom_service.get_dom_tree(target_id='target')
+	return time.perf_counter() - start, root
+
+
+def load_fixture() -> tuple[dict, str]:
+	"""Read the fixture before the event loop starts, returns it with a label for the output."""
+	if len(sys.argv) > 1 and sys.argv[1].endswith('.json'):
+		with open(sys.argv[1]) as f:
+			return json.load(f), sys.argv[1]
+	node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+	return make_fixture(node_count), f'synthetic page ({node_count} nodes)'
+
+
+async def main(fixture: dict, label: str) -> None:
+	timings = []
+	for _ in range(ROUNDS):
+		elapsed, root = await build(fixture)
+		timings.append(elapsed)
+	print(f'{label}: {count_nodes(root)} enhanced nodes')
+	print(f'  get_dom_tree  best {min(timings) * 1000:>8.1f} ms   mean {sum(timings) / len(timings) * 1000:>8.1f} ms')
+
+	deep_depth = 5_000
+	try:
+		elapsed, root = await build(make_deep_fixture(deep_depth))
+		print(f'deep document ({deep_depth} levels): {elapsed * 1000:.1f} ms, {count_nodes(root)} nodes')
+	except RecursionError:
+		print(f'deep document ({deep_depth} levels): RecursionError')
+
+
+if __name__ == '__main__':
+	asyncio.run(main(*load_fixture()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark receiving a download over CDP: the previous `Array.from(uint8Array)` + returnByValue result against the
+chunked base64 IO.read stream used by DownloadsWatchdog._stream_download.
+
+Measures the client side only (parsing the CDP messages, decoding and writing the file), with the messages built as
+the browser sends them. Reports time, peak allocated memory (from a second, traced run) and the largest CDP message,
+which cdp_use rejects above 100MB. The JSON array path is skipped for files whose message alone would take gigabytes.
+
+Usage: python tests/scripts/benchmark_download_streaming.py [size_mb ...]  (default: 1 50 200)
+"""
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from browser_use.browser.watchdogs.downloads_watchdog import _DOWNLOAD_CHUNK_SIZE
+
+CDP_MAX_MESSAGE_SIZE = 100 * 1024 * 1024  # cdp_use CDPClient default max_ws_frame_size
+MAX_JSON_ARRAY_SIZE_MB = 64
+
+NUMBERS = [str(i) for i in range(256)]
+
+
+def json_array_message(body: bytes) -> str:
+	numbers = ','.join([NUMBERS[b] for b in body])
+	return f'{{"id":1,"result":{{"result":{{"type":"object","value":{{"data":[{numbers}],"size":{len(body)}}}}}}}}}'
+
+
+def receive_json_array(body: bytes, path: str, trace: bool) -> tuple[float, int, int]:
+	message = json_array_message(body)
+	if trace:
+		tracemalloc.start()
+	start = time.perf_counter()
+	value = json.loads(message)['result']['result']['value']
+	with open(path, 'wb') as f:
+		f.write(bytes(value['data']))
+	elapsed = time.perf_counter() - start
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return elapsed, peak, len(message)
+
+
+def receive_chunked(body: bytes, path: str, trace: bool) -> tuple[float, int, int]:
+	if trace:
+		tracemalloc.start()
+	elapsed = 0.0
+	largest_message = 0
+	with open(path, 'wb') as f:
+		for offset in range(0, len(body), _DOWNLOAD_CHUNK_SIZE):
+			chunk = body[offset : offset + _DOWNLOAD_CHUNK_SIZE]
+			# what the browser sends for one IO.read call
+			message = json.dumps(
+				{
+					'id': offset,
+					'result': {
+						'base64Encoded': True,
+						'data': base64.b64encode(chunk).decode(),
+						'eof': offset + _DOWNLOAD_CHUNK_SIZE >= len(body),
+					},
+				}
+			)
+			largest_message = max(largest_message, len(message))
+			start = time.perf_counter()
+			result = json.loads(message)['result']
+			f.write(base64.b64decode(result['data']))
+			elapsed += time.perf_counter() - start
+			del message, result
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return elapsed, peak, largest_message
+
+
+def main() -> None:
+	sizes_mb = [int(arg) for arg in sys.argv[1:]] or [1, 50, 200]
+	print(f'{"size":>8} {"method":<12} {"time":>9} {"peak mem":>10} {"largest msg":>12}')
+	with tempfile.TemporaryDirectory() as tmp:
+		path = os.path.join(tmp, 'download.bin')
+		for size_mb in sizes_mb:
+			body = os.urandom(size_mb * 1024 * 1024)
+			receivers = {'chunked': receive_chunked}
+			if size_mb <= MAX_JSON_ARRAY_SIZE_MB:
+				receivers['json array'] = receive_json_array
+			for method, receive in receivers.items():
+				elapsed, _, largest_message = receive(body, path, trace=False)
+				_, peak, _ = receive(body, path, trace=True)
+				too_large = ' (over CDP limit)' if largest_message > CDP_MAX_MESSAGE_SIZE else ''
+				print(
+					f'{size_mb:>6}MB {method:<12} {elapsed * 1000:>7.0f}ms {peak / 1e6:>8.1f}MB '
+					f'{largest_message / 1e6:>10.1f}MB{too_large}'
+				)
+			if size_mb > MAX_JSON_ARRAY_SIZE_MB:
+				print(f'{size_mb:>6}MB {"json array":<12} skipped, the message would be ~{size_mb * 3.6:.0f}MB')
+
+
+if __name__ == '__main__':
+	main()
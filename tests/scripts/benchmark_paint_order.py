@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark paint order filtering with the flat-list and the grid-indexed rectangle union.
+
+Generates a dense product-listing style page (cards with image/title/price/button, a sticky header and a
+cookie banner on top) with N painted rects (default 12k), runs PaintOrderRemover with both backends and checks
+that they flag exactly the same nodes as `ignored_by_paint_order`.
+
+Usage: python tests/scripts/benchmark_paint_order.py [rect_count]
+"""
+
+import random
+import sys
+import time
+
+from browser_use.dom.serializer import paint_order
+from browser_use.dom.serializer.paint_order import PaintOrderRemover
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType, SimplifiedNode
+
+OPAQUE = {'background-color': 'rgb(255, 255, 255)', 'opacity': '1'}
+TRANSPARENT = {'background-color': 'rgba(0, 0, 0, 0)', 'opacity': '1'}
+
+
+def make_node(node_id: int, bounds: DOMRect, paint_order_value: int, styles: dict[str, str]) -> SimplifiedNode:
+	snapshot_node = EnhancedSnapshotNode(
+		is_clickable=None,
+		cursor_style=None,
+		bounds=bounds,
+		clientRects=None,
+		scrollRects=None,
+		computed_styles=styles,
+		paint_order=paint_order_value,
+		stacking_contexts=None,
+	)
+	original_node = EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id,
+		node_type=NodeType.ELEMENT_NODE,
+		node_name='DIV',
+		node_value='',
+		attributes={},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=bounds,
+		target_id='target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot_node,
+	)
+	return SimplifiedNode(original_node=original_node, children=[])
+
+
+def make_page(rect_count: int, seed: int = 0) -> SimplifiedNode:
+	rng = random.Random(seed)
+	nodes: list[SimplifiedNode] = []
+	cards = rect_count // 4
+	columns = 6
+	card_width, card_height = 300.0, 420.0
+
+	for card in range(cards):
+		x = (card % columns) * (card_width + 16)
+		y = 80 + (card // columns) * (card_height + 16)
+		base = card * 4
+		nodes.append(make_node(base, DOMRect(x, y, card_width, card_height), base, OPAQUE))
+		nodes.append(make_node(base + 1, DOMRect(x + 10, y + 10, card_width - 20, 260), base + 1, OPAQUE))
+		nodes.append(make_node(base + 2, DOMRect(x + 10, y + 280, card_width - 20, 40), base + 2, TRANSPARENT))
+		nodes.append(
+			make_node(
+				base + 3, DOMRect(x + 10 + rng.uniform(0, 20), y + 340, 120, 40), base + 3, OPAQUE if card % 3 else TRANSPARENT
+			)
+		)
+
+	page_height = 80 + (cards // columns + 1) * (card_height + 16)
+	top = rect_count + 10
+	# sticky header and a cookie banner covering parts of the listing
+	nodes.append(make_node(top, DOMRect(0, 0, columns * (card_width + 16), 80), top, OPAQUE))
+	nodes.append(make_node(top + 1, DOMRect(0, page_height / 2, columns * (card_width + 16), 600), top + 1, OPAQUE))
+
+	root = make_node(-1, DOMRect(0, 0, columns * (card_width + 16), page_height), -1, TRANSPARENT)
+	root.children = nodes
+	return root
+
+
+def run(root: SimplifiedNode, threshold: int) -> tuple[float, list[bool]]:
+	def reset(node: SimplifiedNode) -> None:
+		node.ignored_by_paint_order = False
+		for child in node.children:
+			reset(child)
+
+	reset(root)
+	original_threshold = paint_order.GRID_RECT_UNION_THRESHOLD
+	paint_order.GRID_RECT_UNION_THRESHOLD = threshold
+	try:
+		start = time.perf_counter()
+		PaintOrderRemover(root).calculate_paint_order()
+		elapsed = time.perf_counter() - start
+	finally:
+		paint_order.GRID_RECT_UNION_THRESHOLD = original_threshold
+	return elapsed, [child.ignored_by_paint_order for child in root.children]
+
+
+def main() -> None:
+	rect_count = int(sys.argv[1]) if len(sys.argv) > 1 else 12_000
+	root = make_page(rect_count)
+	print(f'{len(root.children)} painted rects')
+
+	grid_time, grid_result = run(root, threshold=0)
+	print(f'  grid       {grid_time * 1000:>10.1f} ms')
+	pure_time, pure_result = run(root, threshold=sys.maxsize)
+	print(f'  flat list  {pure_time * 1000:>10.1f} ms')
+
+	assert grid_result == pure_result, 'backends disagree on ignored_by_paint_order'
+	print(f'  -> identical results ({sum(grid_result)} ignored), {pure_time / grid_time:.1f}x faster')
+
+
+if __name__ == '__main__':
+	main()
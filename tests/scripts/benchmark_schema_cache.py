@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-step cost of the structured output schema with and without the schema cache.
+
+Registers N custom actions (default 60) with a few parameters each on top of the default tools, then simulates agent
+steps the way the agent does them: create the page's action model, the AgentOutput model and its optimized JSON schema,
+plus the Gemini dialect on top. The uncached path rebuilds everything per step, the cached path reuses the models and
+schemas as long as the action set doesn't change.
+
+Usage: python tests/scripts/benchmark_schema_cache.py [custom_action_count] [steps]
+"""
+
+import sys
+import time
+
+from pydantic import BaseModel, Field, create_model
+
+from browser_use.agent.views import AgentOutput
+from browser_use.llm.google.chat import ChatGoogle
+from browser_use.llm.schema import SchemaOptimizer
+from browser_use.tools.service import Tools
+
+
+def register_custom_actions(tools: Tools, count: int) -> None:
+	for i in range(count):
+		param_model = create_model(
+			f'CustomAction{i}Params',
+			query=(str, Field(description=f'Query for custom action {i}')),
+			limit=(int, Field(default=10, description='Maximum number of results')),
+			tags=(list[str], Field(default_factory=list, description='Tags to filter by')),
+			exact=(bool, False),
+		)
+
+		async def custom_action(params: BaseModel):
+			return None
+
+		custom_action.__name__ = f'custom_action_{i}'
+		tools.registry.action(f'Custom action number {i}, does something useful with a query', param_model=param_model)(
+			custom_action
+		)
+
+
+def step_uncached(tools: Tools, gemini: ChatGoogle, page_url: str) -> tuple[dict, dict]:
+	available_actions = {
+		name: action
+		for name, action in tools.registry.registry.actions.items()
+		if tools.registry.registry._match_domains(action.domains, page_url)
+	}
+	action_model = tools.registry._build_action_model(available_actions)
+	output_model = AgentOutput.type_with_custom_actions(action_model)
+	schema = SchemaOptimizer._build_optimized_json_schema(output_model)
+	return schema, gemini._fix_gemini_schema(SchemaOptimizer._build_optimized_json_schema(output_model))
+
+
+def step_cached(tools: Tools, gemini: ChatGoogle, page_url: str, output_models: dict) -> tuple[dict, dict]:
+	action_model = tools.registry.create_action_model(page_url=page_url)
+	output_model = output_models.get(action_model)
+	if output_model is None:
+		output_model = output_models[action_model] = AgentOutput.type_with_custom_actions(action_model)
+	schema = SchemaOptimizer.create_optimized_json_schema(output_model)
+	gemini_schema = SchemaOptimizer.get_cached_schema(
+		output_model,
+		'gemini',
+		lambda model: gemini._fix_gemini_schema(SchemaOptimizer.create_optimized_json_schema(model)),
+	)
+	return schema, gemini_schema
+
+
+def main() -> None:
+	action_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+	steps = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+	tools = Tools()
+	register_custom_actions(tools, action_count)
+	gemini = ChatGoogle(model='gemini-2.0-flash', api_key='unused')
+	page_urls = ['https://example.com/a', 'https://example.com/b']
+	output_models: dict = {}
+
+	# sanity check: both paths must produce the same schemas
+	assert step_uncached(tools, gemini, page_urls[0]) == step_cached(tools, gemini, page_urls[0], output_models)
+	SchemaOptimizer.clear_cache()
+
+	print(f'{len(tools.registry.registry.actions)} actions ({action_count} custom), {steps} steps:')
+	start = time.perf_counter()
+	for step in range(steps):
+		step_uncached(tools, gemini, page_urls[step % 2])
+	uncached = (time.perf_counter() - start) / steps
+	print(f'  uncached: {uncached * 1000:8.2f} ms/step')
+
+	start = time.perf_counter()
+	for step in range(steps):
+		step_cached(tools, gemini, page_urls[step % 2], output_models)
+	cached = (time.perf_counter() - start) / steps
+	print(f'  cached:   {cached * 1000:8.2f} ms/step (first step builds the schemas)')
+	print(f'  -> {uncached / cached:.1f}x faster')
+
+
+if __name__ == '__main__':
+	main()
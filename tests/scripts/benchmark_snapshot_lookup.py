@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark the columnar snapshot lookup against the previous eager per-node implementation.
+
+Builds a synthetic DOMSnapshot with N nodes (default 50k, ~30% clickable, mixed styles and rects) and measures
+time and peak allocated memory for building the lookup and reading every node, as the DOM tree builder does.
+
+Usage: python tests/scripts/benchmark_snapshot_lookup.py [node_count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES, _parse_computed_styles, build_snapshot_lookup
+from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
+
+
+def make_snapshot(node_count: int, seed: int = 0) -> dict:
+	rng = random.Random(seed)
+	strings = [
+		'block',
+		'inline',
+		'none',
+		'visible',
+		'hidden',
+		'1',
+		'0.5',
+		'auto',
+		'pointer',
+		'default',
+		'static',
+		'rgba(0, 0, 0, 0)',
+	]
+	style_variants = [[rng.randrange(len(strings)) for _ in REQUIRED_COMPUTED_STYLES] for _ in range(40)]
+
+	layout_node_indices = [i for i in range(node_count) if rng.random() < 0.8]
+	layout_count = len(layout_node_indices)
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'nodes': {
+					'backendNodeId': list(range(1, node_count + 1)),
+					'isClickable': {'index': sorted(rng.sample(range(node_count), node_count * 3 // 10))},
+				},
+				'layout': {
+					'nodeIndex': layout_node_indices,
+					'bounds': [
+						[rng.uniform(0, 1900), rng.uniform(0, 20000), rng.uniform(0, 400), rng.uniform(0, 200)]
+						for _ in range(layout_count)
+					],
+					'styles': [rng.choice(style_variants) for _ in range(layout_count)],
+					'paintOrders': [rng.randrange(layout_count) for _ in range(layout_count)],
+					'clientRects': [[] if rng.random() < 0.95 else [0, 0, 100, 100] for _ in range(layout_count)],
+					'scrollRects': [[] if rng.random() < 0.98 else [0, 0, 100, 2000] for _ in range(layout_count)],
+					'stackingContexts': {'index': [0]},
+				},
+			}
+		],
+	}
+
+
+def build_snapshot_lookup_eager(snapshot: dict, device_pixel_ratio: float = 1.0) -> dict[int, EnhancedSnapshotNode]:
+	"""The previous implementation: one EnhancedSnapshotNode (+ DOMRects + style dict) per backend node, built upfront."""
+	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
+	strings = snapshot['strings']
+	for document in snapshot['documents']:
+		nodes = document['nodes']
+		layout = document['layout']
+		backend_node_to_snapshot_index = {}
+		for i, backend_node_id in enumerate(nodes.get('backendNodeId', [])):
+			backend_node_to_snapshot_index[backend_node_id] = i
+		layout_index_map = {}
+		for layout_idx, node_index in enumerate(layout.get('nodeIndex', [])):
+			if node_index not in layout_index_map:
+				layout_index_map[node_index] = layout_idx
+
+		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
+			is_clickable = snapshot_index in nodes['isClickable']['index'] if 'isClickable' in nodes else None
+			cursor_style = bounding_box = paint_order = client_rects = scroll_rects = stacking_contexts = None
+			computed_styles = {}
+			if snapshot_index in layout_index_map:
+				layout_idx = layout_index_map[snapshot_index]
+				if layout_idx < len(layout.get('bounds', [])):
+					x, y, w, h = layout['bounds'][layout_idx][:4]
+					bounding_box = DOMRect(
+						x=x / device_pixel_ratio,
+						y=y / device_pixel_ratio,
+						width=w / device_pixel_ratio,
+						height=h / device_pixel_ratio,
+					)
+					if layout_idx < len(layout.get('styles', [])):
+						computed_styles = _parse_computed_styles(strings, layout['styles'][layout_idx])
+						cursor_style = computed_styles.get('cursor')
+					if layout_idx < len(layout.get('paintOrders', [])):
+						paint_order = layout['paintOrders'][layout_idx]
+					client_rect_data = layout.get('clientRects', [])[layout_idx]
+					if client_rect_data and len(client_rect_data) >= 4:
+						client_rects = DOMRect(*client_rect_data[:4])
+					scroll_rect_data = layout.get('scrollRects', [])[layout_idx]
+					if scroll_rect_data and len(scroll_rect_data) >= 4:
+						scroll_rects = DOMRect(*scroll_rect_data[:4])
+					if layout_idx < len(layout.get('stackingContexts', [])):
+						stacking_contexts = layout['stackingContexts']['index'][layout_idx]
+			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
+				is_clickable=is_clickable,
+				cursor_style=cursor_style,
+				bounds=bounding_box,
+				clientRects=client_rects,
+				scrollRects=scroll_rects,
+				computed_styles=computed_styles if computed_styles else None,
+				paint_order=paint_order,
+				stacking_contexts=stacking_contexts,
+			)
+	return snapshot_lookup
+
+
+def measure(name: str, build, snapshot: dict, node_count: int, read_all: bool) -> tuple[float, int]:
+	tracemalloc.start()
+	start = time.perf_counter()
+	lookup = build(snapshot, 2.0)
+	if read_all:
+		for backend_node_id in range(1, node_count + 1):
+			lookup.get(backend_node_id)
+	elapsed = time.perf_counter() - start
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	print(f'  {name:<10} {elapsed * 1000:>10.1f} ms {peak / 1024 / 1024:>10.1f} MiB peak')
+	return elapsed, peak
+
+
+def main() -> None:
+	node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+	snapshot = make_snapshot(node_count)
+
+	# sanity check: both implementations must agree on every node
+	eager, columnar = build_snapshot_lookup_eager(snapshot, 2.0), build_snapshot_lookup(snapshot, 2.0)  # type: ignore[arg-type]
+	assert all(eager[i] == columnar[i] for i in range(1, node_count + 1))
+
+	for read_all, title in ((False, 'build only'), (True, 'build + read every node (what the DOM tree builder does)')):
+		print(f'{node_count} nodes, {title}:')
+		eager_time, eager_peak = measure('eager', build_snapshot_lookup_eager, snapshot, node_count, read_all)
+		columnar_time, columnar_peak = measure('columnar', build_snapshot_lookup, snapshot, node_count, read_all)
+		print(f'  -> {eager_time / columnar_time:.1f}x faster, {eager_peak / columnar_peak:.1f}x less memory')
+
+
+if __name__ == '__main__':
+	main()
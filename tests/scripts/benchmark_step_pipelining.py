@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the agent step loop with and without pipeline_steps.
+
+Serves a long local page with a few hundred interactive elements and runs an agent on it with a fake LLM that
+"thinks" for a fixed time and then scrolls, for N steps followed by `done`. Reports the wall time per step of the
+whole run (history, telemetry and events included) and the mean step duration recorded in the history, once with
+the serial step loop and once with the next browser state and the node handles prefetched.
+
+Usage: python tests/scripts/benchmark_step_pipelining.py [--steps N] [--llm-latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from browser_use import Agent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+ROWS = 300
+
+
+def fixture_html() -> str:
+	rows = '\n'.join(
+		f'<tr><td>Item {i}</td><td><input placeholder="Quantity {i}"></td><td><button>Add {i}</button></td>'
+		f'<td><a href="#item-{i}">Details {i}</a></td></tr>'
+		for i in range(ROWS)
+	)
+	return f'<html><head><title>Pipelining fixture</title></head><body><h1>Shop</h1><table>{rows}</table></body></html>'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		body = fixture_html().encode()
+		self.send_response(200)
+		self.send_header('Content-Type', 'text/html')
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		pass
+
+
+@dataclass
+class ThinkingLLM(BaseChatModel):
+	"""Answers after a fixed latency: scroll for `steps` steps, then done."""
+
+	steps: int = 5
+	latency: float = 2.0
+	model: str = 'thinking-llm'
+	calls: int = 0
+	_verified_api_keys: bool = True
+
+	@property
+	def provider(self) -> str:
+		return 'benchmark'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T] | None = None) -> ChatInvokeCompletion:
+		await asyncio.sleep(self.latency)
+		self.calls += 1
+		if self.calls < self.steps:
+			action = {'scroll': {'down': self.calls % 2 == 1, 'num_pages': 1.0}}
+		else:
+			action = {'done': {'text': 'Finished', 'success': True}}
+		output = json.dumps(
+			{
+				'thinking': 'Browsing the shop',
+				'evaluation_previous_goal': 'Success',
+				'memory': f'Step {self.calls}',
+				'next_goal': 'Keep browsing',
+				'action': [action],
+			}
+		)
+		assert output_format is not None
+		return ChatInvokeCompletion(completion=output_format.model_validate_json(output), usage=None)
+
+
+async def run(url: str, steps: int, latency: float, pipeline_steps: bool) -> tuple[float, float]:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+	await browser_session.start()
+	try:
+		agent = Agent(
+			task=f'Open {url} and browse',
+			llm=ThinkingLLM(steps=steps, latency=latency),
+			browser_session=browser_session,
+			initial_actions=[{'go_to_url': {'url': url, 'new_tab': False}}],
+			pipeline_steps=pipeline_steps,
+		)
+		start = time.perf_counter()
+		history = await agent.run(max_steps=steps + 1)
+		wall_time = time.perf_counter() - start
+		durations = [item.metadata.duration_seconds for item in history.history if item.metadata]
+		return wall_time / len(durations), statistics.mean(durations)
+	finally:
+		await browser_session.kill()
+
+
+async def main() -> None:
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--steps', type=int, default=8)
+	parser.add_argument('--llm-latency', type=float, default=2.0)
+	args = parser.parse_args()
+	logging.getLogger('browser_use').setLevel(logging.WARNING)
+
+	server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	url = f'http://127.0.0.1:{server.server_address[1]}/'
+
+	print(f'{args.steps} steps, {ROWS * 3} interactive elements, LLM latency {args.llm_latency:.1f}s:')
+	results = {}
+	for pipeline_steps in (False, True):
+		per_step, step_duration = await run(url, args.steps, args.llm_latency, pipeline_steps)
+		results[pipeline_steps] = per_step
+		label = 'pipelined' if pipeline_steps else 'serial   '
+		print(f'  {label}: {per_step:6.2f}s wall time per step, {step_duration:6.2f}s mean step duration in history')
+	server.shutdown()
+
+	saved = results[False] - results[True]
+	print(f'  -> {saved:.2f}s saved per step ({saved / results[False]:.0%})')
+
+
+if __name__ == '__main__':
+	asyncio.run(main())